@@ -0,0 +1,33 @@
+"""Add keyset pagination index for sessions by owner.
+
+Revision ID: 20261016_000008
+Revises: 9ddfdd63af30
+Create Date: 2026-10-16 00:00:08
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_000008"
+down_revision: str | None = "9ddfdd63af30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add composite index for owner-scoped (created_at, id) seeks."""
+    op.create_index(
+        "idx_sessions_owner_created",
+        "sessions",
+        ["owner_api_key_hash", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Drop composite index for owner-scoped (created_at, id) seeks."""
+    op.drop_index("idx_sessions_owner_created", table_name="sessions")
@@ -0,0 +1,31 @@
+"""Add keyset pagination index for session transcript messages.
+
+Revision ID: 20261016_000009
+Revises: 20261016_000008
+Create Date: 2026-10-16 00:00:09
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_000009"
+down_revision: str | None = "20261016_000008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add composite index for per-session (created_at, id) seeks."""
+    op.create_index(
+        "idx_messages_session_created",
+        "session_messages",
+        ["session_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop composite index for per-session (created_at, id) seeks."""
+    op.drop_index("idx_messages_session_created", table_name="session_messages")
@@ -2,19 +2,56 @@
 
 from __future__ import annotations
 
-import json
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Protocol, cast
 
 import redis.asyncio as redis
 import structlog
 
 from apps.api.config import get_settings
+from apps.api.utils.json_codec import get_json_codec
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from redis.asyncio.client import Pipeline
+
+    from redis.commands.core import AsyncScript
+
+    from apps.api.protocols import RateLimitGrant
     from apps.api.types import JsonValue
+    from apps.api.utils.json_codec import JsonCodec
 
 logger = structlog.get_logger(__name__)
 
+# GCRA: the key holds the theoretical arrival time (TAT) of the next token in
+# ms on the Redis clock, so every instance shares one clock. A claim of k
+# tokens succeeds while TAT + k * interval stays within burst * interval of
+# now; partial claims are granted so lease callers take what is left.
+_GCRA_SCRIPT = """
+local now_parts = redis.call("TIME")
+local now = now_parts[1] * 1000 + math.floor(now_parts[2] / 1000)
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local tat = tonumber(redis.call("GET", KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local horizon = now + interval * burst
+local granted = math.min(requested, math.floor((horizon - tat) / interval))
+local retry_after = 0
+if granted > 0 then
+    tat = tat + granted * interval
+    redis.call("SET", KEYS[1], tat, "PX", tat - now)
+else
+    granted = 0
+    retry_after = tat + interval - horizon
+end
+local remaining = math.max(0, math.floor((horizon - tat) / interval))
+return {granted, remaining, retry_after, tat - now}
+"""
+
 
 class RedisClientProtocol(Protocol):
     """Protocol for Redis client with typed eval method."""
@@ -96,16 +133,127 @@ else:
     RedisClient = redis.Redis
 
 
+def _always_true(_: object) -> bool:
+    return True
+
+
+def _positive(result: object) -> bool:
+    return cast("int", result) > 0
+
+
+class RedisCachePipeline:
+    """Redis implementation of the CachePipeline protocol.
+
+    Commands are buffered client-side by a redis-py pipeline and sent in a
+    single request on execute(). Raw replies are converted to the values the
+    matching RedisCache methods return.
+    """
+
+    def __init__(self, pipeline: Pipeline, codec: JsonCodec) -> None:
+        """Initialize pipeline.
+
+        Args:
+            pipeline: redis-py pipeline to queue commands on.
+            codec: JSON codec for set_json values.
+        """
+        self._pipeline = pipeline
+        self._codec = codec
+        # One converter per queued step; None marks a step that sent nothing
+        self._steps: list[Callable[[object], object] | None] = []
+
+    def cache_set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Queue setting a string value."""
+        self._set_bytes(key, value.encode("utf-8"), ttl)
+
+    def set_json(
+        self,
+        key: str,
+        value: dict[str, JsonValue],
+        ttl: int | None = None,
+    ) -> None:
+        """Queue setting a JSON value."""
+        self._set_bytes(key, self._codec.dumps(value), ttl)
+
+    def _set_bytes(self, key: str, data: bytes, ttl: int | None) -> None:
+        """Queue SET/SETEX of an already encoded value."""
+        if ttl is not None:
+            self._pipeline.setex(key, ttl, data)
+        else:
+            self._pipeline.set(key, data)
+        self._steps.append(_always_true)
+
+    def delete(self, key: str) -> None:
+        """Queue deleting a key."""
+        self._pipeline.delete(key)
+        self._steps.append(_positive)
+
+    def expire(self, key: str, ttl: int) -> None:
+        """Queue setting expiration on a key."""
+        self._pipeline.expire(key, ttl)
+        self._steps.append(lambda result: result is True)
+
+    def incr(self, key: str) -> None:
+        """Queue incrementing a counter."""
+        self._pipeline.incr(key)
+        self._steps.append(lambda result: int(cast("int", result)))
+
+    def add_to_set(self, key: str, value: str) -> None:
+        """Queue adding a value to a set."""
+        self._pipeline.sadd(key, value.encode("utf-8"))
+        self._steps.append(_positive)
+
+    def remove_from_set(self, key: str, value: str) -> None:
+        """Queue removing a value from a set."""
+        self._pipeline.srem(key, value.encode("utf-8"))
+        self._steps.append(_positive)
+
+    def add_to_sorted_set(self, key: str, member: str, score: float) -> None:
+        """Queue adding or re-scoring a sorted set member."""
+        self._pipeline.zadd(key, {member.encode("utf-8"): score})
+        self._steps.append(_positive)
+
+    def remove_from_sorted_set(self, key: str, *members: str) -> None:
+        """Queue removing members from a sorted set."""
+        if not members:
+            self._steps.append(None)
+            return
+        self._pipeline.zrem(key, *(m.encode("utf-8") for m in members))
+        self._steps.append(lambda result: int(cast("int", result)))
+
+    def remove_from_sorted_set_by_score(
+        self, key: str, min_score: float | str, max_score: float | str
+    ) -> None:
+        """Queue removing sorted set members within a score range."""
+        self._pipeline.zremrangebyscore(key, min_score, max_score)
+        self._steps.append(lambda result: int(cast("int", result)))
+
+    async def execute(self) -> list[object]:
+        """Send all queued commands in one round-trip.
+
+        Returns:
+            One result per queued command, in queue order.
+        """
+        steps, self._steps = self._steps, []
+        if not any(step is not None for step in steps):
+            return [0 for _ in steps]
+
+        replies = iter(await self._pipeline.execute())
+        return [0 if step is None else step(next(replies)) for step in steps]
+
+
 class RedisCache:
     """Redis cache implementation of Cache protocol."""
 
-    def __init__(self, client: RedisClient) -> None:
+    def __init__(self, client: RedisClient, codec: JsonCodec | None = None) -> None:
         """Initialize Redis cache.
 
         Args:
             client: Redis async client.
+            codec: JSON codec for *_json methods (defaults to the shared codec).
         """
         self._client = client
+        self._codec = codec if codec is not None else get_json_codec()
+        self._gcra_script: AsyncScript | None = None
 
     @classmethod
     async def create(cls, url: str | None = None) -> RedisCache:
@@ -154,6 +302,19 @@ class RedisCache:
         close_method = getattr(self._client, "aclose", self._client.close)
         await close_method()
 
+    def pipeline(self, *, transaction: bool = True) -> RedisCachePipeline:
+        """Start a batch of writes executed in one round-trip.
+
+        Args:
+            transaction: Wrap the batch in MULTI/EXEC so it applies atomically.
+
+        Returns:
+            Empty pipeline; queue commands then await execute().
+        """
+        return RedisCachePipeline(
+            self._client.pipeline(transaction=transaction), self._codec
+        )
+
     async def get(self, key: str) -> str | None:
         """Get a value from cache.
 
@@ -177,13 +338,12 @@ class RedisCache:
         Returns:
             Parsed JSON dict or None.
         """
-        value = await self.get(key)
+        value = await self._client.get(key)
         if value is None or not value.strip():
             return None
         try:
-            parsed: dict[str, JsonValue] = json.loads(value)
-            return parsed
-        except (json.JSONDecodeError, ValueError):
+            return cast("dict[str, JsonValue]", self._codec.loads(value))
+        except ValueError:
             return None
 
     async def get_many_json(self, keys: list[str]) -> list[dict[str, JsonValue] | None]:
@@ -207,9 +367,8 @@ class RedisCache:
                 results.append(None)
                 continue
             try:
-                decoded = raw.decode("utf-8")
-                results.append(json.loads(decoded))
-            except (UnicodeDecodeError, json.JSONDecodeError, ValueError) as e:
+                results.append(cast("dict[str, JsonValue]", self._codec.loads(raw)))
+            except ValueError as e:
                 logger.debug(
                     "get_many_json decode error",
                     key=keys[len(results)],
@@ -257,7 +416,12 @@ class RedisCache:
         Returns:
             True if successful.
         """
-        return await self.cache_set(key, json.dumps(value), ttl)
+        data = self._codec.dumps(value)
+        if ttl is not None:
+            await self._client.setex(key, ttl, data)
+        else:
+            await self._client.set(key, data)
+        return True
 
     async def scan_keys(self, pattern: str, max_keys: int = 1000) -> list[str]:
         """Scan for keys matching a pattern.
@@ -430,6 +594,142 @@ class RedisCache:
         members = await self._client.smembers(key)
         return {m.decode("utf-8") for m in members}
 
+    async def add_to_sorted_set(self, key: str, member: str, score: float) -> bool:
+        """Add or re-score a member of a sorted set.
+
+        Args:
+            key: Sorted set key.
+            member: Member to add.
+            score: Sort score.
+
+        Returns:
+            True if the member was newly added.
+        """
+        result = await self._client.zadd(key, {member.encode("utf-8"): score})
+        return result > 0
+
+    async def remove_from_sorted_set(self, key: str, *members: str) -> int:
+        """Remove members from a sorted set.
+
+        Args:
+            key: Sorted set key.
+            *members: Members to remove.
+
+        Returns:
+            Number of members removed.
+        """
+        if not members:
+            return 0
+        return await self._client.zrem(key, *(m.encode("utf-8") for m in members))
+
+    async def remove_from_sorted_set_by_score(
+        self, key: str, min_score: float | str, max_score: float | str
+    ) -> int:
+        """Remove sorted set members within a score range.
+
+        Args:
+            key: Sorted set key.
+            min_score: Lower score bound ("-inf" or "(" prefix allowed).
+            max_score: Upper score bound.
+
+        Returns:
+            Number of members removed.
+        """
+        return await self._client.zremrangebyscore(key, min_score, max_score)
+
+    async def sorted_set_rank(
+        self,
+        key: str,
+        member: str,
+        *,
+        descending: bool = False,
+    ) -> int | None:
+        """Get a member's 0-based position in a sorted set.
+
+        Args:
+            key: Sorted set key.
+            member: Member to locate.
+            descending: Rank by descending score (ZREVRANK).
+
+        Returns:
+            Rank, or None if the member is absent.
+        """
+        encoded = member.encode("utf-8")
+        if descending:
+            return await self._client.zrevrank(key, encoded)
+        return await self._client.zrank(key, encoded)
+
+    async def sorted_set_range(
+        self,
+        key: str,
+        start: int,
+        stop: int,
+        *,
+        descending: bool = False,
+    ) -> list[str]:
+        """Get members of a sorted set by rank range (inclusive).
+
+        Args:
+            key: Sorted set key.
+            start: First rank.
+            stop: Last rank (-1 for the end).
+            descending: Order by descending score (ZREVRANGE).
+
+        Returns:
+            Members in rank order.
+        """
+        members = await self._client.zrange(key, start, stop, desc=descending)
+        return [cast("bytes", m).decode("utf-8") for m in members]
+
+    async def sorted_set_score(self, key: str, member: str) -> float | None:
+        """Get a member's score in a sorted set.
+
+        Args:
+            key: Sorted set key.
+            member: Member to look up.
+
+        Returns:
+            Score, or None if the member is absent.
+        """
+        return await self._client.zscore(key, member.encode("utf-8"))
+
+    async def sorted_set_range_by_score(
+        self,
+        key: str,
+        min_score: float | str,
+        max_score: float | str,
+        *,
+        descending: bool = False,
+        count: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """Get members of a sorted set within a score range, with scores.
+
+        Bounds accept Redis syntax: "-inf"/"+inf", or "(" prefix for exclusive.
+
+        Args:
+            key: Sorted set key.
+            min_score: Lower score bound.
+            max_score: Upper score bound.
+            descending: Order by descending score (ZREVRANGEBYSCORE).
+            count: Maximum members to return (None for all).
+
+        Returns:
+            (member, score) pairs in range order.
+        """
+        start, num = (0, count) if count is not None else (None, None)
+        if descending:
+            rows = await self._client.zrevrangebyscore(
+                key, max_score, min_score, start=start, num=num, withscores=True
+            )
+        else:
+            rows = await self._client.zrangebyscore(
+                key, min_score, max_score, start=start, num=num, withscores=True
+            )
+        return [
+            (cast("bytes", member).decode("utf-8"), float(score))
+            for member, score in rows
+        ]
+
     async def _eval_script(self, script: str, num_keys: int, *args: str) -> int:
         """Typed wrapper for Redis eval command.
 
@@ -494,6 +794,37 @@ class RedisCache:
         result = await self._eval_script(script, 1, f"lock:{key}", value)
         return bool(result == 1)
 
+    async def gcra_acquire(
+        self, key: str, emission_interval_ms: int, burst: int, requested: int = 1
+    ) -> RateLimitGrant:
+        """Atomically claim up to ``requested`` tokens from a GCRA bucket.
+
+        The script is sent once and then invoked by SHA (EVALSHA).
+
+        Args:
+            key: Rate limit key.
+            emission_interval_ms: Milliseconds between token refills.
+            burst: Max tokens available at once.
+            requested: Tokens wanted; fewer are granted if the bucket is short.
+
+        Returns:
+            Tokens granted, tokens left and the retry/reset delays.
+        """
+        if self._gcra_script is None:
+            self._gcra_script = self._client.register_script(_GCRA_SCRIPT)
+        result = await self._gcra_script(
+            keys=[key], args=[emission_interval_ms, burst, requested]
+        )
+        granted, remaining, retry_after_ms, reset_after_ms = (
+            int(value) for value in result
+        )
+        return {
+            "granted": granted,
+            "remaining": remaining,
+            "retry_after_ms": retry_after_ms,
+            "reset_after_ms": reset_after_ms,
+        }
+
     async def ping(self) -> bool:
         """Check cache connectivity.
 
@@ -518,6 +849,55 @@ class RedisCache:
         result = await self._client.incr(key)
         return int(result)
 
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish a message to a pub/sub channel.
+
+        Args:
+            channel: Channel name.
+            message: Message payload.
+
+        Returns:
+            Number of subscribers that received the message.
+        """
+        result = await self._client.publish(channel, message.encode("utf-8"))
+        return int(result)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[AsyncIterator[str]]:
+        """Subscribe to a pub/sub channel.
+
+        The subscription is active once the context is entered. Messages are
+        polled with a short timeout so idle channels do not trip the client
+        socket timeout.
+
+        Args:
+            channel: Channel name.
+
+        Yields:
+            Async iterator of decoded message payloads.
+        """
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+
+        async def _messages() -> AsyncIterator[str]:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is None or message.get("type") != "message":
+                    continue
+                data = message["data"]
+                yield data.decode("utf-8") if isinstance(data, bytes) else str(data)
+
+        try:
+            yield _messages()
+        finally:
+            try:
+                await pubsub.unsubscribe(channel)
+            finally:
+                close_method = getattr(pubsub, "aclose", pubsub.close)
+                await close_method()
+
     async def expire(self, key: str, ttl: int) -> bool:
         """Set expiration on a key.
 
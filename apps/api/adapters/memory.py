@@ -1,11 +1,11 @@
 """Mem0 memory adapter implementation."""
 
-import asyncio
 from typing import cast
 
 import structlog
 from mem0 import Memory
 
+from apps.api.adapters.memory_executor import MemoryExecutor
 from apps.api.config import Settings
 from apps.api.exceptions.memory import MemoryNotFoundError
 from apps.api.protocols import MemorySearchResult
@@ -60,15 +60,23 @@ def _patch_langchain_neo4j() -> None:
 class Mem0MemoryAdapter:
     """Adapter for Mem0 memory operations."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self, settings: Settings, executor: MemoryExecutor | None = None
+    ) -> None:
         """Initialize Mem0 client with configuration.
 
         Note: OPENAI_API_KEY environment variable must be set before instantiation.
         This is handled in the application lifespan startup to avoid global state
         mutation in the constructor.
+
+        Args:
+            settings: Application settings.
+            executor: Dedicated thread pool for blocking mem0 calls. A private
+                one is created from settings when omitted.
         """
         self._settings = settings
         self._agent_id = settings.mem0_agent_id
+        self._executor = executor or MemoryExecutor.from_settings(settings)
 
         _patch_langchain_neo4j()
 
@@ -182,7 +190,7 @@ class Mem0MemoryAdapter:
         }
 
         try:
-            results = await asyncio.to_thread(memory_client.search, **kwargs)
+            results = await self._executor.run("search", memory_client.search, **kwargs)
         except Exception as exc:
             if exc.__class__.__name__ == "PermissionDeniedError":
                 logger.warning(
@@ -287,7 +295,7 @@ class Mem0MemoryAdapter:
         }
 
         try:
-            results = await asyncio.to_thread(memory_client.add, **kwargs)
+            results = await self._executor.run("add", memory_client.add, **kwargs)
         except Exception as exc:
             if exc.__class__.__name__ == "PermissionDeniedError":
                 logger.warning(
@@ -350,7 +358,8 @@ class Mem0MemoryAdapter:
         Returns:
             List of all memory records for the user.
         """
-        results = await asyncio.to_thread(
+        results = await self._executor.run(
+            "read",
             self._memory.get_all,
             user_id=user_id,
             agent_id=self._agent_id,
@@ -394,7 +403,8 @@ class Mem0MemoryAdapter:
             MemoryNotFoundError: If memory does not exist or user is not authorized.
         """
         # Fetch memory to verify ownership before deletion
-        memory_data = await asyncio.to_thread(
+        memory_data = await self._executor.run(
+            "read",
             self._memory.get,
             memory_id=memory_id,
         )
@@ -416,7 +426,8 @@ class Mem0MemoryAdapter:
             )
 
         # Authorized - proceed with deletion
-        await asyncio.to_thread(
+        await self._executor.run(
+            "delete",
             self._memory.delete,
             memory_id=memory_id,
         )
@@ -433,7 +444,8 @@ class Mem0MemoryAdapter:
         Args:
             user_id: User identifier whose memories should be deleted.
         """
-        await asyncio.to_thread(
+        await self._executor.run(
+            "delete",
             self._memory.delete_all,
             user_id=user_id,
         )
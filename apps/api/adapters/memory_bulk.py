@@ -0,0 +1,231 @@
+"""Bulk memory ingestion straight to TEI and Qdrant.
+
+``Mem0MemoryAdapter.add`` handles one conversation per call. Each stored fact
+costs its own embedding request and its own Qdrant insert, on top of the LLM
+extraction. For bulk loads of facts that are already curated (documentation,
+imports, seed data) that is mostly round-trips.
+
+BulkMemoryIngestor stores texts as-is, without LLM extraction or graph
+writes. It embeds them in batched requests to TEI's OpenAI-compatible
+``/v1/embeddings`` endpoint and upserts them into the mem0 Qdrant collection
+in bulk. Points use mem0's payload layout (``data``, ``hash``,
+``created_at``, ``user_id``, ``agent_id`` plus metadata), so mem0
+search/list/delete treat them like any other memory.
+"""
+
+import asyncio
+import hashlib
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, TypedDict, cast
+
+import httpx
+import structlog
+
+from apps.api.exceptions.memory import MemoryIngestionError
+
+if TYPE_CHECKING:
+    from apps.api.config import Settings
+    from apps.api.types import JsonValue
+
+logger = structlog.get_logger(__name__)
+
+# Model name mem0's OpenAI embedder sends; TEI serves its one loaded model
+_EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+@dataclass(slots=True)
+class BulkMemoryItem:
+    """One memory text to store verbatim."""
+
+    text: str
+    metadata: dict[str, "JsonValue"] = field(default_factory=dict)
+
+
+class BulkIngestResult(TypedDict):
+    """Outcome of a bulk ingestion."""
+
+    ids: list[str]
+    skipped: int
+    embed_requests: int
+    upsert_requests: int
+    duration_ms: float
+
+
+class BulkMemoryIngestor:
+    """Batches embedding and vector upserts for many memories at once."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        tei_url: str,
+        tei_api_key: str,
+        qdrant_url: str,
+        collection_name: str,
+        agent_id: str,
+        embed_batch_size: int = 32,
+        upsert_batch_size: int = 256,
+        concurrency: int = 4,
+    ) -> None:
+        """Initialize ingestor.
+
+        Args:
+            client: HTTP client for TEI and Qdrant requests.
+            tei_url: Text Embeddings Inference base URL.
+            tei_api_key: Bearer token for TEI.
+            qdrant_url: Qdrant REST base URL.
+            collection_name: mem0 vector collection.
+            agent_id: mem0 agent identifier stored on each point.
+            embed_batch_size: Texts per TEI request.
+            upsert_batch_size: Points per Qdrant upsert.
+            concurrency: Max concurrent TEI requests.
+        """
+        self._client = client
+        self._embeddings_url = f"{tei_url.rstrip('/')}/v1/embeddings"
+        self._points_url = (
+            f"{qdrant_url.rstrip('/')}/collections/{collection_name}/points"
+        )
+        self._tei_headers = {"Authorization": f"Bearer {tei_api_key}"}
+        self._agent_id = agent_id
+        self._embed_batch_size = embed_batch_size
+        self._upsert_batch_size = upsert_batch_size
+        self._embed_slots = asyncio.Semaphore(concurrency)
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "BulkMemoryIngestor":
+        """Build an ingestor with its own HTTP client from settings.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            BulkMemoryIngestor instance.
+        """
+        client = httpx.AsyncClient(
+            timeout=settings.memory_bulk_timeout_seconds,
+            limits=httpx.Limits(max_connections=settings.memory_bulk_concurrency + 1),
+        )
+        return cls(
+            client,
+            tei_url=settings.tei_url,
+            tei_api_key=settings.tei_api_key,
+            qdrant_url=settings.qdrant_url,
+            collection_name=settings.mem0_collection_name,
+            agent_id=settings.mem0_agent_id,
+            embed_batch_size=settings.memory_bulk_embed_batch_size,
+            upsert_batch_size=settings.memory_bulk_upsert_batch_size,
+            concurrency=settings.memory_bulk_concurrency,
+        )
+
+    async def ingest(
+        self, user_id: str, items: list[BulkMemoryItem]
+    ) -> BulkIngestResult:
+        """Embed and store memories in batches.
+
+        Texts repeated within one call are stored once. Upserts are applied
+        in order; if one fails, earlier batches stay stored.
+
+        Args:
+            user_id: User identifier for multi-tenant isolation.
+            items: Memories to store.
+
+        Returns:
+            Stored point ids in input order (after de-duplication) and
+            request counts.
+
+        Raises:
+            MemoryIngestionError: If a TEI or Qdrant request fails.
+        """
+        started = time.perf_counter()
+        unique: dict[str, BulkMemoryItem] = {}
+        for item in items:
+            unique.setdefault(item.text, item)
+        pending = list(unique.values())
+
+        ids: list[str] = []
+        embed_requests = 0
+        upsert_requests = 0
+        for offset in range(0, len(pending), self._upsert_batch_size):
+            chunk = pending[offset : offset + self._upsert_batch_size]
+            batches = [
+                chunk[i : i + self._embed_batch_size]
+                for i in range(0, len(chunk), self._embed_batch_size)
+            ]
+            try:
+                vectors = await asyncio.gather(
+                    *(self._embed([item.text for item in b]) for b in batches)
+                )
+                embed_requests += len(batches)
+                points = [
+                    self._point(user_id, item, vector)
+                    for item, vector in zip(
+                        chunk, (v for batch in vectors for v in batch), strict=True
+                    )
+                ]
+                await self._upsert(points)
+                upsert_requests += 1
+            except (httpx.HTTPError, KeyError, TypeError, ValueError) as e:
+                logger.warning(
+                    "memory_bulk_ingest_failed",
+                    user_id=user_id,
+                    ingested=len(ids),
+                    error=str(e),
+                )
+                raise MemoryIngestionError(str(e), ingested=len(ids)) from e
+            ids.extend(cast("str", point["id"]) for point in points)
+
+        duration_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            "memory_bulk_ingested",
+            user_id=user_id,
+            count=len(ids),
+            embed_requests=embed_requests,
+            upsert_requests=upsert_requests,
+            duration_ms=round(duration_ms, 1),
+        )
+        return BulkIngestResult(
+            ids=ids,
+            skipped=len(items) - len(pending),
+            embed_requests=embed_requests,
+            upsert_requests=upsert_requests,
+            duration_ms=round(duration_ms, 3),
+        )
+
+    async def _embed(self, texts: list[str]) -> list[list[float]]:
+        async with self._embed_slots:
+            response = await self._client.post(
+                self._embeddings_url,
+                json={"model": _EMBEDDING_MODEL, "input": texts},
+                headers=self._tei_headers,
+            )
+        response.raise_for_status()
+        data = sorted(response.json()["data"], key=lambda row: row["index"])
+        if len(data) != len(texts):
+            raise ValueError(f"TEI returned {len(data)} embeddings for {len(texts)}")
+        return [row["embedding"] for row in data]
+
+    async def _upsert(self, points: list[dict[str, object]]) -> None:
+        response = await self._client.put(
+            self._points_url, params={"wait": "true"}, json={"points": points}
+        )
+        response.raise_for_status()
+
+    def _point(
+        self, user_id: str, item: BulkMemoryItem, vector: list[float]
+    ) -> dict[str, object]:
+        payload: dict[str, object] = {
+            **item.metadata,
+            "user_id": user_id,
+            "agent_id": self._agent_id,
+            "data": item.text,
+            "hash": hashlib.md5(item.text.encode()).hexdigest(),
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        return {"id": str(uuid.uuid4()), "vector": vector, "payload": payload}
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
@@ -0,0 +1,221 @@
+"""Dedicated thread pool for blocking mem0 calls.
+
+The mem0 client is synchronous (LLM extraction, embedding, Qdrant and Neo4j
+calls), so Mem0MemoryAdapter runs it in threads. Doing that with
+``asyncio.to_thread`` shares the loop's default executor with every other
+offloaded call, and a burst of extractions could occupy all of its threads.
+
+MemoryExecutor gives mem0 its own pool and caps concurrency per operation
+kind, so slow extractions cannot starve searches. Calls beyond the cap wait
+in a queue; once ``max_queue_depth`` calls of a kind are queued, new calls
+are rejected with MemoryBusyError. QueryExecutor treats that as "continue
+without memories" for search. A call counts as waiting until a pool thread
+starts it, and it keeps its slot until that thread returns, even if the
+awaiting task was cancelled (e.g. by the search deadline).
+"""
+
+import asyncio
+import contextvars
+import functools
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, TypedDict, TypeVar
+
+from apps.api.exceptions.memory import MemoryBusyError
+
+if TYPE_CHECKING:
+    from apps.api.config import Settings
+
+T = TypeVar("T")
+
+MemoryOperation = Literal["search", "add", "read", "delete"]
+
+
+class MemoryOperationMetrics(TypedDict):
+    """Counters for one operation kind."""
+
+    limit: int
+    running: int
+    waiting: int
+    completed: int
+    rejected: int
+    wait_ms_total: float
+    wait_ms_max: float
+
+
+class MemoryExecutorMetrics(TypedDict):
+    """Snapshot of memory executor counters."""
+
+    threads: int
+    max_queue_depth: int
+    operations: dict[str, MemoryOperationMetrics]
+
+
+@dataclass(slots=True)
+class _Operation:
+    semaphore: asyncio.Semaphore
+    limit: int
+    running: int = 0
+    waiting: int = 0
+    queued: int = 0
+    completed: int = 0
+    rejected: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+
+
+def _notify(loop: asyncio.AbstractEventLoop, callback: Callable[[], None]) -> None:
+    """Schedule bookkeeping on the event loop from a pool thread."""
+    try:
+        loop.call_soon_threadsafe(callback)
+    except RuntimeError:
+        # Loop already closed during shutdown; counters no longer matter
+        pass
+
+
+class MemoryExecutor:
+    """Bounded thread pool with per-operation concurrency limits."""
+
+    def __init__(
+        self,
+        threads: int,
+        limits: dict[MemoryOperation, int],
+        max_queue_depth: int,
+    ) -> None:
+        """Initialize executor.
+
+        Args:
+            threads: Worker threads dedicated to mem0 calls.
+            limits: Max concurrent calls per operation kind.
+            max_queue_depth: Calls of one kind allowed to wait before new
+                calls are rejected.
+        """
+        self._threads = threads
+        self._max_queue_depth = max_queue_depth
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="mem0")
+        self._operations = {
+            name: _Operation(asyncio.Semaphore(limit), limit)
+            for name, limit in limits.items()
+        }
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "MemoryExecutor":
+        """Build an executor from application settings.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            MemoryExecutor instance.
+        """
+        return cls(
+            threads=settings.memory_executor_threads,
+            limits={
+                "search": settings.memory_search_concurrency,
+                "add": settings.memory_add_concurrency,
+                "read": settings.memory_read_concurrency,
+                "delete": settings.memory_delete_concurrency,
+            },
+            max_queue_depth=settings.memory_executor_max_queue_depth,
+        )
+
+    async def run(
+        self,
+        operation: MemoryOperation,
+        func: Callable[..., T],
+        /,
+        **kwargs: object,
+    ) -> T:
+        """Run a blocking mem0 call in the dedicated pool.
+
+        Args:
+            operation: Operation kind whose concurrency limit applies.
+            func: Blocking callable.
+            **kwargs: Keyword arguments for the callable.
+
+        Returns:
+            The callable's return value.
+
+        Raises:
+            MemoryBusyError: If too many calls of this kind are already waiting.
+        """
+        op = self._operations[operation]
+        if op.queued >= self._max_queue_depth and op.semaphore.locked():
+            op.rejected += 1
+            raise MemoryBusyError(operation)
+
+        queued_at = time.perf_counter()
+        op.waiting += 1
+        op.queued += 1
+        try:
+            await op.semaphore.acquire()
+        except BaseException:
+            op.waiting -= 1
+            raise
+        finally:
+            op.queued -= 1
+
+        loop = asyncio.get_running_loop()
+        started = False
+
+        def on_start(started_at: float) -> None:
+            nonlocal started
+            started = True
+            op.waiting -= 1
+            op.running += 1
+            wait_ms = (started_at - queued_at) * 1000
+            op.wait_ms_total += wait_ms
+            op.wait_ms_max = max(op.wait_ms_max, wait_ms)
+
+        def on_done() -> None:
+            if started:
+                op.running -= 1
+                op.completed += 1
+            else:
+                op.waiting -= 1
+            op.semaphore.release()
+
+        def call() -> T:
+            _notify(loop, functools.partial(on_start, time.perf_counter()))
+            return func(**kwargs)
+
+        context = contextvars.copy_context()
+        try:
+            future = self._pool.submit(context.run, call)
+        except RuntimeError:
+            on_done()
+            raise
+        # The slot is released when the thread finishes, not when the awaiting
+        # task is cancelled: a running mem0 call cannot be interrupted.
+        future.add_done_callback(lambda _: _notify(loop, on_done))
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running mem0 calls finish in the background."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def metrics(self) -> MemoryExecutorMetrics:
+        """Return executor counters.
+
+        Returns:
+            Pool size, queue limit and per-operation counters; wait time is
+            measured from the call until a pool thread starts running it.
+        """
+        return MemoryExecutorMetrics(
+            threads=self._threads,
+            max_queue_depth=self._max_queue_depth,
+            operations={
+                name: MemoryOperationMetrics(
+                    limit=op.limit,
+                    running=op.running,
+                    waiting=op.waiting,
+                    completed=op.completed,
+                    rejected=op.rejected,
+                    wait_ms_total=round(op.wait_ms_total, 3),
+                    wait_ms_max=round(op.wait_ms_max, 3),
+                )
+                for name, op in self._operations.items()
+            },
+        )
@@ -8,12 +8,12 @@ This repository implements secure API key hashing:
 See: .docs/api-key-hashing-migration.md for full migration plan.
 """
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Select, func, insert, select, tuple_
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +22,7 @@ from apps.api.exceptions.session import SessionNotFoundError
 from apps.api.models.session import Checkpoint, Session, SessionMessage
 from apps.api.types import JsonValue
 from apps.api.utils.crypto import hash_api_key
+from apps.api.utils.pagination import KeysetCursor
 
 
 class SessionRepository:
@@ -194,16 +195,120 @@ class SessionRepository:
         Returns:
             Tuple of session list and total count.
         """
+        filters = self._list_filters(
+            status=status,
+            owner_api_key=owner_api_key,
+            filter_by_owner_or_public=filter_by_owner_or_public,
+            mode=mode,
+            project_id=project_id,
+            tags=tags,
+            search=search,
+        )
+
+        # Get total count
+        count_stmt = select(func.count()).select_from(Session).where(*filters)
+        count_result = await self._db.execute(count_stmt)
+        total = count_result.scalar_one()
+
+        # Get paginated results
+        stmt = (
+            select(Session)
+            .where(*filters)
+            # Same order as list_sessions_keyset, so offset pages continue it
+            .order_by(Session.created_at.desc(), Session.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self._db.execute(stmt)
+        sessions = result.scalars().all()
+
+        return sessions, total
+
+    async def list_sessions_keyset(
+        self,
+        owner_api_key: str | None = None,
+        limit: int = 50,
+        *,
+        after: KeysetCursor | None = None,
+        include_total: bool = False,
+        status: str | None = None,
+        filter_by_owner_or_public: bool = False,
+        mode: str | None = None,
+        project_id: str | None = None,
+        tags: list[str] | None = None,
+        search: str | None = None,
+    ) -> tuple[Sequence[Session], bool, int | None]:
+        """List sessions newest first, seeking past a (created_at, id) cursor.
+
+        Seeks use idx_sessions_owner_created (or idx_sessions_created_at when
+        unowned), so the cost of a page does not grow with its depth.
+
+        Args:
+            owner_api_key: Filter by owner API key (exact match).
+            limit: Maximum results.
+            after: Sort key of the last session on the previous page.
+            include_total: Run the filtered count(*) query as well.
+            status: Filter by status.
+            filter_by_owner_or_public: If True, returns sessions where
+                owner_api_key is NULL (public) OR matches the provided key.
+            mode: Filter by session mode (JSONB metadata.mode field).
+            project_id: Filter by project ID (JSONB metadata.project_id field).
+            tags: Filter by tags (JSONB metadata.tags array - must contain ALL tags).
+            search: Filter by title substring (JSONB metadata.title field).
+
+        Returns:
+            Tuple of session list, whether more sessions follow, and the total
+            count (None unless include_total).
+        """
+        filters = self._list_filters(
+            status=status,
+            owner_api_key=owner_api_key,
+            filter_by_owner_or_public=filter_by_owner_or_public,
+            mode=mode,
+            project_id=project_id,
+            tags=tags,
+            search=search,
+        )
+
+        total: int | None = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(Session).where(*filters)
+            total = (await self._db.execute(count_stmt)).scalar_one()
+
+        stmt = select(Session).where(*filters)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(Session.created_at, Session.id)
+                < (after.created_at, UUID(after.id))
+            )
+        # Fetch one extra row to learn whether another page exists
+        stmt = stmt.order_by(Session.created_at.desc(), Session.id.desc()).limit(
+            limit + 1
+        )
+        result = await self._db.execute(stmt)
+        rows = result.scalars().all()
+
+        return rows[:limit], len(rows) > limit, total
+
+    @staticmethod
+    def _list_filters(
+        *,
+        status: str | None,
+        owner_api_key: str | None,
+        filter_by_owner_or_public: bool,
+        mode: str | None,
+        project_id: str | None,
+        tags: list[str] | None,
+        search: str | None,
+    ) -> list[ColumnElement[bool]]:
+        """Build WHERE clauses shared by the list and count queries."""
         from sqlalchemy import cast, or_
         from sqlalchemy.dialects.postgresql import JSONB
 
-        # Build query
-        stmt = select(Session).order_by(Session.created_at.desc())
-        count_stmt = select(func.count()).select_from(Session)
+        filters: list[ColumnElement[bool]] = []
 
         if status:
-            stmt = stmt.where(Session.status == status)
-            count_stmt = count_stmt.where(Session.status == status)
+            filters.append(Session.status == status)
 
         # Phase 2: Filter by hashed API key instead of plaintext
         # Prevents timing attacks and prepares for Phase 3 (plaintext removal)
@@ -212,64 +317,38 @@ class SessionRepository:
 
             if filter_by_owner_or_public:
                 # Secure multi-tenant filter: public sessions OR owned by this key
-                owner_filter = or_(
-                    Session.owner_api_key_hash.is_(None),
-                    Session.owner_api_key_hash == owner_api_key_hash,
+                filters.append(
+                    or_(
+                        Session.owner_api_key_hash.is_(None),
+                        Session.owner_api_key_hash == owner_api_key_hash,
+                    )
                 )
-                stmt = stmt.where(owner_filter)
-                count_stmt = count_stmt.where(owner_filter)
             else:
                 # Exact match only
-                stmt = stmt.where(Session.owner_api_key_hash == owner_api_key_hash)
-                count_stmt = count_stmt.where(
-                    Session.owner_api_key_hash == owner_api_key_hash
-                )
+                filters.append(Session.owner_api_key_hash == owner_api_key_hash)
 
         # JSONB metadata filtering (database-level instead of in-memory)
         if mode:
             # Filter by metadata.mode (string field)
-            stmt = stmt.where(Session.session_metadata["mode"].astext == mode)
-            count_stmt = count_stmt.where(
-                Session.session_metadata["mode"].astext == mode
-            )
+            filters.append(Session.session_metadata["mode"].astext == mode)
 
         if project_id:
             # Filter by metadata.project_id (string field)
-            stmt = stmt.where(
-                Session.session_metadata["project_id"].astext == project_id
-            )
-            count_stmt = count_stmt.where(
-                Session.session_metadata["project_id"].astext == project_id
-            )
+            filters.append(Session.session_metadata["project_id"].astext == project_id)
 
         if tags:
             # Filter by metadata.tags (array field - must contain ALL specified tags)
             # PostgreSQL @> operator checks if left array contains all elements from right array
             tags_jsonb = cast(tags, JSONB)
-            stmt = stmt.where(Session.session_metadata["tags"].op("@>")(tags_jsonb))
-            count_stmt = count_stmt.where(
-                Session.session_metadata["tags"].op("@>")(tags_jsonb)
-            )
+            filters.append(Session.session_metadata["tags"].op("@>")(tags_jsonb))
 
         if search:
             # Filter by metadata.title substring (case-insensitive)
-            stmt = stmt.where(
+            filters.append(
                 Session.session_metadata["title"].astext.ilike(f"%{search}%")
             )
-            count_stmt = count_stmt.where(
-                Session.session_metadata["title"].astext.ilike(f"%{search}%")
-            )
-
-        # Get total count
-        count_result = await self._db.execute(count_stmt)
-        total = count_result.scalar_one()
-
-        # Get paginated results
-        stmt = stmt.limit(limit).offset(offset)
-        result = await self._db.execute(stmt)
-        sessions = result.scalars().all()
 
-        return sessions, total
+        return filters
 
     async def add_message(
         self,
@@ -328,6 +407,52 @@ class SessionRepository:
                 status_code=500,
             ) from e
 
+    async def add_messages(self, messages: Sequence[dict[str, object]]) -> int:
+        """Insert many messages with batched multi-row INSERTs.
+
+        Unlike add_message, session existence is not checked up front: a
+        missing session surfaces as a foreign key violation for the batch.
+
+        Args:
+            messages: Rows with session_id, message_type, content and
+                created_at (set by the caller so rows inserted in one
+                transaction keep their order).
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            APIError: 409 on constraint violations (e.g. unknown session),
+                503 if the database is unavailable, 500 otherwise.
+        """
+        if not messages:
+            return 0
+        try:
+            await self._db.execute(insert(SessionMessage), list(messages))
+            await self._db.commit()
+            return len(messages)
+        except IntegrityError as e:
+            await self._db.rollback()
+            raise APIError(
+                message="Message already exists or violates constraints",
+                code="ALREADY_EXISTS",
+                status_code=409,
+            ) from e
+        except OperationalError as e:
+            await self._db.rollback()
+            raise APIError(
+                message="Database temporarily unavailable",
+                code="DATABASE_UNAVAILABLE",
+                status_code=503,
+            ) from e
+        except Exception as e:
+            await self._db.rollback()
+            raise APIError(
+                message="Failed to add messages",
+                code="INTERNAL_ERROR",
+                status_code=500,
+            ) from e
+
     async def get_messages(
         self,
         session_id: UUID,
@@ -342,17 +467,79 @@ class SessionRepository:
         Returns:
             List of messages.
         """
-        stmt = (
-            select(SessionMessage)
-            .where(SessionMessage.session_id == session_id)
-            .order_by(SessionMessage.created_at)
-        )
+        stmt = self._messages_after(session_id, None)
         if limit is not None:
             stmt = stmt.limit(limit)
 
         result = await self._db.execute(stmt)
         return result.scalars().all()
 
+    async def list_messages_keyset(
+        self,
+        session_id: UUID,
+        limit: int = 100,
+        *,
+        after: KeysetCursor | None = None,
+    ) -> tuple[Sequence[SessionMessage], bool]:
+        """List a session's messages oldest first, seeking past a cursor.
+
+        Seeks use idx_messages_session_created, so the cost of a page does
+        not grow with its depth in the transcript.
+
+        Args:
+            session_id: Session identifier.
+            limit: Maximum results.
+            after: Sort key of the last message on the previous page.
+
+        Returns:
+            Tuple of message list and whether more messages follow.
+        """
+        # Fetch one extra row to learn whether another page exists
+        stmt = self._messages_after(session_id, after).limit(limit + 1)
+        result = await self._db.execute(stmt)
+        rows = result.scalars().all()
+        return rows[:limit], len(rows) > limit
+
+    async def stream_messages(
+        self,
+        session_id: UUID,
+        *,
+        after: KeysetCursor | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[SessionMessage]:
+        """Stream a session's messages oldest first through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory use does not
+        depend on the length of the transcript.
+
+        Args:
+            session_id: Session identifier.
+            after: Sort key of the last message already read.
+            batch_size: Rows fetched per round-trip.
+
+        Yields:
+            Messages in (created_at, id) order.
+        """
+        stmt = self._messages_after(session_id, after).execution_options(
+            yield_per=batch_size
+        )
+        result = await self._db.stream_scalars(stmt)
+        async for message in result:
+            yield message
+
+    @staticmethod
+    def _messages_after(
+        session_id: UUID, after: KeysetCursor | None
+    ) -> Select[tuple[SessionMessage]]:
+        """Build the ordered transcript query shared by the message reads."""
+        stmt = select(SessionMessage).where(SessionMessage.session_id == session_id)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(SessionMessage.created_at, SessionMessage.id)
+                > (after.created_at, UUID(after.id))
+            )
+        return stmt.order_by(SessionMessage.created_at, SessionMessage.id)
+
     async def add_checkpoint(
         self,
         session_id: UUID,
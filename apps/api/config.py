@@ -61,6 +61,10 @@ class Settings(BaseSettings):
     redis_interrupt_ttl: int = Field(
         default=300, ge=60, le=3600, description="Interrupt marker TTL in seconds"
     )
+    redis_interrupt_channel: str = Field(
+        default="agent:interrupts",
+        description="Redis pub/sub channel for session interrupt signals",
+    )
     mcp_share_ttl_seconds: int = Field(
         default=86400,
         ge=300,
@@ -118,6 +122,203 @@ class Settings(BaseSettings):
     rate_limit_general_per_minute: int = Field(
         default=100, ge=1, description="General endpoint rate limit per minute"
     )
+    rate_limit_backend: Literal["slowapi", "redis"] = Field(
+        default="slowapi",
+        description="Rate limiter: per-instance slowapi or shared Redis GCRA",
+    )
+    rate_limit_lease_size: int = Field(
+        default=0,
+        ge=0,
+        le=100,
+        description="Tokens each instance pre-claims per key (0 = Redis per request)",
+    )
+    rate_limit_lease_ttl_ms: int = Field(
+        default=1000,
+        ge=10,
+        le=60000,
+        description="Max milliseconds an instance holds unused leased tokens",
+    )
+    rate_limit_max_tracked_keys: int = Field(
+        default=1000,
+        ge=1,
+        description="Max keys with local leases and per-key counters",
+    )
+
+    # Query Admission Control
+    query_admission_enabled: bool = Field(
+        default=True,
+        description="Cap concurrently running agent queries per instance and key",
+    )
+    query_max_in_flight: int = Field(
+        default=32, ge=1, description="Max agent queries running on this instance"
+    )
+    query_max_in_flight_per_key: int = Field(
+        default=8, ge=1, description="Max agent queries running per API key"
+    )
+    query_max_queued: int = Field(
+        default=64, ge=0, description="Max queries waiting for a slot (instance)"
+    )
+    query_max_queued_per_key: int = Field(
+        default=16, ge=0, description="Max queries waiting for a slot per API key"
+    )
+    query_queue_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        le=600,
+        description="Max seconds a query waits for a slot before it is shed",
+    )
+    websocket_max_streams: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Max concurrent request_id-tagged queries per WebSocket",
+    )
+    websocket_credit_timeout_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        le=3600,
+        description="Max seconds a tagged query waits for client credit",
+    )
+
+    # SDK Client Pool
+    sdk_pool_enabled: bool = Field(
+        default=False,
+        description="Keep pre-connected Claude SDK clients warm between queries",
+    )
+    sdk_pool_max_idle: int = Field(
+        default=4, ge=1, le=64, description="Max idle SDK clients across all keys"
+    )
+    sdk_pool_min_idle_per_key: int = Field(
+        default=1,
+        ge=0,
+        le=16,
+        description="Warm SDK clients to keep per option fingerprint after a lease",
+    )
+    sdk_pool_max_age_seconds: int = Field(
+        default=600, ge=10, le=86400, description="Max SDK client age in seconds"
+    )
+    sdk_pool_spawn_timeout: int = Field(
+        default=30, ge=1, le=300, description="SDK client connect timeout in seconds"
+    )
+
+    # Slash Command Discovery Cache
+    command_cache_ttl_seconds: int = Field(
+        default=30,
+        ge=0,
+        le=3600,
+        description="Max age of cached .claude/commands listings (0 = mtime only)",
+    )
+    command_cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        le=100000,
+        description="Project paths kept in the command discovery cache (LRU)",
+    )
+
+    # MCP Config Cache
+    mcp_config_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        description=(
+            "Max age of a cached per-API-key MCP config merge; bounds staleness "
+            "of the config file and env vars (0 = disable caching)"
+        ),
+    )
+    mcp_config_cache_max_entries: int = Field(
+        default=1024,
+        ge=1,
+        le=100000,
+        description="API keys kept in the MCP config cache (LRU)",
+    )
+
+    # Webhook HTTP Pool
+    webhook_http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 for hook webhooks (requires the h2 package)",
+    )
+    webhook_max_connections: int = Field(
+        default=100, ge=1, le=10000, description="Max open webhook connections"
+    )
+    webhook_max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        le=10000,
+        description="Idle webhook connections kept alive for reuse",
+    )
+    webhook_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        le=3600,
+        description="Seconds an idle webhook connection is kept before closing",
+    )
+    webhook_max_connections_per_host: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Max concurrent webhook requests to a single host",
+    )
+
+    # Webhook Background Delivery
+    webhook_delivery_enabled: bool = Field(
+        default=True,
+        description="Deliver PostToolUse/Stop/SubagentStop hooks in the background",
+    )
+    webhook_delivery_queue_size: int = Field(
+        default=1000, ge=1, le=100000, description="Max hook events awaiting delivery"
+    )
+    webhook_delivery_workers: int = Field(
+        default=4, ge=1, le=64, description="Concurrent background delivery tasks"
+    )
+    webhook_delivery_max_batch_size: int = Field(
+        default=1,
+        ge=1,
+        le=100,
+        description=(
+            'Events per POST to the same URL; >1 sends {"events": [...]} '
+            "when several are queued"
+        ),
+    )
+    webhook_delivery_max_attempts: int = Field(
+        default=3, ge=1, le=10, description="Delivery attempts per batch"
+    )
+    webhook_delivery_retry_backoff_seconds: float = Field(
+        default=0.5,
+        ge=0,
+        le=60,
+        description="Delay before the first retry (doubles per attempt)",
+    )
+    webhook_delivery_overflow: Literal["drop_newest", "drop_oldest"] = Field(
+        default="drop_newest",
+        description="Which event to drop when the delivery queue is full",
+    )
+    webhook_delivery_drain_timeout_seconds: float = Field(
+        default=10.0,
+        ge=0,
+        le=300,
+        description="Max seconds to flush queued hook events on shutdown",
+    )
+
+    # Hook Decision Cache
+    hook_decision_cache_max_hooks: int = Field(
+        default=256,
+        ge=1,
+        le=100000,
+        description="PreToolUse hooks with cached decisions kept in memory (LRU)",
+    )
+    hook_decision_cache_redis: bool = Field(
+        default=False,
+        description="Share cached PreToolUse decisions across instances via Redis",
+    )
+
+    # JSON Encoding
+    json_codec: Literal["auto", "orjson", "stdlib"] = Field(
+        default="auto",
+        description=(
+            "JSON codec for cache, streaming and webhook payloads "
+            "(auto = orjson when installed, else stdlib)"
+        ),
+    )
 
     # Request Settings
     request_timeout: int = Field(
@@ -176,6 +377,164 @@ class Settings(BaseSettings):
         default=1024, ge=1, le=4096, description="Mem0 embedding dimensions"
     )
     mem0_agent_id: str = Field(default="main", description="Mem0 agent identifier")
+    memory_search_deadline_ms: int = Field(
+        default=500,
+        ge=1,
+        le=30000,
+        description=(
+            "Max time from query start to wait for memory search; the query "
+            "proceeds without memories after it"
+        ),
+    )
+    memory_context_placement: Literal["prompt", "system_prompt"] = Field(
+        default="prompt",
+        description=(
+            "Where retrieved memories are injected: 'prompt' prepends them to "
+            "the user message so the search overlaps SDK client startup; "
+            "'system_prompt' appends them to the system prompt, which must be "
+            "known before the client starts"
+        ),
+    )
+
+    memory_search_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        le=86400,
+        description=(
+            "Max age of a cached memory search; entries are also invalidated "
+            "by every memory write for the user (0 = disable caching)"
+        ),
+    )
+    memory_search_cache_max_entries: int = Field(
+        default=1024,
+        ge=1,
+        le=100000,
+        description="Memory searches kept in the search cache (LRU)",
+    )
+
+    # Memory Executor (dedicated thread pool for blocking mem0 calls)
+    memory_executor_threads: int = Field(
+        default=8, ge=1, le=128, description="Threads dedicated to mem0 calls"
+    )
+    memory_search_concurrency: int = Field(
+        default=4, ge=1, le=128, description="Max concurrent memory searches"
+    )
+    memory_add_concurrency: int = Field(
+        default=2, ge=1, le=128, description="Max concurrent memory extractions"
+    )
+    memory_read_concurrency: int = Field(
+        default=2, ge=1, le=128, description="Max concurrent memory list/get calls"
+    )
+    memory_delete_concurrency: int = Field(
+        default=2, ge=1, le=128, description="Max concurrent memory deletions"
+    )
+    memory_executor_max_queue_depth: int = Field(
+        default=32,
+        ge=0,
+        le=10000,
+        description=(
+            "Calls of one kind allowed to wait for a slot; beyond this they "
+            "fail fast (memory search is skipped for the query)"
+        ),
+    )
+
+    # Bulk Memory Ingestion (batched TEI embedding + Qdrant upsert)
+    memory_bulk_max_items: int = Field(
+        default=1000, ge=1, le=10000, description="Max memories per bulk request"
+    )
+    memory_bulk_embed_batch_size: int = Field(
+        default=32, ge=1, le=512, description="Texts per TEI embedding request"
+    )
+    memory_bulk_upsert_batch_size: int = Field(
+        default=256, ge=1, le=10000, description="Points per Qdrant upsert"
+    )
+    memory_bulk_concurrency: int = Field(
+        default=4, ge=1, le=64, description="Concurrent TEI embedding requests"
+    )
+    memory_bulk_timeout_seconds: float = Field(
+        default=30.0, ge=1, le=600, description="Timeout per TEI/Qdrant request"
+    )
+
+    # Background Memory Extraction
+    memory_extraction_async: bool = Field(
+        default=True,
+        description=(
+            "Extract memories in a Redis-backed background queue instead of "
+            "before the query stream completes"
+        ),
+    )
+    memory_extraction_workers: int = Field(
+        default=2, ge=1, le=32, description="Extraction worker tasks per instance"
+    )
+    memory_extraction_batch_size: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Max jobs claimed at once; jobs are grouped per user",
+    )
+    memory_extraction_max_attempts: int = Field(
+        default=3, ge=1, le=10, description="Attempts per job before dead-lettering"
+    )
+    memory_extraction_visibility_timeout_seconds: int = Field(
+        default=300,
+        ge=10,
+        le=3600,
+        description="Seconds a claimed job is hidden before it may be retried",
+    )
+    memory_extraction_poll_interval_seconds: float = Field(
+        default=1.0,
+        ge=0.05,
+        le=60,
+        description="Idle delay between checks for due extraction jobs",
+    )
+    memory_extraction_retry_backoff_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        le=3600,
+        description="Delay before the first retry (doubles per attempt)",
+    )
+    memory_extraction_drain_timeout_seconds: float = Field(
+        default=10.0,
+        ge=0,
+        le=300,
+        description="Max seconds to finish in-flight extractions on shutdown",
+    )
+
+    # Transcript Persistence
+    transcript_persistence_enabled: bool = Field(
+        default=True,
+        description="Persist streamed messages to session_messages (write-behind)",
+    )
+    transcript_buffer_size: int = Field(
+        default=1000,
+        ge=1,
+        le=100000,
+        description="Max transcript rows buffered before streams are slowed",
+    )
+    transcript_flush_batch_size: int = Field(
+        default=100, ge=1, le=5000, description="Max rows per multi-row INSERT"
+    )
+    transcript_flush_interval_ms: int = Field(
+        default=250,
+        ge=1,
+        le=60000,
+        description="Max delay between buffering a row and flushing its batch",
+    )
+    transcript_backpressure_timeout_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        le=300,
+        description="Max seconds a stream waits for buffer room before dropping a row",
+    )
+    transcript_max_attempts: int = Field(
+        default=3, ge=1, le=10, description="Write attempts per transcript batch"
+    )
+    transcript_drain_timeout_seconds: float = Field(
+        default=10.0,
+        ge=0,
+        le=300,
+        description="Max seconds to flush buffered transcript rows on shutdown",
+    )
 
     @model_validator(mode="after")
     def compute_redis_max_connections(self) -> "Settings":
@@ -17,6 +17,8 @@ from apps.api.config import Settings, get_settings
 from apps.api.exceptions import AuthenticationError, ServiceUnavailableError
 
 if TYPE_CHECKING:
+    from apps.api.adapters.memory_bulk import BulkMemoryIngestor
+    from apps.api.adapters.memory_executor import MemoryExecutor
     from apps.api.protocols import (
         AgentConfigProtocol,
         Cache,
@@ -24,7 +26,10 @@ if TYPE_CHECKING:
         SessionRepositoryProtocol,
     )
     from apps.api.protocols import AgentService as AgentServiceProtocol
+    from apps.api.services.admission import AdmissionController
     from apps.api.services.agent import AgentService
+    from apps.api.services.agent.client_pool import SdkClientPool
+    from apps.api.services.agent.interrupt_listener import InterruptListener
     from apps.api.services.assistants import (
         AssistantService,
         MessageService,
@@ -33,19 +38,27 @@ if TYPE_CHECKING:
     )
     from apps.api.services.checkpoint import CheckpointService
     from apps.api.services.health import CacheHealthService
+    from apps.api.services.hook_decision_cache import HookDecisionCache
+    from apps.api.services.mcp_config_cache import McpConfigCache
     from apps.api.services.mcp_config_injector import McpConfigInjector
     from apps.api.services.mcp_config_loader import McpConfigLoader
     from apps.api.services.mcp_discovery import McpDiscoveryService
     from apps.api.services.mcp_server_configs import McpServerConfigService
     from apps.api.services.mcp_share import McpShareService
     from apps.api.services.memory import MemoryService
+    from apps.api.services.memory_extraction import MemoryExtractionQueue
+    from apps.api.services.memory_search_cache import MemorySearchCache
     from apps.api.services.query_enrichment import QueryEnrichmentService
+    from apps.api.services.rate_limiter import RateLimiter
     from apps.api.services.session import SessionService
     from apps.api.services.shutdown import ShutdownManager
     from apps.api.services.skills import SkillsService
     from apps.api.services.skills_crud import SkillCrudService
     from apps.api.services.slash_commands import SlashCommandService
     from apps.api.services.tool_presets import ToolPresetService
+    from apps.api.services.transcript_recorder import TranscriptRecorder
+    from apps.api.services.webhook_delivery import WebhookDeliveryQueue
+    from apps.api.services.webhook_http import WebhookHttpPool
 
 
 @dataclass
@@ -61,6 +74,19 @@ class AppState:
         cache: Redis cache instance.
         agent_service: Optional singleton for tests (None = per-request).
         memory_service: Optional singleton for tests (None = cached).
+        sdk_client_pool: Warm pool of SDK clients (None = pooling disabled).
+        interrupt_listener: Pub/sub subscriber delivering session interrupts.
+        mcp_config_cache: Per-API-key MCP config merge cache (None = disabled).
+        webhook_http_pool: Shared HTTP connection pool for hook webhooks.
+        hook_decision_cache: Cache of opted-in PreToolUse webhook decisions.
+        webhook_delivery_queue: Background delivery for observational hooks.
+        memory_extraction_queue: Background worker pool for memory extraction.
+        memory_search_cache: Per-user memory search result cache.
+        memory_executor: Dedicated thread pool for blocking mem0 calls.
+        memory_bulk_ingestor: Batched TEI/Qdrant writer for bulk memory adds.
+        transcript_recorder: Write-behind persistence of streamed messages.
+        rate_limiter: Shared Redis GCRA limiter (None = slowapi backend).
+        admission_controller: Concurrency caps for agent queries.
     """
 
     engine: AsyncEngine | None = None
@@ -68,6 +94,19 @@ class AppState:
     cache: "Cache | None" = None
     agent_service: "AgentService | None" = None
     memory_service: "MemoryService | None" = field(default=None)
+    sdk_client_pool: "SdkClientPool | None" = None
+    interrupt_listener: "InterruptListener | None" = None
+    mcp_config_cache: "McpConfigCache | None" = None
+    webhook_http_pool: "WebhookHttpPool | None" = None
+    hook_decision_cache: "HookDecisionCache | None" = None
+    webhook_delivery_queue: "WebhookDeliveryQueue | None" = None
+    memory_extraction_queue: "MemoryExtractionQueue | None" = None
+    memory_search_cache: "MemorySearchCache | None" = None
+    memory_executor: "MemoryExecutor | None" = None
+    memory_bulk_ingestor: "BulkMemoryIngestor | None" = None
+    transcript_recorder: "TranscriptRecorder | None" = None
+    rate_limiter: "RateLimiter | None" = None
+    admission_controller: "AdmissionController | None" = None
 
 
 def get_app_state(request: Request) -> "AppState":
@@ -203,6 +242,433 @@ async def close_cache(state: "AppState") -> None:
         state.cache = None
 
 
+def init_sdk_client_pool(
+    state: "AppState", settings: Settings
+) -> "SdkClientPool | None":
+    """Initialize the warm SDK client pool if enabled.
+
+    Args:
+        state: Application state to store the pool.
+        settings: Application settings.
+
+    Returns:
+        SdkClientPool instance, or None if pooling is disabled.
+    """
+    if not settings.sdk_pool_enabled:
+        return None
+
+    from apps.api.services.agent.client_pool import SdkClientPool
+
+    state.sdk_client_pool = SdkClientPool(settings)
+    return state.sdk_client_pool
+
+
+async def close_sdk_client_pool(state: "AppState") -> None:
+    """Disconnect all pooled SDK clients.
+
+    Args:
+        state: Application state containing the pool to close.
+    """
+    if state.sdk_client_pool is not None:
+        await state.sdk_client_pool.close()
+        state.sdk_client_pool = None
+
+
+async def init_interrupt_listener(
+    state: "AppState", settings: Settings
+) -> "InterruptListener":
+    """Start the Redis pub/sub listener for session interrupts.
+
+    Args:
+        state: Application state with an initialized cache.
+        settings: Application settings.
+
+    Returns:
+        Running InterruptListener instance.
+
+    Raises:
+        RuntimeError: If the cache has not been initialized.
+    """
+    if state.cache is None:
+        raise RuntimeError("Cache must be initialized before interrupt listener")
+
+    from apps.api.services.agent.interrupt_listener import InterruptListener
+
+    state.interrupt_listener = InterruptListener(state.cache, settings)
+    await state.interrupt_listener.start()
+    return state.interrupt_listener
+
+
+async def init_assistant_indexes(state: "AppState") -> int:
+    """Backfill the assistant listing indexes from already cached assistants.
+
+    A no-op once the indexes are marked complete. Failures are logged and
+    left for the next startup rather than blocking this one.
+
+    Args:
+        state: Application state with an initialized cache.
+
+    Returns:
+        Number of assistants added to the indexes.
+
+    Raises:
+        RuntimeError: If the cache has not been initialized.
+    """
+    if state.cache is None:
+        raise RuntimeError("Cache must be initialized before assistant indexes")
+
+    import structlog
+
+    from apps.api.services.assistants import AssistantService
+
+    try:
+        return await AssistantService(cache=state.cache).backfill_indexes()
+    except Exception as exc:
+        structlog.get_logger(__name__).warning(
+            "assistant_index_backfill_failed", error=str(exc)
+        )
+        return 0
+
+
+async def close_interrupt_listener(state: "AppState") -> None:
+    """Stop the interrupt listener.
+
+    Args:
+        state: Application state containing the listener to stop.
+    """
+    if state.interrupt_listener is not None:
+        await state.interrupt_listener.close()
+        state.interrupt_listener = None
+
+
+def init_mcp_config_cache(
+    state: "AppState", settings: Settings
+) -> "McpConfigCache | None":
+    """Initialize the per-API-key MCP config cache if enabled.
+
+    Args:
+        state: Application state to store the cache.
+        settings: Application settings.
+
+    Returns:
+        McpConfigCache instance, or None if the TTL is 0.
+    """
+    if settings.mcp_config_cache_ttl_seconds == 0:
+        return None
+
+    from apps.api.services.mcp_config_cache import McpConfigCache
+
+    state.mcp_config_cache = McpConfigCache(
+        max_entries=settings.mcp_config_cache_max_entries,
+        ttl_seconds=settings.mcp_config_cache_ttl_seconds,
+    )
+    return state.mcp_config_cache
+
+
+def init_webhook_http_pool(state: "AppState", settings: Settings) -> "WebhookHttpPool":
+    """Create the shared HTTP connection pool for hook webhooks.
+
+    Args:
+        state: Application state to store the pool.
+        settings: Application settings.
+
+    Returns:
+        WebhookHttpPool instance.
+    """
+    from apps.api.services.webhook_http import WebhookHttpPool
+
+    state.webhook_http_pool = WebhookHttpPool.from_settings(settings)
+    return state.webhook_http_pool
+
+
+async def close_webhook_http_pool(state: "AppState") -> None:
+    """Close pooled webhook connections.
+
+    Args:
+        state: Application state containing the pool to close.
+    """
+    if state.webhook_http_pool is not None:
+        await state.webhook_http_pool.close()
+        state.webhook_http_pool = None
+
+
+def init_webhook_delivery_queue(
+    state: "AppState", settings: Settings
+) -> "WebhookDeliveryQueue | None":
+    """Start the background delivery queue for observational hooks.
+
+    Args:
+        state: Application state with an initialized webhook HTTP pool.
+        settings: Application settings.
+
+    Returns:
+        Running WebhookDeliveryQueue, or None if background delivery is disabled.
+
+    Raises:
+        RuntimeError: If the webhook HTTP pool has not been initialized.
+    """
+    if not settings.webhook_delivery_enabled:
+        return None
+    if state.webhook_http_pool is None:
+        raise RuntimeError("Webhook HTTP pool must be initialized before delivery")
+
+    from apps.api.services.webhook_delivery import WebhookDeliveryQueue
+
+    state.webhook_delivery_queue = WebhookDeliveryQueue.from_settings(
+        state.webhook_http_pool, settings
+    )
+    state.webhook_delivery_queue.start()
+    return state.webhook_delivery_queue
+
+
+async def close_webhook_delivery_queue(state: "AppState", settings: Settings) -> None:
+    """Flush queued hook events and stop the delivery workers.
+
+    Args:
+        state: Application state containing the queue to close.
+        settings: Application settings (drain timeout).
+    """
+    if state.webhook_delivery_queue is not None:
+        await state.webhook_delivery_queue.close(
+            timeout=settings.webhook_delivery_drain_timeout_seconds
+        )
+        state.webhook_delivery_queue = None
+
+
+def init_memory_executor(state: "AppState", settings: Settings) -> "MemoryExecutor":
+    """Create the dedicated thread pool for mem0 calls.
+
+    Args:
+        state: Application state to store the executor.
+        settings: Application settings.
+
+    Returns:
+        MemoryExecutor instance.
+    """
+    from apps.api.adapters.memory_executor import MemoryExecutor
+
+    state.memory_executor = MemoryExecutor.from_settings(settings)
+    return state.memory_executor
+
+
+def close_memory_executor(state: "AppState") -> None:
+    """Shut down the mem0 thread pool.
+
+    Args:
+        state: Application state containing the executor.
+    """
+    if state.memory_executor is not None:
+        state.memory_executor.shutdown()
+        state.memory_executor = None
+
+
+def init_memory_bulk_ingestor(
+    state: "AppState", settings: Settings
+) -> "BulkMemoryIngestor":
+    """Create the batched TEI/Qdrant writer for bulk memory ingestion.
+
+    Args:
+        state: Application state to store the ingestor.
+        settings: Application settings.
+
+    Returns:
+        BulkMemoryIngestor instance.
+    """
+    from apps.api.adapters.memory_bulk import BulkMemoryIngestor
+
+    state.memory_bulk_ingestor = BulkMemoryIngestor.from_settings(settings)
+    return state.memory_bulk_ingestor
+
+
+async def close_memory_bulk_ingestor(state: "AppState") -> None:
+    """Close the bulk ingestor's HTTP client.
+
+    Args:
+        state: Application state containing the ingestor.
+    """
+    if state.memory_bulk_ingestor is not None:
+        await state.memory_bulk_ingestor.close()
+        state.memory_bulk_ingestor = None
+
+
+def init_memory_search_cache(
+    state: "AppState", settings: Settings
+) -> "MemorySearchCache | None":
+    """Initialize the per-user memory search cache if enabled.
+
+    Args:
+        state: Application state with an optional cache for shared versions.
+        settings: Application settings.
+
+    Returns:
+        MemorySearchCache instance, or None if the TTL is 0.
+    """
+    if settings.memory_search_cache_ttl_seconds == 0:
+        return None
+
+    from apps.api.services.memory_search_cache import MemorySearchCache
+
+    state.memory_search_cache = MemorySearchCache(
+        max_entries=settings.memory_search_cache_max_entries,
+        ttl_seconds=settings.memory_search_cache_ttl_seconds,
+        versions=state.cache,
+    )
+    return state.memory_search_cache
+
+
+def init_memory_extraction_queue(
+    state: "AppState", settings: Settings
+) -> "MemoryExtractionQueue | None":
+    """Start the background memory extraction workers.
+
+    Args:
+        state: Application state with an initialized cache.
+        settings: Application settings.
+
+    Returns:
+        Running MemoryExtractionQueue, or None if extraction runs inline.
+
+    Raises:
+        RuntimeError: If the cache has not been initialized.
+    """
+    if not settings.memory_extraction_async:
+        return None
+    if state.cache is None:
+        raise RuntimeError("Cache must be initialized before memory extraction")
+
+    from apps.api.services.memory_extraction import MemoryExtractionQueue
+
+    state.memory_extraction_queue = MemoryExtractionQueue.from_settings(
+        state.cache, lambda: get_memory_service(state=state), settings
+    )
+    state.memory_extraction_queue.start()
+    return state.memory_extraction_queue
+
+
+async def close_memory_extraction_queue(state: "AppState", settings: Settings) -> None:
+    """Stop the extraction workers; unfinished jobs stay queued in Redis.
+
+    Args:
+        state: Application state containing the queue to close.
+        settings: Application settings (drain timeout).
+    """
+    if state.memory_extraction_queue is not None:
+        await state.memory_extraction_queue.close(
+            timeout=settings.memory_extraction_drain_timeout_seconds
+        )
+        state.memory_extraction_queue = None
+
+
+def init_transcript_recorder(
+    state: "AppState", settings: Settings
+) -> "TranscriptRecorder | None":
+    """Start the write-behind transcript recorder.
+
+    Args:
+        state: Application state with an initialized session maker.
+        settings: Application settings.
+
+    Returns:
+        Running TranscriptRecorder, or None if transcript persistence is disabled.
+
+    Raises:
+        RuntimeError: If the database has not been initialized.
+    """
+    if not settings.transcript_persistence_enabled:
+        return None
+    if state.session_maker is None:
+        raise RuntimeError("Database must be initialized before transcript recording")
+
+    from apps.api.services.transcript_recorder import TranscriptRecorder
+
+    state.transcript_recorder = TranscriptRecorder.from_settings(
+        state.session_maker, settings
+    )
+    state.transcript_recorder.start()
+    return state.transcript_recorder
+
+
+async def close_transcript_recorder(state: "AppState", settings: Settings) -> None:
+    """Flush buffered transcript rows and stop the recorder.
+
+    Args:
+        state: Application state containing the recorder to close.
+        settings: Application settings (drain timeout).
+    """
+    if state.transcript_recorder is not None:
+        await state.transcript_recorder.close(
+            timeout=settings.transcript_drain_timeout_seconds
+        )
+        state.transcript_recorder = None
+
+
+def init_rate_limiter(state: "AppState", settings: Settings) -> "RateLimiter | None":
+    """Initialize the shared Redis rate limiter if selected.
+
+    Args:
+        state: Application state with an initialized cache.
+        settings: Application settings.
+
+    Returns:
+        RateLimiter instance, or None if the slowapi backend is configured.
+
+    Raises:
+        RuntimeError: If the cache has not been initialized.
+    """
+    if settings.rate_limit_backend != "redis":
+        return None
+    if state.cache is None:
+        raise RuntimeError("Cache must be initialized before the rate limiter")
+
+    from apps.api.services.rate_limiter import RateLimiter
+
+    state.rate_limiter = RateLimiter.from_settings(state.cache, settings)
+    return state.rate_limiter
+
+
+def init_admission_controller(
+    state: "AppState", settings: Settings
+) -> "AdmissionController | None":
+    """Initialize query admission control if enabled.
+
+    Args:
+        state: Application state to store the controller.
+        settings: Application settings.
+
+    Returns:
+        AdmissionController instance, or None if admission control is off.
+    """
+    if not settings.query_admission_enabled:
+        return None
+
+    from apps.api.services.admission import AdmissionController
+
+    state.admission_controller = AdmissionController.from_settings(settings)
+    return state.admission_controller
+
+
+def init_hook_decision_cache(
+    state: "AppState", settings: Settings
+) -> "HookDecisionCache":
+    """Initialize the PreToolUse webhook decision cache.
+
+    Args:
+        state: Application state to store the cache (and, when Redis backing
+            is enabled, holding an initialized cache).
+        settings: Application settings.
+
+    Returns:
+        HookDecisionCache instance.
+    """
+    from apps.api.services.hook_decision_cache import HookDecisionCache
+
+    state.hook_decision_cache = HookDecisionCache(
+        max_hooks=settings.hook_decision_cache_max_hooks,
+        redis=state.cache if settings.hook_decision_cache_redis else None,
+    )
+    return state.hook_decision_cache
+
+
 async def get_db(
     state: Annotated["AppState", Depends(get_app_state)],
 ) -> AsyncGenerator[AsyncSession, None]:
@@ -347,6 +813,7 @@ async def get_agent_service(
         config_loader=loader,
         config_service=config_service,
         validator=validator,
+        cache=state.mcp_config_cache,
     )
 
     # Get memory service
@@ -354,11 +821,19 @@ async def get_agent_service(
 
     # Build config object
     config = AgentServiceConfig(
-        webhook_service=WebhookService(),
+        webhook_service=WebhookService(
+            http_pool=state.webhook_http_pool,
+            decision_cache=state.hook_decision_cache,
+            delivery_queue=state.webhook_delivery_queue,
+        ),
         checkpoint_service=checkpoint_service,
         cache=cache,
         mcp_config_injector=config_injector,
         memory_service=memory_service,
+        memory_extraction_queue=state.memory_extraction_queue,
+        client_pool=state.sdk_client_pool,
+        interrupt_listener=state.interrupt_listener,
+        transcript_recorder=state.transcript_recorder,
     )
 
     # Otherwise create new instance per request with config
@@ -383,6 +858,46 @@ async def get_session_service(
     return SessionService(cache=cache, db_repo=db_repo)
 
 
+async def admit_query(
+    state: Annotated["AppState", Depends(get_app_state)],
+    api_key: Annotated[str, Depends(verify_api_key)],
+) -> AsyncGenerator[None, None]:
+    """Hold an admission slot for an agent query.
+
+    The slot is released when the response has been sent, so streaming
+    queries keep it for the whole stream.
+
+    Args:
+        state: Application state containing the admission controller.
+        api_key: Validated API key the query runs under.
+
+    Yields:
+        None once the query is admitted.
+
+    Raises:
+        QueryRejectedError: If the query is shed.
+    """
+    if state.admission_controller is None:
+        yield
+        return
+    async with state.admission_controller.slot(api_key):
+        yield
+
+
+def get_admission_controller(
+    state: Annotated["AppState", Depends(get_app_state)],
+) -> "AdmissionController | None":
+    """Get the query admission controller.
+
+    Args:
+        state: Application state containing the admission controller.
+
+    Returns:
+        AdmissionController, or None if admission control is off.
+    """
+    return state.admission_controller
+
+
 def check_shutdown_state() -> "ShutdownManager":
     """Check if service is accepting new requests (T131).
 
@@ -468,6 +983,7 @@ async def get_mcp_server_config_service_provider(
 
 
 async def get_mcp_config_injector(
+    state: Annotated["AppState", Depends(get_app_state)],
     loader: Annotated["McpConfigLoader", Depends(get_mcp_config_loader)],
     config_service: Annotated[
         "McpServerConfigService", Depends(get_mcp_server_config_service_provider)
@@ -476,6 +992,7 @@ async def get_mcp_config_injector(
     """Get MCP config injector instance.
 
     Args:
+        state: Application state holding the shared MCP config cache.
         loader: MCP config loader from dependency injection.
         config_service: MCP server config service from dependency injection.
 
@@ -490,6 +1007,7 @@ async def get_mcp_config_injector(
         config_loader=loader,
         config_service=config_service,
         validator=validator,
+        cache=state.mcp_config_cache,
     )
 
 
@@ -520,8 +1038,12 @@ async def get_memory_service(
 
     # Create and cache on first use
     settings = get_settings()
-    adapter = Mem0MemoryAdapter(settings)
-    memory_service = MemoryService(adapter)
+    adapter = Mem0MemoryAdapter(settings, executor=state.memory_executor)
+    memory_service = MemoryService(
+        adapter,
+        search_cache=state.memory_search_cache,
+        bulk_ingestor=state.memory_bulk_ingestor,
+    )
 
     # Cache on state for subsequent requests
     state.memory_service = memory_service
@@ -703,6 +1225,7 @@ SessionSvc = Annotated["SessionService", Depends(get_session_service)]
 CheckpointSvc = Annotated["CheckpointService", Depends(get_checkpoint_service)]
 SkillsSvc = Annotated["SkillsService", Depends(get_skills_service)]
 ShutdownState = Annotated["ShutdownManager", Depends(check_shutdown_state)]
+QueryAdmission = Annotated[None, Depends(admit_query)]
 QueryEnrichment = Annotated[
     "QueryEnrichmentService", Depends(get_query_enrichment_service)
 ]
@@ -7,6 +7,7 @@ Import from this module or submodules as needed.
 from apps.api.exceptions.agent import (
     AgentError,
     HookError,
+    QueryRejectedError,
     ToolNotAllowedError,
 )
 from apps.api.exceptions.assistant import AssistantNotFoundError
@@ -26,7 +27,11 @@ from apps.api.exceptions.infra import (
     ServiceUnavailableError,
 )
 from apps.api.exceptions.mcp import McpShareNotFoundError
-from apps.api.exceptions.memory import MemoryNotFoundError
+from apps.api.exceptions.memory import (
+    MemoryBusyError,
+    MemoryIngestionError,
+    MemoryNotFoundError,
+)
 from apps.api.exceptions.session import (
     SessionCompletedError,
     SessionLockedError,
@@ -49,7 +54,10 @@ __all__ = [
     "HookError",
     "InvalidCheckpointError",
     "McpShareNotFoundError",
+    "MemoryBusyError",
+    "MemoryIngestionError",
     "MemoryNotFoundError",
+    "QueryRejectedError",
     "RateLimitError",
     "RequestTimeoutError",
     "ServiceUnavailableError",
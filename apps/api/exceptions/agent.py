@@ -67,3 +67,47 @@ class HookError(APIError):
             status_code=502,
             details=details,
         )
+
+
+class QueryRejectedError(APIError):
+    """Raised when admission control sheds an agent query."""
+
+    def __init__(
+        self,
+        *,
+        key_limited: bool,
+        in_flight: int,
+        limit: int,
+        queue_position: int,
+        queue_depth: int,
+    ) -> None:
+        """Initialize query rejected error.
+
+        Args:
+            key_limited: True if the caller's API key is at its concurrency
+                cap (429), False if the whole instance is (503).
+            in_flight: Queries running for the key, or on the instance.
+            limit: Concurrency cap that was reached.
+            queue_position: Position the query held or would have held
+                in the wait queue.
+            queue_depth: Queries waiting when the query was shed.
+        """
+        if key_limited:
+            message = f"Too many concurrent queries for this API key (limit {limit})"
+            code = "CONCURRENCY_LIMIT_EXCEEDED"
+            status_code = 429
+        else:
+            message = "Server is at query capacity, retry later"
+            code = "SERVER_OVERLOADED"
+            status_code = 503
+        super().__init__(
+            message=message,
+            code=code,
+            status_code=status_code,
+            details={
+                "in_flight": in_flight,
+                "limit": limit,
+                "queue_position": queue_position,
+                "queue_depth": queue_depth,
+            },
+        )
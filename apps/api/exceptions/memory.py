@@ -20,3 +20,38 @@ class MemoryNotFoundError(APIError):
             status_code=404,
             details={"memory_id": memory_id},
         )
+
+
+class MemoryBusyError(APIError):
+    """Raised when memory operations are shed because their queue is full."""
+
+    def __init__(self, operation: str) -> None:
+        """Initialize memory busy error.
+
+        Args:
+            operation: Memory operation kind that was rejected.
+        """
+        super().__init__(
+            message=f"Memory service is busy ({operation} queue full)",
+            code="MEMORY_BUSY",
+            status_code=503,
+            details={"operation": operation},
+        )
+
+
+class MemoryIngestionError(APIError):
+    """Raised when a bulk memory ingestion fails part-way."""
+
+    def __init__(self, message: str, ingested: int) -> None:
+        """Initialize memory ingestion error.
+
+        Args:
+            message: Underlying TEI or Qdrant error.
+            ingested: Memories stored before the failure.
+        """
+        super().__init__(
+            message=f"Bulk memory ingestion failed: {message}",
+            code="MEMORY_INGESTION_FAILED",
+            status_code=502,
+            details={"ingested": ingested},
+        )
@@ -11,13 +11,44 @@ from packaging.version import parse as parse_version
 
 from apps.api import __version__
 from apps.api.config import get_settings
-from apps.api.dependencies import AppState, close_cache, close_db, init_cache, init_db
+from apps.api.dependencies import (
+    AppState,
+    close_cache,
+    close_db,
+    close_interrupt_listener,
+    close_memory_bulk_ingestor,
+    close_memory_executor,
+    close_memory_extraction_queue,
+    close_sdk_client_pool,
+    close_transcript_recorder,
+    close_webhook_delivery_queue,
+    close_webhook_http_pool,
+    init_admission_controller,
+    init_assistant_indexes,
+    init_cache,
+    init_db,
+    init_hook_decision_cache,
+    init_interrupt_listener,
+    init_mcp_config_cache,
+    init_memory_bulk_ingestor,
+    init_memory_executor,
+    init_memory_extraction_queue,
+    init_memory_search_cache,
+    init_rate_limiter,
+    init_sdk_client_pool,
+    init_transcript_recorder,
+    init_webhook_delivery_queue,
+    init_webhook_http_pool,
+)
 from apps.api.exception_handlers import register_exception_handlers
 from apps.api.middleware.auth import ApiKeyAuthMiddleware
 from apps.api.middleware.correlation import CorrelationIdMiddleware
 from apps.api.middleware.logging import RequestLoggingMiddleware, configure_logging
 from apps.api.middleware.openai_auth import BearerAuthMiddleware
-from apps.api.middleware.ratelimit import configure_rate_limiting
+from apps.api.middleware.ratelimit import (
+    RateLimitMiddleware,
+    configure_rate_limiting,
+)
 from apps.api.routes import (
     agents,
     checkpoints,
@@ -39,6 +70,7 @@ from apps.api.routes.openai import chat as openai_chat
 from apps.api.routes.openai import models as openai_models
 from apps.api.routes.openai import threads as openai_threads
 from apps.api.services.shutdown import get_shutdown_manager, reset_shutdown_manager
+from apps.api.utils.json_codec import get_json_codec
 
 logger = structlog.get_logger(__name__)
 
@@ -155,13 +187,58 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
             tei_api_key="<redacted>" if settings.tei_api_key else "<unset>",
         )
 
+    # Resolve the JSON codec up front so a missing orjson fails fast
+    json_codec = get_json_codec(settings)
+
     # Initialize database
     await init_db(app_state, settings)
 
     # Initialize cache
     await init_cache(app_state, settings)
 
-    logger.info("Application started", version=__version__)
+    # Index assistants cached before the listing indexes existed
+    await init_assistant_indexes(app_state)
+
+    # Enforce rate limits across instances (RATE_LIMIT_BACKEND=redis)
+    init_rate_limiter(app_state, settings)
+
+    # Cap concurrently running agent queries
+    init_admission_controller(app_state, settings)
+
+    # Initialize warm SDK client pool (disabled unless SDK_POOL_ENABLED=true)
+    init_sdk_client_pool(app_state, settings)
+
+    # Cache merged MCP configs per API key (disabled when TTL is 0)
+    init_mcp_config_cache(app_state, settings)
+
+    # Subscribe to pushed session interrupts
+    await init_interrupt_listener(app_state, settings)
+
+    # Share keep-alive webhook connections across hook calls
+    init_webhook_http_pool(app_state, settings)
+
+    # Deliver PostToolUse/Stop/SubagentStop hooks off the request path
+    init_webhook_delivery_queue(app_state, settings)
+
+    # Reuse opted-in PreToolUse webhook decisions
+    init_hook_decision_cache(app_state, settings)
+
+    # Run mem0 calls in their own bounded thread pool
+    init_memory_executor(app_state, settings)
+
+    # Batched TEI/Qdrant writes for bulk memory ingestion
+    init_memory_bulk_ingestor(app_state, settings)
+
+    # Reuse memory searches until the user's memories change
+    init_memory_search_cache(app_state, settings)
+
+    # Extract memories off the query stream
+    init_memory_extraction_queue(app_state, settings)
+
+    # Persist streamed messages to session_messages in batches
+    init_transcript_recorder(app_state, settings)
+
+    logger.info("Application started", version=__version__, json_codec=json_codec.name)
 
     yield
 
@@ -174,6 +251,14 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     await shutdown_manager.wait_for_sessions(timeout=30)
 
     # Cleanup resources
+    await close_sdk_client_pool(app_state)
+    await close_webhook_delivery_queue(app_state, settings)
+    await close_webhook_http_pool(app_state)
+    await close_memory_extraction_queue(app_state, settings)
+    await close_transcript_recorder(app_state, settings)
+    close_memory_executor(app_state)
+    await close_memory_bulk_ingestor(app_state)
+    await close_interrupt_listener(app_state)
     await close_cache(app_state)
     await close_db(app_state)
 
@@ -201,6 +286,7 @@ def create_app() -> FastAPI:
     # Reverse order so auth runs first, then correlation, then logging, then CORS.
     # Cast to protocol to satisfy type checker (FastAPI's stubs use ParamSpec which is incompatible).
     add_middleware = cast("_AddMiddlewareCallable", app.add_middleware)
+    add_middleware(RateLimitMiddleware)
     add_middleware(ApiKeyAuthMiddleware)
     add_middleware(BearerAuthMiddleware)
     add_middleware(CorrelationIdMiddleware)
@@ -1,13 +1,28 @@
-"""Rate limiting middleware using slowapi (T124)."""
+"""Rate limiting middleware using slowapi (T124) or a shared Redis GCRA."""
+
+from typing import TYPE_CHECKING
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import Response as StarletteResponse
 
 from apps.api.config import get_settings
+from apps.api.middleware.auth import PUBLIC_PATH_PREFIXES, PUBLIC_PATHS
+from apps.api.utils.crypto import hash_api_key
+
+if TYPE_CHECKING:
+    from apps.api.services.rate_limiter import (
+        RateLimitDecision,
+        RateLimiter,
+        RateLimitScope,
+    )
+
+QUERY_PATH_PREFIXES = ("/api/v1/query", "/v1/chat/completions")
+SESSION_PATH_PREFIXES = ("/api/v1/sessions",)
 
 
 def get_client_ip(request: Request) -> str:
@@ -57,6 +72,39 @@ def get_api_key(request: Request) -> str:
     return get_client_ip(request)
 
 
+def get_rate_limit_client_id(request: Request) -> str:
+    """Get the identity a shared rate limit bucket is keyed by.
+
+    Unlike get_api_key, the API key is hashed so raw keys never reach Redis.
+
+    Args:
+        request: FastAPI request object.
+
+    Returns:
+        Hashed API key, or client IP address when no key is sent.
+    """
+    api_key = request.headers.get("X-API-Key")
+    if api_key:
+        return f"key:{hash_api_key(api_key)}"
+    return f"ip:{get_client_ip(request)}"
+
+
+def classify_path(path: str) -> "RateLimitScope":
+    """Map a request path to the limit that applies to it.
+
+    Args:
+        path: Request URL path.
+
+    Returns:
+        "query", "session" or "general".
+    """
+    if path.startswith(QUERY_PATH_PREFIXES):
+        return "query"
+    if path.startswith(SESSION_PATH_PREFIXES):
+        return "session"
+    return "general"
+
+
 # Create limiter with API key-based identification
 limiter = Limiter(key_func=get_api_key)
 
@@ -90,6 +138,76 @@ async def rate_limit_handler(_request: Request, exc: Exception) -> StarletteResp
     )
 
 
+def _rate_limit_headers(decision: "RateLimitDecision") -> dict[str, str]:
+    headers = {
+        "X-RateLimit-Limit": str(decision.limit),
+        "X-RateLimit-Remaining": str(decision.remaining),
+        "X-RateLimit-Reset": str(decision.reset_after_seconds),
+    }
+    if not decision.allowed:
+        headers["Retry-After"] = str(decision.retry_after_seconds)
+    return headers
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """Enforce shared Redis GCRA limits and report X-RateLimit-* headers.
+
+    A no-op unless the app state carries a rate limiter
+    (RATE_LIMIT_BACKEND=redis).
+    """
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> StarletteResponse:
+        """Check the caller's limit before handling the request.
+
+        Args:
+            request: Incoming request.
+            call_next: Next middleware/handler.
+
+        Returns:
+            Response with rate limit headers, or 429 when limited.
+        """
+        app_state = getattr(request.app.state, "app_state", None)
+        rate_limiter: RateLimiter | None = getattr(app_state, "rate_limiter", None)
+        path = request.url.path
+        if (
+            rate_limiter is None
+            or request.method == "OPTIONS"
+            or path in PUBLIC_PATHS
+            or path.startswith(PUBLIC_PATH_PREFIXES)
+        ):
+            return await call_next(request)
+
+        decision = await rate_limiter.acquire(
+            classify_path(path), get_rate_limit_client_id(request)
+        )
+        if decision is None:
+            return await call_next(request)
+
+        headers = _rate_limit_headers(decision)
+        if not decision.allowed:
+            return JSONResponse(
+                status_code=429,
+                content={
+                    "error": {
+                        "code": "RATE_LIMIT_EXCEEDED",
+                        "message": (
+                            f"Rate limit exceeded: {decision.limit} per 1 minute"
+                        ),
+                        "details": {"retry_after": decision.retry_after_seconds},
+                    }
+                },
+                headers=headers,
+            )
+
+        response = await call_next(request)
+        response.headers.update(headers)
+        return response
+
+
 def configure_rate_limiting(app: FastAPI) -> None:
     """Configure rate limiting for the FastAPI application.
 
@@ -106,6 +106,12 @@ class Session(Base):
             postgresql_where=parent_session_id.isnot(None),
         ),
         Index("idx_sessions_owner_api_key_hash", owner_api_key_hash),
+        Index(
+            "idx_sessions_owner_created",
+            owner_api_key_hash,
+            created_at.desc(),
+            id.desc(),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -142,7 +148,10 @@ class SessionMessage(Base):
         back_populates="messages",
     )
 
-    __table_args__ = (Index("idx_messages_created_at", created_at),)
+    __table_args__ = (
+        Index("idx_messages_created_at", created_at),
+        Index("idx_messages_session_created", session_id, created_at, id),
+    )
 
     def __repr__(self) -> str:
         """String representation."""
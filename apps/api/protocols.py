@@ -7,6 +7,7 @@ from apps.api.types import JsonValue
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+    from contextlib import AbstractAsyncContextManager
 
     from apps.api.models.session import Checkpoint, Session, SessionMessage
     from apps.api.schemas.openai.requests import ChatCompletionRequest
@@ -16,10 +17,11 @@ if TYPE_CHECKING:
     )
     from apps.api.schemas.requests.query import QueryRequest
     from apps.api.schemas.responses import SingleQueryResponse
-    from apps.api.services.agent import QueryResponseDict
+    from apps.api.services.agent import QueryResponseDict, StreamEvent
     from apps.api.services.commands import CommandsService
     from apps.api.services.memory import MemoryService
     from apps.api.types import AgentMessage
+    from apps.api.utils.pagination import KeysetCursor
 
 
 class MemorySearchResult(TypedDict):
@@ -233,6 +235,41 @@ class SessionRepositoryProtocol(Protocol):
         """
         ...
 
+    async def list_sessions_keyset(
+        self,
+        owner_api_key: str | None = None,
+        limit: int = 50,
+        *,
+        after: "KeysetCursor | None" = None,
+        include_total: bool = False,
+        status: str | None = None,
+        filter_by_owner_or_public: bool = False,
+        mode: str | None = None,
+        project_id: str | None = None,
+        tags: list[str] | None = None,
+        search: str | None = None,
+    ) -> tuple["Sequence[Session]", bool, int | None]:
+        """List sessions newest first, seeking past a (created_at, id) cursor.
+
+        Args:
+            owner_api_key: Filter by owner API key (exact match).
+            limit: Maximum results.
+            after: Sort key of the last session on the previous page.
+            include_total: Run the filtered count(*) query as well.
+            status: Filter by status.
+            filter_by_owner_or_public: If True, returns sessions where
+                owner_api_key is NULL (public) OR matches the provided key.
+            mode: Filter by session mode (JSONB metadata.mode field).
+            project_id: Filter by project ID (JSONB metadata.project_id field).
+            tags: Filter by tags (JSONB metadata.tags array - must contain ALL tags).
+            search: Filter by title substring (JSONB metadata.title field).
+
+        Returns:
+            Tuple of session list, whether more sessions follow, and the total
+            count (None unless include_total).
+        """
+        ...
+
     async def add_message(
         self,
         session_id: UUID,
@@ -251,6 +288,17 @@ class SessionRepositoryProtocol(Protocol):
         """
         ...
 
+    async def add_messages(self, messages: "Sequence[dict[str, object]]") -> int:
+        """Insert many messages with batched multi-row INSERTs.
+
+        Args:
+            messages: Rows with session_id, message_type, content and created_at.
+
+        Returns:
+            Number of rows inserted.
+        """
+        ...
+
     async def get_messages(
         self,
         session_id: UUID,
@@ -267,6 +315,44 @@ class SessionRepositoryProtocol(Protocol):
         """
         ...
 
+    async def list_messages_keyset(
+        self,
+        session_id: UUID,
+        limit: int = 100,
+        *,
+        after: "KeysetCursor | None" = None,
+    ) -> tuple["Sequence[SessionMessage]", bool]:
+        """List a session's messages oldest first, seeking past a cursor.
+
+        Args:
+            session_id: Session identifier.
+            limit: Maximum results.
+            after: Sort key of the last message on the previous page.
+
+        Returns:
+            Tuple of message list and whether more messages follow.
+        """
+        ...
+
+    def stream_messages(
+        self,
+        session_id: UUID,
+        *,
+        after: "KeysetCursor | None" = None,
+        batch_size: int = 500,
+    ) -> "AsyncIterator[SessionMessage]":
+        """Stream a session's messages oldest first through a server-side cursor.
+
+        Args:
+            session_id: Session identifier.
+            after: Sort key of the last message already read.
+            batch_size: Rows fetched per round-trip.
+
+        Returns:
+            Async iterator over messages in (created_at, id) order.
+        """
+        ...
+
     async def add_checkpoint(
         self,
         session_id: UUID,
@@ -324,6 +410,130 @@ class SessionRepositoryProtocol(Protocol):
         ...
 
 
+class RateLimitGrant(TypedDict):
+    """Outcome of one GCRA token claim against a shared rate limit key."""
+
+    granted: int
+    remaining: int
+    retry_after_ms: int
+    reset_after_ms: int
+
+
+class CachePipeline(Protocol):
+    """Batch of cache writes sent to the server in one round-trip.
+
+    Commands are queued synchronously and nothing is sent until execute().
+    """
+
+    def cache_set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Queue setting a string value.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl: Time to live in seconds.
+        """
+        ...
+
+    def set_json(
+        self,
+        key: str,
+        value: dict[str, "JsonValue"],
+        ttl: int | None = None,
+    ) -> None:
+        """Queue setting a JSON value.
+
+        Args:
+            key: Cache key.
+            value: Dict to cache as JSON.
+            ttl: Time to live in seconds.
+        """
+        ...
+
+    def delete(self, key: str) -> None:
+        """Queue deleting a key.
+
+        Args:
+            key: Cache key.
+        """
+        ...
+
+    def expire(self, key: str, ttl: int) -> None:
+        """Queue setting expiration on a key.
+
+        Args:
+            key: Cache key.
+            ttl: Time to live in seconds.
+        """
+        ...
+
+    def incr(self, key: str) -> None:
+        """Queue incrementing a counter.
+
+        Args:
+            key: Counter key.
+        """
+        ...
+
+    def add_to_set(self, key: str, value: str) -> None:
+        """Queue adding a value to a set.
+
+        Args:
+            key: Set key.
+            value: Value to add.
+        """
+        ...
+
+    def remove_from_set(self, key: str, value: str) -> None:
+        """Queue removing a value from a set.
+
+        Args:
+            key: Set key.
+            value: Value to remove.
+        """
+        ...
+
+    def add_to_sorted_set(self, key: str, member: str, score: float) -> None:
+        """Queue adding or re-scoring a sorted set member.
+
+        Args:
+            key: Sorted set key.
+            member: Member to add.
+            score: Sort score.
+        """
+        ...
+
+    def remove_from_sorted_set(self, key: str, *members: str) -> None:
+        """Queue removing members from a sorted set.
+
+        Args:
+            key: Sorted set key.
+            *members: Members to remove.
+        """
+        ...
+
+    def remove_from_sorted_set_by_score(
+        self, key: str, min_score: float | str, max_score: float | str
+    ) -> None:
+        """Queue removing sorted set members within a score range.
+
+        Args:
+            key: Sorted set key.
+            min_score: Lower score bound ("-inf" or "(" prefix allowed).
+            max_score: Upper score bound.
+        """
+        ...
+
+    async def execute(self) -> list[object]:
+        """Send all queued commands in one round-trip.
+
+        Returns:
+            One result per queued command, in order, with the same value the
+            equivalent Cache method returns (e.g. bool for delete).
+        """
+        ...
+
+
 @runtime_checkable
 class Cache(Protocol):
     """Protocol for caching operations."""
@@ -386,6 +596,158 @@ class Cache(Protocol):
         """
         ...
 
+    async def add_to_sorted_set(self, key: str, member: str, score: float) -> bool:
+        """Add or re-score a member of a sorted set.
+
+        Args:
+            key: Sorted set key.
+            member: Member to add.
+            score: Sort score.
+
+        Returns:
+            True if the member was newly added.
+        """
+        ...
+
+    async def remove_from_sorted_set(self, key: str, *members: str) -> int:
+        """Remove members from a sorted set.
+
+        Args:
+            key: Sorted set key.
+            *members: Members to remove.
+
+        Returns:
+            Number of members removed.
+        """
+        ...
+
+    async def remove_from_sorted_set_by_score(
+        self, key: str, min_score: float | str, max_score: float | str
+    ) -> int:
+        """Remove sorted set members within a score range.
+
+        Args:
+            key: Sorted set key.
+            min_score: Lower score bound ("-inf" or "(" prefix allowed).
+            max_score: Upper score bound.
+
+        Returns:
+            Number of members removed.
+        """
+        ...
+
+    async def sorted_set_rank(
+        self,
+        key: str,
+        member: str,
+        *,
+        descending: bool = False,
+    ) -> int | None:
+        """Get a member's 0-based position in a sorted set.
+
+        Args:
+            key: Sorted set key.
+            member: Member to locate.
+            descending: Rank by descending score.
+
+        Returns:
+            Rank, or None if the member is absent.
+        """
+        ...
+
+    async def sorted_set_range(
+        self,
+        key: str,
+        start: int,
+        stop: int,
+        *,
+        descending: bool = False,
+    ) -> list[str]:
+        """Get members of a sorted set by rank range (inclusive).
+
+        Args:
+            key: Sorted set key.
+            start: First rank.
+            stop: Last rank (-1 for the end).
+            descending: Order by descending score.
+
+        Returns:
+            Members in rank order.
+        """
+        ...
+
+    async def sorted_set_score(self, key: str, member: str) -> float | None:
+        """Get a member's score in a sorted set.
+
+        Args:
+            key: Sorted set key.
+            member: Member to look up.
+
+        Returns:
+            Score, or None if the member is absent.
+        """
+        ...
+
+    async def sorted_set_range_by_score(
+        self,
+        key: str,
+        min_score: float | str,
+        max_score: float | str,
+        *,
+        descending: bool = False,
+        count: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """Get members of a sorted set within a score range, with scores.
+
+        Args:
+            key: Sorted set key.
+            min_score: Lower score bound ("-inf", "+inf" or "(" prefix allowed).
+            max_score: Upper score bound.
+            descending: Order by descending score.
+            count: Maximum members to return (None for all).
+
+        Returns:
+            (member, score) pairs in range order.
+        """
+        ...
+
+    async def incr(self, key: str) -> int:
+        """Increment a counter.
+
+        Args:
+            key: Counter key.
+
+        Returns:
+            New counter value.
+        """
+        ...
+
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish a message to a pub/sub channel.
+
+        Args:
+            channel: Channel name.
+            message: Message payload.
+
+        Returns:
+            Number of subscribers that received the message.
+        """
+        ...
+
+    def subscribe(
+        self, channel: str
+    ) -> "AbstractAsyncContextManager[AsyncIterator[str]]":
+        """Subscribe to a pub/sub channel.
+
+        Args:
+            channel: Channel name.
+
+        Returns:
+            Async context manager yielding an iterator of message payloads.
+            The subscription is active once the context is entered.
+        """
+        ...
+
     async def add_to_set(self, key: str, value: str) -> bool:
         """Add value to a set.
 
@@ -448,6 +810,22 @@ class Cache(Protocol):
         """
         ...
 
+    async def gcra_acquire(
+        self, key: str, emission_interval_ms: int, burst: int, requested: int = 1
+    ) -> RateLimitGrant:
+        """Atomically claim up to ``requested`` tokens from a GCRA bucket.
+
+        Args:
+            key: Rate limit key.
+            emission_interval_ms: Milliseconds between token refills.
+            burst: Max tokens available at once.
+            requested: Tokens wanted; fewer are granted if the bucket is short.
+
+        Returns:
+            Tokens granted, tokens left and the retry/reset delays.
+        """
+        ...
+
     async def ping(self) -> bool:
         """Check cache connectivity.
 
@@ -524,6 +902,17 @@ class Cache(Protocol):
         """
         ...
 
+    def pipeline(self, *, transaction: bool = True) -> CachePipeline:
+        """Start a batch of writes executed in one round-trip.
+
+        Args:
+            transaction: Apply the batch atomically (MULTI/EXEC).
+
+        Returns:
+            Empty pipeline; queue commands then await execute().
+        """
+        ...
+
     async def close(self) -> None:
         """Close cache connection and clean up resources.
 
@@ -581,7 +970,7 @@ class AgentService(Protocol):
 
     def query_stream(
         self, request: "QueryRequest", api_key: str = ""
-    ) -> "AsyncGenerator[dict[str, str], None]":
+    ) -> "AsyncGenerator[StreamEvent, None]":
         """Stream a query to the agent."""
         ...
 
@@ -1,12 +1,12 @@
 """Health check endpoints."""
 
-from typing import Literal
+from typing import Annotated, Literal
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from sqlalchemy import text
 
-from apps.api.dependencies import CacheHealthSvc, DbSession
+from apps.api.dependencies import AppState, CacheHealthSvc, DbSession, get_app_state
 
 router = APIRouter(tags=["Health"])
 
@@ -27,6 +27,23 @@ class HealthResponse(BaseModel):
     dependencies: dict[str, DependencyStatus]
 
 
+class MetricsResponse(BaseModel):
+    """In-process performance metrics snapshot."""
+
+    sdk_client_pool: dict[str, float | int | bool] | None = None
+    command_cache: dict[str, int] | None = None
+    mcp_config_cache: dict[str, int] | None = None
+    webhook_http: dict[str, object] | None = None
+    hook_decision_cache: dict[str, int] | None = None
+    webhook_delivery: dict[str, int] | None = None
+    memory_extraction: dict[str, int] | None = None
+    memory_search_cache: dict[str, int] | None = None
+    memory_executor: dict[str, object] | None = None
+    transcript_recorder: dict[str, int] | None = None
+    rate_limiter: dict[str, object] | None = None
+    admission: dict[str, int] | None = None
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check(
     db: DbSession,
@@ -97,6 +114,60 @@ async def health_check(
     )
 
 
+@router.get("/metrics", response_model=MetricsResponse)
+async def metrics(
+    state: Annotated[AppState, Depends(get_app_state)],
+) -> MetricsResponse:
+    """Get in-process performance metrics for this instance.
+
+    Returns:
+        Metrics for optional subsystems (None when a subsystem is disabled).
+    """
+    from apps.api.services.commands import get_command_cache
+
+    pool = state.sdk_client_pool
+    mcp_cache = state.mcp_config_cache
+    webhook_pool = state.webhook_http_pool
+    decision_cache = state.hook_decision_cache
+    delivery_queue = state.webhook_delivery_queue
+    extraction_queue = state.memory_extraction_queue
+    search_cache = state.memory_search_cache
+    memory_executor = state.memory_executor
+    transcript_recorder = state.transcript_recorder
+    rate_limiter = state.rate_limiter
+    admission = state.admission_controller
+    return MetricsResponse(
+        sdk_client_pool=dict(pool.metrics()) if pool is not None else None,
+        command_cache=dict(get_command_cache().metrics()),
+        mcp_config_cache=dict(mcp_cache.metrics()) if mcp_cache is not None else None,
+        webhook_http=(
+            dict(webhook_pool.metrics()) if webhook_pool is not None else None
+        ),
+        hook_decision_cache=(
+            dict(decision_cache.metrics()) if decision_cache is not None else None
+        ),
+        webhook_delivery=(
+            dict(delivery_queue.metrics()) if delivery_queue is not None else None
+        ),
+        memory_extraction=(
+            dict(extraction_queue.metrics()) if extraction_queue is not None else None
+        ),
+        memory_search_cache=(
+            dict(search_cache.metrics()) if search_cache is not None else None
+        ),
+        memory_executor=(
+            dict(memory_executor.metrics()) if memory_executor is not None else None
+        ),
+        transcript_recorder=(
+            dict(transcript_recorder.metrics())
+            if transcript_recorder is not None
+            else None
+        ),
+        rate_limiter=dict(rate_limiter.metrics()) if rate_limiter is not None else None,
+        admission=dict(admission.metrics()) if admission is not None else None,
+    )
+
+
 @router.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint.
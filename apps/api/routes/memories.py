@@ -9,10 +9,15 @@ from typing import TYPE_CHECKING, cast
 import structlog
 from fastapi import APIRouter, status
 
+from apps.api.adapters.memory_bulk import BulkMemoryItem
+from apps.api.config import get_settings
 from apps.api.dependencies import ApiKey, MemorySvc  # noqa: TC001
+from apps.api.exceptions import ValidationError
 from apps.api.schemas.memory import (
     MemoryAddRequest,
     MemoryAddResponse,
+    MemoryBulkAddRequest,
+    MemoryBulkAddResponse,
     MemoryDeleteResponse,
     MemoryListResponse,
     MemoryRecordDict,
@@ -157,6 +162,60 @@ async def add_memory(
     return MemoryAddResponse(memories=validated_results, count=len(validated_results))
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=MemoryBulkAddResponse,
+)
+async def bulk_add_memories(
+    request: MemoryBulkAddRequest,
+    api_key: ApiKey,
+    memory_service: MemorySvc,
+) -> MemoryBulkAddResponse:
+    """Store many memories verbatim with batched embedding.
+
+    Each item becomes one memory; there is no LLM extraction or graph write.
+
+    Args:
+        request: Memory texts and metadata.
+        api_key: API key from auth middleware (hashed for secure storage).
+        memory_service: Injected memory service.
+
+    Returns:
+        Created memory ids and batching statistics.
+
+    Raises:
+        ValidationError: If the request has more items than allowed.
+    """
+    max_items = get_settings().memory_bulk_max_items
+    if len(request.items) > max_items:
+        raise ValidationError(
+            f"At most {max_items} memories per bulk request", field="items"
+        )
+
+    # Hash API key to prevent plaintext storage in Qdrant/Neo4j metadata
+    user_id = hash_api_key(api_key)
+
+    common = request.metadata or {}
+    items = [
+        BulkMemoryItem(
+            text=item.text,
+            metadata=cast("dict[str, JsonValue]", {**common, **(item.metadata or {})}),
+        )
+        for item in request.items
+    ]
+    result = await memory_service.bulk_add_memories(items=items, user_id=user_id)
+
+    return MemoryBulkAddResponse(
+        ids=result["ids"],
+        count=len(result["ids"]),
+        skipped=result["skipped"],
+        embed_requests=result["embed_requests"],
+        upsert_requests=result["upsert_requests"],
+        duration_ms=result["duration_ms"],
+    )
+
+
 @router.get("", response_model=MemoryListResponse)
 async def list_memories(
     api_key: ApiKey,
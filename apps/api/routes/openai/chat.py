@@ -1,6 +1,5 @@
 """OpenAI-compatible chat completions endpoint."""
 
-import json
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Annotated, cast
@@ -9,7 +8,7 @@ import structlog
 from fastapi import APIRouter, Depends, Request
 from sse_starlette import EventSourceResponse
 
-from apps.api.dependencies import get_agent_service, verify_api_key
+from apps.api.dependencies import admit_query, get_agent_service, verify_api_key
 from apps.api.protocols import RequestTranslator, ResponseTranslator
 from apps.api.routes.openai.dependencies import (
     get_request_translator,
@@ -21,9 +20,11 @@ from apps.api.schemas.responses import SingleQueryResponse
 from apps.api.services.agent import AgentService
 from apps.api.services.openai.streaming import StreamingAdapter
 from apps.api.types import MessageEventDataDict, ResultEventDataDict
+from apps.api.utils.json_codec import get_json_codec
 
 if TYPE_CHECKING:
     from apps.api.schemas.requests.query import QueryRequest
+    from apps.api.services.agent import StreamEvent
 
 router = APIRouter(prefix="/chat", tags=["openai"])
 logger = structlog.get_logger(__name__)
@@ -42,6 +43,7 @@ class StreamingChatHandler:
         """Create SSE response for stream-enabled requests."""
 
         async def event_generator() -> AsyncGenerator[str, None]:
+            codec = get_json_codec()
             native_events = self.agent_service.query_stream(query_request, self.api_key)
             adapter = StreamingAdapter(
                 original_model=self.payload.model,
@@ -53,52 +55,25 @@ class StreamingChatHandler:
                 if chunk == "[DONE]":
                     yield "[DONE]"
                 else:
-                    yield json.dumps(chunk)
+                    yield codec.dumps_str(chunk)
 
         return EventSourceResponse(event_generator())
 
     async def _native_event_tuples(
         self,
-        native_events: AsyncGenerator[dict[str, str], None],
+        native_events: AsyncGenerator["StreamEvent", None],
     ) -> AsyncGenerator[tuple[str, MessageEventDataDict | ResultEventDataDict], None]:
-        """Parse native SSE events into adapter-compatible tuples."""
-        async for event in native_events:
-            if not isinstance(event, dict):
-                continue
-
-            event_type = event.get("event", "")
-            event_data_raw = event.get("data", "{}")
-            event_data = self._parse_event_data(event_type, event_data_raw)
-            if event_data is None:
-                continue
-
-            if event_type in ("message", "partial", "result"):
-                yield (event_type, event_data)
+        """Convert native stream events into adapter-compatible tuples.
 
-    def _parse_event_data(
-        self,
-        event_type: object,
-        event_data_raw: object,
-    ) -> MessageEventDataDict | ResultEventDataDict | None:
-        """Safely parse event payload JSON from SSE data field."""
-        if isinstance(event_data_raw, str):
-            try:
-                parsed = json.loads(event_data_raw)
-            except json.JSONDecodeError:
-                logger.warning(
-                    "skipping_malformed_sse_event",
-                    correlation_id=self.request.headers.get("X-Correlation-ID"),
-                    event_type=event_type,
-                    raw_data=event_data_raw[:100],
+        Reads the structured payload directly; native events are never
+        encoded on this route.
+        """
+        async for event in native_events:
+            if event.event in ("message", "partial", "result"):
+                yield (
+                    event.event,
+                    cast("MessageEventDataDict | ResultEventDataDict", event.payload),
                 )
-                return None
-            if isinstance(parsed, dict):
-                return cast("MessageEventDataDict | ResultEventDataDict", parsed)
-            return None
-
-        if isinstance(event_data_raw, dict):
-            return cast("MessageEventDataDict | ResultEventDataDict", event_data_raw)
-        return None
 
 
 @dataclass
@@ -134,6 +109,7 @@ async def create_chat_completion(
         ResponseTranslator, Depends(get_response_translator)
     ],
     agent_service: Annotated[AgentService, Depends(get_agent_service)],
+    _admission: Annotated[None, Depends(admit_query)],
 ) -> OpenAIChatCompletion | EventSourceResponse:
     """Create a chat completion in OpenAI format."""
     permission_mode = request.headers.get("X-Permission-Mode")
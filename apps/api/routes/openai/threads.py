@@ -455,6 +455,40 @@ async def modify_message(
     return _convert_message_to_response(message)
 
 
+@router.delete("/threads/{thread_id}/messages/{message_id}", response_model=None)
+async def delete_message(
+    thread_id: str,
+    message_id: str,
+    message_service: Annotated[MessageService, Depends(get_message_service)],
+) -> OpenAIDeletionStatus:
+    """Delete a message.
+
+    Args:
+        thread_id: The thread ID.
+        message_id: The message ID.
+        message_service: Message service instance.
+
+    Returns:
+        Deletion status.
+
+    Raises:
+        HTTPException: 404 if message not found.
+    """
+    deleted = await message_service.delete_message(thread_id, message_id)
+
+    if not deleted:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Message '{message_id}' not found in thread '{thread_id}'",
+        )
+
+    return OpenAIDeletionStatus(
+        id=message_id,
+        object="thread.message.deleted",
+        deleted=True,
+    )
+
+
 # =============================================================================
 # Run Endpoints
 # =============================================================================
@@ -511,6 +545,8 @@ async def list_runs(
     run_service: Annotated[RunService, Depends(get_run_service)],
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     order: Annotated[str, Query(pattern="^(asc|desc)$")] = "desc",
+    after: str | None = None,
+    before: str | None = None,
 ) -> OpenAIRunList:
     """List runs in a thread.
 
@@ -519,6 +555,8 @@ async def list_runs(
         run_service: Run service instance.
         limit: Maximum number of results.
         order: Sort order.
+        after: Cursor for pagination.
+        before: Cursor for pagination.
 
     Returns:
         Paginated list of runs.
@@ -527,6 +565,8 @@ async def list_runs(
         thread_id=thread_id,
         limit=limit,
         order=order,
+        after=after,
+        before=before,
     )
 
     # Convert runs
@@ -10,6 +10,7 @@ from sse_starlette import EventSourceResponse
 from apps.api.dependencies import (
     AgentSvc,
     ApiKey,
+    QueryAdmission,
     QueryEnrichment,
     SessionSvc,
     ShutdownState,
@@ -35,6 +36,7 @@ async def query_stream(
     session_service: SessionSvc,
     enrichment_service: QueryEnrichment,
     _shutdown: ShutdownState,
+    _admission: QueryAdmission,
 ) -> EventSourceResponse:
     """Execute a streaming query to the agent.
 
@@ -55,6 +57,7 @@ async def query_stream(
         session_service: Session service for state management.
         enrichment_service: Service for enriching queries with context.
         _shutdown: Shutdown state for graceful degradation.
+        _admission: Concurrency slot held until the stream ends.
 
     Returns:
         SSE event stream.
@@ -89,6 +92,7 @@ async def query_single(
     session_service: SessionSvc,
     enrichment_service: QueryEnrichment,
     _shutdown: ShutdownState,
+    _admission: QueryAdmission,
 ) -> QueryResponseDict:
     """Execute a non-streaming query to the agent.
 
@@ -101,6 +105,7 @@ async def query_single(
         session_service: Session service instance.
         enrichment_service: Query enrichment service for auto-injecting MCP servers.
         _shutdown: Shutdown state check (via dependency, rejects if shutting down).
+        _admission: Concurrency slot (via dependency, 429/503 when shed).
 
     Returns:
         Complete query response.
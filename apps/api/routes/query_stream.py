@@ -2,8 +2,7 @@
 
 import asyncio
 import contextlib
-import json
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Mapping
 from typing import Literal
 
 import structlog
@@ -11,6 +10,7 @@ from fastapi import Request
 
 from apps.api.protocols import AgentService
 from apps.api.schemas.requests.query import QueryRequest
+from apps.api.services.agent.types import StreamEvent
 from apps.api.services.session import SessionService
 from apps.api.utils.crypto import hash_api_key
 
@@ -57,22 +57,20 @@ class QueryStreamEventGenerator:
         # maxsize=100: When queue fills, producer blocks until consumer drains events.
         # This prevents fast SDK output from consuming unbounded memory if client is slow.
         # Trade-off: Producer may lag behind SDK if consumer network is slow.
-        self.event_queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue(
-            maxsize=100
-        )
+        self.event_queue: asyncio.Queue[StreamEvent | None] = asyncio.Queue(maxsize=100)
         self.producer_task: asyncio.Task[None] | None = None
 
-    async def _handle_init_event(self, event_data: str) -> None:
+    async def _handle_init_event(self, init_data: Mapping[str, object]) -> None:
         """Handle session initialization event.
 
         Args:
-            event_data: JSON string with init event data.
+            init_data: Structured init event payload.
         """
         try:
-            init_data = json.loads(event_data)
-            self.session_id = init_data.get("session_id")
-            if not self.session_id:
+            session_id = init_data.get("session_id")
+            if not isinstance(session_id, str) or not session_id:
                 return
+            self.session_id = session_id
 
             # Session lifecycle:
             # 1. SDK generates session_id and emits it in 'init' event
@@ -80,36 +78,12 @@ class QueryStreamEventGenerator:
             # 3. DO NOT set query.session_id before execution - that would cause
             #    SDK to attempt resuming a non-existent conversation!
             # 4. Only set query.session_id when resuming existing sessions
-            model = init_data.get("model", "sonnet")
+            model = init_data.get("model") or "sonnet"
             await self.session_service.create_session(
-                model=model,
+                model=str(model),
                 session_id=self.session_id,
                 owner_api_key=self.api_key,
             )
-        except json.JSONDecodeError as e:
-            logger.error(
-                "Failed to parse init event",
-                error=str(e),
-                error_type=type(e).__name__,
-                event_data=event_data,
-                session_id=self.session_id,
-                api_key_hash=hash_api_key(self.api_key),
-                prompt_preview=self.query.prompt[:100] if self.query.prompt else None,
-                error_id="ERR_INIT_PARSE_FAILED",
-            )
-            await self.event_queue.put(
-                {
-                    "event": "error",
-                    "data": json.dumps(
-                        {
-                            "error": "Session initialization failed",
-                            "message": "Invalid session initialization format",
-                        }
-                    ),
-                }
-            )
-            self.is_error = True
-            # Do NOT re-raise - error event already queued, prevents duplicate from _producer
         except Exception as e:
             logger.error(
                 "Failed to create session",
@@ -121,65 +95,51 @@ class QueryStreamEventGenerator:
                 error_id="ERR_SESSION_CREATE_FAILED",
             )
             await self.event_queue.put(
-                {
-                    "event": "error",
-                    "data": json.dumps(
-                        {
-                            "error": "Session creation failed",
-                            "message": "Unable to initialize session",
-                        }
-                    ),
-                }
+                StreamEvent(
+                    "error",
+                    {
+                        "error": "Session creation failed",
+                        "message": "Unable to initialize session",
+                    },
+                )
             )
             self.is_error = True
             # Do NOT re-raise - error event already queued, prevents duplicate from _producer
 
-    def _track_event_metadata(self, event_type: str, event_data: str) -> None:
+    def _track_event_metadata(
+        self, event_type: str, event_data: Mapping[str, object]
+    ) -> None:
         """Track metadata from events (turns, cost, errors).
 
         Args:
             event_type: Type of event (message, error, result).
-            event_data: JSON string with event data.
+            event_data: Structured event payload.
         """
         if event_type == "message":
             self.num_turns += 1
         if event_type == "error":
             self.is_error = True
         if event_type == "result":
-            try:
-                result_data = json.loads(event_data)
-                if "turns" in result_data:
-                    self.num_turns = result_data["turns"]
-                if "total_cost_usd" in result_data:
-                    self.total_cost_usd = result_data["total_cost_usd"]
-            except json.JSONDecodeError as e:
-                logger.error(
-                    "failed_to_parse_result_event",
-                    session_id=self.session_id,
-                    api_key_hash=hash_api_key(self.api_key),
-                    prompt_preview=self.query.prompt[:100]
-                    if self.query.prompt
-                    else None,
-                    error=str(e),
-                    event_data=event_data[:500],
-                    error_id="ERR_RESULT_PARSE_FAILED",
-                )
+            turns = event_data.get("turns")
+            if isinstance(turns, int):
+                self.num_turns = turns
+            total_cost_usd = event_data.get("total_cost_usd")
+            if isinstance(total_cost_usd, int | float):
+                self.total_cost_usd = float(total_cost_usd)
 
     async def _producer(self) -> None:
         """Producer task: reads events from SDK and queues them."""
         try:
+            # The session row is created on init, so the transcript can be kept
             async for event in self.agent_service.query_stream(
-                self.query, self.api_key
+                self.query, self.api_key, record_transcript=True
             ):
-                event_type = event.get("event", "")
-                event_data = event.get("data", "{}")
-
-                # Track metadata from events
-                self._track_event_metadata(event_type, event_data)
+                # Track metadata from the structured payload (no re-parsing)
+                self._track_event_metadata(event.event, event.payload)
 
                 # Handle session initialization
-                if self.session_id is None and event_type == "init":
-                    await self._handle_init_event(event_data)
+                if self.session_id is None and event.event == "init":
+                    await self._handle_init_event(event.payload)
 
                 # Check for client disconnect
                 if await self.request.is_disconnected():
@@ -208,15 +168,13 @@ class QueryStreamEventGenerator:
             )
             # Return generic error to client (prevent exception detail leakage)
             await self.event_queue.put(
-                {
-                    "event": "error",
-                    "data": json.dumps(
-                        {
-                            "error": "Internal stream error",
-                            "message": "An unexpected error occurred while processing the stream",
-                        }
-                    ),
-                }
+                StreamEvent(
+                    "error",
+                    {
+                        "error": "Internal stream error",
+                        "message": "An unexpected error occurred while processing the stream",
+                    },
+                )
             )
         finally:
             # Signal end of stream with None sentinel
@@ -238,11 +196,13 @@ class QueryStreamEventGenerator:
             current_api_key=self.api_key,
         )
 
-    async def generate(self) -> AsyncGenerator[dict[str, str], None]:
+    async def generate(self) -> AsyncGenerator[bytes, None]:
         """Generate SSE events with disconnect monitoring and backpressure.
 
+        Each event is encoded exactly once here, at the transport edge.
+
         Yields:
-            Event dictionaries with 'event' and 'data' keys.
+            Encoded SSE frames.
         """
         try:
             # Start producer task
@@ -254,7 +214,7 @@ class QueryStreamEventGenerator:
                 if event is None:
                     # Producer finished
                     break
-                yield event
+                yield event.encode_sse()
 
         except asyncio.CancelledError:
             # Client disconnected
@@ -6,6 +6,7 @@ from sse_starlette import EventSourceResponse
 from apps.api.dependencies import (
     AgentSvc,
     ApiKey,
+    QueryAdmission,
     SessionSvc,
     ShutdownState,
 )
@@ -26,6 +27,7 @@ async def resume_session(
     agent_service: AgentSvc,
     session_service: SessionSvc,
     _shutdown: ShutdownState,
+    _admission: QueryAdmission,
 ) -> EventSourceResponse:
     """Resume an existing session with a new prompt.
 
@@ -36,6 +38,7 @@ async def resume_session(
         agent_service: Agent service instance.
         session_service: Session service instance.
         _shutdown: Shutdown state check (via dependency, rejects if shutting down).
+        _admission: Concurrency slot held until the stream ends.
 
     Returns:
         SSE stream of agent events.
@@ -66,7 +69,12 @@ async def resume_session(
     )
 
     return EventSourceResponse(
-        agent_service.query_stream(query_request, api_key),
+        (
+            event.encode_sse()
+            async for event in agent_service.query_stream(
+                query_request, api_key, record_transcript=True
+            )
+        ),
         ping=15,
         headers={
             "Cache-Control": "no-cache",
@@ -83,6 +91,7 @@ async def fork_session(
     agent_service: AgentSvc,
     session_service: SessionSvc,
     _shutdown: ShutdownState,
+    _admission: QueryAdmission,
 ) -> EventSourceResponse:
     """Fork an existing session into a new branch.
 
@@ -96,6 +105,7 @@ async def fork_session(
         agent_service: Agent service instance.
         session_service: Session service instance.
         _shutdown: Shutdown state check (via dependency, rejects if shutting down).
+        _admission: Concurrency slot held until the stream ends.
 
     Returns:
         SSE stream of agent events for the new session.
@@ -134,7 +144,12 @@ async def fork_session(
     )
 
     return EventSourceResponse(
-        agent_service.query_stream(query_request, api_key),
+        (
+            event.encode_sse()
+            async for event in agent_service.query_stream(
+                query_request, api_key, record_transcript=True
+            )
+        ),
         ping=15,
         headers={
             "Cache-Control": "no-cache",
@@ -1,17 +1,24 @@
 """Session CRUD endpoints."""
 
+from collections.abc import AsyncIterator
+from typing import Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 
 from apps.api.dependencies import ApiKey, SessionSvc
 from apps.api.exceptions import SessionNotFoundError, ValidationError
 from apps.api.schemas.requests.sessions import PromoteRequest, UpdateTagsRequest
 from apps.api.schemas.responses import (
+    SessionMessageListResponse,
+    SessionMessageResponse,
     SessionResponse,
     SessionWithMetaListResponse,
     SessionWithMetaResponse,
 )
+from apps.api.services.session_models import TranscriptMessage
+from apps.api.utils.json_codec import get_json_codec
 from apps.api.utils.response_helpers import map_session_with_metadata
 
 router = APIRouter(prefix="/sessions", tags=["Sessions"])
@@ -27,9 +34,14 @@ async def list_sessions(
     search: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, max_length=512),
+    include_total: bool = False,
 ) -> SessionWithMetaListResponse:
     """<summary>List sessions with metadata filtering.</summary>"""
 
+    # Passing the previous page's next_cursor switches to keyset pagination;
+    # total is null unless include_total is set (it costs a count query).
+
     # Use service layer for business logic (includes ownership enforcement and filtering)
     result = await session_service.list_sessions(
         current_api_key=_api_key,
@@ -39,6 +51,8 @@ async def list_sessions(
         search=search,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
     )
     sessions = result.sessions
     total = result.total
@@ -53,6 +67,7 @@ async def list_sessions(
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -104,6 +119,98 @@ async def get_session(
     )
 
 
+@router.get("/{session_id}/messages", response_model=SessionMessageListResponse)
+async def list_session_messages(
+    session_id: str,
+    _api_key: ApiKey,
+    session_service: SessionSvc,
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: str | None = Query(default=None, max_length=512),
+    format: Literal["json", "ndjson"] = "json",
+) -> SessionMessageListResponse | StreamingResponse:
+    """Read a session's persisted transcript, oldest first.
+
+    ``format=json`` returns one page and a ``next_cursor`` for the next one.
+    ``format=ndjson`` streams the whole transcript (after ``cursor``, if
+    given) as one JSON object per line, read through a server-side cursor
+    so large transcripts are exported in constant memory; ``limit`` is
+    ignored.
+
+    Args:
+        session_id: Session ID whose transcript to read.
+        _api_key: Validated API key (via dependency).
+        session_service: Session service instance.
+        limit: Maximum messages per page (json format).
+        cursor: Opaque next_cursor from a previous page.
+        format: ``json`` for a page, ``ndjson`` for a streaming export.
+
+    Returns:
+        Page of messages, or an NDJSON streaming response.
+
+    Raises:
+        ValidationError: If session_id or cursor is invalid.
+        SessionNotFoundError: If session doesn't exist.
+    """
+    # Validate UUID format
+    try:
+        UUID(session_id)
+    except ValueError as e:
+        raise ValidationError(
+            message=f"Invalid session ID format: {session_id}",
+            field="session_id",
+        ) from e
+
+    if format == "ndjson":
+        messages = await session_service.stream_messages(
+            session_id,
+            current_api_key=_api_key,
+            cursor=cursor,
+        )
+        return StreamingResponse(
+            _ndjson_lines(messages),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    page = await session_service.list_messages(
+        session_id,
+        current_api_key=_api_key,
+        limit=limit,
+        cursor=cursor,
+    )
+    return SessionMessageListResponse(
+        messages=[_map_message(m) for m in page.messages],
+        next_cursor=page.next_cursor,
+    )
+
+
+def _map_message(message: TranscriptMessage) -> SessionMessageResponse:
+    """Map a service transcript message to its response schema."""
+    return SessionMessageResponse(
+        id=message.id,
+        session_id=message.session_id,
+        message_type=message.message_type,
+        content=message.content,
+        created_at=message.created_at,
+    )
+
+
+async def _ndjson_lines(
+    messages: AsyncIterator[TranscriptMessage],
+) -> AsyncIterator[bytes]:
+    """Encode transcript messages as newline-delimited JSON."""
+    codec = get_json_codec()
+    async for message in messages:
+        line: dict[str, object] = {
+            "id": message.id,
+            "session_id": message.session_id,
+            "message_type": message.message_type,
+            "content": message.content,
+            "created_at": message.created_at.isoformat(),
+        }
+        yield codec.dumps(line) + b"\n"
+
+
 @router.post("/{session_id}/promote", response_model=SessionWithMetaResponse)
 async def promote_session(
     session_id: str,
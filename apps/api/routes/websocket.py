@@ -2,20 +2,32 @@
 
 import asyncio
 import contextlib
-import json
+import contextvars
 import secrets
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal, NotRequired, Required, TypedDict, cast
 
 import structlog
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 
 from apps.api.config import get_settings
-from apps.api.dependencies import get_agent_service, get_session_service
-from apps.api.exceptions import SessionNotFoundError
+from apps.api.dependencies import (
+    get_admission_controller,
+    get_agent_service,
+    get_session_service,
+)
+from apps.api.exceptions import QueryRejectedError, SessionNotFoundError
 from apps.api.schemas.requests.query import QueryRequest
-from apps.api.services.agent import AgentService
+from apps.api.services.admission import AdmissionController
+from apps.api.services.agent import AgentService, StreamEvent
 from apps.api.services.session import SessionService
+from apps.api.utils.json_codec import get_json_codec
+from apps.api.utils.ws_framing import (
+    FRAME_ACK,
+    FRAME_ERROR,
+    CompactFrameCodec,
+    negotiate_frame_codec,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -27,11 +39,24 @@ VALID_PERMISSION_MODES: frozenset[str] = frozenset(
     {"default", "acceptEdits", "plan", "bypassPermissions"}
 )
 
+# Compact frame codec negotiated for the current connection (None = JSON text)
+frame_codec_ctx: contextvars.ContextVar[CompactFrameCodec | None] = (
+    contextvars.ContextVar("ws_frame_codec", default=None)
+)
+# Multiplexed query the current message or stream task belongs to
+request_id_ctx: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "ws_request_id", default=None
+)
+
 
 class WebSocketMessageDict(TypedDict):
     """WebSocket message format."""
 
-    type: Required[Literal["prompt", "interrupt", "answer", "control"]]
+    type: Required[Literal["prompt", "interrupt", "answer", "control", "credit"]]
+    # Tags a multiplexed query; omitted for the connection's single query
+    request_id: NotRequired[str | None]
+    # Event frames the client accepts before it must grant more credit
+    credits: NotRequired[int | None]
     prompt: NotRequired[str | None]
     session_id: NotRequired[str | None]
     answer: NotRequired[str | None]
@@ -53,14 +78,74 @@ class WebSocketResponseDict(TypedDict):
     event: NotRequired[str | None]
     data: NotRequired[dict[str, object] | None]
     message: NotRequired[str | None]
+    request_id: NotRequired[str | None]
+
+
+@dataclass
+class QueryStream:
+    """A query multiplexed on a connection under a client-chosen request_id."""
+
+    session_id: str | None = None
+    # Event frames the client will still accept; None means unlimited
+    credits: int | None = None
+    task: asyncio.Task[None] | None = None
+    credit_granted: asyncio.Event = field(default_factory=asyncio.Event)
+
+    async def take_credit(self, timeout: float) -> bool:
+        """Wait until the client has credit for one more event frame.
+
+        Args:
+            timeout: Max seconds to wait for the client to grant credit.
+
+        Returns:
+            False if the client granted no credit within the timeout.
+        """
+        if self.credits is None:
+            return True
+        while self.credits <= 0:
+            self.credit_granted.clear()
+            try:
+                await asyncio.wait_for(self.credit_granted.wait(), timeout)
+            except TimeoutError:
+                return False
+        self.credits -= 1
+        return True
+
+    def grant(self, credits: int) -> None:
+        """Add credit granted by the client and wake a paused stream.
+
+        Args:
+            credits: Additional event frames the client will accept.
+        """
+        if self.credits is None:
+            return
+        self.credits += credits
+        self.credit_granted.set()
 
 
 @dataclass
 class WebSocketState:
     """Mutable state for WebSocket connection."""
 
+    # Untagged query; a new untagged prompt replaces it
     query_task: asyncio.Task[None] | None = None
     current_session_id: str | None = None
+    # Tagged queries running side by side, by request_id
+    streams: dict[str, QueryStream] = field(default_factory=dict)
+
+    def session_for(self, request_id: str | None) -> str | None:
+        """Return the session of the untagged query or of a tagged one.
+
+        Args:
+            request_id: Tag of the query, or None for the untagged query.
+
+        Returns:
+            Session ID if known.
+        """
+        if request_id is None:
+            return self.current_session_id
+        stream = self.streams.get(request_id)
+        return stream.session_id if stream is not None else None
 
 
 async def _handle_prompt_message(
@@ -69,21 +154,34 @@ async def _handle_prompt_message(
     agent_service: AgentService,
     state: WebSocketState,
     api_key: str,
+    admission: AdmissionController | None = None,
 ) -> None:
     """Handle prompt message to start a new query.
 
+    An untagged prompt replaces the connection's current untagged query; a
+    prompt with a request_id starts a tagged query alongside the others.
+
     Args:
         websocket: WebSocket connection.
         message: WebSocket message dict.
         agent_service: Agent service instance.
         state: WebSocket connection state.
         api_key: API key for scoped MCP server configuration.
+        admission: Concurrency caps the query must be admitted by.
     """
     prompt = message.get("prompt")
     if not prompt:
         await _send_error(websocket, "prompt is required")
         return
 
+    request_id = message.get("request_id")
+    credits = message.get("credits")
+    if request_id is not None:
+        error = _stream_open_error(state, request_id, credits)
+        if error is not None:
+            await _send_error(websocket, error)
+            return
+
     # Build query request from WebSocket message
     request = QueryRequest(
         prompt=prompt,
@@ -99,6 +197,22 @@ async def _handle_prompt_message(
         include_partial_messages=message.get("include_partial_messages") or False,
     )
 
+    if request_id is not None:
+        # Tagged queries run alongside each other and the untagged query
+        stream = QueryStream(session_id=request.session_id, credits=credits)
+        stream.task = asyncio.create_task(
+            _stream_query(websocket, agent_service, request, api_key, admission, stream)
+        )
+        state.streams[request_id] = stream
+
+        def _forget(_task: "asyncio.Task[None]") -> None:
+            if state.streams.get(request_id) is stream:
+                del state.streams[request_id]
+
+        stream.task.add_done_callback(_forget)
+        await _send_ack(websocket, "Query started")
+        return
+
     # Cancel existing query if running
     if state.query_task and not state.query_task.done():
         state.query_task.cancel()
@@ -107,13 +221,40 @@ async def _handle_prompt_message(
 
     # Start streaming query
     state.query_task = asyncio.create_task(
-        _stream_query(websocket, agent_service, request, api_key)
+        _stream_query(websocket, agent_service, request, api_key, admission)
     )
     state.current_session_id = request.session_id
 
     await _send_ack(websocket, "Query started")
 
 
+def _stream_open_error(
+    state: WebSocketState, request_id: str, credits: int | None
+) -> str | None:
+    """Check whether a tagged query can start on this connection.
+
+    Args:
+        state: WebSocket connection state.
+        request_id: Tag chosen by the client.
+        credits: Initial credit window, if the client uses flow control.
+
+    Returns:
+        Error message, or None if the query can start.
+    """
+    if request_id in state.streams:
+        return f"request_id already in use: {request_id}"
+    max_streams = get_settings().websocket_max_streams
+    if len(state.streams) >= max_streams:
+        return f"Too many concurrent queries on this connection (max {max_streams})"
+    if credits is not None and not _is_positive_int(credits):
+        return "credits must be a positive integer"
+    return None
+
+
+def _is_positive_int(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
 async def _handle_interrupt_message(
     websocket: WebSocket,
     message: WebSocketMessageDict,
@@ -224,6 +365,30 @@ async def _handle_control_message(
         await _send_error(websocket, "Session not found or not active")
 
 
+async def _handle_credit_message(
+    websocket: WebSocket,
+    message: WebSocketMessageDict,
+    stream: QueryStream | None,
+) -> None:
+    """Handle credit message granting a tagged query more event frames.
+
+    Credit is granted silently (no ack) since clients send it continuously.
+
+    Args:
+        websocket: WebSocket connection.
+        message: WebSocket message dict.
+        stream: Tagged query the credit is for, if any.
+    """
+    credits = message.get("credits")
+    if stream is None:
+        await _send_error(websocket, "request_id is required")
+        return
+    if not _is_positive_int(credits):
+        await _send_error(websocket, "credits must be a positive integer")
+        return
+    stream.grant(cast("int", credits))
+
+
 async def _process_websocket_message(
     websocket: WebSocket,
     message: WebSocketMessageDict,
@@ -231,6 +396,7 @@ async def _process_websocket_message(
     session_service: SessionService,
     state: WebSocketState,
     api_key: str,
+    admission: AdmissionController | None = None,
 ) -> None:
     """Route and process a WebSocket message by type.
 
@@ -241,30 +407,56 @@ async def _process_websocket_message(
         session_service: Session service instance.
         state: WebSocket connection state.
         api_key: API key of the requester.
+        admission: Concurrency caps prompts must be admitted by.
     """
     msg_type = message.get("type")
+    request_id = message.get("request_id")
+    if request_id is not None and not (isinstance(request_id, str) and request_id):
+        await _send_error(websocket, "request_id must be a non-empty string")
+        return
 
-    if msg_type == "prompt":
-        await _handle_prompt_message(websocket, message, agent_service, state, api_key)
-    elif msg_type == "interrupt":
-        await _handle_interrupt_message(
-            websocket,
-            message,
-            agent_service,
-            session_service,
-            state.current_session_id,
-            api_key,
-        )
-    elif msg_type == "answer":
-        await _handle_answer_message(
-            websocket, message, agent_service, state.current_session_id
-        )
-    elif msg_type == "control":
-        await _handle_control_message(
-            websocket, message, agent_service, state.current_session_id
-        )
-    else:
-        await _send_error(websocket, f"Unknown message type: {msg_type}")
+    # Acks, errors and the started query's frames are tagged with request_id
+    token = request_id_ctx.set(request_id)
+    try:
+        # Interrupts, answers and control events target the tagged query's session
+        current_session_id = state.session_for(request_id)
+        if (
+            request_id is not None
+            and msg_type != "prompt"
+            and request_id not in state.streams
+        ):
+            await _send_error(websocket, f"Unknown request_id: {request_id}")
+        elif msg_type == "prompt":
+            await _handle_prompt_message(
+                websocket, message, agent_service, state, api_key, admission
+            )
+        elif msg_type == "interrupt":
+            await _handle_interrupt_message(
+                websocket,
+                message,
+                agent_service,
+                session_service,
+                current_session_id,
+                api_key,
+            )
+        elif msg_type == "answer":
+            await _handle_answer_message(
+                websocket, message, agent_service, current_session_id
+            )
+        elif msg_type == "control":
+            await _handle_control_message(
+                websocket, message, agent_service, current_session_id
+            )
+        elif msg_type == "credit":
+            await _handle_credit_message(
+                websocket,
+                message,
+                state.streams.get(request_id) if request_id is not None else None,
+            )
+        else:
+            await _send_error(websocket, f"Unknown message type: {msg_type}")
+    finally:
+        request_id_ctx.reset(token)
 
 
 @router.websocket("/query/ws")
@@ -272,6 +464,7 @@ async def websocket_query(
     websocket: WebSocket,
     agent_service: AgentService = Depends(get_agent_service),
     session_service: SessionService = Depends(get_session_service),
+    admission: AdmissionController | None = Depends(get_admission_controller),
 ) -> None:
     """WebSocket endpoint for bidirectional agent communication (T119-T120).
 
@@ -282,11 +475,18 @@ async def websocket_query(
     - interrupt: Interrupt the current query
     - answer: Submit an answer to a pending AskUserQuestion
     - control: Send control events (e.g., permission mode changes)
+    - credit: Grant a tagged query more event frames (flow control)
 
     Response Types (server -> client):
     - sse_event: SSE event data (init, message, result, done, etc.)
     - error: Error message
     - ack: Acknowledgment of a received message
+
+    Prompts carrying a request_id run concurrently on the connection. Their
+    frames are tagged with the request_id, and interrupt, answer and control
+    messages with the same request_id target that query's session. Clients
+    may negotiate a compact binary wire format via the
+    Sec-WebSocket-Protocol header (see apps.api.utils.ws_framing).
     """
     settings = get_settings()
 
@@ -302,23 +502,37 @@ async def websocket_query(
         await websocket.close(code=4001, reason="Invalid API key")
         return
 
-    await websocket.accept()
-    logger.info("WebSocket connection accepted")
+    codec = negotiate_frame_codec(websocket.headers.get("sec-websocket-protocol"))
+    if codec is None:
+        await websocket.accept()
+    else:
+        await websocket.accept(subprotocol=codec.subprotocol)
+    codec_token = frame_codec_ctx.set(codec)
+    logger.info(
+        "WebSocket connection accepted",
+        subprotocol=codec.subprotocol if codec is not None else None,
+    )
 
     state = WebSocketState()
 
     try:
         while True:
-            raw_message = await websocket.receive_text()
-
             try:
-                message: WebSocketMessageDict = json.loads(raw_message)
-            except json.JSONDecodeError:
+                message = cast(
+                    "WebSocketMessageDict", await _receive_message(websocket, codec)
+                )
+            except ValueError:
                 await _send_error(websocket, "Invalid JSON message")
                 continue
 
             await _process_websocket_message(
-                websocket, message, agent_service, session_service, state, api_key
+                websocket,
+                message,
+                agent_service,
+                session_service,
+                state,
+                api_key,
+                admission,
             )
 
     except WebSocketDisconnect:
@@ -331,6 +545,40 @@ async def websocket_query(
             state.query_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await state.query_task
+        stream_tasks = [
+            stream.task
+            for stream in state.streams.values()
+            if stream.task is not None and not stream.task.done()
+        ]
+        for task in stream_tasks:
+            task.cancel()
+        await asyncio.gather(*stream_tasks, return_exceptions=True)
+        frame_codec_ctx.reset(codec_token)
+
+
+async def _receive_message(
+    websocket: WebSocket, codec: CompactFrameCodec | None
+) -> object:
+    """Receive and decode the next client message.
+
+    Args:
+        websocket: WebSocket connection.
+        codec: Negotiated compact codec, or None for JSON text frames.
+
+    Returns:
+        Decoded message.
+
+    Raises:
+        WebSocketDisconnect: If the client disconnected.
+        ValueError: If the message cannot be decoded.
+    """
+    if codec is None:
+        return get_json_codec().loads(await websocket.receive_text())
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    text = message.get("text")
+    return codec.decode(text if text is not None else message.get("bytes") or b"")
 
 
 async def _stream_query(
@@ -338,6 +586,8 @@ async def _stream_query(
     agent_service: AgentService,
     request: QueryRequest,
     api_key: str,
+    admission: AdmissionController | None = None,
+    stream: QueryStream | None = None,
 ) -> None:
     """Stream query results to WebSocket.
 
@@ -346,25 +596,46 @@ async def _stream_query(
         agent_service: Agent service instance.
         request: Query request.
         api_key: API key for scoped MCP server configuration.
+        admission: Concurrency caps the query must be admitted by.
+        stream: Tagged query state (session and credit), if multiplexed.
     """
+    slot = (
+        admission.slot(api_key) if admission is not None else contextlib.nullcontext()
+    )
+    codec = frame_codec_ctx.get()
+    request_id = request_id_ctx.get()
+    credit_timeout = get_settings().websocket_credit_timeout_seconds
     try:
-        async for sse_event in agent_service.query_stream(request, api_key):
-            # SSE event is a dict with 'event' and 'data' keys
-            # Parse the JSON data string to send as structured WebSocket message
-            event_type = sse_event.get("event", "")
-            data_str = sse_event.get("data", "{}")
-
-            try:
-                event_data: dict[str, object] = json.loads(data_str)
-            except json.JSONDecodeError:
-                event_data = {"raw": data_str}
-
-            response: WebSocketResponseDict = {
-                "type": "sse_event",
-                "event": event_type,
-                "data": event_data,
-            }
-            await websocket.send_json(response)
+        async with (
+            slot,
+            contextlib.aclosing(agent_service.query_stream(request, api_key)) as events,
+        ):
+            async for event in events:
+                if stream is not None:
+                    if event.event == "init":
+                        session_id = event.payload.get("session_id")
+                        if isinstance(session_id, str):
+                            stream.session_id = session_id
+                    # A stream out of credit pauses without blocking the others
+                    if not await stream.take_credit(credit_timeout):
+                        # Closing the generator cancels the query and the
+                        # slot is released on the way out
+                        logger.warning(
+                            "websocket_credit_timeout",
+                            request_id=request_id,
+                            timeout_seconds=credit_timeout,
+                        )
+                        await _send_error(
+                            websocket, "No credit granted in time; query cancelled"
+                        )
+                        return
+                if codec is None:
+                    await websocket.send_text(_encode_event_frame(event, request_id))
+                else:
+                    await websocket.send_bytes(codec.encode_event(event, request_id))
+
+    except QueryRejectedError as e:
+        await _send_error(websocket, e.message)
 
     except asyncio.CancelledError:
         # Query was interrupted
@@ -377,6 +648,25 @@ async def _stream_query(
         await _send_error(websocket, "Stream processing failed")
 
 
+def _encode_event_frame(event: StreamEvent, request_id: str | None = None) -> str:
+    """Encode a stream event as an ``sse_event`` WebSocket frame.
+
+    Splices the event's cached JSON payload into the frame instead of
+    parsing it back into a dict and re-serializing it.
+
+    Args:
+        event: Stream event to send.
+        request_id: Multiplexed query the event belongs to, if any.
+
+    Returns:
+        JSON text equivalent to a WebSocketResponseDict with type "sse_event".
+    """
+    codec = get_json_codec()
+    event_name = codec.dumps_str(event.event)
+    tag = "" if request_id is None else f',"request_id":{codec.dumps_str(request_id)}'
+    return f'{{"type":"sse_event","event":{event_name},"data":{event.data}{tag}}}'
+
+
 async def _send_error(websocket: WebSocket, message: str) -> None:
     """Send error message via WebSocket.
 
@@ -384,10 +674,18 @@ async def _send_error(websocket: WebSocket, message: str) -> None:
         websocket: WebSocket connection.
         message: Error message.
     """
+    codec = frame_codec_ctx.get()
+    request_id = request_id_ctx.get()
+    if codec is not None:
+        frame = codec.encode_control(FRAME_ERROR, message, request_id)
+        await websocket.send_bytes(frame)
+        return
     response: WebSocketResponseDict = {
         "type": "error",
         "message": message,
     }
+    if request_id is not None:
+        response["request_id"] = request_id
     await websocket.send_json(response)
 
 
@@ -398,8 +696,16 @@ async def _send_ack(websocket: WebSocket, message: str) -> None:
         websocket: WebSocket connection.
         message: Acknowledgment message.
     """
+    codec = frame_codec_ctx.get()
+    request_id = request_id_ctx.get()
+    if codec is not None:
+        frame = codec.encode_control(FRAME_ACK, message, request_id)
+        await websocket.send_bytes(frame)
+        return
     response: WebSocketResponseDict = {
         "type": "ack",
         "message": message,
     }
+    if request_id is not None:
+        response["request_id"] = request_id
     await websocket.send_json(response)
@@ -24,6 +24,26 @@ class MemoryAddRequest(BaseModel):
     )
 
 
+class MemoryBulkItem(BaseModel):
+    """One memory stored verbatim by a bulk add."""
+
+    text: str = Field(..., min_length=1, description="Memory text (stored as-is)")
+    metadata: dict[str, object] | None = Field(
+        None, description="Metadata for this memory (overrides request metadata)"
+    )
+
+
+class MemoryBulkAddRequest(BaseModel):
+    """Request to add many memories without LLM extraction."""
+
+    items: list[MemoryBulkItem] = Field(
+        ..., min_length=1, description="Memories to store"
+    )
+    metadata: dict[str, object] | None = Field(
+        None, description="Metadata attached to every memory"
+    )
+
+
 class MemorySearchRequest(BaseModel):
     """Request to search memories."""
 
@@ -79,6 +99,17 @@ class MemoryAddResponse(BaseModel):
     count: int
 
 
+class MemoryBulkAddResponse(BaseModel):
+    """Response from a bulk memory add."""
+
+    ids: list[str] = Field(..., description="Created memory ids, in request order")
+    count: int
+    skipped: int = Field(..., description="Duplicate texts within the request")
+    embed_requests: int = Field(..., description="Batched TEI embedding requests")
+    upsert_requests: int = Field(..., description="Batched Qdrant upserts")
+    duration_ms: float
+
+
 class MemoryListResponse(BaseModel):
     """Response from listing all memories."""
 
@@ -89,6 +89,40 @@ class McpServerConfigSchema(BaseModel):
         return self
 
 
+class HookDecisionCacheSchema(BaseModel):
+    """Opt-in cache of PreToolUse webhook decisions."""
+
+    ttl_seconds: int = Field(
+        default=60,
+        ge=1,
+        le=86400,
+        description="Max age of a cached decision; Cache-Control may shorten it",
+    )
+    key_fields: list[str] = Field(
+        default_factory=lambda: ["tool_name", "tool_input"],
+        min_length=1,
+        description=(
+            "Payload fields identifying a decision: tool_name, tool_input, "
+            "session_id, or tool_input.<key> for a single input field"
+        ),
+    )
+    max_entries: int = Field(
+        default=256, ge=1, le=10000, description="Decisions kept per hook (LRU)"
+    )
+
+    @field_validator("key_fields")
+    @classmethod
+    def validate_key_fields(cls, v: list[str]) -> list[str]:
+        """Validate that key fields name payload fields."""
+        for key_field in v:
+            if key_field in ("tool_name", "tool_input", "session_id"):
+                continue
+            if key_field.startswith("tool_input.") and len(key_field) > 11:
+                continue
+            raise ValueError(f"Unsupported decision cache key field: {key_field}")
+        return v
+
+
 class HookWebhookSchema(BaseModel):
     """Webhook configuration for a hook event."""
 
@@ -96,6 +130,9 @@ class HookWebhookSchema(BaseModel):
     headers: dict[str, str] = Field(default_factory=dict)
     timeout: int = Field(default=30, ge=1, le=300)
     matcher: str | None = Field(None, description="Regex pattern for tool names")
+    decision_cache: HookDecisionCacheSchema | None = Field(
+        None, description="Reuse decisions for repeated tool calls (PreToolUse only)"
+    )
 
     @field_validator("url")
     @classmethod
@@ -118,6 +155,21 @@ class HooksConfigSchema(BaseModel):
 
     model_config = {"populate_by_name": True}
 
+    @model_validator(mode="after")
+    def validate_decision_cache_event(self) -> Self:
+        """Validate that only PreToolUse hooks cache decisions."""
+        for name, field in type(self).model_fields.items():
+            hook = getattr(self, name)
+            if (
+                name != "pre_tool_use"
+                and hook is not None
+                and hook.decision_cache is not None
+            ):
+                raise ValueError(
+                    f"decision_cache is only supported for PreToolUse, not {field.alias}"
+                )
+        return self
+
 
 class OutputFormatSchema(BaseModel):
     """Structured output format specification."""
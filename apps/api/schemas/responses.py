@@ -288,6 +288,9 @@ class ResultEventData(BaseModel):
     model_usage: dict[str, UsageSchema] | None = None
     result: str | None = None
     structured_output: dict[str, object] | None = None
+    timings: dict[str, float] | None = Field(
+        None, description="Per-phase span durations in milliseconds"
+    )
 
 
 class ErrorEventData(BaseModel):
@@ -427,9 +430,27 @@ class SessionWithMetaListResponse(BaseModel):
     """Paginated session list with metadata."""
 
     sessions: list[SessionWithMetaResponse]
-    total: int
+    total: int | None
     page: int
     page_size: int
+    next_cursor: str | None = None
+
+
+class SessionMessageResponse(BaseModel):
+    """Persisted transcript message."""
+
+    id: str
+    session_id: str
+    message_type: str
+    content: dict[str, object]
+    created_at: datetime
+
+
+class SessionMessageListResponse(BaseModel):
+    """Page of a session transcript, oldest first."""
+
+    messages: list[SessionMessageResponse]
+    next_cursor: str | None = None
 
 
 # Checkpoint Response Types
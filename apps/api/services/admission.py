@@ -0,0 +1,279 @@
+"""Concurrency-based admission control for agent queries.
+
+Requests-per-minute limits do not bound what actually exhausts an instance:
+every running query holds an SDK subprocess, so a few long queries can pin
+CPU and memory while the request rate looks idle. The controller caps the
+queries running at once, per instance and per API key.
+
+A query that cannot start immediately waits in a bounded queue. Waiters are
+grouped per key and served round-robin across keys, so one client with a
+deep backlog cannot starve the others. A waiter gives up after
+``queue_timeout_seconds``. Shed queries raise QueryRejectedError: 429 when
+the caller's own key is saturated, 503 when the instance is.
+"""
+
+import asyncio
+import contextlib
+from collections import deque
+from typing import TYPE_CHECKING, TypedDict
+
+import structlog
+
+from apps.api.exceptions.agent import QueryRejectedError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from apps.api.config import Settings
+
+logger = structlog.get_logger(__name__)
+
+
+class AdmissionMetrics(TypedDict):
+    """Snapshot of admission controller gauges and counters."""
+
+    in_flight: int
+    queued: int
+    max_in_flight: int
+    max_queued: int
+    active_keys: int
+    admitted: int
+    waited: int
+    rejected_key_limit: int
+    rejected_overloaded: int
+    timed_out: int
+
+
+class AdmissionController:
+    """Per-instance and per-key concurrency caps with a fair wait queue."""
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int,
+        max_in_flight_per_key: int,
+        max_queued: int,
+        max_queued_per_key: int,
+        queue_timeout_seconds: float,
+    ) -> None:
+        """Initialize controller.
+
+        Args:
+            max_in_flight: Max queries running at once on this instance.
+            max_in_flight_per_key: Max queries running at once per API key.
+            max_queued: Max queries waiting for a slot across all keys.
+            max_queued_per_key: Max queries waiting for a slot per API key.
+            queue_timeout_seconds: Max wait for a slot before shedding.
+        """
+        self._max_in_flight = max_in_flight
+        self._max_in_flight_per_key = max_in_flight_per_key
+        self._max_queued = max_queued
+        self._max_queued_per_key = max_queued_per_key
+        self._queue_timeout = queue_timeout_seconds
+        self._in_flight = 0
+        self._in_flight_by_key: dict[str, int] = {}
+        self._queued = 0
+        self._waiting: dict[str, deque[asyncio.Future[None]]] = {}
+        # Keys with waiters, in the order they are next served
+        self._rotation: deque[str] = deque()
+        self._admitted = 0
+        self._waited = 0
+        self._rejected_key_limit = 0
+        self._rejected_overloaded = 0
+        self._timed_out = 0
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "AdmissionController":
+        """Build a controller from application settings.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            AdmissionController instance.
+        """
+        return cls(
+            max_in_flight=settings.query_max_in_flight,
+            max_in_flight_per_key=settings.query_max_in_flight_per_key,
+            max_queued=settings.query_max_queued,
+            max_queued_per_key=settings.query_max_queued_per_key,
+            queue_timeout_seconds=settings.query_queue_timeout_seconds,
+        )
+
+    @contextlib.asynccontextmanager
+    async def slot(self, key: str) -> "AsyncIterator[None]":
+        """Hold a query slot for the duration of the block.
+
+        Args:
+            key: API key the query runs under.
+
+        Yields:
+            None once the query is admitted.
+
+        Raises:
+            QueryRejectedError: If the query is shed instead of admitted.
+        """
+        await self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release(key)
+
+    async def acquire(self, key: str) -> None:
+        """Wait for a query slot. Every successful call must be released.
+
+        Args:
+            key: API key the query runs under.
+
+        Raises:
+            QueryRejectedError: If the wait queue is full or the wait times out.
+        """
+        key_queue = self._waiting.get(key)
+        if key_queue is None and self._has_room(key):
+            self._start(key)
+            return
+
+        key_depth = len(key_queue) if key_queue is not None else 0
+        if key_depth >= self._max_queued_per_key:
+            self._rejected_key_limit += 1
+            raise self._rejection(key, key_depth + 1, key_limited=True)
+        if self._queued >= self._max_queued:
+            self._rejected_overloaded += 1
+            raise self._rejection(key, self._queued + 1, key_limited=False)
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if key_queue is None:
+            key_queue = self._waiting[key] = deque()
+            self._rotation.append(key)
+        key_queue.append(future)
+        self._queued += 1
+        self._waited += 1
+
+        try:
+            async with asyncio.timeout(self._queue_timeout):
+                await future
+        except TimeoutError:
+            if future.done() and not future.cancelled():
+                # Granted as the deadline fired; keep the slot
+                return
+            position = self._position(key, future)
+            self._remove(key, future)
+            self._timed_out += 1
+            # Free instance capacity means only the key's own cap held it back
+            raise self._rejection(
+                key, position, key_limited=self._in_flight < self._max_in_flight
+            ) from None
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(key)
+            else:
+                self._remove(key, future)
+            raise
+
+    def release(self, key: str) -> None:
+        """Free a slot taken by acquire and admit the next waiter.
+
+        Args:
+            key: API key the finished query ran under.
+        """
+        self._in_flight -= 1
+        remaining = self._in_flight_by_key.get(key, 1) - 1
+        if remaining > 0:
+            self._in_flight_by_key[key] = remaining
+        else:
+            self._in_flight_by_key.pop(key, None)
+        self._dispatch()
+
+    def _has_room(self, key: str) -> bool:
+        return (
+            self._in_flight < self._max_in_flight
+            and self._in_flight_by_key.get(key, 0) < self._max_in_flight_per_key
+        )
+
+    def _start(self, key: str) -> None:
+        self._in_flight += 1
+        self._in_flight_by_key[key] = self._in_flight_by_key.get(key, 0) + 1
+        self._admitted += 1
+
+    def _dispatch(self) -> None:
+        # Serve keys round-robin, skipping keys at their own cap
+        skipped = 0
+        while self._in_flight < self._max_in_flight and skipped < len(self._rotation):
+            key = self._rotation.popleft()
+            key_queue = self._waiting[key]
+            if not self._has_room(key):
+                self._rotation.append(key)
+                skipped += 1
+                continue
+            future = key_queue.popleft()
+            self._queued -= 1
+            if not future.done():
+                # A cancelled waiter has already given up; skip it
+                self._start(key)
+                future.set_result(None)
+            if key_queue:
+                self._rotation.append(key)
+            else:
+                del self._waiting[key]
+            skipped = 0
+
+    def _remove(self, key: str, future: "asyncio.Future[None]") -> None:
+        key_queue = self._waiting.get(key)
+        if key_queue is None or future not in key_queue:
+            return
+        key_queue.remove(future)
+        self._queued -= 1
+        if not key_queue:
+            del self._waiting[key]
+            self._rotation.remove(key)
+
+    def _position(self, key: str, future: "asyncio.Future[None]") -> int:
+        key_queue = self._waiting.get(key)
+        if key_queue is None or future not in key_queue:
+            return 0
+        index = key_queue.index(future)
+        # Round-robin serves one waiter per key per turn
+        return index + 1 + sum(
+            min(len(other), index + 1)
+            for other_key, other in self._waiting.items()
+            if other_key != key
+        )
+
+    def _rejection(
+        self, key: str, position: int, *, key_limited: bool
+    ) -> QueryRejectedError:
+        logger.warning(
+            "query_rejected",
+            reason="key_limit" if key_limited else "overloaded",
+            in_flight=self._in_flight,
+            queued=self._queued,
+            key_in_flight=self._in_flight_by_key.get(key, 0),
+        )
+        return QueryRejectedError(
+            key_limited=key_limited,
+            in_flight=(
+                self._in_flight_by_key.get(key, 0) if key_limited else self._in_flight
+            ),
+            limit=self._max_in_flight_per_key if key_limited else self._max_in_flight,
+            queue_position=position,
+            queue_depth=self._queued,
+        )
+
+    def metrics(self) -> AdmissionMetrics:
+        """Return controller gauges and counters.
+
+        Returns:
+            In-flight and queued gauges, limits and admission/shed totals.
+        """
+        return AdmissionMetrics(
+            in_flight=self._in_flight,
+            queued=self._queued,
+            max_in_flight=self._max_in_flight,
+            max_queued=self._max_queued,
+            active_keys=len(self._in_flight_by_key),
+            admitted=self._admitted,
+            waited=self._waited,
+            rejected_key_limit=self._rejected_key_limit,
+            rejected_overloaded=self._rejected_overloaded,
+            timed_out=self._timed_out,
+        )
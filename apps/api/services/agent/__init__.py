@@ -8,7 +8,11 @@ from apps.api.services.agent.handlers import MessageHandler
 from apps.api.services.agent.hooks import HookExecutor
 from apps.api.services.agent.options import OptionsBuilder
 from apps.api.services.agent.service import AgentService
-from apps.api.services.agent.types import QueryResponseDict, StreamContext
+from apps.api.services.agent.types import (
+    QueryResponseDict,
+    StreamContext,
+    StreamEvent,
+)
 from apps.api.services.agent.utils import (
     detect_slash_command,
     resolve_env_dict,
@@ -22,6 +26,7 @@ __all__ = [
     "OptionsBuilder",
     "QueryResponseDict",
     "StreamContext",
+    "StreamEvent",
     "detect_slash_command",
     "resolve_env_dict",
     "resolve_env_var",
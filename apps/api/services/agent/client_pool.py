@@ -0,0 +1,447 @@
+"""Warm pool of pre-connected Claude SDK clients.
+
+Spawning the Claude Code CLI and completing the SDK handshake dominates
+time-to-first-token, so the pool keeps connected clients ready ahead of
+queries. Clients are keyed by a fingerprint of the ClaudeAgentOptions they
+were started with: a client is only ever leased to a query whose options
+fingerprint matches exactly. Each client serves a single lease and is then
+disconnected, because a CLI process keeps its conversation and would leak it
+into the next query (possibly another tenant's).
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypedDict
+
+import structlog
+
+from apps.api.config import Settings, get_settings
+
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
+logger = structlog.get_logger(__name__)
+
+# Option fields that hold callables or file handles and cannot be fingerprinted
+_UNHASHABLE_OPTION_FIELDS = frozenset(
+    {"can_use_tool", "hooks", "stderr", "debug_stderr"}
+)
+
+# Number of recently leased fingerprints remembered for replenishment decisions
+_DEMAND_HISTORY_SIZE = 1024
+
+
+class SdkClientPoolMetrics(TypedDict):
+    """Point-in-time snapshot of SDK client pool metrics."""
+
+    enabled: bool
+    hits: int
+    misses: int
+    bypassed: int
+    hit_rate: float
+    spawned: int
+    spawn_failures: int
+    evicted: int
+    idle_count: int
+    leased_count: int
+    pending_spawns: int
+    avg_spawn_latency_ms: float
+    last_spawn_latency_ms: float
+
+
+@dataclass
+class _PooledClient:
+    """Pooled client with lifecycle bookkeeping."""
+
+    client: "ClaudeSDKClient"
+    fingerprint: str
+    created_at: float
+
+
+def fingerprint_options(options: "ClaudeAgentOptions") -> str:
+    """Compute a stable fingerprint for SDK options.
+
+    Every serializable option field participates (model, tools, MCP servers,
+    cwd, permission mode, system prompt, env, ...) so two options objects
+    share a fingerprint only if they would start an identical CLI process.
+
+    Args:
+        options: Options built by OptionsBuilder.
+
+    Returns:
+        Hex SHA-256 digest of the canonical option payload.
+    """
+    payload = {
+        field.name: getattr(options, field.name)
+        for field in dataclasses.fields(options)
+        if field.name not in _UNHASHABLE_OPTION_FIELDS
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def is_poolable(options: "ClaudeAgentOptions") -> bool:
+    """Check whether a client for these options may be pooled.
+
+    Resumed, continued and forked conversations are bound to one session and
+    callback-based options cannot be fingerprinted, so those always get a
+    dedicated client.
+
+    Args:
+        options: Options built by OptionsBuilder.
+
+    Returns:
+        True if the options can be served from the pool.
+    """
+    return (
+        options.resume is None
+        and not options.continue_conversation
+        and not options.fork_session
+        and options.can_use_tool is None
+        and options.hooks is None
+    )
+
+
+class SdkClientPool:
+    """Pool of pre-connected ClaudeSDKClient instances.
+
+    After each lease the pool schedules a background spawn so that the next
+    query with the same options fingerprint finds a warm client. Clients are
+    disconnected after their lease, idle clients are evicted once they exceed
+    the configured max age, and the total idle count is bounded with
+    oldest-first eviction.
+    """
+
+    def __init__(self, settings: Settings | None = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            settings: Application settings (defaults to cached settings).
+        """
+        self._settings = settings if settings is not None else get_settings()
+        self._idle: dict[str, deque[_PooledClient]] = {}
+        self._pending: dict[str, int] = {}
+        self._demand: OrderedDict[str, int] = OrderedDict()
+        self._spawn_tasks: set[asyncio.Task[None]] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        self._spawned = 0
+        self._spawn_failures = 0
+        self._evicted = 0
+        self._leased = 0
+        self._spawn_latency_total_ms = 0.0
+        self._last_spawn_latency_ms = 0.0
+
+    @property
+    def idle_count(self) -> int:
+        """Get the number of idle clients across all fingerprints.
+
+        Returns:
+            Idle client count.
+        """
+        return sum(len(entries) for entries in self._idle.values())
+
+    @asynccontextmanager
+    async def lease(
+        self, options: "ClaudeAgentOptions"
+    ) -> AsyncIterator["ClaudeSDKClient"]:
+        """Lease a connected client for the given options.
+
+        Args:
+            options: Options built by OptionsBuilder.
+
+        Yields:
+            Connected ClaudeSDKClient.
+        """
+        if self._closed or not is_poolable(options):
+            self._bypassed += 1
+            client = await self._spawn(options)
+            try:
+                yield client
+            finally:
+                await self._disconnect(client)
+            return
+
+        key = fingerprint_options(options)
+        self._record_demand(key)
+        entry = self._take_idle(key)
+        if entry is not None:
+            self._hits += 1
+        else:
+            self._misses += 1
+            entry = _PooledClient(
+                client=await self._spawn(options),
+                fingerprint=key,
+                created_at=time.monotonic(),
+            )
+
+        self._leased += 1
+        try:
+            yield entry.client
+        finally:
+            self._leased -= 1
+            # Never re-lease: the CLI process still holds this conversation
+            await self._disconnect(entry.client)
+            self._schedule_replenish(key, options)
+
+    async def prewarm(self, options: "ClaudeAgentOptions", count: int = 1) -> int:
+        """Spawn idle clients for known options ahead of traffic.
+
+        Args:
+            options: Options built by OptionsBuilder.
+            count: Number of clients to spawn.
+
+        Returns:
+            Number of clients added to the pool.
+        """
+        if self._closed or not is_poolable(options):
+            return 0
+
+        key = fingerprint_options(options)
+        # Prewarmed options are expected to repeat, so keep them replenished
+        self._demand[key] = max(self._demand.pop(key, 0), 2)
+        added = 0
+        for _ in range(count):
+            if self.idle_count >= self._settings.sdk_pool_max_idle:
+                break
+            try:
+                client = await self._spawn(options)
+            except Exception:
+                break
+            self._put_idle(
+                _PooledClient(
+                    client=client, fingerprint=key, created_at=time.monotonic()
+                )
+            )
+            added += 1
+        return added
+
+    def metrics(self) -> SdkClientPoolMetrics:
+        """Get a snapshot of pool metrics.
+
+        Returns:
+            Pool metrics including hit rate, spawn latency and idle count.
+        """
+        lookups = self._hits + self._misses
+        return SdkClientPoolMetrics(
+            enabled=not self._closed,
+            hits=self._hits,
+            misses=self._misses,
+            bypassed=self._bypassed,
+            hit_rate=round(self._hits / lookups, 4) if lookups else 0.0,
+            spawned=self._spawned,
+            spawn_failures=self._spawn_failures,
+            evicted=self._evicted,
+            idle_count=self.idle_count,
+            leased_count=self._leased,
+            pending_spawns=sum(self._pending.values()),
+            avg_spawn_latency_ms=(
+                round(self._spawn_latency_total_ms / self._spawned, 2)
+                if self._spawned
+                else 0.0
+            ),
+            last_spawn_latency_ms=round(self._last_spawn_latency_ms, 2),
+        )
+
+    async def close(self) -> None:
+        """Stop background spawns and disconnect all idle clients.
+
+        Safe to call multiple times.
+        """
+        self._closed = True
+        for task in self._spawn_tasks:
+            task.cancel()
+        tasks = [*self._spawn_tasks, *self._tasks]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        idle = [entry for entries in self._idle.values() for entry in entries]
+        self._idle.clear()
+        for entry in idle:
+            await self._disconnect(entry.client)
+
+        logger.info("sdk_client_pool_closed", disconnected=len(idle))
+
+    async def _spawn(self, options: "ClaudeAgentOptions") -> "ClaudeSDKClient":
+        """Start and connect a new SDK client.
+
+        Args:
+            options: Options to start the client with.
+
+        Returns:
+            Connected ClaudeSDKClient.
+        """
+        # Import SDK here to avoid import errors if not installed
+        from claude_agent_sdk import ClaudeSDKClient
+
+        client = ClaudeSDKClient(options)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                client.connect(), timeout=self._settings.sdk_pool_spawn_timeout
+            )
+        except BaseException:
+            self._spawn_failures += 1
+            await self._disconnect(client)
+            raise
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self._spawned += 1
+        self._spawn_latency_total_ms += latency_ms
+        self._last_spawn_latency_ms = latency_ms
+        logger.debug("sdk_client_spawned", latency_ms=round(latency_ms, 2))
+        return client
+
+    async def _disconnect(self, client: "ClaudeSDKClient") -> None:
+        """Disconnect a client, logging failures.
+
+        Args:
+            client: Client to disconnect.
+        """
+        try:
+            await client.disconnect()
+        except Exception as exc:
+            logger.warning("sdk_client_disconnect_failed", error=str(exc))
+
+    def _is_expired(self, entry: _PooledClient) -> bool:
+        """Check whether a pooled client exceeded its max age.
+
+        Args:
+            entry: Pooled client.
+
+        Returns:
+            True if the client must not be leased again.
+        """
+        age = time.monotonic() - entry.created_at
+        return age >= self._settings.sdk_pool_max_age_seconds
+
+    def _take_idle(self, key: str) -> _PooledClient | None:
+        """Pop a live idle client for a fingerprint, evicting expired ones.
+
+        Args:
+            key: Options fingerprint.
+
+        Returns:
+            Idle client or None if none is available.
+        """
+        entries = self._idle.get(key)
+        while entries:
+            entry = entries.popleft()
+            if not self._is_expired(entry):
+                if not entries:
+                    del self._idle[key]
+                return entry
+            self._evict(entry)
+        self._idle.pop(key, None)
+        return None
+
+    def _put_idle(self, entry: _PooledClient) -> None:
+        """Add a client to the idle set, evicting the oldest if over capacity.
+
+        Args:
+            entry: Connected client to keep warm.
+        """
+        if self._closed:
+            self._run_background(self._disconnect(entry.client))
+            return
+
+        self._idle.setdefault(entry.fingerprint, deque()).append(entry)
+        while self.idle_count > self._settings.sdk_pool_max_idle:
+            oldest_key = min(self._idle, key=lambda k: self._idle[k][0].created_at)
+            oldest = self._idle[oldest_key].popleft()
+            if not self._idle[oldest_key]:
+                del self._idle[oldest_key]
+            self._evict(oldest)
+
+    def _evict(self, entry: _PooledClient) -> None:
+        """Disconnect an evicted client in the background.
+
+        Args:
+            entry: Client removed from the pool.
+        """
+        self._evicted += 1
+        self._run_background(self._disconnect(entry.client))
+
+    def _record_demand(self, key: str) -> None:
+        """Count a lease for a fingerprint in the bounded demand history.
+
+        Args:
+            key: Options fingerprint.
+        """
+        self._demand[key] = self._demand.pop(key, 0) + 1
+        while len(self._demand) > _DEMAND_HISTORY_SIZE:
+            self._demand.popitem(last=False)
+
+    def _schedule_replenish(self, key: str, options: "ClaudeAgentOptions") -> None:
+        """Spawn replacement clients in the background for a fingerprint.
+
+        Only fingerprints that have been leased more than once are kept warm,
+        so one-off option sets (e.g. per-request system prompts) do not spawn
+        processes that will never be used.
+
+        Args:
+            key: Options fingerprint.
+            options: Options to spawn replacements with.
+        """
+        if self._closed or self._demand.get(key, 0) < 2:
+            return
+
+        target = self._settings.sdk_pool_min_idle_per_key
+        pending = self._pending.get(key, 0)
+        missing = target - len(self._idle.get(key, ())) - pending
+        capacity = (
+            self._settings.sdk_pool_max_idle
+            - self.idle_count
+            - sum(self._pending.values())
+        )
+        for _ in range(max(0, min(missing, capacity))):
+            self._pending[key] = self._pending.get(key, 0) + 1
+            task = asyncio.create_task(self._replenish(key, options))
+            self._spawn_tasks.add(task)
+            task.add_done_callback(self._spawn_tasks.discard)
+
+    async def _replenish(self, key: str, options: "ClaudeAgentOptions") -> None:
+        """Spawn one idle client for a fingerprint.
+
+        Args:
+            key: Options fingerprint.
+            options: Options to spawn the client with.
+        """
+        try:
+            client = await self._spawn(options)
+            self._put_idle(
+                _PooledClient(
+                    client=client, fingerprint=key, created_at=time.monotonic()
+                )
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("sdk_client_replenish_failed", error=str(exc))
+        finally:
+            remaining = self._pending.get(key, 1) - 1
+            if remaining > 0:
+                self._pending[key] = remaining
+            else:
+                self._pending.pop(key, None)
+
+    def _run_background(self, coro: Coroutine[object, object, None]) -> None:
+        """Run a coroutine as a tracked background task.
+
+        Args:
+            coro: Coroutine to schedule.
+        """
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -20,7 +20,4 @@ class CommandDiscovery:
 
     def discover_commands(self) -> list[CommandInfoSchema]:
         """<summary>Return discovered commands as schema objects.</summary>"""
-        discovered = self._commands_service.discover_commands()
-        return [
-            CommandInfoSchema(name=cmd["name"], path=cmd["path"]) for cmd in discovered
-        ]
+        return self._commands_service.discover_command_schemas()
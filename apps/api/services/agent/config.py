@@ -5,9 +5,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from apps.api.protocols import Cache
+    from apps.api.services.agent.client_pool import SdkClientPool
+    from apps.api.services.agent.interrupt_listener import InterruptListener
     from apps.api.services.checkpoint import CheckpointService
     from apps.api.services.mcp_config_injector import McpConfigInjector
     from apps.api.services.memory import MemoryService
+    from apps.api.services.memory_extraction import MemoryExtractionQueue
+    from apps.api.services.transcript_recorder import TranscriptRecorder
     from apps.api.services.webhook import WebhookService
 
 
@@ -24,3 +28,7 @@ class AgentServiceConfig:
     cache: "Cache | None" = None
     mcp_config_injector: "McpConfigInjector | None" = None
     memory_service: "MemoryService | None" = None
+    memory_extraction_queue: "MemoryExtractionQueue | None" = None
+    client_pool: "SdkClientPool | None" = None
+    interrupt_listener: "InterruptListener | None" = None
+    transcript_recorder: "TranscriptRecorder | None" = None
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Callable, Literal, cast  # noqa: UP035
 
 import structlog
@@ -23,6 +22,7 @@ from apps.api.schemas.responses import (
     QuestionEventData,
     UsageSchema,
 )
+from apps.api.services.agent.types import StreamEvent
 
 if TYPE_CHECKING:
     from apps.api.services.agent.types import StreamContext
@@ -43,7 +43,7 @@ class MessageHandler:
 
     def __init__(self) -> None:
         self._message_handlers: dict[
-            str, Callable[[object, StreamContext], dict[str, str] | None]
+            str, Callable[[object, StreamContext], StreamEvent | None]
         ] = {
             "SystemMessage": self._handle_system_message,
             "UserMessage": self._handle_user_message,
@@ -51,14 +51,14 @@ class MessageHandler:
             "ResultMessage": self._handle_result_passthrough,
         }
         self._partial_handlers: dict[
-            str, Callable[[object, StreamContext], dict[str, str]]
+            str, Callable[[object, StreamContext], StreamEvent]
         ] = {
             "ContentBlockStart": self._handle_partial_start,
             "ContentBlockDelta": self._handle_partial_delta,
             "ContentBlockStop": self._handle_partial_stop,
         }
         self._stream_partial_handlers: dict[
-            str, Callable[[object, StreamContext], dict[str, str]]
+            str, Callable[[object, StreamContext], StreamEvent]
         ] = {
             "content_block_start": self._handle_partial_start,
             "content_block_delta": self._handle_partial_delta,
@@ -67,7 +67,7 @@ class MessageHandler:
 
     def map_sdk_message(
         self, message: object, ctx: StreamContext
-    ) -> dict[str, str] | None:
+    ) -> StreamEvent | None:
         """Map SDK message to SSE event dict.
 
         Args:
@@ -96,7 +96,7 @@ class MessageHandler:
 
     def _handle_system_message(
         self, message: object, _ctx: StreamContext
-    ) -> dict[str, str] | None:
+    ) -> StreamEvent | None:
         """Log and ignore SDK system messages."""
         subtype = getattr(message, "subtype", None)
         if subtype == "init":
@@ -127,14 +127,14 @@ class MessageHandler:
 
     def _handle_result_passthrough(
         self, message: object, ctx: StreamContext
-    ) -> dict[str, str] | None:
+    ) -> StreamEvent | None:
         """Update context for result messages without emitting SSE."""
         self._handle_result_message(message, ctx)
         return None
 
     def _handle_stream_event_partial(
         self, message: object, ctx: StreamContext
-    ) -> dict[str, str] | None:
+    ) -> StreamEvent | None:
         """Dispatch partial stream event payloads to handlers by subtype."""
         event_data = getattr(message, "event", None)
         if not isinstance(event_data, dict):
@@ -149,9 +149,7 @@ class MessageHandler:
             return None
         return handler(event_data, ctx)
 
-    def _handle_user_message(
-        self, message: object, ctx: StreamContext
-    ) -> dict[str, str]:
+    def _handle_user_message(self, message: object, ctx: StreamContext) -> StreamEvent:
         """Handle UserMessage from SDK.
 
         Args:
@@ -179,7 +177,7 @@ class MessageHandler:
 
     def _handle_assistant_message(
         self, message: object, ctx: StreamContext
-    ) -> dict[str, str]:
+    ) -> StreamEvent:
         """Handle AssistantMessage from SDK.
 
         Args:
@@ -213,7 +211,7 @@ class MessageHandler:
 
     def _check_special_tool_uses(
         self, content_blocks: list[ContentBlockSchema], ctx: StreamContext
-    ) -> dict[str, str] | None:
+    ) -> StreamEvent | None:
         """Check for special tool uses and return event if found.
 
         Args:
@@ -307,7 +305,7 @@ class MessageHandler:
 
     def _handle_partial_start(
         self, message: object, _ctx: StreamContext
-    ) -> dict[str, str]:
+    ) -> StreamEvent:
         """Handle ContentBlockStart for partial message streaming.
 
         Args:
@@ -393,7 +391,7 @@ class MessageHandler:
 
     def _handle_partial_delta(
         self, message: object, _ctx: StreamContext
-    ) -> dict[str, str]:
+    ) -> StreamEvent:
         """Handle ContentBlockDelta for partial message streaming.
 
         Args:
@@ -488,9 +486,7 @@ class MessageHandler:
             partial_delta_event.event, partial_delta_event.data.model_dump()
         )
 
-    def _handle_partial_stop(
-        self, message: object, _ctx: StreamContext
-    ) -> dict[str, str]:
+    def _handle_partial_stop(self, message: object, _ctx: StreamContext) -> StreamEvent:
         """Handle ContentBlockStop for partial message streaming.
 
         Args:
@@ -670,14 +666,16 @@ class MessageHandler:
             )
         return None
 
-    def format_sse(self, event_type: str, data: dict[str, object]) -> dict[str, str]:
-        """Format data as SSE event dict for EventSourceResponse.
+    def format_sse(self, event_type: str, data: dict[str, object]) -> StreamEvent:
+        """Wrap event data in a typed stream event.
+
+        Encoding is deferred to the transport edge (see StreamEvent).
 
         Args:
             event_type: Event type name.
             data: Event data.
 
         Returns:
-            Dict with event and data keys for SSE.
+            StreamEvent carrying the structured payload.
         """
-        return {"event": event_type, "data": json.dumps(data)}
+        return StreamEvent(event_type, data)
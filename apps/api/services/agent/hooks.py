@@ -16,6 +16,10 @@ class HookExecutor:
     - Stop: When a session ends
     - SubagentStop: When a subagent completes
     - UserPromptSubmit: When a user submits a prompt
+
+    PreToolUse and UserPromptSubmit are always awaited. PostToolUse, Stop and
+    SubagentStop return once queued when the WebhookService has a delivery
+    queue attached.
     """
 
     def __init__(self, webhook_service: "WebhookService") -> None:
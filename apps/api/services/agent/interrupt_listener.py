@@ -0,0 +1,175 @@
+"""Push-based interrupt delivery for streaming sessions.
+
+Interrupts are published on a Redis pub/sub channel by whichever instance
+receives the interrupt request. Every instance runs one InterruptListener
+that subscribes to the channel and flips a local asyncio.Event for sessions
+it is streaming, so the streaming hot loop checks an in-memory flag instead
+of issuing a Redis EXISTS per event.
+"""
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+import structlog
+
+from apps.api.config import Settings, get_settings
+from apps.api.services.agent.session_tracker import interrupt_marker_key
+
+if TYPE_CHECKING:
+    from apps.api.protocols import Cache
+
+logger = structlog.get_logger(__name__)
+
+# Backoff bounds (seconds) for re-subscribing after a pub/sub failure
+_RESUBSCRIBE_BACKOFF_MIN = 0.1
+_RESUBSCRIBE_BACKOFF_MAX = 5.0
+
+
+class InterruptListener:
+    """Per-process subscriber that mirrors interrupt signals into local flags.
+
+    While the subscription is down, ``is_listening`` is False and callers
+    must fall back to checking the Redis interrupt marker directly.
+    """
+
+    def __init__(self, cache: "Cache", settings: Settings | None = None) -> None:
+        """Initialize listener.
+
+        Args:
+            cache: Cache providing Redis pub/sub.
+            settings: Application settings (defaults to cached settings).
+        """
+        self._cache = cache
+        self._settings = settings if settings is not None else get_settings()
+        self._events: dict[str, asyncio.Event] = {}
+        self._watchers: dict[str, int] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._listening = False
+
+    @property
+    def is_listening(self) -> bool:
+        """Check whether the pub/sub subscription is active.
+
+        Returns:
+            True if interrupts are being delivered to local flags.
+        """
+        return self._listening
+
+    async def start(self) -> None:
+        """Start the background subscription task.
+
+        Returns once the first subscription attempt has completed so that
+        streams started right after startup get push delivery.
+        """
+        if self._task is not None:
+            return
+        ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run(ready))
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(
+                ready.wait(), timeout=self._settings.redis_socket_connect_timeout
+            )
+
+    async def close(self) -> None:
+        """Stop the subscription task. Safe to call multiple times."""
+        task, self._task = self._task, None
+        self._listening = False
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def watch(self, session_id: str) -> None:
+        """Start tracking interrupts for a locally running session.
+
+        Args:
+            session_id: Session to watch.
+        """
+        self._watchers[session_id] = self._watchers.get(session_id, 0) + 1
+        self._events.setdefault(session_id, asyncio.Event())
+
+    def unwatch(self, session_id: str) -> None:
+        """Stop tracking interrupts for a session.
+
+        Args:
+            session_id: Session to stop watching.
+        """
+        remaining = self._watchers.get(session_id, 0) - 1
+        if remaining > 0:
+            self._watchers[session_id] = remaining
+            return
+        self._watchers.pop(session_id, None)
+        self._events.pop(session_id, None)
+
+    def is_watching(self, session_id: str) -> bool:
+        """Check whether a session's interrupts are delivered locally.
+
+        Args:
+            session_id: Session to check.
+
+        Returns:
+            True if the listener is subscribed and watching the session.
+        """
+        return self._listening and session_id in self._events
+
+    def is_interrupted(self, session_id: str) -> bool:
+        """Check the local interrupt flag without any I/O.
+
+        Args:
+            session_id: Session to check.
+
+        Returns:
+            True if an interrupt was delivered for the session.
+        """
+        event = self._events.get(session_id)
+        return event is not None and event.is_set()
+
+    def set_interrupted(self, session_id: str) -> None:
+        """Flip the local interrupt flag for a watched session.
+
+        Args:
+            session_id: Interrupted session.
+        """
+        event = self._events.get(session_id)
+        if event is not None:
+            event.set()
+
+    async def _run(self, ready: asyncio.Event) -> None:
+        """Subscribe and deliver interrupts, re-subscribing on failure.
+
+        Args:
+            ready: Set after the first subscription attempt.
+        """
+        channel = self._settings.redis_interrupt_channel
+        backoff = _RESUBSCRIBE_BACKOFF_MIN
+        while True:
+            try:
+                async with self._cache.subscribe(channel) as messages:
+                    self._listening = True
+                    ready.set()
+                    backoff = _RESUBSCRIBE_BACKOFF_MIN
+                    logger.info("interrupt_listener_subscribed", channel=channel)
+                    await self._resync()
+                    async for session_id in messages:
+                        self.set_interrupted(session_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "interrupt_listener_disconnected",
+                    channel=channel,
+                    error=str(exc),
+                    retry_in_seconds=backoff,
+                )
+            finally:
+                self._listening = False
+            ready.set()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, _RESUBSCRIBE_BACKOFF_MAX)
+
+    async def _resync(self) -> None:
+        """Pick up interrupt markers written while the subscription was down."""
+        for session_id in list(self._events):
+            if await self._cache.exists(interrupt_marker_key(session_id)):
+                self.set_interrupted(session_id)
@@ -1,22 +1,30 @@
 """Query execution helpers for AgentService."""
 
 import asyncio
+import time
 from collections.abc import AsyncGenerator, AsyncIterable
+from contextlib import AbstractAsyncContextManager
 from enum import Enum
 from typing import TYPE_CHECKING, NoReturn, Protocol, cast
 
 import structlog
 
-from apps.api.exceptions import AgentError
+from apps.api.config import Settings, get_settings
+from apps.api.exceptions import AgentError, MemoryBusyError
 from apps.api.services.agent.options import OptionsBuilder
-from apps.api.services.agent.types import StreamContext
+from apps.api.services.agent.types import StreamContext, StreamEvent
 from apps.api.utils.crypto import hash_api_key
 
 if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
     from apps.api.schemas.requests.query import QueryRequest
+    from apps.api.services.agent.client_pool import SdkClientPool
     from apps.api.services.agent.handlers import MessageHandler
     from apps.api.services.commands import CommandsService
     from apps.api.services.memory import MemoryService
+    from apps.api.services.memory_extraction import MemoryExtractionQueue
+    from apps.api.types import JsonValue
 
 logger = structlog.get_logger(__name__)
 
@@ -47,13 +55,23 @@ class QueryExecutor:
     def __init__(
         self,
         message_handler: "MessageHandler",
+        client_pool: "SdkClientPool | None" = None,
+        settings: Settings | None = None,
+        extraction_queue: "MemoryExtractionQueue | None" = None,
     ) -> None:
         """Initialize query executor.
 
         Args:
             message_handler: MessageHandler instance for SDK message mapping.
+            client_pool: Optional warm pool of pre-connected SDK clients.
+            settings: Application settings (defaults to cached settings).
+            extraction_queue: Background queue for memory extraction; when
+                None, memories are extracted before the stream completes.
         """
         self._message_handler = message_handler
+        self._client_pool = client_pool
+        self._extraction_queue = extraction_queue
+        self._settings = settings if settings is not None else get_settings()
 
     async def execute(
         self,
@@ -62,7 +80,7 @@ class QueryExecutor:
         commands_service: "CommandsService",
         memory_service: "MemoryService | None" = None,
         api_key: str = "",
-    ) -> AsyncGenerator[dict[str, str], None]:
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Execute query using Claude Agent SDK with memory integration.
 
         Args:
@@ -73,7 +91,7 @@ class QueryExecutor:
             api_key: API key for memory multi-tenant isolation.
 
         Yields:
-            SSE-formatted event dictionaries.
+            Stream events.
 
         Raises:
             AgentError: If SDK execution fails.
@@ -114,7 +132,7 @@ class QueryExecutor:
         memory_service: "MemoryService | None",
         api_key: str,
         assistant_responses: list[str],
-    ) -> AsyncGenerator[dict[str, str], None]:
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Execute query with SDK client.
 
         Args:
@@ -126,11 +144,8 @@ class QueryExecutor:
             assistant_responses: List to track responses.
 
         Yields:
-            SSE event dicts.
+            Stream events.
         """
-        # Import SDK here to avoid import errors if not installed
-        from claude_agent_sdk import ClaudeSDKClient
-
         # Detect slash commands for observability
         parsed_command = commands_service.parse_command(request.prompt)
         if parsed_command:
@@ -139,14 +154,75 @@ class QueryExecutor:
                 session_id=ctx.session_id,
                 command=parsed_command["command"],
                 args=parsed_command["args"],
+                known=commands_service.has_command(parsed_command["command"]),
             )
 
-        # Inject memory context
+        # Search memories in the background while the SDK client starts.
+        # Memories go into the user message unless they must be part of the
+        # system prompt (configured, or a slash command that has to stay first
+        # in the prompt), in which case the search has to finish first.
+        original_request = request
+        memory_deadline = (
+            time.perf_counter() + self._settings.memory_search_deadline_ms / 1000
+        )
+        memory_task: asyncio.Task[str] | None = None
         if memory_service and api_key:
-            request = await self._inject_memory_context(
-                request, memory_service, api_key, ctx.session_id
+            memory_task = asyncio.create_task(
+                self._search_memory_context(request, memory_service, api_key, ctx)
             )
+            if (
+                self._settings.memory_context_placement == "system_prompt"
+                or parsed_command
+            ):
+                memory_context = await self._await_memory_context(
+                    memory_task, memory_deadline, ctx
+                )
+                memory_task = None
+                request = self._with_memory_in_system_prompt(request, memory_context)
+
+        try:
+            async for event in self._run_client(
+                request, ctx, memory_task, memory_deadline, assistant_responses
+            ):
+                yield event
+        finally:
+            if memory_task is not None and not memory_task.done():
+                memory_task.cancel()
+
+        # Extract memories after completion
+        if memory_service and api_key:
+            error_event = await self._extract_memory(
+                original_request,
+                assistant_responses,
+                memory_service,
+                api_key,
+                ctx.session_id,
+            )
+            if error_event:
+                yield error_event
+
+    async def _run_client(
+        self,
+        request: "QueryRequest",
+        ctx: StreamContext,
+        memory_task: "asyncio.Task[str] | None",
+        memory_deadline: float,
+        assistant_responses: list[str],
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """Connect an SDK client, send the query and stream its messages.
 
+        Args:
+            request: Query request.
+            ctx: Stream context (receives per-phase timings).
+            memory_task: Pending memory search whose result is prepended to
+                the prompt once the client is connected, or None.
+            memory_deadline: perf_counter() value after which the query
+                proceeds without memories.
+            assistant_responses: List to track responses.
+
+        Yields:
+            Stream events.
+        """
         # Build SDK options
         options = OptionsBuilder(request).build()
 
@@ -156,13 +232,25 @@ class QueryExecutor:
             model=ctx.model,
             enable_file_checkpointing=request.enable_file_checkpointing,
             permission_mode=request.permission_mode,
+            pooled=self._client_pool is not None,
         )
 
         # Execute query
-        async with ClaudeSDKClient(options) as client:
+        connect_started = time.perf_counter()
+        async with self._open_client(options) as client:
+            ctx.timings["sdk_connect_ms"] = _elapsed_ms(connect_started)
             logger.debug("SDK client connected", session_id=ctx.session_id)
 
+            if memory_task is not None:
+                wait_started = time.perf_counter()
+                memory_context = await self._await_memory_context(
+                    memory_task, memory_deadline, ctx
+                )
+                ctx.timings["memory_wait_ms"] = _elapsed_ms(wait_started)
+                request = self._with_memory_in_prompt(request, memory_context)
+
             # Send query (text or multimodal)
+            query_started = time.perf_counter()
             if request.images:
                 await self._send_multimodal_query(client, request, ctx)
             else:
@@ -172,6 +260,8 @@ class QueryExecutor:
 
             # Process responses
             async for message in client.receive_response():
+                if ctx.num_turns == 0:
+                    ctx.timings["first_message_ms"] = _elapsed_ms(query_started)
                 ctx.num_turns += 1
 
                 logger.debug(
@@ -190,13 +280,24 @@ class QueryExecutor:
 
             logger.debug("SDK client disconnecting", session_id=ctx.session_id)
 
-        # Extract memories after completion
-        if memory_service and api_key:
-            error_event = await self._extract_memory(
-                request, assistant_responses, memory_service, api_key, ctx.session_id
-            )
-            if error_event:
-                yield error_event
+    def _open_client(
+        self, options: "ClaudeAgentOptions"
+    ) -> AbstractAsyncContextManager["ClaudeSDKClient"]:
+        """Open a connected SDK client, leasing from the warm pool if configured.
+
+        Args:
+            options: SDK options built from the request.
+
+        Returns:
+            Async context manager yielding a connected client.
+        """
+        if self._client_pool is not None:
+            return self._client_pool.lease(options)
+
+        # Import SDK here to avoid import errors if not installed
+        from claude_agent_sdk import ClaudeSDKClient
+
+        return ClaudeSDKClient(options)
 
     async def _send_multimodal_query(
         self,
@@ -287,53 +388,42 @@ class QueryExecutor:
         logger.error("SDK execution error", error=str(error))
         raise AgentError("Agent execution failed", original_error=str(error)) from error
 
-    async def _inject_memory_context(
+    async def _search_memory_context(
         self,
         request: "QueryRequest",
         memory_service: "MemoryService",
         api_key: str,
-        session_id: str,
-    ) -> "QueryRequest":
-        """Inject memory context into system prompt.
+        ctx: StreamContext,
+    ) -> str:
+        """Search memories relevant to the prompt.
 
         Args:
             request: Original query request.
             memory_service: Memory service for retrieving context.
             api_key: API key for multi-tenant isolation.
-            session_id: Session ID for logging.
+            ctx: Stream context (receives the memory_search_ms timing).
 
         Returns:
-            Modified request with memory context injected (immutable copy).
+            Formatted memory context, or empty string if none found or the
+            search failed.
         """
         # Hash API key once before try block (prevents duplicate hashing in error path)
         hashed_user_id = hash_api_key(api_key)
+        session_id = ctx.session_id
+        started = time.perf_counter()
 
         try:
             memory_context = await memory_service.format_memory_context(
                 query=request.prompt,
                 user_id=hashed_user_id,
             )
-
-            # Enhance system prompt with memory context if memories found
-            if memory_context:
-                if not isinstance(memory_context, str):
-                    memory_context = str(memory_context)
-                original_system_prompt = request.system_prompt or ""
-                enhanced_system_prompt = (
-                    f"{original_system_prompt}\n\n{memory_context}".strip()
-                )
-                # Create immutable copy with updated system prompt
-                request = request.model_copy(
-                    update={"system_prompt": enhanced_system_prompt}
-                )
-
-                logger.debug(
-                    "memory_context_injected",
-                    session_id=session_id,
-                    user_id=hashed_user_id,
-                    memory_count=memory_context.count("\n- "),
-                )
+        except MemoryBusyError:
+            # Memory pool saturated: shed the search rather than queue behind it
+            ctx.timings["memory_search_ms"] = _elapsed_ms(started)
+            logger.info("memory_injection_shed", session_id=session_id)
+            return ""
         except Exception as exc:
+            ctx.timings["memory_search_ms"] = _elapsed_ms(started)
             logger.warning(
                 "memory_injection_failed",
                 session_id=session_id,
@@ -341,8 +431,92 @@ class QueryExecutor:
                 error=str(exc),
             )
             # Continue without memory context
+            return ""
+
+        ctx.timings["memory_search_ms"] = _elapsed_ms(started)
+        if not memory_context:
+            return ""
+        if not isinstance(memory_context, str):
+            memory_context = str(memory_context)
+        logger.debug(
+            "memory_context_injected",
+            session_id=session_id,
+            user_id=hashed_user_id,
+            memory_count=memory_context.count("\n- "),
+        )
+        return memory_context
 
-        return request
+    async def _await_memory_context(
+        self,
+        memory_task: "asyncio.Task[str]",
+        deadline: float,
+        ctx: StreamContext,
+    ) -> str:
+        """Wait for a memory search until the deadline.
+
+        Args:
+            memory_task: Running memory search.
+            deadline: perf_counter() value after which memories are skipped.
+            ctx: Stream context for logging and timings.
+
+        Returns:
+            Memory context, or empty string if the deadline passed first.
+        """
+        remaining = deadline - time.perf_counter()
+        try:
+            return await asyncio.wait_for(memory_task, max(remaining, 0))
+        except TimeoutError:
+            # wait_for cancels the task; a search running in a worker thread
+            # finishes in the background and its result is discarded
+            logger.warning(
+                "memory_search_deadline_exceeded",
+                session_id=ctx.session_id,
+                deadline_ms=self._settings.memory_search_deadline_ms,
+            )
+            ctx.timings["memory_search_ms"] = float(
+                self._settings.memory_search_deadline_ms
+            )
+            return ""
+
+    @staticmethod
+    def _with_memory_in_system_prompt(
+        request: "QueryRequest", memory_context: str
+    ) -> "QueryRequest":
+        """Append memory context to the system prompt.
+
+        Args:
+            request: Query request.
+            memory_context: Formatted memory context (may be empty).
+
+        Returns:
+            Immutable copy with the enhanced system prompt, or the request
+            unchanged when there is no memory context.
+        """
+        if not memory_context:
+            return request
+        original_system_prompt = request.system_prompt or ""
+        enhanced_system_prompt = f"{original_system_prompt}\n\n{memory_context}".strip()
+        return request.model_copy(update={"system_prompt": enhanced_system_prompt})
+
+    @staticmethod
+    def _with_memory_in_prompt(
+        request: "QueryRequest", memory_context: str
+    ) -> "QueryRequest":
+        """Prepend memory context to the user prompt.
+
+        Args:
+            request: Query request.
+            memory_context: Formatted memory context (may be empty).
+
+        Returns:
+            Immutable copy with the enhanced prompt, or the request unchanged
+            when there is no memory context.
+        """
+        if not memory_context:
+            return request
+        return request.model_copy(
+            update={"prompt": f"{memory_context}\n\n{request.prompt}"}
+        )
 
     def _build_multimodal_content(
         self, request: "QueryRequest"
@@ -423,9 +597,12 @@ class QueryExecutor:
         memory_service: "MemoryService",
         api_key: str,
         session_id: str,
-    ) -> dict[str, str] | None:
+    ) -> StreamEvent | None:
         """Extract and store memories from conversation.
 
+        With an extraction queue the conversation is enqueued and extracted
+        in the background; failures are then reported through queue metrics.
+
         Args:
             request: Original query request.
             assistant_responses: List of assistant response texts.
@@ -439,22 +616,38 @@ class QueryExecutor:
         # Hash API key once before try block (prevents duplicate hashing in error path)
         hashed_user_id = hash_api_key(api_key)
 
-        try:
-            # Format conversation for memory extraction
-            if assistant_responses:
-                assistant_text = " ".join(assistant_responses)
-                conversation = f"User: {request.prompt}\n\nAssistant: {assistant_text}"
+        # Format conversation for memory extraction
+        if assistant_responses:
+            assistant_text = " ".join(assistant_responses)
+            conversation = f"User: {request.prompt}\n\nAssistant: {assistant_text}"
+        else:
+            # Even without responses, store the user prompt
+            conversation = f"User: {request.prompt}"
+        metadata: dict[str, JsonValue] = {"session_id": session_id, "source": "query"}
+
+        if self._extraction_queue is not None:
+            try:
+                job_id = await self._extraction_queue.enqueue(
+                    hashed_user_id, conversation, metadata
+                )
+            except Exception as exc:
+                # Queue unavailable: fall back to extracting inline
+                logger.warning(
+                    "memory_extraction_enqueue_failed",
+                    session_id=session_id,
+                    error=str(exc),
+                )
             else:
-                # Even without responses, store the user prompt
-                conversation = f"User: {request.prompt}"
+                logger.debug(
+                    "memory_extraction_queued", session_id=session_id, job_id=job_id
+                )
+                return None
 
+        try:
             await memory_service.add_memory(
                 messages=conversation,
                 user_id=hashed_user_id,
-                metadata={
-                    "session_id": session_id,
-                    "source": "query",
-                },
+                metadata=metadata,
             )
             logger.debug(
                 "memory_extracted",
@@ -488,7 +681,7 @@ class QueryExecutor:
         self,
         request: "QueryRequest",
         ctx: StreamContext,
-    ) -> AsyncGenerator[dict[str, str], None]:
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Generate mock response for development without SDK.
 
         Args:
@@ -496,7 +689,7 @@ class QueryExecutor:
             ctx: Stream context for tracking execution state.
 
         Yields:
-            SSE-formatted event dictionaries.
+            Stream events.
         """
         from apps.api.schemas.responses import (
             ContentBlockSchema,
@@ -546,3 +739,8 @@ class QueryExecutor:
                     "message": "Mock structured response matching schema",
                     "validated": True,
                 }
+
+
+def _elapsed_ms(started: float) -> float:
+    """Milliseconds since a perf_counter() reading, rounded to 0.01 ms."""
+    return round((time.perf_counter() - started) * 1000, 2)
@@ -22,7 +22,11 @@ from apps.api.services.agent.session_tracker import AgentSessionTracker
 from apps.api.services.agent.single_query_runner import SingleQueryRunner
 from apps.api.services.agent.stream_orchestrator import StreamOrchestrator
 from apps.api.services.agent.stream_query_runner import StreamQueryRunner
-from apps.api.services.agent.types import QueryResponseDict, StreamContext
+from apps.api.services.agent.types import (
+    QueryResponseDict,
+    StreamContext,
+    StreamEvent,
+)
 from apps.api.services.webhook import WebhookService
 
 if TYPE_CHECKING:
@@ -46,6 +50,7 @@ class _StreamRunnerKwargs(TypedDict, total=False):
     session_id_override: str
     api_key: str
     memory_service: "MemoryService | None"
+    record_transcript: bool
 
 
 class _SingleRunnerKwargs(TypedDict, total=False):
@@ -133,17 +138,23 @@ class AgentService:
 
         # Initialize core components
         self._session_tracker = session_tracker or AgentSessionTracker(
-            cache=self._cache
+            cache=self._cache,
+            interrupt_listener=self._config.interrupt_listener,
         )
         self._message_handler = MessageHandler()
         self._hook_executor = HookExecutor(self._webhook_service)
         self._hook_facade = HookFacade(self._hook_executor)
-        self._query_executor = query_executor or QueryExecutor(self._message_handler)
+        self._query_executor = query_executor or QueryExecutor(
+            self._message_handler,
+            client_pool=self._config.client_pool,
+            extraction_queue=self._config.memory_extraction_queue,
+        )
         self._stream_orchestrator = StreamOrchestrator(self._message_handler)
         self._stream_runner = stream_runner or StreamQueryRunner(
             session_tracker=self._session_tracker,
             query_executor=self._query_executor,
             stream_orchestrator=self._stream_orchestrator,
+            transcript_recorder=self._config.transcript_recorder,
         )
         self._single_query_runner = single_query_runner or SingleQueryRunner(
             query_executor=self._query_executor,
@@ -225,8 +236,12 @@ class AgentService:
         return self._checkpoint_service
 
     async def query_stream(
-        self, request: "QueryRequest", api_key: str = ""
-    ) -> AsyncGenerator[dict[str, str], None]:
+        self,
+        request: "QueryRequest",
+        api_key: str = "",
+        *,
+        record_transcript: bool = False,
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Stream a query to the agent (distributed-aware).
 
         This method now uses Redis-backed session tracking instead of
@@ -235,9 +250,12 @@ class AgentService:
         Args:
             request: Query request.
             api_key: API key for scoped MCP server configuration. Empty string disables injection.
+            record_transcript: Persist the transcript to session_messages. Only
+                callers that create the session row may set this, since the
+                messages reference it.
 
         Yields:
-            SSE event dicts with 'event' and 'data' keys.
+            Stream events (encoded lazily at the transport edge).
         """
         # Inject server-side MCP configuration before execution
         if self._mcp_config_injector and api_key:
@@ -285,6 +303,7 @@ class AgentService:
             session_id_override=session_id,
             api_key=api_key,
             memory_service=self._memory_service,
+            record_transcript=record_transcript,
         )
 
         # Invoke runner with typed kwargs
@@ -300,7 +319,7 @@ class AgentService:
         request: "QueryRequest",
         ctx: StreamContext,
         commands_service: "CommandsService",
-    ) -> AsyncGenerator[dict[str, str], None]:
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Execute query using Claude Agent SDK.
 
         Args:
@@ -309,7 +328,7 @@ class AgentService:
             commands_service: Commands service for slash command detection.
 
         Yields:
-            SSE event dicts with 'event' and 'data' keys.
+            Stream events (encoded lazily at the transport edge).
         """
         async for event in self._query_executor.execute(request, ctx, commands_service):
             yield event
@@ -318,7 +337,7 @@ class AgentService:
         self,
         request: "QueryRequest",
         ctx: StreamContext,
-    ) -> AsyncGenerator[dict[str, str], None]:
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Generate mock response for development without SDK.
 
         Args:
@@ -326,7 +345,7 @@ class AgentService:
             ctx: Stream context.
 
         Yields:
-            SSE event dicts with 'event' and 'data' keys.
+            Stream events (encoded lazily at the transport edge).
         """
         async for event in self._query_executor.mock_response(request, ctx):
             yield event
@@ -552,7 +571,7 @@ class AgentService:
 
     def _map_sdk_message(
         self, message: object, ctx: StreamContext
-    ) -> dict[str, str] | None:
+    ) -> StreamEvent | None:
         """Map SDK message to SSE event - delegates to MessageHandler for testing."""
         return self._message_handler.map_sdk_message(message, ctx)
 
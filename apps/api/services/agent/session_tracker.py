@@ -8,17 +8,29 @@ from apps.api.config import Settings, get_settings
 
 if TYPE_CHECKING:
     from apps.api.protocols import Cache
+    from apps.api.services.agent.interrupt_listener import InterruptListener
 
 logger = structlog.get_logger(__name__)
 
 
+def interrupt_marker_key(session_id: str) -> str:
+    """<summary>Return the Redis key of a session's interrupt marker.</summary>"""
+    return f"interrupted:{session_id}"
+
+
 class AgentSessionTracker:
     """<summary>Tracks active sessions and interrupts in Redis.</summary>"""
 
-    def __init__(self, cache: "Cache | None", settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        cache: "Cache | None",
+        settings: Settings | None = None,
+        interrupt_listener: "InterruptListener | None" = None,
+    ) -> None:
         """<summary>Initialize tracker.</summary>"""
         self._cache = cache
         self._settings = settings if settings is not None else get_settings()
+        self._interrupt_listener = interrupt_listener
 
     async def register(self, session_id: str) -> None:
         """<summary>Register session as active.</summary>"""
@@ -28,6 +40,13 @@ class AgentSessionTracker:
         await self._cache.cache_set(key, "true", ttl=self._settings.redis_session_ttl)
         logger.info("Registered active session", session_id=session_id, storage="redis")
 
+        listener = self._interrupt_listener
+        if listener is not None:
+            listener.watch(session_id)
+            # Catch interrupts published before the watch was registered
+            if await self._cache.exists(interrupt_marker_key(session_id)):
+                listener.set_interrupted(session_id)
+
     async def is_active(self, session_id: str) -> bool:
         """<summary>Return True if session is active.</summary>"""
         if not self._cache:
@@ -40,26 +59,45 @@ class AgentSessionTracker:
         if not self._cache:
             raise RuntimeError("Cache is required for distributed session tracking")
         key = f"active_session:{session_id}"
+        if self._interrupt_listener is not None:
+            self._interrupt_listener.unwatch(session_id)
         await self._cache.delete(key)
         logger.info(
             "Unregistered active session", session_id=session_id, storage="redis"
         )
 
     async def is_interrupted(self, session_id: str) -> bool:
-        """<summary>Return True if interrupt marker exists.</summary>"""
+        """<summary>Return True if the session was interrupted.</summary>
+
+        Sessions watched by a subscribed InterruptListener are answered from
+        the local flag; otherwise the Redis interrupt marker is checked.
+        """
         if not self._cache:
             raise RuntimeError("Cache is required for distributed interrupt checking")
-        interrupt_key = f"interrupted:{session_id}"
-        return await self._cache.exists(interrupt_key)
+        listener = self._interrupt_listener
+        if listener is not None and listener.is_watching(session_id):
+            return listener.is_interrupted(session_id)
+        return await self._cache.exists(interrupt_marker_key(session_id))
 
     async def mark_interrupted(self, session_id: str) -> None:
         """<summary>Mark session as interrupted.</summary>"""
         if not self._cache:
             raise RuntimeError("Cache is required for distributed interrupt signaling")
-        interrupt_key = f"interrupted:{session_id}"
         await self._cache.cache_set(
-            interrupt_key, "true", ttl=self._settings.redis_interrupt_ttl
+            interrupt_marker_key(session_id),
+            "true",
+            ttl=self._settings.redis_interrupt_ttl,
+        )
+        # The marker stays authoritative; the publish pushes it to every
+        # instance's InterruptListener so streams stop without polling.
+        if self._interrupt_listener is not None:
+            self._interrupt_listener.set_interrupted(session_id)
+        receivers = await self._cache.publish(
+            self._settings.redis_interrupt_channel, session_id
         )
         logger.info(
-            "Marked session as interrupted", session_id=session_id, storage="redis"
+            "Marked session as interrupted",
+            session_id=session_id,
+            storage="redis",
+            receivers=receivers,
         )
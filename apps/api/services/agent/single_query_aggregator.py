@@ -1,11 +1,12 @@
 """Aggregates streaming events for single-query responses."""
 
-import json
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, cast
 
 import structlog
 
-from apps.api.services.agent.types import StreamContext
+from apps.api.services.agent.types import StreamContext, StreamEvent
+from apps.api.utils.json_codec import get_json_codec
 
 if TYPE_CHECKING:
     from apps.api.services.agent.types import QueryResponseDict
@@ -37,33 +38,51 @@ class SingleQueryAggregator:
         """Return True if an error event was observed."""
         return self._is_error
 
-    def handle_event(self, event: dict[str, str]) -> None:
+    def handle_event(self, event: StreamEvent | Mapping[str, str]) -> None:
         """Handle a streaming event.
 
         Processes 'message' events for content aggregation, 'result' events
         for final usage statistics, and 'error' events for error state tracking.
 
+        Typed events are read from their structured payload, so nothing on the
+        single-query path is ever JSON-encoded or parsed. Plain SSE dicts
+        (JSON ``data`` strings) are still accepted.
+
         Args:
-            event: SSE event dict with 'event' and 'data' keys.
+            event: Typed stream event, or SSE dict with 'event' and 'data' keys.
         """
-        event_type = event.get("event")
-        if event_type == "message":
-            try:
-                event_data = json.loads(event.get("data", "{}"))
-                if event_data.get("type") == "assistant":
-                    self._content_blocks.extend(event_data.get("content", []))
-                    self._accumulate_usage(event_data.get("usage"))
-            except json.JSONDecodeError:
-                logger.error("Failed to parse event data", event=event)
-        elif event_type == "result":
-            # Result event contains final usage statistics
-            try:
-                event_data = json.loads(event.get("data", "{}"))
-                self._accumulate_usage(event_data.get("usage"))
-            except json.JSONDecodeError:
-                logger.error("Failed to parse result event data", event=event)
-        elif event_type == "error":
+        if isinstance(event, StreamEvent):
+            event_type = event.event
+        else:
+            event_type = event.get("event")
+        if event_type == "error":
             self._is_error = True
+            return
+        if event_type not in ("message", "result"):
+            return
+
+        event_data = self._payload(event)
+        if event_data is None:
+            return
+        if event_type == "result":
+            # Result event contains final usage statistics
+            self._accumulate_usage(event_data.get("usage"))
+        elif event_data.get("type") == "assistant":
+            self._content_blocks.extend(event_data.get("content") or [])
+            self._accumulate_usage(event_data.get("usage"))
+
+    @staticmethod
+    def _payload(event: StreamEvent | Mapping[str, str]) -> dict[str, Any] | None:
+        """Return the event data as a dict, parsing it only for SSE dicts."""
+        if isinstance(event, StreamEvent):
+            return cast("dict[str, Any]", event.payload)
+        try:
+            return cast(
+                "dict[str, Any]", get_json_codec().loads(event.get("data", "{}"))
+            )
+        except ValueError:
+            logger.error("Failed to parse event data", event_type=event.get("event"))
+            return None
 
     def _accumulate_usage(self, usage: dict[str, int] | None) -> None:
         """Accumulate usage statistics.
@@ -48,6 +48,10 @@ class SingleQueryRunner:
         Runs the query to completion, collects all events, and returns a complete
         response dictionary with messages, usage, and metadata.
 
+        Events are consumed as typed payloads, so no SSE or JSON encoding
+        happens on this path. Partial-message deltas are never aggregated, so
+        they are disabled for the SDK run rather than mapped and discarded.
+
         Args:
             request: Query request with prompt and configuration.
             commands_service: Service for detecting slash commands.
@@ -67,13 +71,14 @@ class SingleQueryRunner:
         model = request.model or "sonnet"
         start_time = time.perf_counter()
         aggregator = SingleQueryAggregator()
+        if request.include_partial_messages:
+            request = request.model_copy(update={"include_partial_messages": False})
 
         ctx = StreamContext(
             session_id=session_id,
             model=model,
             start_time=start_time,
             enable_file_checkpointing=request.enable_file_checkpointing,
-            include_partial_messages=request.include_partial_messages,
         )
 
         try:
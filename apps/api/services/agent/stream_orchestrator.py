@@ -18,7 +18,7 @@ from apps.api.schemas.responses import (
 
 if TYPE_CHECKING:
     from apps.api.services.agent.handlers import MessageHandler
-    from apps.api.services.agent.types import StreamContext
+    from apps.api.services.agent.types import StreamContext, StreamEvent
 
 
 class StreamOrchestrator:
@@ -41,7 +41,7 @@ class StreamOrchestrator:
         commands: list[CommandInfoSchema],
         permission_mode: str | None,
         mcp_servers: list[dict[str, object]] | None = None,
-    ) -> dict[str, str]:
+    ) -> "StreamEvent":
         """Build init event SSE payload.
 
         Args:
@@ -54,7 +54,7 @@ class StreamOrchestrator:
             mcp_servers: Optional list of MCP server configurations.
 
         Returns:
-            SSE-formatted dict with event type and JSON data.
+            StreamEvent with the structured payload.
         """
         init_event = InitEvent(
             data=InitEventData(
@@ -78,7 +78,7 @@ class StreamOrchestrator:
         self,
         ctx: "StreamContext",
         duration_ms: int,
-    ) -> dict[str, str]:
+    ) -> "StreamEvent":
         """Build result event SSE payload.
 
         Args:
@@ -86,7 +86,7 @@ class StreamOrchestrator:
             duration_ms: Total duration in milliseconds.
 
         Returns:
-            SSE-formatted dict with event type and JSON data.
+            StreamEvent with the structured payload.
         """
         # Convert per-model usage and aggregate total usage
         model_usage_converted: dict[str, UsageSchema] | None = None
@@ -150,6 +150,7 @@ class StreamOrchestrator:
                 model_usage=model_usage_converted,
                 result=ctx.result_text,
                 structured_output=ctx.structured_output,
+                timings=ctx.timings or None,
             )
         )
         return self._message_handler.format_sse(
@@ -159,21 +160,21 @@ class StreamOrchestrator:
     def build_done_event(
         self,
         reason: Literal["completed", "interrupted", "error"],
-    ) -> dict[str, str]:
+    ) -> "StreamEvent":
         """Build done event SSE payload.
 
         Args:
             reason: Completion reason (completed, interrupted, or error).
 
         Returns:
-            SSE-formatted dict with event type and JSON data.
+            StreamEvent with the structured payload.
         """
         done_event = DoneEvent(data=DoneEventData(reason=reason))
         return self._message_handler.format_sse(
             done_event.event, done_event.data.model_dump()
         )
 
-    def build_error_event(self, code: str, message: str) -> dict[str, str]:
+    def build_error_event(self, code: str, message: str) -> "StreamEvent":
         """Build error event SSE payload.
 
         Args:
@@ -181,7 +182,7 @@ class StreamOrchestrator:
             message: Error message to surface.
 
         Returns:
-            SSE-formatted dict with event type and JSON data.
+            StreamEvent with the structured payload.
         """
         error_event = ErrorEvent(data=ErrorEventData(code=code, message=message))
         return self._message_handler.format_sse(
@@ -1,12 +1,15 @@
 """Run streaming queries for AgentService.
 
 Handles the streaming query flow with memory integration and session tracking.
-Yields SSE events for real-time updates during query execution.
+Yields SSE events for real-time updates during query execution. When a
+transcript recorder is configured and the caller persists the session row,
+the prompt and every mapped message and result event are handed to it for
+write-behind persistence.
 """
 
 import time
 from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, cast
 from uuid import uuid4
 
 import structlog
@@ -14,12 +17,14 @@ import structlog
 from apps.api.services.agent.query_executor import QueryExecutor
 from apps.api.services.agent.session_tracker import AgentSessionTracker
 from apps.api.services.agent.stream_orchestrator import StreamOrchestrator
-from apps.api.services.agent.types import StreamContext
+from apps.api.services.agent.types import StreamContext, StreamEvent
 
 if TYPE_CHECKING:
     from apps.api.schemas.requests.query import QueryRequest
     from apps.api.services.commands import CommandsService
     from apps.api.services.memory import MemoryService
+    from apps.api.services.transcript_recorder import TranscriptRecorder
+    from apps.api.types import JsonValue
 
 logger = structlog.get_logger(__name__)
 
@@ -36,6 +41,7 @@ class StreamQueryRunner:
         session_tracker: AgentSessionTracker | None = None,
         query_executor: QueryExecutor | None = None,
         stream_orchestrator: StreamOrchestrator | None = None,
+        transcript_recorder: "TranscriptRecorder | None" = None,
     ) -> None:
         """Initialize dependencies.
 
@@ -43,10 +49,12 @@ class StreamQueryRunner:
             session_tracker: Optional session tracker (required if not injected).
             query_executor: Optional query executor (required if not injected).
             stream_orchestrator: Optional stream orchestrator (required if not injected).
+            transcript_recorder: Optional recorder persisting the transcript.
         """
         self._session_tracker = session_tracker
         self._query_executor = query_executor
         self._stream_orchestrator = stream_orchestrator
+        self._transcript_recorder = transcript_recorder
 
     async def run(
         self,
@@ -55,7 +63,8 @@ class StreamQueryRunner:
         session_id_override: str | None = None,
         memory_service: "MemoryService | None" = None,
         api_key: str = "",
-    ) -> AsyncGenerator[dict[str, str], None]:
+        record_transcript: bool = False,
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Execute the streaming query flow with memory integration.
 
         Manages the complete lifecycle of a streaming query including session
@@ -67,9 +76,11 @@ class StreamQueryRunner:
             session_id_override: Override session ID (uses request.session_id if None).
             memory_service: Optional memory service for context injection/extraction.
             api_key: API key for multi-tenant memory isolation.
+            record_transcript: Persist the transcript; only set by callers
+                that create the session row the messages reference.
 
         Yields:
-            SSE event dictionaries with query progress and results.
+            Stream events with query progress and results.
 
         Raises:
             RuntimeError: If dependencies are not configured.
@@ -91,28 +102,40 @@ class StreamQueryRunner:
             include_partial_messages=request.include_partial_messages,
         )
 
+        recorder = self._transcript_recorder if record_transcript else None
         try:
             await self._session_tracker.register(session_id)
+            await self._record(
+                recorder,
+                session_id,
+                "user",
+                {"type": "user", "content": [{"type": "text", "text": request.prompt}]},
+            )
             async for event in self._query_executor.execute(
                 request, ctx, commands_service, memory_service, api_key
             ):
+                await self._record_event(recorder, session_id, event)
                 yield event
                 if await self._session_tracker.is_interrupted(session_id):
                     duration_ms = int((time.perf_counter() - ctx.start_time) * 1000)
-                    yield self._stream_orchestrator.build_result_event(
+                    result_event = self._stream_orchestrator.build_result_event(
                         ctx=ctx,
                         duration_ms=duration_ms,
                     )
+                    await self._record_event(recorder, session_id, result_event)
+                    yield result_event
                     yield self._stream_orchestrator.build_done_event(
                         reason="interrupted",
                     )
                     return
 
             duration_ms = int((time.perf_counter() - ctx.start_time) * 1000)
-            yield self._stream_orchestrator.build_result_event(
+            result_event = self._stream_orchestrator.build_result_event(
                 ctx=ctx,
                 duration_ms=duration_ms,
             )
+            await self._record_event(recorder, session_id, result_event)
+            yield result_event
             reason: Literal["completed", "error"] = (
                 "error" if ctx.is_error else "completed"
             )
@@ -130,3 +153,44 @@ class StreamQueryRunner:
             yield self._stream_orchestrator.build_done_event(reason="error")
         finally:
             await self._session_tracker.unregister(session_id)
+
+    async def _record_event(
+        self,
+        recorder: "TranscriptRecorder | None",
+        session_id: str,
+        event: StreamEvent,
+    ) -> None:
+        """Hand message and result events to the transcript recorder.
+
+        Args:
+            recorder: Recorder for this stream, or None to skip recording.
+            session_id: Session the event belongs to.
+            event: Stream event; other event types are not persisted.
+        """
+        if recorder is None:
+            return
+        content = cast("dict[str, JsonValue]", event.payload)
+        if event.event == "message":
+            message_type = event.payload.get("type")
+            if isinstance(message_type, str):
+                await self._record(recorder, session_id, message_type, content)
+        elif event.event == "result":
+            await self._record(recorder, session_id, "result", content)
+
+    async def _record(
+        self,
+        recorder: "TranscriptRecorder | None",
+        session_id: str,
+        message_type: str,
+        content: "dict[str, JsonValue]",
+    ) -> None:
+        """Buffer a transcript row; waits only when the recorder is backlogged.
+
+        Args:
+            recorder: Recorder for this stream, or None to skip recording.
+            session_id: Session the message belongs to.
+            message_type: Type of message (user, assistant, system, result).
+            content: Message content.
+        """
+        if recorder is not None:
+            await recorder.record(session_id, message_type, content)
@@ -1,8 +1,15 @@
 """Type definitions for agent service."""
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from typing import TypedDict
 
+from apps.api.utils.json_codec import get_json_codec
+
+# Line separator used by sse-starlette when encoding events
+_SSE_SEP = "\r\n"
+_SSE_SEP_BYTES = _SSE_SEP.encode()
+
 
 class QueryResponseDict(TypedDict):
     """TypedDict for non-streaming query response.
@@ -23,6 +30,86 @@ class QueryResponseDict(TypedDict):
     structured_output: dict[str, object] | None
 
 
+class StreamEvent(Mapping[str, str]):
+    """Typed streaming event with a lazily encoded, cached wire form.
+
+    Producers build events from structured payloads and consumers read
+    ``payload`` directly, so an event is never dumped and re-parsed on its
+    way through the pipeline. The JSON encoding happens at most once, the
+    first time ``data`` or ``encode_sse()`` is used at the edge. Payloads
+    must not be mutated after the event has been built.
+
+    Mapping access (``event["event"]``, ``event["data"]``) preserves the SSE
+    dict shape for callers that still expect it.
+    """
+
+    __slots__ = ("_data", "_json", "_sse", "event", "payload")
+
+    def __init__(self, event: str, payload: dict[str, object]) -> None:
+        """Initialize event.
+
+        Args:
+            event: Event type name.
+            payload: Structured event data.
+        """
+        self.event = event
+        self.payload = payload
+        self._json: bytes | None = None
+        self._data: str | None = None
+        self._sse: bytes | None = None
+
+    @property
+    def json_bytes(self) -> bytes:
+        """UTF-8 JSON-encoded payload, computed once and cached."""
+        if self._json is None:
+            self._json = get_json_codec().dumps(self.payload)
+        return self._json
+
+    @property
+    def data(self) -> str:
+        """JSON-encoded payload as text, decoded once from ``json_bytes``."""
+        if self._data is None:
+            self._data = self.json_bytes.decode("utf-8")
+        return self._data
+
+    def encode_sse(self) -> bytes:
+        """Encode the event as an SSE frame, computed once and cached.
+
+        Returns:
+            Bytes accepted as-is by EventSourceResponse.
+        """
+        if self._sse is None:
+            self._sse = b"".join(
+                (
+                    f"event: {self.event}{_SSE_SEP}data: ".encode(),
+                    self.json_bytes,
+                    _SSE_SEP_BYTES,
+                    _SSE_SEP_BYTES,
+                )
+            )
+        return self._sse
+
+    def __getitem__(self, key: str) -> str:
+        """Return the SSE dict field ``event`` or ``data``."""
+        if key == "event":
+            return self.event
+        if key == "data":
+            return self.data
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the SSE dict keys."""
+        return iter(("event", "data"))
+
+    def __len__(self) -> int:
+        """Return the number of SSE dict keys."""
+        return 2
+
+    def __repr__(self) -> str:
+        """Return a debug representation without forcing encoding."""
+        return f"StreamEvent(event={self.event!r}, payload={self.payload!r})"
+
+
 @dataclass
 class StreamContext:
     """Context for a streaming query.
@@ -52,3 +139,5 @@ class StreamContext:
     files_modified: list[str] = field(default_factory=list)
     # Partial messages tracking (T118)
     include_partial_messages: bool = False
+    # Per-phase span durations in milliseconds (memory search, SDK connect, ...)
+    timings: dict[str, float] = field(default_factory=dict)
@@ -111,8 +111,10 @@ class AgentService:
             share_token=None,
         )
 
-        await self._cache.set_json(self._agent_key(agent_id), agent.__dict__)
-        await self._cache.add_to_set(self._INDEX_KEY, agent_id)
+        pipe = self._cache.pipeline()
+        pipe.set_json(self._agent_key(agent_id), agent.__dict__)
+        pipe.add_to_set(self._INDEX_KEY, agent_id)
+        await pipe.execute()
         return agent
 
     async def get_agent(self, agent_id: str) -> AgentRecord | None:
@@ -167,8 +169,11 @@ class AgentService:
 
     async def delete_agent(self, agent_id: str) -> bool:
         """<summary>Delete an agent.</summary>"""
-        await self._cache.remove_from_set(self._INDEX_KEY, agent_id)
-        return await self._cache.delete(self._agent_key(agent_id))
+        pipe = self._cache.pipeline()
+        pipe.remove_from_set(self._INDEX_KEY, agent_id)
+        pipe.delete(self._agent_key(agent_id))
+        _, deleted = await pipe.execute()
+        return bool(deleted)
 
     async def share_agent(self, agent_id: str, share_url: str) -> AgentRecord | None:
         """<summary>Mark an agent as shared and assign a token.</summary>"""
@@ -26,6 +26,10 @@ from apps.api.config import get_settings
 from apps.api.exceptions.assistant import AssistantNotFoundError
 from apps.api.exceptions.base import APIError
 from apps.api.models.assistant import generate_assistant_id
+from apps.api.services.assistants.sorted_index import (
+    index_marker_key,
+    page_merged_indexes,
+)
 from apps.api.types import JsonValue
 from apps.api.utils.crypto import hash_api_key
 
@@ -34,6 +38,22 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Sorted-set indexes of assistant IDs scored by creation time
+ASSISTANT_INDEX_ALL_KEY = "assistant:index:all"
+ASSISTANT_INDEX_PUBLIC_KEY = "assistant:index:public"
+
+
+def assistant_owner_index_key(owner_api_key_hash: str) -> str:
+    """Build the key of an owner's assistant index.
+
+    Args:
+        owner_api_key_hash: SHA-256 hash of the owning API key.
+
+    Returns:
+        Redis key of the sorted set of the owner's assistant IDs.
+    """
+    return f"assistant:index:owner:{owner_api_key_hash}"
+
 
 # =============================================================================
 # Type Definitions
@@ -239,7 +259,7 @@ class AssistantService:
         Multi-Tenant Isolation:
             - Public assistants visible to all tenants (owner_api_key=None)
             - Private assistants filtered by owner_api_key in list operations
-            - Redis cache uses hashed owner index: assistant:owner:<hash>
+            - Redis cache uses hashed owner index: assistant:index:owner:<hash>
 
         Returns:
             Created assistant.
@@ -424,47 +444,56 @@ class AssistantService:
                     has_more=False,
                 )
 
-            # Fallback for deployments without assistant DB repository:
-            # list cached assistants by OpenAI assistant ID prefix.
-            keys = await self._cache.scan_keys("assistant:asst_*")
-            if not keys:
+            # Deployments without an assistant DB repository page the
+            # creation-time indexes: everything when unfiltered, otherwise
+            # public assistants plus the owner's (multi-tenant isolation).
+            if owner_api_key:
+                index_keys = [
+                    ASSISTANT_INDEX_PUBLIC_KEY,
+                    assistant_owner_index_key(hash_api_key(owner_api_key)),
+                ]
+            else:
+                index_keys = [ASSISTANT_INDEX_ALL_KEY]
+
+            page = await page_merged_indexes(
+                self._cache,
+                index_keys,
+                limit=limit,
+                order=order,
+                after=after,
+                before=before,
+            )
+            if not page.ids:
                 return AssistantListResult(
                     data=[],
                     first_id=None,
                     last_id=None,
-                    has_more=False,
+                    has_more=page.has_more,
                 )
 
-            cached_rows = await self._cache.get_many_json(keys)
+            cached_rows = await self._cache.get_many_json(
+                [self._cache_key(assistant_id) for assistant_id in page.ids]
+            )
             assistants: list[Assistant] = []
-
-            # Hash the owner API key for filtering (multi-tenant isolation)
-            owner_hash = hash_api_key(owner_api_key) if owner_api_key else None
-
-            for parsed in cached_rows:
+            expired: list[str] = []
+            for assistant_id, parsed in zip(page.ids, cached_rows, strict=True):
                 if not parsed:
+                    expired.append(assistant_id)
                     continue
                 assistant = self._parse_cached_assistant(parsed)
-                if not assistant:
-                    continue
+                if assistant:
+                    assistants.append(assistant)
 
-                # Filter by owner to prevent cross-tenant data leakage
-                # Public assistants (owner_api_key_hash=None) are visible to all tenants
-                if owner_hash and assistant.owner_api_key_hash is not None and assistant.owner_api_key_hash != owner_hash:
-                    continue
-
-                assistants.append(assistant)
-
-            reverse = order == "desc"
-            assistants.sort(key=lambda a: a.created_at, reverse=reverse)
-            has_more = len(assistants) > limit
-            assistants = assistants[:limit]
+            # Prune index entries whose assistant has expired
+            if expired:
+                for key in {ASSISTANT_INDEX_ALL_KEY, *index_keys}:
+                    await self._cache.remove_from_sorted_set(key, *expired)
 
             return AssistantListResult(
                 data=assistants,
                 first_id=assistants[0].id if assistants else None,
                 last_id=assistants[-1].id if assistants else None,
-                has_more=has_more,
+                has_more=page.has_more,
             )
 
         try:
@@ -608,17 +637,64 @@ class AssistantService:
 
         # Delete from cache
         if self._cache:
-            key = self._cache_key(assistant_id)
-            await self._cache.delete(key)
-
-            # Phase 3: Remove from owner index using hash directly
-            if assistant and assistant.owner_api_key_hash:
-                owner_index_key = f"assistant:owner:{assistant.owner_api_key_hash}"
-                await self._cache.remove_from_set(owner_index_key, assistant_id)
+            pipe = self._cache.pipeline()
+            pipe.delete(self._cache_key(assistant_id))
+
+            # Phase 3: Remove from indexes (owner index keyed by hash directly)
+            pipe.remove_from_sorted_set(ASSISTANT_INDEX_ALL_KEY, assistant_id)
+            if assistant:
+                pipe.remove_from_sorted_set(
+                    self._scope_index_key(assistant), assistant_id
+                )
+            await pipe.execute()
 
         logger.info("Assistant deleted", assistant_id=assistant_id)
         return True
 
+    async def backfill_indexes(self) -> int:
+        """Index assistants cached before the creation-time indexes existed.
+
+        Runs once per index lifetime (tracked by a marker key) and is meant
+        for startup, so the SCAN it needs stays off the request path.
+        Assistants already indexed are left untouched.
+
+        Returns:
+            Number of assistants added to the indexes.
+        """
+        if not self._cache:
+            return 0
+
+        marker_key = index_marker_key(ASSISTANT_INDEX_ALL_KEY)
+        if await self._cache.exists(marker_key):
+            return 0
+
+        keys = await self._cache.scan_keys("assistant:asst_*", max_keys=10000)
+        rows = await self._cache.get_many_json(keys) if keys else []
+        # Read after the scan so assistants created meanwhile keep their score
+        indexed = set(
+            await self._cache.sorted_set_range(ASSISTANT_INDEX_ALL_KEY, 0, -1)
+        )
+
+        pipe = self._cache.pipeline()
+        added = 0
+        for parsed in rows:
+            assistant = self._parse_cached_assistant(parsed) if parsed else None
+            if not assistant or assistant.id in indexed:
+                continue
+            score = assistant.created_at.timestamp()
+            for index_key in (
+                ASSISTANT_INDEX_ALL_KEY,
+                self._scope_index_key(assistant),
+            ):
+                pipe.add_to_sorted_set(index_key, assistant.id, score)
+                pipe.expire(index_key, self._ttl)
+            added += 1
+        pipe.cache_set(marker_key, "1", self._ttl)
+        await pipe.execute()
+
+        logger.info("Assistant indexes backfilled", added=added)
+        return added
+
     async def _cache_assistant(self, assistant: Assistant) -> None:
         """Cache an assistant in Redis."""
         if not self._cache:
@@ -645,12 +721,22 @@ class AssistantService:
             "updated_at": assistant.updated_at.isoformat(),
         }
 
-        await self._cache.set_json(key, data, self._ttl)
+        pipe = self._cache.pipeline()
+        pipe.set_json(key, data, self._ttl)
+
+        # Phase 3: Index by creation time (owner index keyed by hash directly).
+        # Re-adding on update is idempotent since created_at never changes.
+        score = assistant.created_at.timestamp()
+        for index_key in (ASSISTANT_INDEX_ALL_KEY, self._scope_index_key(assistant)):
+            pipe.add_to_sorted_set(index_key, assistant.id, score)
+            pipe.expire(index_key, self._ttl)
+        await pipe.execute()
 
-        # Phase 3: Add to owner index using hash directly
+    def _scope_index_key(self, assistant: Assistant) -> str:
+        """Get the owner index key for an assistant (public when unowned)."""
         if assistant.owner_api_key_hash:
-            owner_index_key = f"assistant:owner:{assistant.owner_api_key_hash}"
-            await self._cache.add_to_set(owner_index_key, assistant.id)
+            return assistant_owner_index_key(assistant.owner_api_key_hash)
+        return ASSISTANT_INDEX_PUBLIC_KEY
 
     async def _get_cached_assistant(self, assistant_id: str) -> Assistant | None:
         """Get an assistant from cache."""
@@ -11,6 +11,10 @@ from typing import TYPE_CHECKING, Literal, TypedDict
 import structlog
 
 from apps.api.config import get_settings
+from apps.api.services.assistants.sorted_index import (
+    backfill_sorted_index,
+    page_sorted_index,
+)
 from apps.api.types import JsonValue
 
 if TYPE_CHECKING:
@@ -29,6 +33,18 @@ def generate_message_id() -> str:
     return f"msg_{random_suffix}"
 
 
+def thread_messages_index_key(thread_id: str) -> str:
+    """Build the key of a thread's message index (ZSET scored by creation time).
+
+    Args:
+        thread_id: Thread ID.
+
+    Returns:
+        Redis key of the sorted set of message IDs.
+    """
+    return f"thread_messages:{thread_id}"
+
+
 # =============================================================================
 # Content Types
 # =============================================================================
@@ -165,8 +181,9 @@ class MessageService:
             run_id=run_id,
         )
 
-        # Cache the message
-        await self._cache_message(message)
+        # Cache the message and index it (sub-second score keeps same-second
+        # messages in creation order)
+        await self._cache_message(message, index_score=now.timestamp())
 
         logger.info(
             "Message created",
@@ -203,17 +220,19 @@ class MessageService:
     ) -> MessageListResult:
         """List messages in a thread.
 
+        Reads one page of IDs from the thread's message index and fetches
+        only those messages.
+
         Args:
             thread_id: Thread ID to list messages from.
             limit: Maximum number of results.
             order: Sort order ("asc" or "desc").
-            after: Cursor for pagination.
-            before: Cursor for pagination.
+            after: Message ID to list after.
+            before: Message ID to list before.
 
         Returns:
             Paginated message list.
         """
-        _ = (after, before)
         if not self._cache:
             return MessageListResult(
                 data=[],
@@ -222,44 +241,86 @@ class MessageService:
                 has_more=False,
             )
 
-        # Scan for messages in this thread
-        pattern = f"message:{thread_id}:*"
-        keys = await self._cache.scan_keys(pattern)
+        index_key = thread_messages_index_key(thread_id)
+        # Thread may predate the index; index its older messages once
+        await backfill_sorted_index(
+            self._cache, index_key, f"message:{thread_id}:*", self._ttl
+        )
+        page = await page_sorted_index(
+            self._cache,
+            index_key,
+            limit=limit,
+            order=order,
+            after=after,
+            before=before,
+        )
 
-        if not keys:
+        if not page.ids:
             return MessageListResult(
                 data=[],
                 first_id=None,
                 last_id=None,
-                has_more=False,
+                has_more=page.has_more,
             )
 
-        # Fetch all messages
-        cached_rows = await self._cache.get_many_json(keys)
+        # Fetch just this page
+        cached_rows = await self._cache.get_many_json(
+            [self._cache_key(thread_id, message_id) for message_id in page.ids]
+        )
 
         messages: list[Message] = []
-        for parsed in cached_rows:
-            if parsed:
-                message = self._parse_cached_message(parsed)
-                if message:
-                    messages.append(message)
-
-        # Sort by created_at
-        reverse = order == "desc"
-        messages.sort(key=lambda m: m.created_at, reverse=reverse)
-
-        # Apply cursor pagination
-        # TODO: Implement proper cursor-based pagination
-        has_more = len(messages) > limit
-        messages = messages[:limit]
+        expired: list[str] = []
+        for message_id, parsed in zip(page.ids, cached_rows, strict=True):
+            if not parsed:
+                expired.append(message_id)
+                continue
+            message = self._parse_cached_message(parsed)
+            if message:
+                messages.append(message)
+
+        # Prune index entries whose message has expired
+        if expired:
+            await self._cache.remove_from_sorted_set(index_key, *expired)
 
         return MessageListResult(
             data=messages,
             first_id=messages[0].id if messages else None,
             last_id=messages[-1].id if messages else None,
-            has_more=has_more,
+            has_more=page.has_more,
         )
 
+    async def delete_message(
+        self,
+        thread_id: str,
+        message_id: str,
+    ) -> bool:
+        """Delete a message from a thread.
+
+        Args:
+            thread_id: Thread ID containing the message.
+            message_id: Message ID to delete.
+
+        Returns:
+            True if deleted, False if not found.
+        """
+        if not self._cache:
+            return False
+
+        pipe = self._cache.pipeline()
+        pipe.remove_from_sorted_set(thread_messages_index_key(thread_id), message_id)
+        pipe.delete(self._cache_key(thread_id, message_id))
+        results = await pipe.execute()
+        deleted = bool(results[-1])
+
+        if deleted:
+            logger.info(
+                "Message deleted",
+                message_id=message_id,
+                thread_id=thread_id,
+            )
+
+        return deleted
+
     async def modify_message(
         self,
         thread_id: str,
@@ -294,8 +355,14 @@ class MessageService:
 
         return message
 
-    async def _cache_message(self, message: Message) -> None:
-        """Cache a message in Redis."""
+    async def _cache_message(
+        self, message: Message, index_score: float | None = None
+    ) -> None:
+        """Cache a message in Redis.
+
+        With ``index_score`` the message is also added to its thread's index
+        (refreshing the index TTL) in the same pipelined round-trip.
+        """
         if not self._cache:
             return
 
@@ -317,7 +384,16 @@ class MessageService:
             "run_id": message.run_id,
         }
 
-        await self._cache.set_json(key, data, self._ttl)
+        if index_score is None:
+            await self._cache.set_json(key, data, self._ttl)
+            return
+
+        index_key = thread_messages_index_key(message.thread_id)
+        pipe = self._cache.pipeline()
+        pipe.set_json(key, data, self._ttl)
+        pipe.add_to_sorted_set(index_key, message.id, index_score)
+        pipe.expire(index_key, self._ttl)
+        await pipe.execute()
 
     async def _get_cached_message(
         self,
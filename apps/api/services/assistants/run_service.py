@@ -11,6 +11,10 @@ from typing import TYPE_CHECKING, Literal, Protocol, TypedDict, cast, runtime_ch
 import structlog
 
 from apps.api.config import get_settings
+from apps.api.services.assistants.sorted_index import (
+    backfill_sorted_index,
+    page_sorted_index,
+)
 from apps.api.types import JsonValue
 
 if TYPE_CHECKING:
@@ -42,6 +46,18 @@ def generate_run_id() -> str:
     return f"run_{random_suffix}"
 
 
+def thread_runs_index_key(thread_id: str) -> str:
+    """Build the key of a thread's run index (ZSET scored by creation time).
+
+    Args:
+        thread_id: Thread ID.
+
+    Returns:
+        Redis key of the sorted set of run IDs.
+    """
+    return f"thread_runs:{thread_id}"
+
+
 # =============================================================================
 # Tool Call Types
 # =============================================================================
@@ -267,8 +283,8 @@ class RunService:
                 metadata=run.metadata,
             )
 
-        # Cache
-        await self._cache_run(run)
+        # Cache and index
+        await self._cache_run(run, index_score=now.timestamp())
 
         logger.info(
             "Run created",
@@ -300,13 +316,20 @@ class RunService:
         thread_id: str,
         limit: int = 20,
         order: str = "desc",
+        after: str | None = None,
+        before: str | None = None,
     ) -> RunListResult:
         """List runs for a thread.
 
+        Reads one page of IDs from the thread's run index and fetches only
+        those runs.
+
         Args:
             thread_id: Thread ID to list runs from.
             limit: Maximum number of results.
             order: Sort order.
+            after: Run ID to list after.
+            before: Run ID to list before.
 
         Returns:
             Paginated run list.
@@ -319,41 +342,52 @@ class RunService:
                 has_more=False,
             )
 
-        # Scan for runs in this thread
-        pattern = f"run:{thread_id}:*"
-        keys = await self._cache.scan_keys(pattern)
+        index_key = thread_runs_index_key(thread_id)
+        # Thread may predate the index; index its older runs once
+        await backfill_sorted_index(
+            self._cache, index_key, f"run:{thread_id}:*", self._ttl
+        )
+        page = await page_sorted_index(
+            self._cache,
+            index_key,
+            limit=limit,
+            order=order,
+            after=after,
+            before=before,
+        )
 
-        if not keys:
+        if not page.ids:
             return RunListResult(
                 data=[],
                 first_id=None,
                 last_id=None,
-                has_more=False,
+                has_more=page.has_more,
             )
 
-        # Fetch all runs
-        cached_rows = await self._cache.get_many_json(keys)
+        # Fetch just this page
+        cached_rows = await self._cache.get_many_json(
+            [self._cache_key(thread_id, run_id) for run_id in page.ids]
+        )
 
         runs: list[Run] = []
-        for parsed in cached_rows:
-            if parsed:
-                run = self._parse_cached_run(parsed)
-                if run:
-                    runs.append(run)
-
-        # Sort
-        reverse = order == "desc"
-        runs.sort(key=lambda r: r.created_at, reverse=reverse)
-
-        # Paginate
-        has_more = len(runs) > limit
-        runs = runs[:limit]
+        expired: list[str] = []
+        for run_id, parsed in zip(page.ids, cached_rows, strict=True):
+            if not parsed:
+                expired.append(run_id)
+                continue
+            run = self._parse_cached_run(parsed)
+            if run:
+                runs.append(run)
+
+        # Prune index entries whose run has expired
+        if expired:
+            await self._cache.remove_from_sorted_set(index_key, *expired)
 
         return RunListResult(
             data=runs,
             first_id=runs[0].id if runs else None,
             last_id=runs[-1].id if runs else None,
-            has_more=has_more,
+            has_more=page.has_more,
         )
 
     async def start_run(
@@ -570,8 +604,12 @@ class RunService:
                 usage=dict(run.usage) if run.usage else None,
             )
 
-    async def _cache_run(self, run: Run) -> None:
-        """Cache a run in Redis."""
+    async def _cache_run(self, run: Run, index_score: float | None = None) -> None:
+        """Cache a run in Redis.
+
+        With ``index_score`` the run is also added to its thread's index
+        (refreshing the index TTL) in the same pipelined round-trip.
+        """
         if not self._cache:
             return
 
@@ -602,7 +640,16 @@ class RunService:
             "completed_at": run.completed_at,
         }
 
-        await self._cache.set_json(key, data, self._ttl)
+        if index_score is None:
+            await self._cache.set_json(key, data, self._ttl)
+            return
+
+        index_key = thread_runs_index_key(run.thread_id)
+        pipe = self._cache.pipeline()
+        pipe.set_json(key, data, self._ttl)
+        pipe.add_to_sorted_set(index_key, run.id, index_score)
+        pipe.expire(index_key, self._ttl)
+        await pipe.execute()
 
     async def _get_cached_run(
         self,
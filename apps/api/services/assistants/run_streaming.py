@@ -4,12 +4,12 @@ Emits Server-Sent Events (SSE) for run state changes, message deltas,
 and step updates following OpenAI's Assistants API streaming protocol.
 """
 
-import json
 from typing import Literal, Required, TypedDict
 
 import structlog
 
 from apps.api.services.assistants.run_service import Run
+from apps.api.utils.json_codec import get_json_codec
 
 logger = structlog.get_logger(__name__)
 
@@ -375,7 +375,7 @@ def format_sse_event(event: AssistantStreamEvent | str) -> str:
     if isinstance(event, dict):
         event_type = event.get("event", "")
         data = event.get("data", {})
-        return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+        return f"event: {event_type}\ndata: {get_json_codec().dumps_str(data)}\n\n"
 
     # Fallback for unknown types
-    return f"data: {json.dumps(event)}\n\n"
+    return f"data: {get_json_codec().dumps_str(event)}\n\n"
@@ -0,0 +1,301 @@
+"""Cursor pagination over Redis sorted-set indexes.
+
+Thread messages and runs are indexed per thread in a sorted set scored by
+creation time. A page is served by locating the ``after``/``before`` cursor
+IDs with ZRANK and reading just the page with a ZRANGE by rank, so the cost
+is O(log N + limit) instead of scanning and parsing every object in the thread.
+Ranks (rather than score bounds) keep objects created in the same instant in
+a stable order without skipping or repeating any of them across pages.
+
+Assistants visible to an API key span two indexes (its own and the public
+one); page_merged_indexes pages their union by (score, member) using
+ZRANGEBYSCORE reads bounded by the page size.
+
+Messages and runs cached before their thread had an index are indexed by
+backfill_sorted_index the first time the thread is listed after the index
+was introduced; a per-index marker key records that the backfill ran.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from apps.api.protocols import Cache
+
+
+@dataclass
+class IndexPage:
+    """Member IDs of one page of a sorted-set index."""
+
+    ids: list[str]
+    has_more: bool
+
+
+async def page_sorted_index(
+    cache: "Cache",
+    index_key: str,
+    *,
+    limit: int,
+    order: str = "desc",
+    after: str | None = None,
+    before: str | None = None,
+) -> IndexPage:
+    """Read one page of IDs from a sorted-set index.
+
+    ``after`` returns the IDs following that ID in list order; ``before``
+    alone returns the ``limit`` IDs immediately preceding it. With both,
+    the page is bounded on each side. A cursor ID that is no longer in the
+    index yields an empty page.
+
+    Args:
+        cache: Cache holding the index.
+        index_key: Sorted set key.
+        limit: Maximum number of IDs.
+        order: "asc" (oldest first) or "desc" (newest first).
+        after: ID to start after.
+        before: ID to stop before.
+
+    Returns:
+        Page of IDs in list order and whether more follow in that direction.
+    """
+    descending = order == "desc"
+    empty = IndexPage(ids=[], has_more=False)
+
+    low = 0
+    if after is not None:
+        after_rank = await cache.sorted_set_rank(
+            index_key, after, descending=descending
+        )
+        if after_rank is None:
+            return empty
+        low = after_rank + 1
+
+    if before is not None:
+        before_rank = await cache.sorted_set_rank(
+            index_key, before, descending=descending
+        )
+        if before_rank is None or before_rank <= low:
+            return empty
+        high = before_rank - 1
+        if after is None:
+            # Previous page: the items immediately preceding the cursor
+            start = max(low, high - limit + 1)
+            ids = await cache.sorted_set_range(
+                index_key, start, high, descending=descending
+            )
+            return IndexPage(ids=ids, has_more=start > low)
+        stop = min(low + limit, high)
+    else:
+        # Read one extra ID to learn whether another page exists
+        stop = low + limit
+
+    ids = await cache.sorted_set_range(index_key, low, stop, descending=descending)
+    return IndexPage(ids=ids[:limit], has_more=len(ids) > limit)
+
+
+async def page_merged_indexes(
+    cache: "Cache",
+    index_keys: "Sequence[str]",
+    *,
+    limit: int,
+    order: str = "desc",
+    after: str | None = None,
+    before: str | None = None,
+) -> IndexPage:
+    """Read one page of IDs from the union of several sorted-set indexes.
+
+    Members are ordered by (score, member) across all indexes, which is the
+    order Redis itself uses within one index. Cursors are located by score
+    (ZSCORE) and each index is read with ZRANGEBYSCORE for at most
+    ``limit + 1`` members past the cursor, so the cost does not depend on
+    the size of the indexes. A single index is served by page_sorted_index.
+
+    Args:
+        cache: Cache holding the indexes.
+        index_keys: Sorted set keys; every member must appear in only one.
+        limit: Maximum number of IDs.
+        order: "asc" (oldest first) or "desc" (newest first).
+        after: ID to start after.
+        before: ID to stop before.
+
+    Returns:
+        Page of IDs in list order and whether more follow in that direction.
+    """
+    if len(index_keys) == 1:
+        return await page_sorted_index(
+            cache,
+            index_keys[0],
+            limit=limit,
+            order=order,
+            after=after,
+            before=before,
+        )
+
+    descending = order == "desc"
+    empty = IndexPage(ids=[], has_more=False)
+
+    after_pos = await _locate(cache, index_keys, after) if after else None
+    before_pos = await _locate(cache, index_keys, before) if before else None
+    if (after and after_pos is None) or (before and before_pos is None):
+        return empty
+
+    if before_pos is not None and after_pos is None:
+        # Previous page: walk backwards from the cursor, then restore order
+        rows = await _walk_merged(
+            cache,
+            index_keys,
+            start=before_pos,
+            descending=not descending,
+            count=limit + 1,
+        )
+        ids = [member for _, member in rows[:limit]]
+        return IndexPage(ids=ids[::-1], has_more=len(rows) > limit)
+
+    rows = await _walk_merged(
+        cache,
+        index_keys,
+        start=after_pos,
+        stop=before_pos,
+        descending=descending,
+        count=limit + 1,
+    )
+    return IndexPage(
+        ids=[member for _, member in rows[:limit]], has_more=len(rows) > limit
+    )
+
+
+def index_marker_key(index_key: str) -> str:
+    """Build the key marking an index as backfilled.
+
+    Args:
+        index_key: Sorted set key.
+
+    Returns:
+        Redis key of the marker.
+    """
+    return f"{index_key}:indexed"
+
+
+async def backfill_sorted_index(
+    cache: "Cache", index_key: str, pattern: str, ttl: int
+) -> int:
+    """Index objects cached before their index existed, once per index.
+
+    Does nothing while the index's marker key exists. Otherwise scans the
+    scoped key pattern and adds every object missing from the index, scored
+    by its ``created_at`` (whole seconds, so those objects are ordered by ID
+    within a second), then sets the marker. Objects already indexed keep
+    their score, so an index that gained entries before its first list is
+    completed rather than skipped.
+
+    Args:
+        cache: Cache holding the objects and the index.
+        index_key: Sorted set key to fill.
+        pattern: SCAN pattern scoped to the index's objects.
+        ttl: Index and marker TTL in seconds.
+
+    Returns:
+        Number of objects added to the index.
+    """
+    marker_key = index_marker_key(index_key)
+    if await cache.exists(marker_key):
+        return 0
+    keys = await cache.scan_keys(pattern)
+    rows = await cache.get_many_json(keys) if keys else []
+    # Read after the scan so objects created meanwhile keep their own score
+    indexed = set(await cache.sorted_set_range(index_key, 0, -1))
+    pipe = cache.pipeline()
+    added = 0
+    for row in rows:
+        if not row:
+            continue
+        member = row.get("id")
+        created_at = row.get("created_at")
+        if (
+            isinstance(member, str)
+            and member not in indexed
+            and isinstance(created_at, (int, float))
+        ):
+            pipe.add_to_sorted_set(index_key, member, float(created_at))
+            added += 1
+    if added:
+        pipe.expire(index_key, ttl)
+    pipe.cache_set(marker_key, "1", ttl)
+    await pipe.execute()
+    return added
+
+
+async def _locate(
+    cache: "Cache", index_keys: "Sequence[str]", member: str
+) -> tuple[float, str] | None:
+    """Return (score, member) of a member from whichever index holds it."""
+    for key in index_keys:
+        score = await cache.sorted_set_score(key, member)
+        if score is not None:
+            return score, member
+    return None
+
+
+async def _walk_merged(
+    cache: "Cache",
+    index_keys: "Sequence[str]",
+    *,
+    start: tuple[float, str] | None,
+    descending: bool,
+    count: int,
+    stop: tuple[float, str] | None = None,
+) -> list[tuple[float, str]]:
+    """Read up to ``count`` positions strictly between start and stop."""
+    rows: list[tuple[float, str]] = []
+    for key in index_keys:
+        rows.extend(
+            await _walk(
+                cache, key, start=start, stop=stop, descending=descending, count=count
+            )
+        )
+    rows.sort(reverse=descending)
+    return rows[:count]
+
+
+async def _walk(
+    cache: "Cache",
+    index_key: str,
+    *,
+    start: tuple[float, str] | None,
+    stop: tuple[float, str] | None,
+    descending: bool,
+    count: int,
+) -> list[tuple[float, str]]:
+    """Read up to ``count`` positions of one index strictly between start and stop."""
+
+    def beyond(pos: tuple[float, str], bound: tuple[float, str]) -> bool:
+        return pos < bound if descending else pos > bound
+
+    rows: list[tuple[float, str]] = []
+    low: float | str = "-inf"
+    high: float | str = "+inf"
+    if start is not None:
+        # Members sharing the cursor's score are ordered by member name
+        ties = await cache.sorted_set_range_by_score(
+            index_key, start[0], start[0], descending=descending
+        )
+        rows.extend((score, m) for m, score in ties if beyond((score, m), start))
+        if descending:
+            high = f"({start[0]!r}"
+        else:
+            low = f"({start[0]!r}"
+    if stop is not None:
+        if descending:
+            low = stop[0]
+        else:
+            high = stop[0]
+
+    tail = await cache.sorted_set_range_by_score(
+        index_key, low, high, descending=descending, count=count
+    )
+    rows.extend((score, m) for m, score in tail)
+    if stop is not None:
+        rows = [pos for pos in rows if beyond(stop, pos)]
+    return rows[:count]
@@ -12,6 +12,9 @@ from typing import TYPE_CHECKING
 import structlog
 
 from apps.api.config import get_settings
+from apps.api.services.assistants.message_service import thread_messages_index_key
+from apps.api.services.assistants.run_service import thread_runs_index_key
+from apps.api.services.assistants.sorted_index import index_marker_key
 from apps.api.types import JsonValue
 
 if TYPE_CHECKING:
@@ -231,10 +234,17 @@ class ThreadService:
         if self._session_service and thread.session_id:
             await self._session_service.delete_session(thread.session_id)
 
-        # Delete from cache
+        # Delete from cache, dropping the thread's message and run indexes
         if self._cache:
-            key = self._cache_key(thread_id)
-            await self._cache.delete(key)
+            pipe = self._cache.pipeline()
+            pipe.delete(self._cache_key(thread_id))
+            for index_key in (
+                thread_messages_index_key(thread_id),
+                thread_runs_index_key(thread_id),
+            ):
+                pipe.delete(index_key)
+                pipe.delete(index_marker_key(index_key))
+            await pipe.execute()
 
         logger.info("Thread deleted", thread_id=thread_id)
         return True
@@ -99,15 +99,8 @@ class CheckpointService:
             files_modified=files_modified,
         )
 
-        # Cache the checkpoint
         await self._cache_checkpoint(checkpoint)
 
-        # Add to session checkpoints list
-        await self._add_to_session_checkpoints(checkpoint)
-
-        # Create UUID index for lookup by user_message_uuid
-        await self._create_uuid_index(checkpoint)
-
         logger.info(
             "Checkpoint created",
             checkpoint_id=checkpoint_id,
@@ -206,7 +199,10 @@ class CheckpointService:
         return checkpoint.session_id == session_id
 
     async def _cache_checkpoint(self, checkpoint: Checkpoint) -> None:
-        """Cache a checkpoint in Redis.
+        """Cache a checkpoint, its session list entry and its UUID index.
+
+        The session checkpoints list is read first; the three writes are then
+        sent together in one pipelined round-trip.
 
         Args:
             checkpoint: Checkpoint to cache.
@@ -214,7 +210,6 @@ class CheckpointService:
         if not self._cache:
             return
 
-        key = self._checkpoint_key(checkpoint.id)
         data: CachedCheckpointData = {
             "id": checkpoint.id,
             "session_id": checkpoint.session_id,
@@ -223,7 +218,31 @@ class CheckpointService:
             "files_modified": checkpoint.files_modified,
         }
 
-        await self._cache.set_json(key, cast("dict[str, JsonValue]", data), self._ttl)
+        # Append to the session checkpoints list
+        list_key = self._checkpoints_key(checkpoint.session_id)
+        session_list = await self._cache.get_json(list_key)
+        if session_list is None:
+            session_list = {"checkpoints": []}
+        checkpoints_raw = session_list.get("checkpoints", [])
+        if not isinstance(checkpoints_raw, list):
+            checkpoints_raw = []
+        checkpoints_raw.append(cast("JsonValue", dict(data)))
+        session_list["checkpoints"] = checkpoints_raw
+
+        pipe = self._cache.pipeline()
+        pipe.set_json(
+            self._checkpoint_key(checkpoint.id),
+            cast("dict[str, JsonValue]", data),
+            self._ttl,
+        )
+        pipe.set_json(list_key, session_list, self._ttl)
+        # Index for lookup by user_message_uuid
+        pipe.cache_set(
+            self._uuid_index_key(checkpoint.user_message_uuid),
+            checkpoint.id,
+            self._ttl,
+        )
+        await pipe.execute()
 
     async def _get_cached_checkpoint(self, checkpoint_id: str) -> Checkpoint | None:
         """Get a checkpoint from cache.
@@ -245,49 +264,6 @@ class CheckpointService:
 
         return self._parse_checkpoint_data(parsed)
 
-    async def _add_to_session_checkpoints(self, checkpoint: Checkpoint) -> None:
-        """Add checkpoint to session checkpoints list.
-
-        Args:
-            checkpoint: Checkpoint to add.
-        """
-        if not self._cache:
-            return
-
-        key = self._checkpoints_key(checkpoint.session_id)
-        data = await self._cache.get_json(key)
-
-        if data is None:
-            data = {"checkpoints": []}
-
-        checkpoints_raw = data.get("checkpoints", [])
-        if not isinstance(checkpoints_raw, list):
-            checkpoints_raw = []
-
-        checkpoint_data: CachedCheckpointData = {
-            "id": checkpoint.id,
-            "session_id": checkpoint.session_id,
-            "user_message_uuid": checkpoint.user_message_uuid,
-            "created_at": checkpoint.created_at.isoformat(),
-            "files_modified": checkpoint.files_modified,
-        }
-        checkpoints_raw.append(cast("JsonValue", checkpoint_data))
-
-        data["checkpoints"] = checkpoints_raw
-        await self._cache.set_json(key, data, self._ttl)
-
-    async def _create_uuid_index(self, checkpoint: Checkpoint) -> None:
-        """Create UUID index for checkpoint lookup.
-
-        Args:
-            checkpoint: Checkpoint to create index for.
-        """
-        if not self._cache:
-            return
-
-        index_key = self._uuid_index_key(checkpoint.user_message_uuid)
-        await self._cache.cache_set(index_key, checkpoint.id, self._ttl)
-
     def _parse_checkpoint_data(self, data: dict[str, JsonValue]) -> Checkpoint | None:
         """Parse checkpoint data from cache format.
 
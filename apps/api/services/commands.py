@@ -1,13 +1,22 @@
 """Slash commands discovery and execution service."""
 
 import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TypedDict
 
 import structlog
 
+from apps.api.schemas.responses import CommandInfoSchema
+
 logger = structlog.get_logger(__name__)
 
+# Pattern: /command_name followed by optional whitespace and args
+_COMMAND_ARGS_PATTERN = re.compile(r"^/[a-zA-Z][a-zA-Z0-9_-]*\s*(.*)", re.DOTALL)
+
 
 class CommandInfo(TypedDict):
     """Information about a discovered command."""
@@ -23,29 +32,123 @@ class ParsedCommand(TypedDict):
     args: str
 
 
-class CommandsService:
-    """Service for discovering and executing slash commands."""
+class CommandCacheMetrics(TypedDict):
+    """Snapshot of command discovery cache counters."""
+
+    entries: int
+    hits: int
+    misses: int
+    evicted: int
+
+
+@dataclass(frozen=True, slots=True)
+class CommandSet:
+    """Commands discovered in one .claude/commands directory."""
+
+    mtime_ns: int | None
+    loaded_at: float
+    commands: tuple[CommandInfo, ...]
+    schemas: tuple[CommandInfoSchema, ...]
+    names: frozenset[str]
 
-    def __init__(self, project_path: Path | str) -> None:
-        """Initialize commands service.
+
+class CommandDiscoveryCache:
+    """Process-wide LRU cache of discovered commands keyed by commands dir.
+
+    An entry is reused while the directory's mtime is unchanged (adding,
+    removing or renaming a command file bumps it) and the entry is younger
+    than ``ttl_seconds``. Validating an entry costs a single stat() instead
+    of a directory walk.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        """Initialize cache.
 
         Args:
-            project_path: Path to project root containing .claude/commands/
+            max_entries: Max directories kept before evicting the least recent.
+            ttl_seconds: Max entry age in seconds (0 disables age expiry).
         """
-        self.project_path = Path(project_path)
-        self.commands_dir = self.project_path / ".claude" / "commands"
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Path, CommandSet] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
 
-    def discover_commands(self) -> list[CommandInfo]:
-        """Discover commands from .claude/commands/ directory.
+    def get(self, commands_dir: Path) -> CommandSet:
+        """Return the command set for a directory, rescanning if stale.
+
+        Args:
+            commands_dir: Resolved .claude/commands directory.
 
         Returns:
-            List of command info dicts with name and path
+            Cached or freshly scanned CommandSet.
+        """
+        mtime_ns = _dir_mtime_ns(commands_dir)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(commands_dir)
+            if entry is not None and self._is_fresh(entry, mtime_ns, now):
+                self._entries.move_to_end(commands_dir)
+                self._hits += 1
+                return entry
+            self._misses += 1
+
+        entry = _scan_commands(commands_dir, mtime_ns, now)
+        with self._lock:
+            self._entries[commands_dir] = entry
+            self._entries.move_to_end(commands_dir)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evicted += 1
+        return entry
+
+    def invalidate(self, commands_dir: Path | None = None) -> None:
+        """Drop one directory's entry, or every entry when None.
+
+        Args:
+            commands_dir: Resolved .claude/commands directory.
+        """
+        with self._lock:
+            if commands_dir is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(commands_dir, None)
+
+    def metrics(self) -> CommandCacheMetrics:
+        """Return cache counters.
+
+        Returns:
+            Entry count and hit/miss/eviction totals.
         """
-        if not self.commands_dir.exists():
-            return []
+        with self._lock:
+            return CommandCacheMetrics(
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evicted=self._evicted,
+            )
+
+    def _is_fresh(self, entry: CommandSet, mtime_ns: int | None, now: float) -> bool:
+        if entry.mtime_ns != mtime_ns:
+            return False
+        return self._ttl_seconds == 0 or now - entry.loaded_at < self._ttl_seconds
+
+
+def _dir_mtime_ns(path: Path) -> int | None:
+    """Return a directory's mtime in nanoseconds, or None if it is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
 
-        commands: list[CommandInfo] = []
-        for command_file in self.commands_dir.glob("*.md"):
+
+def _scan_commands(commands_dir: Path, mtime_ns: int | None, now: float) -> CommandSet:
+    """Walk a commands directory and build its CommandSet."""
+    commands: list[CommandInfo] = []
+    if mtime_ns is not None:
+        for command_file in commands_dir.glob("*.md"):
             try:
                 commands.append(
                     CommandInfo(name=command_file.stem, path=str(command_file))
@@ -60,7 +163,96 @@ class CommandsService:
                 # Continue processing other files
                 continue
 
-        return commands
+    return CommandSet(
+        mtime_ns=mtime_ns,
+        loaded_at=now,
+        commands=tuple(commands),
+        schemas=tuple(
+            CommandInfoSchema(name=cmd["name"], path=cmd["path"]) for cmd in commands
+        ),
+        names=frozenset(cmd["name"] for cmd in commands),
+    )
+
+
+_command_cache: CommandDiscoveryCache | None = None
+
+
+def get_command_cache() -> CommandDiscoveryCache:
+    """Get the process-wide command discovery cache.
+
+    Returns:
+        Shared CommandDiscoveryCache sized from settings.
+    """
+    global _command_cache
+    if _command_cache is None:
+        from apps.api.config import get_settings
+
+        settings = get_settings()
+        _command_cache = CommandDiscoveryCache(
+            max_entries=settings.command_cache_max_entries,
+            ttl_seconds=settings.command_cache_ttl_seconds,
+        )
+    return _command_cache
+
+
+def reset_command_cache() -> None:
+    """Reset the process-wide command discovery cache (for testing)."""
+    global _command_cache
+    _command_cache = None
+
+
+class CommandsService:
+    """Service for discovering and executing slash commands."""
+
+    def __init__(
+        self,
+        project_path: Path | str,
+        cache: CommandDiscoveryCache | None = None,
+    ) -> None:
+        """Initialize commands service.
+
+        Args:
+            project_path: Path to project root containing .claude/commands/
+            cache: Discovery cache (defaults to the process-wide cache).
+        """
+        self.project_path = Path(project_path)
+        self.commands_dir = self.project_path / ".claude" / "commands"
+        self._cache = cache
+        self._command_set: CommandSet | None = None
+
+    def _get_command_set(self) -> CommandSet:
+        """Return the cached command set, memoized for this service instance."""
+        if self._command_set is None:
+            cache = self._cache if self._cache is not None else get_command_cache()
+            self._command_set = cache.get(self.commands_dir.resolve())
+        return self._command_set
+
+    def discover_commands(self) -> list[CommandInfo]:
+        """Discover commands from .claude/commands/ directory.
+
+        Returns:
+            List of command info dicts with name and path
+        """
+        return list(self._get_command_set().commands)
+
+    def discover_command_schemas(self) -> list[CommandInfoSchema]:
+        """Discover commands as response schema objects.
+
+        Returns:
+            List of CommandInfoSchema built once per cached directory scan.
+        """
+        return list(self._get_command_set().schemas)
+
+    def has_command(self, name: str) -> bool:
+        """Check whether a command file exists for a command name.
+
+        Args:
+            name: Command name without the leading slash.
+
+        Returns:
+            True if .claude/commands/<name>.md was discovered.
+        """
+        return name in self._get_command_set().names
 
     def parse_command(self, prompt: str) -> ParsedCommand | None:
         """Parse slash command from prompt string.
@@ -79,9 +271,7 @@ class CommandsService:
             return None
 
         # Extract arguments: everything after the command name
-        # Pattern: /command_name followed by optional whitespace and args
-        pattern = re.compile(r"^/[a-zA-Z][a-zA-Z0-9_-]*\s*(.*)", re.DOTALL)
-        match = pattern.match(prompt.strip())
+        match = _COMMAND_ARGS_PATTERN.match(prompt.strip())
 
         args = ""
         if match:
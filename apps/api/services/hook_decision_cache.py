@@ -0,0 +1,282 @@
+"""Cache of PreToolUse webhook decisions.
+
+A hook opts in through ``HookWebhookSchema.decision_cache``. Decisions are
+keyed by the configured payload fields (by default the tool name and tool
+input) within a namespace derived from the hook's URL, headers, matcher and
+key fields, so changing any of them starts from an empty cache. Entries live
+in an in-process LRU per hook and, when a Redis cache is attached, are also
+written to Redis so other instances can reuse them.
+
+The webhook response's ``Cache-Control`` header is honoured: ``no-store`` and
+``no-cache`` skip caching, and ``s-maxage``/``max-age`` shorten the
+configured TTL (they never extend it).
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypedDict, cast
+
+import structlog
+
+if TYPE_CHECKING:
+    from apps.api.protocols import Cache
+    from apps.api.schemas.requests.config import HookWebhookSchema
+    from apps.api.types import JsonValue
+
+logger = structlog.get_logger(__name__)
+
+_REDIS_KEY_PREFIX = "hook_decision"
+_CACHEABLE_DECISIONS = frozenset({"allow", "deny", "ask"})
+_MAX_AGE_PATTERN = re.compile(r"(s-maxage|max-age)\s*=\s*\"?(\d+)\"?")
+
+
+class HookDecisionCacheMetrics(TypedDict):
+    """Snapshot of hook decision cache counters."""
+
+    hooks: int
+    entries: int
+    hits: int
+    redis_hits: int
+    misses: int
+    stored: int
+    evicted: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    response: dict[str, object]
+    expires_at: float
+
+
+def cache_control_ttl(header: str | None, ttl_seconds: float) -> float:
+    """Resolve how long a decision may be cached.
+
+    Args:
+        header: Cache-Control header from the webhook response.
+        ttl_seconds: TTL configured on the hook.
+
+    Returns:
+        Seconds to cache the decision (0 = do not cache).
+    """
+    if not header:
+        return ttl_seconds
+    directives = header.lower()
+    if "no-store" in directives or "no-cache" in directives:
+        return 0.0
+    ages = dict(_MAX_AGE_PATTERN.findall(directives))
+    max_age = ages.get("s-maxage", ages.get("max-age"))
+    if max_age is None:
+        return ttl_seconds
+    return min(float(max_age), ttl_seconds)
+
+
+def _digest(value: object) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _namespace(hook_config: "HookWebhookSchema") -> str:
+    decision_cache = hook_config.decision_cache
+    return _digest(
+        [
+            str(hook_config.url),
+            hook_config.headers,
+            hook_config.matcher,
+            decision_cache.key_fields if decision_cache else None,
+        ]
+    )[:32]
+
+
+def _key(key_fields: list[str], payload: dict[str, object]) -> str:
+    values: list[object] = []
+    for key_field in key_fields:
+        name, _, input_key = key_field.partition(".")
+        value = payload.get(name)
+        if input_key:
+            value = value.get(input_key) if isinstance(value, dict) else None
+        values.append(value)
+    return _digest(values)
+
+
+class HookDecisionCache:
+    """Per-hook LRU of webhook decisions with optional Redis backing."""
+
+    def __init__(self, max_hooks: int, redis: "Cache | None" = None) -> None:
+        """Initialize cache.
+
+        Args:
+            max_hooks: Max hook namespaces kept before evicting the least recent.
+            redis: Cache to share decisions across instances (None = local only).
+        """
+        self._max_hooks = max_hooks
+        self._redis = redis
+        self._hooks: OrderedDict[str, OrderedDict[str, _Entry]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+        self._stored = 0
+        self._evicted = 0
+
+    async def get(
+        self, hook_config: "HookWebhookSchema", payload: dict[str, object]
+    ) -> dict[str, object] | None:
+        """Return a cached decision for a webhook payload.
+
+        Args:
+            hook_config: Hook configuration with decision_cache set.
+            payload: Webhook payload that would be sent.
+
+        Returns:
+            Cached webhook response, or None on miss.
+        """
+        decision_cache = hook_config.decision_cache
+        if decision_cache is None:
+            return None
+        namespace = _namespace(hook_config)
+        key = _key(decision_cache.key_fields, payload)
+
+        with self._lock:
+            entries = self._hooks.get(namespace)
+            entry = entries.get(key) if entries is not None else None
+            if entries is not None and entry is not None:
+                if entry.expires_at > time.monotonic():
+                    entries.move_to_end(key)
+                    self._hooks.move_to_end(namespace)
+                    self._hits += 1
+                    return dict(entry.response)
+                del entries[key]
+
+        if self._redis is not None:
+            stored = await self._redis_get(self._redis, namespace, key)
+            if stored is not None:
+                response, remaining = stored
+                self._store_local(
+                    namespace, key, response, remaining, decision_cache.max_entries
+                )
+                with self._lock:
+                    self._redis_hits += 1
+                return dict(response)
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    async def put(
+        self,
+        hook_config: "HookWebhookSchema",
+        payload: dict[str, object],
+        response: dict[str, object],
+        cache_control: str | None = None,
+    ) -> None:
+        """Cache a webhook decision.
+
+        Responses without an allow/deny/ask decision are not cached.
+
+        Args:
+            hook_config: Hook configuration with decision_cache set.
+            payload: Webhook payload that was sent.
+            response: Parsed webhook response.
+            cache_control: Cache-Control header from the webhook response.
+        """
+        decision_cache = hook_config.decision_cache
+        if (
+            decision_cache is None
+            or response.get("decision") not in _CACHEABLE_DECISIONS
+        ):
+            return
+        ttl = cache_control_ttl(cache_control, decision_cache.ttl_seconds)
+        if ttl <= 0:
+            return
+        namespace = _namespace(hook_config)
+        key = _key(decision_cache.key_fields, payload)
+
+        self._store_local(namespace, key, response, ttl, decision_cache.max_entries)
+        with self._lock:
+            self._stored += 1
+        if self._redis is not None and ttl >= 1:
+            await self._redis_put(self._redis, namespace, key, response, ttl)
+
+    def _store_local(
+        self,
+        namespace: str,
+        key: str,
+        response: dict[str, object],
+        ttl: float,
+        max_entries: int,
+    ) -> None:
+        entry = _Entry(response=dict(response), expires_at=time.monotonic() + ttl)
+        with self._lock:
+            entries = self._hooks.get(namespace)
+            if entries is None:
+                entries = OrderedDict()
+                self._hooks[namespace] = entries
+            self._hooks.move_to_end(namespace)
+            entries[key] = entry
+            entries.move_to_end(key)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+                self._evicted += 1
+            while len(self._hooks) > self._max_hooks:
+                _, dropped = self._hooks.popitem(last=False)
+                self._evicted += len(dropped)
+
+    @staticmethod
+    async def _redis_get(
+        redis: "Cache", namespace: str, key: str
+    ) -> tuple[dict[str, object], float] | None:
+        try:
+            stored = await redis.get_json(f"{_REDIS_KEY_PREFIX}:{namespace}:{key}")
+        except Exception as e:
+            logger.warning("hook_decision_cache_read_failed", error=str(e))
+            return None
+        if stored is None:
+            return None
+        expires_at = stored.get("expires_at")
+        response = stored.get("response")
+        if not isinstance(expires_at, int | float) or not isinstance(response, dict):
+            return None
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            return None
+        return cast("dict[str, object]", response), remaining
+
+    @staticmethod
+    async def _redis_put(
+        redis: "Cache",
+        namespace: str,
+        key: str,
+        response: dict[str, object],
+        ttl: float,
+    ) -> None:
+        value = {"response": response, "expires_at": time.time() + ttl}
+        try:
+            await redis.set_json(
+                f"{_REDIS_KEY_PREFIX}:{namespace}:{key}",
+                cast("dict[str, JsonValue]", value),
+                int(ttl),
+            )
+        except Exception as e:
+            logger.warning("hook_decision_cache_write_failed", error=str(e))
+
+    def metrics(self) -> HookDecisionCacheMetrics:
+        """Return cache counters.
+
+        Returns:
+            Hook and entry counts with hit/miss/store/eviction totals.
+        """
+        with self._lock:
+            return HookDecisionCacheMetrics(
+                hooks=len(self._hooks),
+                entries=sum(len(entries) for entries in self._hooks.values()),
+                hits=self._hits,
+                redis_hits=self._redis_hits,
+                misses=self._misses,
+                stored=self._stored,
+                evicted=self._evicted,
+            )
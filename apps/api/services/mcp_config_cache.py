@@ -0,0 +1,118 @@
+"""In-process cache of server-side MCP configuration per API key.
+
+Entries hold the resolved application tier, the API-key tier loaded from
+Redis, and the merged server-side schemas. An entry is valid while the API
+key's Redis version counter is unchanged (McpServerConfigService bumps it on
+every create/update/delete) and the entry is younger than the TTL, which
+bounds staleness of the application config file and environment variables.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TypedDict
+
+from apps.api.schemas.requests.config import McpServerConfigSchema
+
+
+class McpConfigCacheMetrics(TypedDict):
+    """Snapshot of MCP config cache counters."""
+
+    entries: int
+    hits: int
+    misses: int
+    evicted: int
+
+
+@dataclass(frozen=True, slots=True)
+class McpConfigCacheEntry:
+    """Server-side MCP configuration tiers for one API key."""
+
+    version: str
+    loaded_at: float
+    application_config: dict[str, object]
+    api_key_config: dict[str, object]
+    merged_schemas: dict[str, McpServerConfigSchema]
+
+
+class McpConfigCache:
+    """Bounded LRU of McpConfigCacheEntry keyed by API key."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        """Initialize cache.
+
+        Args:
+            max_entries: Max API keys kept before evicting the least recent.
+            ttl_seconds: Max entry age in seconds.
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, McpConfigCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+
+    def get(self, api_key: str, version: str) -> McpConfigCacheEntry | None:
+        """Return the entry for an API key if it matches the current version.
+
+        Args:
+            api_key: API key the configuration is scoped to.
+            version: Current value of the API key's version counter.
+
+        Returns:
+            Fresh cache entry, or None on miss.
+        """
+        with self._lock:
+            entry = self._entries.get(api_key)
+            if (
+                entry is None
+                or entry.version != version
+                or time.monotonic() - entry.loaded_at >= self._ttl_seconds
+            ):
+                self._misses += 1
+                return None
+            self._entries.move_to_end(api_key)
+            self._hits += 1
+            return entry
+
+    def put(self, api_key: str, entry: McpConfigCacheEntry) -> None:
+        """Store an entry, evicting the least recently used past capacity.
+
+        Args:
+            api_key: API key the configuration is scoped to.
+            entry: Loaded configuration tiers.
+        """
+        with self._lock:
+            self._entries[api_key] = entry
+            self._entries.move_to_end(api_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evicted += 1
+
+    def invalidate(self, api_key: str | None = None) -> None:
+        """Drop one API key's entry, or every entry when None.
+
+        Args:
+            api_key: API key to invalidate.
+        """
+        with self._lock:
+            if api_key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(api_key, None)
+
+    def metrics(self) -> McpConfigCacheMetrics:
+        """Return cache counters.
+
+        Returns:
+            Entry count and hit/miss/eviction totals.
+        """
+        with self._lock:
+            return McpConfigCacheMetrics(
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evicted=self._evicted,
+            )
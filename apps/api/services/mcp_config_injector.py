@@ -8,6 +8,7 @@ Coordinates loading and merging of MCP server configurations from three tiers:
 Enriches QueryRequest with merged server-side MCP configurations.
 """
 
+import time
 from collections.abc import Sequence
 from typing import cast
 
@@ -15,6 +16,7 @@ import structlog
 
 from apps.api.schemas.requests.config import McpServerConfigSchema
 from apps.api.schemas.requests.query import QueryRequest
+from apps.api.services.mcp_config_cache import McpConfigCache, McpConfigCacheEntry
 from apps.api.services.mcp_config_loader import McpConfigLoader
 from apps.api.services.mcp_config_validator import ConfigValidator
 from apps.api.services.mcp_server_configs import McpServerConfigService, McpServerRecord
@@ -30,6 +32,7 @@ class McpConfigInjector:
         config_loader: McpConfigLoader,
         config_service: McpServerConfigService,
         validator: ConfigValidator | None = None,
+        cache: McpConfigCache | None = None,
     ) -> None:
         """Initialize MCP config injector.
 
@@ -37,10 +40,12 @@ class McpConfigInjector:
             config_loader: Loader for application-level config files.
             config_service: Service for API-key-scoped config storage.
             validator: Optional validator for security checks and credential sanitization.
+            cache: Optional process-wide cache of server-side configs per API key.
         """
         self.config_loader = config_loader
         self.config_service = config_service
         self.validator = validator
+        self.cache = cache
 
     async def inject(self, request: QueryRequest, api_key: str) -> QueryRequest:
         """Inject server-side MCP configuration into request.
@@ -79,17 +84,19 @@ class McpConfigInjector:
             return request
 
         try:
-            # Load application-level config from file
-            app_config_raw = self.config_loader.load_application_config()
-            app_config_resolved = self.config_loader.resolve_env_vars(app_config_raw)
-
-            # Load API-key-level config from database
-            api_key_records = await self.config_service.list_servers_for_api_key(
-                api_key
-            )
-            api_key_config = cast(
-                "dict[str, object]", self._records_to_config_dict(api_key_records)
-            )
+            if self.cache is not None:
+                entry = await self._get_cached_tiers(api_key)
+                if request.mcp_servers is None:
+                    # Server-side merge is fully cached: no rebuild, no re-log
+                    return self._apply_servers(
+                        request, dict(entry.merged_schemas), api_key
+                    )
+                app_config_resolved = entry.application_config
+                api_key_config = entry.api_key_config
+            else:
+                app_config_resolved, api_key_config = await self._load_server_tiers(
+                    api_key
+                )
 
             # Convert request mcp_servers to dict format for merging
             request_config_raw = (
@@ -131,30 +138,7 @@ class McpConfigInjector:
                 merged_config=sanitized_config,
             )
 
-            # Build allowed_tools patterns for MCP servers
-            # Pattern: mcp__<server-name>__* allows all tools from the server
-            mcp_tool_patterns = [f"mcp__{name}__*" for name in merged_schemas]
-
-            # Merge with existing allowed_tools (preserve user-specified tools)
-            existing_allowed = (
-                list(request.allowed_tools) if request.allowed_tools else []
-            )
-            updated_allowed_tools = existing_allowed + mcp_tool_patterns
-
-            logger.info(
-                "mcp_tools_added_to_allowed",
-                mcp_tool_patterns=mcp_tool_patterns,
-                existing_allowed_count=len(existing_allowed),
-                updated_allowed_count=len(updated_allowed_tools),
-            )
-
-            # Create enriched request with merged MCP servers and updated allowed_tools
-            return request.model_copy(
-                update={
-                    "mcp_servers": merged_schemas,
-                    "allowed_tools": updated_allowed_tools,
-                }
-            )
+            return self._apply_servers(request, merged_schemas, api_key)
 
         except Exception as e:
             # Graceful degradation: log error and return original request
@@ -168,6 +152,120 @@ class McpConfigInjector:
             )
             return request
 
+    def _apply_servers(
+        self,
+        request: QueryRequest,
+        merged_schemas: dict[str, McpServerConfigSchema],
+        api_key: str,
+    ) -> QueryRequest:
+        """Return a copy of the request with merged servers and tool patterns.
+
+        Args:
+            request: Query request to enrich.
+            merged_schemas: Merged MCP server schemas.
+            api_key: API key (for logging).
+
+        Returns:
+            Enriched query request.
+        """
+        # Build allowed_tools patterns for MCP servers
+        # Pattern: mcp__<server-name>__* allows all tools from the server
+        mcp_tool_patterns = [f"mcp__{name}__*" for name in merged_schemas]
+
+        # Merge with existing allowed_tools (preserve user-specified tools)
+        existing_allowed = list(request.allowed_tools) if request.allowed_tools else []
+        updated_allowed_tools = existing_allowed + mcp_tool_patterns
+
+        logger.debug(
+            "mcp_tools_added_to_allowed",
+            api_key_prefix=api_key[:8] if len(api_key) >= 8 else api_key,
+            mcp_tool_patterns=mcp_tool_patterns,
+            existing_allowed_count=len(existing_allowed),
+            updated_allowed_count=len(updated_allowed_tools),
+        )
+
+        # Create enriched request with merged MCP servers and updated allowed_tools
+        return request.model_copy(
+            update={
+                "mcp_servers": merged_schemas,
+                "allowed_tools": updated_allowed_tools,
+            }
+        )
+
+    async def _load_server_tiers(
+        self, api_key: str
+    ) -> tuple[dict[str, object], dict[str, object]]:
+        """Load the application and API-key configuration tiers.
+
+        Args:
+            api_key: API key for scoped configuration lookup.
+
+        Returns:
+            Tuple of (resolved application config, API-key config).
+        """
+        # Load application-level config from file
+        app_config_raw = self.config_loader.load_application_config()
+        app_config_resolved = self.config_loader.resolve_env_vars(app_config_raw)
+
+        # Load API-key-level config from database
+        api_key_records = await self.config_service.list_servers_for_api_key(api_key)
+        api_key_config = cast(
+            "dict[str, object]", self._records_to_config_dict(api_key_records)
+        )
+        return app_config_resolved, api_key_config
+
+    async def _get_cached_tiers(self, api_key: str) -> McpConfigCacheEntry:
+        """Return server-side tiers from the cache, reloading on version change.
+
+        The only Redis round-trip on a hit is the version counter read.
+
+        Args:
+            api_key: API key for scoped configuration lookup.
+
+        Returns:
+            Cache entry for the API key's current config version.
+        """
+        cache = cast("McpConfigCache", self.cache)
+        # Read the version before loading so a concurrent change is never
+        # cached under a version that already includes it.
+        version = await self.config_service.get_config_version(api_key)
+        entry = cache.get(api_key, version)
+        if entry is not None:
+            return entry
+
+        app_config_resolved, api_key_config = await self._load_server_tiers(api_key)
+        merged_config = self.config_loader.merge_configs(
+            application_config=app_config_resolved,
+            api_key_config=api_key_config,
+            request_config=None,
+        )
+        merged_schemas = self._config_dict_to_schemas(merged_config)
+        entry = McpConfigCacheEntry(
+            version=version,
+            loaded_at=time.monotonic(),
+            application_config=app_config_resolved,
+            api_key_config=api_key_config,
+            merged_schemas=merged_schemas,
+        )
+        cache.put(api_key, entry)
+
+        sanitized_config = (
+            self.validator.sanitize_credentials(merged_config)
+            if self.validator
+            else merged_config
+        )
+        logger.info(
+            "mcp_config_cached",
+            api_key_prefix=api_key[:8] if len(api_key) >= 8 else api_key,
+            version=version,
+            application_count=len(app_config_resolved),
+            api_key_count=len(api_key_config),
+            merged_count=len(merged_schemas),
+            server_names=list(merged_schemas.keys()),
+            merged_config=sanitized_config,
+        )
+        return entry
+
     def _records_to_config_dict(
         self, records: Sequence[McpServerRecord]
     ) -> dict[str, dict[str, object]]:
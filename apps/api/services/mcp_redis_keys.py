@@ -72,3 +72,23 @@ class McpRedisKeyBuilder:
         """
         McpRedisKeyBuilder.validate_api_key(api_key)
         return f"mcp_servers:index:{api_key}"
+
+    @staticmethod
+    def version_key(api_key: str) -> str:
+        """Build cache key for API key's config version counter.
+
+        Args:
+            api_key: API key for tenant isolation
+
+        Returns:
+            Redis key in format: mcp_servers:version:{api_key}
+
+        Raises:
+            ValueError: If API key format is invalid
+
+        Example:
+            >>> McpRedisKeyBuilder.version_key("tenant-1")
+            'mcp_servers:version:tenant-1'
+        """
+        McpRedisKeyBuilder.validate_api_key(api_key)
+        return f"mcp_servers:version:{api_key}"
@@ -6,7 +6,7 @@ from datetime import UTC, datetime
 from typing import cast
 from uuid import uuid4
 
-from apps.api.protocols import Cache
+from apps.api.protocols import Cache, CachePipeline
 from apps.api.services.mcp_redis_keys import McpRedisKeyBuilder
 
 
@@ -48,6 +48,15 @@ class McpServerConfigService:
         """<summary>Build cache key for API key's server index.</summary>"""
         return McpRedisKeyBuilder.index_key(api_key)
 
+    async def get_config_version(self, api_key: str) -> str:
+        """<summary>Return the API key's config version (bumped on every change).</summary>"""
+        version = await self._cache.get(McpRedisKeyBuilder.version_key(api_key))
+        return version or "0"
+
+    def _bump_config_version(self, pipe: CachePipeline, api_key: str) -> None:
+        """<summary>Queue invalidation of cached merged configs for an API key.</summary>"""
+        pipe.incr(McpRedisKeyBuilder.version_key(api_key))
+
     async def list_servers(self) -> list[McpServerRecord]:
         """<summary>List all MCP servers (legacy, not API-key scoped).</summary>"""
         names = await self._cache.set_members(self._INDEX_KEY)
@@ -119,8 +128,10 @@ class McpServerConfigService:
             else [],
         )
 
-        await self._cache.set_json(f"mcp_server:{name}", record.__dict__)
-        await self._cache.add_to_set(self._INDEX_KEY, name)
+        pipe = self._cache.pipeline()
+        pipe.set_json(f"mcp_server:{name}", record.__dict__)
+        pipe.add_to_set(self._INDEX_KEY, name)
+        await pipe.execute()
         return record
 
     async def get_server(self, name: str) -> McpServerRecord | None:
@@ -173,8 +184,11 @@ class McpServerConfigService:
 
     async def delete_server(self, name: str) -> bool:
         """<summary>Delete MCP server config (legacy, not API-key scoped).</summary>"""
-        await self._cache.remove_from_set(self._INDEX_KEY, name)
-        return await self._cache.delete(f"mcp_server:{name}")
+        pipe = self._cache.pipeline()
+        pipe.remove_from_set(self._INDEX_KEY, name)
+        pipe.delete(f"mcp_server:{name}")
+        _, deleted = await pipe.execute()
+        return bool(deleted)
 
     async def create_server_for_api_key(
         self,
@@ -211,8 +225,11 @@ class McpServerConfigService:
             else [],
         )
 
-        await self._cache.set_json(self._server_key(api_key, name), record.__dict__)
-        await self._cache.add_to_set(self._index_key(api_key), name)
+        pipe = self._cache.pipeline()
+        pipe.set_json(self._server_key(api_key, name), record.__dict__)
+        pipe.add_to_set(self._index_key(api_key), name)
+        self._bump_config_version(pipe, api_key)
+        await pipe.execute()
         return record
 
     async def get_server_for_api_key(
@@ -263,13 +280,20 @@ class McpServerConfigService:
             ),
         )
 
-        await self._cache.set_json(self._server_key(api_key, name), record.__dict__)
+        pipe = self._cache.pipeline()
+        pipe.set_json(self._server_key(api_key, name), record.__dict__)
+        self._bump_config_version(pipe, api_key)
+        await pipe.execute()
         return record
 
     async def delete_server_for_api_key(self, api_key: str, name: str) -> bool:
         """<summary>Delete MCP server config for specific API key.</summary>"""
-        await self._cache.remove_from_set(self._index_key(api_key), name)
-        return await self._cache.delete(self._server_key(api_key, name))
+        pipe = self._cache.pipeline()
+        pipe.remove_from_set(self._index_key(api_key), name)
+        pipe.delete(self._server_key(api_key, name))
+        self._bump_config_version(pipe, api_key)
+        _, deleted, _ = await pipe.execute()
+        return bool(deleted)
 
     def _map_record(self, name: str, raw: Mapping[str, object]) -> McpServerRecord:
         """<summary>Map cached data to MCP server record.</summary>"""
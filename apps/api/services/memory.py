@@ -1,10 +1,21 @@
 """Memory service for managing conversation memories."""
 
+from typing import TYPE_CHECKING
+
 import structlog
 
+from apps.api.exceptions import ServiceUnavailableError
 from apps.api.protocols import MemoryProtocol, MemorySearchResult
 from apps.api.types import JsonValue
 
+if TYPE_CHECKING:
+    from apps.api.adapters.memory_bulk import (
+        BulkIngestResult,
+        BulkMemoryIngestor,
+        BulkMemoryItem,
+    )
+    from apps.api.services.memory_search_cache import MemorySearchCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -17,15 +28,28 @@ class MemoryService:
 
     Args:
         memory_client: MemoryProtocol implementation for memory operations.
+        search_cache: Optional cache of search results per user.
+        bulk_ingestor: Optional batched TEI/Qdrant writer for bulk adds.
     """
 
-    def __init__(self, memory_client: MemoryProtocol) -> None:
+    def __init__(
+        self,
+        memory_client: MemoryProtocol,
+        search_cache: "MemorySearchCache | None" = None,
+        bulk_ingestor: "BulkMemoryIngestor | None" = None,
+    ) -> None:
         """Initialize memory service.
 
         Args:
             memory_client: MemoryProtocol implementation for memory operations.
+            search_cache: Optional cache of search results per user; entries
+                are invalidated by every add/delete for that user.
+            bulk_ingestor: Optional batched TEI/Qdrant writer used by
+                bulk_add_memories.
         """
         self._client = memory_client
+        self._search_cache = search_cache
+        self._bulk_ingestor = bulk_ingestor
 
     async def search_memories(
         self,
@@ -45,12 +69,28 @@ class MemoryService:
         Returns:
             List of memory search results with id, memory, score, and metadata.
         """
-        return await self._client.search(
+        cache = self._search_cache
+        version: str | None = None
+        if cache is not None:
+            try:
+                version = await cache.version(user_id)
+            except Exception as e:
+                # Version unknown: search uncached rather than risk stale results
+                logger.warning("memory_search_cache_unavailable", error=str(e))
+            else:
+                cached = cache.get(user_id, query, limit, enable_graph, version)
+                if cached is not None:
+                    return cached
+
+        results = await self._client.search(
             query=query,
             user_id=user_id,
             limit=limit,
             enable_graph=enable_graph,
         )
+        if cache is not None and version is not None:
+            cache.put(user_id, query, limit, enable_graph, version, results)
+        return results
 
     async def add_memory(
         self,
@@ -70,12 +110,43 @@ class MemoryService:
         Returns:
             List of created memory records with id and memory text.
         """
-        return await self._client.add(
-            messages=messages,
-            user_id=user_id,
-            metadata=metadata,
-            enable_graph=enable_graph,
-        )
+        try:
+            return await self._client.add(
+                messages=messages,
+                user_id=user_id,
+                metadata=metadata,
+                enable_graph=enable_graph,
+            )
+        finally:
+            # A failed add may still have written some memories
+            await self._invalidate_searches(user_id)
+
+    async def bulk_add_memories(
+        self,
+        items: "list[BulkMemoryItem]",
+        user_id: str,
+    ) -> "BulkIngestResult":
+        """Store many memory texts verbatim with batched embedding.
+
+        Unlike add_memory there is no LLM extraction or graph write; each
+        text becomes one memory.
+
+        Args:
+            items: Memory texts and metadata.
+            user_id: User identifier for multi-tenant isolation.
+
+        Returns:
+            Created memory ids and batching statistics.
+
+        Raises:
+            ServiceUnavailableError: If bulk ingestion is not configured.
+        """
+        if self._bulk_ingestor is None:
+            raise ServiceUnavailableError("Bulk memory ingestion is not configured")
+        try:
+            return await self._bulk_ingestor.ingest(user_id, items)
+        finally:
+            await self._invalidate_searches(user_id)
 
     async def get_all_memories(
         self,
@@ -102,7 +173,10 @@ class MemoryService:
             memory_id: Memory identifier to delete.
             user_id: User identifier for authorization.
         """
-        await self._client.delete(memory_id=memory_id, user_id=user_id)
+        try:
+            await self._client.delete(memory_id=memory_id, user_id=user_id)
+        finally:
+            await self._invalidate_searches(user_id)
 
     async def delete_all_memories(
         self,
@@ -113,7 +187,23 @@ class MemoryService:
         Args:
             user_id: User identifier for authorization.
         """
-        await self._client.delete_all(user_id=user_id)
+        try:
+            await self._client.delete_all(user_id=user_id)
+        finally:
+            await self._invalidate_searches(user_id)
+
+    async def _invalidate_searches(self, user_id: str) -> None:
+        if self._search_cache is None:
+            return
+        try:
+            await self._search_cache.invalidate(user_id)
+        except Exception as e:
+            # Local entries are already dropped; other instances expire by TTL
+            logger.warning(
+                "memory_search_cache_invalidation_failed",
+                user_id=user_id,
+                error=str(e),
+            )
 
     async def format_memory_context(
         self,
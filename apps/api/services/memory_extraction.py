@@ -0,0 +1,366 @@
+"""Durable background queue for memory extraction.
+
+After a query completes, QueryExecutor enqueues the conversation here instead
+of awaiting ``MemoryService.add_memory`` (an LLM extraction, embedding and
+graph write) before the stream can finish. Jobs are stored in Redis so they
+survive restarts and can be processed by any instance:
+
+- ``memory_extraction:job:<id>`` holds the job JSON.
+- ``memory_extraction:queue`` is a sorted set of job ids scored by the time
+  the job becomes visible (enqueue time, the next retry time, or, while a
+  worker processes it, the end of the visibility timeout).
+- ``memory_extraction:claim:<id>`` is a lock held while a worker processes
+  the job. It expires with the visibility timeout, so jobs claimed by a
+  crashed instance are picked up again (at-least-once delivery).
+- ``memory_extraction:dead`` collects job ids that exhausted their attempts,
+  for as long as their job is kept.
+
+A local worker pool claims due jobs, groups them per user and sends each
+group to mem0 as one extraction. Failures are retried with exponential
+backoff and reported through metrics rather than to the client.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypedDict, cast
+from uuid import uuid4
+
+import structlog
+
+if TYPE_CHECKING:
+    from apps.api.config import Settings
+    from apps.api.protocols import Cache
+    from apps.api.services.memory import MemoryService
+    from apps.api.types import JsonValue
+
+logger = structlog.get_logger(__name__)
+
+QUEUE_KEY = "memory_extraction:queue"
+DEAD_LETTER_KEY = "memory_extraction:dead"
+_JOB_PREFIX = "memory_extraction:job:"
+_CLAIM_PREFIX = "memory_extraction:claim:"
+# Jobs (including dead-lettered ones) expire after a week; the dead-letter
+# index is trimmed to the same window
+_JOB_TTL_SECONDS = 7 * 24 * 3600
+
+
+class MemoryExtractionMetrics(TypedDict):
+    """Snapshot of memory extraction queue counters."""
+
+    workers: int
+    in_flight: int
+    enqueued: int
+    processed: int
+    batches: int
+    retried: int
+    failed: int
+    errors: int
+
+
+@dataclass(slots=True)
+class _Claim:
+    job_id: str
+    token: str
+    job: dict[str, "JsonValue"]
+
+
+class MemoryExtractionQueue:
+    """Redis-backed extraction queue with a local worker pool."""
+
+    def __init__(
+        self,
+        cache: "Cache",
+        memory_service_factory: Callable[[], Awaitable["MemoryService"]],
+        *,
+        workers: int = 2,
+        batch_size: int = 10,
+        max_attempts: int = 3,
+        visibility_timeout_seconds: int = 300,
+        poll_interval_seconds: float = 1.0,
+        retry_backoff_seconds: float = 5.0,
+    ) -> None:
+        """Initialize queue.
+
+        Args:
+            cache: Redis cache storing jobs and the queue index.
+            memory_service_factory: Returns the MemoryService used by workers.
+            workers: Number of concurrent worker tasks on this instance.
+            batch_size: Max jobs claimed at once (grouped per user).
+            max_attempts: Attempts per job before it is dead-lettered.
+            visibility_timeout_seconds: How long a claim lasts before another
+                worker may retry the job.
+            poll_interval_seconds: Idle delay between checks for due jobs.
+            retry_backoff_seconds: Delay before the first retry; doubles after.
+        """
+        self._cache = cache
+        self._memory_service_factory = memory_service_factory
+        self._worker_count = workers
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._visibility_timeout = visibility_timeout_seconds
+        self._poll_interval = poll_interval_seconds
+        self._retry_backoff = retry_backoff_seconds
+        self._workers: list[asyncio.Task[None]] = []
+        self._wakeup = asyncio.Event()
+        self._claim_lock = asyncio.Lock()
+        self._stopping = False
+        self._in_flight = 0
+        self._enqueued = 0
+        self._processed = 0
+        self._batches = 0
+        self._retried = 0
+        self._failed = 0
+        self._errors = 0
+
+    @classmethod
+    def from_settings(
+        cls,
+        cache: "Cache",
+        memory_service_factory: Callable[[], Awaitable["MemoryService"]],
+        settings: "Settings",
+    ) -> "MemoryExtractionQueue":
+        """Build a queue from application settings.
+
+        Args:
+            cache: Redis cache storing jobs and the queue index.
+            memory_service_factory: Returns the MemoryService used by workers.
+            settings: Application settings.
+
+        Returns:
+            Unstarted MemoryExtractionQueue.
+        """
+        return cls(
+            cache,
+            memory_service_factory,
+            workers=settings.memory_extraction_workers,
+            batch_size=settings.memory_extraction_batch_size,
+            max_attempts=settings.memory_extraction_max_attempts,
+            visibility_timeout_seconds=(
+                settings.memory_extraction_visibility_timeout_seconds
+            ),
+            poll_interval_seconds=settings.memory_extraction_poll_interval_seconds,
+            retry_backoff_seconds=settings.memory_extraction_retry_backoff_seconds,
+        )
+
+    def start(self) -> None:
+        """Start the worker tasks. Safe to call multiple times."""
+        if self._workers:
+            return
+        self._stopping = False
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self._worker_count)
+        ]
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Stop the workers, letting in-flight extractions finish first.
+
+        Jobs still claimed when the timeout expires stay in Redis and are
+        retried once their claim expires.
+
+        Args:
+            timeout: Max seconds to wait for in-flight extractions.
+        """
+        self._stopping = True
+        self._wakeup.set()
+        workers, self._workers = self._workers, []
+        if not workers:
+            return
+        _, pending = await asyncio.wait(workers, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        for task in pending:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def enqueue(
+        self,
+        user_id: str,
+        messages: str,
+        metadata: dict[str, "JsonValue"],
+    ) -> str:
+        """Persist an extraction job and wake a local worker.
+
+        Args:
+            user_id: Hashed user identifier for multi-tenant isolation.
+            messages: Conversation text to extract memories from.
+            metadata: Metadata attached to the extracted memories.
+
+        Returns:
+            Job id.
+        """
+        job_id = uuid4().hex
+        now = time.time()
+        job: dict[str, JsonValue] = {
+            "id": job_id,
+            "user_id": user_id,
+            "messages": messages,
+            "metadata": metadata,
+            "attempts": 0,
+            "enqueued_at": now,
+        }
+        pipe = self._cache.pipeline()
+        pipe.set_json(f"{_JOB_PREFIX}{job_id}", job, _JOB_TTL_SECONDS)
+        pipe.add_to_sorted_set(QUEUE_KEY, job_id, now)
+        await pipe.execute()
+        self._enqueued += 1
+        self._wakeup.set()
+        return job_id
+
+    async def _work(self) -> None:
+        while not self._stopping:
+            try:
+                claims = await self._claim()
+            except Exception as e:
+                self._errors += 1
+                logger.warning("memory_extraction_claim_failed", error=str(e))
+                claims = []
+            if not claims:
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self._poll_interval
+                    )
+                continue
+            self._in_flight += len(claims)
+            try:
+                await self._process(claims)
+            except Exception as e:
+                # Claims stay hidden until the visibility timeout, then retry
+                self._errors += 1
+                logger.warning(
+                    "memory_extraction_process_failed",
+                    jobs=len(claims),
+                    error=str(e),
+                )
+            finally:
+                self._in_flight -= len(claims)
+
+    async def _claim(self) -> list[_Claim]:
+        # One local claimer at a time so workers don't race for the same ids
+        async with self._claim_lock:
+            now = time.time()
+            due = await self._cache.sorted_set_range_by_score(
+                QUEUE_KEY, "-inf", now, count=self._batch_size * 2
+            )
+            tokens: dict[str, str] = {}
+            for job_id, _ in due:
+                if len(tokens) >= self._batch_size:
+                    break
+                token = await self._cache.acquire_lock(
+                    f"{_CLAIM_PREFIX}{job_id}", ttl=self._visibility_timeout
+                )
+                if token is None:
+                    continue
+                # Re-check: another worker may have rescheduled it meanwhile
+                score = await self._cache.sorted_set_score(QUEUE_KEY, job_id)
+                if score is None or score > now:
+                    await self._cache.release_lock(f"{_CLAIM_PREFIX}{job_id}", token)
+                    continue
+                tokens[job_id] = token
+
+            if not tokens:
+                return []
+            jobs = await self._cache.get_many_json(
+                [f"{_JOB_PREFIX}{job_id}" for job_id in tokens]
+            )
+            claims: list[_Claim] = []
+            stale: list[str] = []
+            for (job_id, token), job in zip(tokens.items(), jobs, strict=True):
+                if job is None:
+                    stale.append(job_id)
+                    await self._cache.release_lock(f"{_CLAIM_PREFIX}{job_id}", token)
+                else:
+                    claims.append(_Claim(job_id, token, job))
+            pipe = self._cache.pipeline()
+            # Hide claimed jobs from other claimers until the claim expires
+            visible_at = now + self._visibility_timeout
+            for claim in claims:
+                pipe.add_to_sorted_set(QUEUE_KEY, claim.job_id, visible_at)
+            if stale:
+                # Job expired or was completed after the index was read
+                pipe.remove_from_sorted_set(QUEUE_KEY, *stale)
+            await pipe.execute()
+            return claims
+
+    async def _process(self, claims: list[_Claim]) -> None:
+        by_user: dict[str, list[_Claim]] = {}
+        for claim in claims:
+            by_user.setdefault(str(claim.job["user_id"]), []).append(claim)
+
+        memory_service = await self._memory_service_factory()
+        for user_id, user_claims in by_user.items():
+            messages = "\n\n".join(str(c.job["messages"]) for c in user_claims)
+            metadata = dict(
+                cast("dict[str, JsonValue]", user_claims[-1].job["metadata"])
+            )
+            if len(user_claims) > 1:
+                metadata["session_ids"] = [
+                    cast("dict[str, JsonValue]", c.job["metadata"]).get("session_id")
+                    for c in user_claims
+                ]
+            try:
+                await memory_service.add_memory(
+                    messages=messages, user_id=user_id, metadata=metadata
+                )
+            except Exception as e:
+                await self._fail(user_claims, str(e))
+            else:
+                await self._complete(user_claims)
+
+    async def _complete(self, claims: list[_Claim]) -> None:
+        pipe = self._cache.pipeline()
+        for claim in claims:
+            pipe.delete(f"{_JOB_PREFIX}{claim.job_id}")
+            pipe.delete(f"{_CLAIM_PREFIX}{claim.job_id}")
+        pipe.remove_from_sorted_set(QUEUE_KEY, *(c.job_id for c in claims))
+        await pipe.execute()
+        self._processed += len(claims)
+        self._batches += 1
+
+    async def _fail(self, claims: list[_Claim], error: str) -> None:
+        now = time.time()
+        pipe = self._cache.pipeline()
+        for claim in claims:
+            attempts = cast("int", claim.job.get("attempts", 0)) + 1
+            job = {**claim.job, "attempts": attempts, "last_error": error}
+            pipe.set_json(f"{_JOB_PREFIX}{claim.job_id}", job, _JOB_TTL_SECONDS)
+            if attempts >= self._max_attempts:
+                pipe.remove_from_sorted_set(QUEUE_KEY, claim.job_id)
+                pipe.add_to_sorted_set(DEAD_LETTER_KEY, claim.job_id, now)
+                self._failed += 1
+            else:
+                retry_at = now + self._retry_backoff * 2 ** (attempts - 1)
+                pipe.add_to_sorted_set(QUEUE_KEY, claim.job_id, retry_at)
+                self._retried += 1
+            pipe.delete(f"{_CLAIM_PREFIX}{claim.job_id}")
+        # Drop dead letters whose job has expired
+        pipe.remove_from_sorted_set_by_score(
+            DEAD_LETTER_KEY, "-inf", now - _JOB_TTL_SECONDS
+        )
+        await pipe.execute()
+        logger.warning(
+            "memory_extraction_failed",
+            jobs=len(claims),
+            user_id=claims[0].job["user_id"],
+            error=error,
+        )
+
+    def metrics(self) -> MemoryExtractionMetrics:
+        """Return queue counters.
+
+        Returns:
+            Worker/in-flight counts and enqueue/process/retry/failure totals.
+        """
+        return MemoryExtractionMetrics(
+            workers=len(self._workers),
+            in_flight=self._in_flight,
+            enqueued=self._enqueued,
+            processed=self._processed,
+            batches=self._batches,
+            retried=self._retried,
+            failed=self._failed,
+            errors=self._errors,
+        )
@@ -0,0 +1,189 @@
+"""In-process cache of memory search results per user.
+
+``MemoryService.format_memory_context`` runs on every prompt, and each run is
+an embedding call plus a vector (and optionally graph) search. Retried or
+near-identical prompts in a session repeat the same search, so results are
+cached keyed by user, normalized query text, limit and graph flag.
+
+An entry is valid while the user's memory version counter is unchanged and
+the entry is younger than the TTL. MemoryService bumps the counter after
+every add/delete for that user. With a Redis cache attached the counter
+lives in Redis, so writes on any instance (including the background
+extraction workers) invalidate every instance's entries.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    from apps.api.protocols import Cache, MemorySearchResult
+
+_VERSION_KEY_PREFIX = "memory_version"
+
+_CacheKey = tuple[str, str, int, bool]
+
+
+class MemorySearchCacheMetrics(TypedDict):
+    """Snapshot of memory search cache counters."""
+
+    entries: int
+    hits: int
+    misses: int
+    invalidations: int
+    evicted: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    version: str
+    loaded_at: float
+    results: list["MemorySearchResult"]
+
+
+def normalize_query(query: str) -> str:
+    """Normalize query text so trivially different prompts share an entry.
+
+    Args:
+        query: Raw search query.
+
+    Returns:
+        Lower-cased query with whitespace collapsed.
+    """
+    return " ".join(query.lower().split())
+
+
+class MemorySearchCache:
+    """Bounded LRU of search results, invalidated by per-user versions."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        versions: "Cache | None" = None,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            max_entries: Max searches kept before evicting the least recent.
+            ttl_seconds: Max entry age in seconds.
+            versions: Redis cache holding per-user version counters shared
+                across instances (None = process-local counters).
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._versions = versions
+        self._local_versions: dict[str, int] = {}
+        self._entries: OrderedDict[_CacheKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._evicted = 0
+
+    async def version(self, user_id: str) -> str:
+        """Return the user's current memory version.
+
+        Args:
+            user_id: User identifier.
+
+        Returns:
+            Version string (bumped on every memory write for the user).
+        """
+        if self._versions is None:
+            return str(self._local_versions.get(user_id, 0))
+        value = await self._versions.get(f"{_VERSION_KEY_PREFIX}:{user_id}")
+        return value or "0"
+
+    def get(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+        enable_graph: bool,
+        version: str,
+    ) -> list["MemorySearchResult"] | None:
+        """Return cached results if they match the user's current version.
+
+        Args:
+            user_id: User identifier.
+            query: Search query.
+            limit: Max results requested.
+            enable_graph: Whether graph relationships were included.
+            version: Current value from ``version()``.
+
+        Returns:
+            Copy of the cached results, or None on miss.
+        """
+        key = (user_id, normalize_query(query), limit, enable_graph)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or entry.version != version
+                or time.monotonic() - entry.loaded_at >= self._ttl_seconds
+            ):
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(entry.results)
+
+    def put(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+        enable_graph: bool,
+        version: str,
+        results: list["MemorySearchResult"],
+    ) -> None:
+        """Store results, evicting the least recently used past capacity.
+
+        Args:
+            user_id: User identifier.
+            query: Search query.
+            limit: Max results requested.
+            enable_graph: Whether graph relationships were included.
+            version: Version read before the search ran.
+            results: Search results.
+        """
+        key = (user_id, normalize_query(query), limit, enable_graph)
+        with self._lock:
+            self._entries[key] = _Entry(version, time.monotonic(), list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evicted += 1
+
+    async def invalidate(self, user_id: str) -> None:
+        """Bump the user's version so their cached searches are skipped.
+
+        Args:
+            user_id: User whose memories changed.
+        """
+        with self._lock:
+            self._local_versions[user_id] = self._local_versions.get(user_id, 0) + 1
+            self._invalidations += 1
+            stale = [key for key in self._entries if key[0] == user_id]
+            for key in stale:
+                del self._entries[key]
+        if self._versions is not None:
+            await self._versions.incr(f"{_VERSION_KEY_PREFIX}:{user_id}")
+
+    def metrics(self) -> MemorySearchCacheMetrics:
+        """Return cache counters.
+
+        Returns:
+            Entry count and hit/miss/invalidation/eviction totals.
+        """
+        with self._lock:
+            return MemorySearchCacheMetrics(
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                evicted=self._evicted,
+            )
@@ -1,6 +1,5 @@
 """OpenAI streaming adapter for Claude Agent SDK events."""
 
-import json
 import time
 import uuid
 from collections.abc import AsyncGenerator
@@ -18,6 +17,7 @@ from apps.api.types import (
     MessageEventDataDict,
     ResultEventDataDict,
 )
+from apps.api.utils.json_codec import get_json_codec
 
 logger = structlog.get_logger(__name__)
 
@@ -164,7 +164,9 @@ class StreamingAdapter:
 
                                 # Convert input to JSON string
                                 if isinstance(tool_input, dict):
-                                    arguments_str = json.dumps(tool_input)
+                                    arguments_str = get_json_codec().dumps_str(
+                                        tool_input
+                                    )
                                 else:
                                     arguments_str = str(tool_input)
 
@@ -6,12 +6,13 @@ This module handles bidirectional translation of:
 - Tool results in requests (OpenAI tool messages -> Claude tool_result)
 """
 
-import json
 import uuid
 from typing import TYPE_CHECKING, cast
 
 import structlog
 
+from apps.api.utils.json_codec import get_json_codec
+
 if TYPE_CHECKING:
     from apps.api.schemas.openai.requests import (
         OpenAIMessage,
@@ -142,7 +143,7 @@ class ToolTranslator:
 
             # Convert Claude's parsed input to JSON string for OpenAI
             if isinstance(input_data, dict):
-                arguments = json.dumps(input_data)
+                arguments = get_json_codec().dumps_str(input_data)
             else:
                 arguments = str(input_data)
 
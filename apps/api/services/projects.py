@@ -88,8 +88,10 @@ class ProjectService:
             metadata=metadata,
         )
 
-        await self._cache.set_json(self._project_key(project_id), project.__dict__)
-        await self._cache.add_to_set(self._INDEX_KEY, project_id)
+        pipe = self._cache.pipeline()
+        pipe.set_json(self._project_key(project_id), project.__dict__)
+        pipe.add_to_set(self._INDEX_KEY, project_id)
+        await pipe.execute()
         return project
 
     async def get_project(self, project_id: str) -> ProjectRecord | None:
@@ -133,5 +135,8 @@ class ProjectService:
 
     async def delete_project(self, project_id: str) -> bool:
         """<summary>Delete a project.</summary>"""
-        await self._cache.remove_from_set(self._INDEX_KEY, project_id)
-        return await self._cache.delete(self._project_key(project_id))
+        pipe = self._cache.pipeline()
+        pipe.remove_from_set(self._INDEX_KEY, project_id)
+        pipe.delete(self._project_key(project_id))
+        _, deleted = await pipe.execute()
+        return bool(deleted)
@@ -0,0 +1,286 @@
+"""Redis-backed GCRA rate limiter shared by every API instance.
+
+Each (scope, client) pair owns one GCRA bucket in Redis, so limits hold
+across replicas instead of multiplying with them. The bucket is updated by a
+single Lua script (``Cache.gcra_acquire``), which keeps the check-and-claim
+atomic without WATCH/MULTI round-trips.
+
+With ``lease_size`` > 0 an instance claims up to that many tokens per Redis
+call and spends them locally, so only one request in ``lease_size`` touches
+Redis. Leased tokens are already taken from the shared bucket, so the global
+limit is never exceeded; tokens left unused when the lease expires are
+forfeited, which can limit a key slightly early when its traffic is spread
+over many instances.
+
+A denial is also remembered locally until its retry time, so a client that
+keeps hammering a limited key costs no Redis calls. Redis errors fail open:
+the request is let through and counted.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, TypedDict
+
+import structlog
+
+if TYPE_CHECKING:
+    from apps.api.config import Settings
+    from apps.api.protocols import Cache
+
+logger = structlog.get_logger(__name__)
+
+RateLimitScope = Literal["query", "session", "general"]
+
+_KEY_PREFIX = "ratelimit"
+
+
+class RateLimitKeyCounters(TypedDict):
+    """Per-key request counters."""
+
+    allowed: int
+    limited: int
+
+
+class RateLimiterMetrics(TypedDict):
+    """Snapshot of rate limiter counters."""
+
+    allowed: int
+    limited: int
+    redis_calls: int
+    lease_hits: int
+    local_denials: int
+    errors: int
+    tracked_keys: int
+    keys: dict[str, RateLimitKeyCounters]
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    """Outcome of a rate limit check, rendered as X-RateLimit-* headers."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after_seconds: int
+    retry_after_seconds: int
+
+
+@dataclass(slots=True)
+class _Lease:
+    tokens: int
+    remaining: int
+    expires_at: float
+    reset_at: float
+    blocked_until: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class _Policy:
+    limit: int
+    burst: int
+    emission_interval_ms: int
+
+
+class RateLimiter:
+    """Per-client GCRA limits in Redis with optional local token leases."""
+
+    def __init__(
+        self,
+        cache: "Cache",
+        limits: dict[RateLimitScope, int],
+        *,
+        burst: int,
+        lease_size: int = 0,
+        lease_ttl_seconds: float = 1.0,
+        max_tracked_keys: int = 1000,
+    ) -> None:
+        """Initialize limiter.
+
+        Args:
+            cache: Redis cache holding the shared buckets.
+            limits: Requests allowed per minute for each scope.
+            burst: Max requests allowed at once (capped at each scope's limit).
+            lease_size: Tokens claimed per Redis call (0 = claim per request).
+            lease_ttl_seconds: Max age of unused leased tokens.
+            max_tracked_keys: Max keys holding local leases and counters.
+        """
+        self._cache = cache
+        self._policies = {
+            scope: _Policy(
+                limit=limit,
+                burst=min(burst, limit),
+                emission_interval_ms=max(1, round(60_000 / limit)),
+            )
+            for scope, limit in limits.items()
+        }
+        self._lease_size = lease_size
+        self._lease_ttl = lease_ttl_seconds
+        self._max_tracked_keys = max_tracked_keys
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+        self._key_counters: OrderedDict[str, RateLimitKeyCounters] = OrderedDict()
+        self._allowed = 0
+        self._limited = 0
+        self._redis_calls = 0
+        self._lease_hits = 0
+        self._local_denials = 0
+        self._errors = 0
+
+    @classmethod
+    def from_settings(cls, cache: "Cache", settings: "Settings") -> "RateLimiter":
+        """Build a limiter from application settings.
+
+        Args:
+            cache: Redis cache holding the shared buckets.
+            settings: Application settings.
+
+        Returns:
+            RateLimiter enforcing the per-minute limits of each scope.
+        """
+        return cls(
+            cache,
+            {
+                "query": settings.rate_limit_query_per_minute,
+                "session": settings.rate_limit_session_per_minute,
+                "general": settings.rate_limit_general_per_minute,
+            },
+            burst=settings.rate_limit_burst,
+            lease_size=settings.rate_limit_lease_size,
+            lease_ttl_seconds=settings.rate_limit_lease_ttl_ms / 1000,
+            max_tracked_keys=settings.rate_limit_max_tracked_keys,
+        )
+
+    async def acquire(
+        self, scope: RateLimitScope, client_id: str
+    ) -> RateLimitDecision | None:
+        """Take one request token for a client.
+
+        Args:
+            scope: Endpoint class whose limit applies.
+            client_id: Hashed API key or client IP identifying the caller.
+
+        Returns:
+            Decision for the request, or None if Redis was unreachable and
+            the request is let through unchecked.
+        """
+        policy = self._policies[scope]
+        key = f"{_KEY_PREFIX}:{scope}:{client_id}"
+        now = time.monotonic()
+
+        lease = self._leases.get(key)
+        if lease is not None:
+            self._leases.move_to_end(key)
+            if now < lease.blocked_until:
+                self._local_denials += 1
+                return self._deny(key, policy, lease.blocked_until - now, lease, now)
+            if lease.tokens > 0 and now < lease.expires_at:
+                lease.tokens -= 1
+                self._lease_hits += 1
+                return self._allow(key, policy, lease, now)
+
+        requested = max(1, min(self._lease_size, policy.burst))
+        self._redis_calls += 1
+        try:
+            grant = await self._cache.gcra_acquire(
+                key, policy.emission_interval_ms, policy.burst, requested
+            )
+        except Exception as e:
+            self._errors += 1
+            logger.warning("rate_limit_backend_error", scope=scope, error=str(e))
+            return None
+
+        reset_at = now + grant["reset_after_ms"] / 1000
+        if grant["granted"] == 0:
+            retry_after = grant["retry_after_ms"] / 1000
+            lease = self._store_lease(
+                key,
+                _Lease(
+                    tokens=0,
+                    remaining=0,
+                    expires_at=now,
+                    reset_at=reset_at,
+                    blocked_until=now + retry_after,
+                ),
+            )
+            return self._deny(key, policy, retry_after, lease, now)
+
+        lease = self._store_lease(
+            key,
+            _Lease(
+                tokens=grant["granted"] - 1,
+                remaining=grant["remaining"],
+                expires_at=now + self._lease_ttl,
+                reset_at=reset_at,
+            ),
+        )
+        return self._allow(key, policy, lease, now)
+
+    def _store_lease(self, key: str, lease: _Lease) -> _Lease:
+        self._leases[key] = lease
+        self._leases.move_to_end(key)
+        while len(self._leases) > self._max_tracked_keys:
+            self._leases.popitem(last=False)
+        return lease
+
+    def _allow(
+        self, key: str, policy: _Policy, lease: _Lease, now: float
+    ) -> RateLimitDecision:
+        self._allowed += 1
+        self._count(key)["allowed"] += 1
+        return RateLimitDecision(
+            allowed=True,
+            limit=policy.limit,
+            remaining=lease.remaining + lease.tokens,
+            reset_after_seconds=math.ceil(max(0.0, lease.reset_at - now)),
+            retry_after_seconds=0,
+        )
+
+    def _deny(
+        self,
+        key: str,
+        policy: _Policy,
+        retry_after: float,
+        lease: _Lease,
+        now: float,
+    ) -> RateLimitDecision:
+        self._limited += 1
+        self._count(key)["limited"] += 1
+        return RateLimitDecision(
+            allowed=False,
+            limit=policy.limit,
+            remaining=0,
+            reset_after_seconds=math.ceil(max(0.0, lease.reset_at - now)),
+            retry_after_seconds=max(1, math.ceil(retry_after)),
+        )
+
+    def _count(self, key: str) -> RateLimitKeyCounters:
+        counters = self._key_counters.get(key)
+        if counters is None:
+            counters = RateLimitKeyCounters(allowed=0, limited=0)
+            self._key_counters[key] = counters
+            while len(self._key_counters) > self._max_tracked_keys:
+                self._key_counters.popitem(last=False)
+        else:
+            self._key_counters.move_to_end(key)
+        return counters
+
+    def metrics(self) -> RateLimiterMetrics:
+        """Return limiter counters.
+
+        Returns:
+            Totals plus allowed/limited counts for the most recent keys.
+        """
+        return RateLimiterMetrics(
+            allowed=self._allowed,
+            limited=self._limited,
+            redis_calls=self._redis_calls,
+            lease_hits=self._lease_hits,
+            local_denials=self._local_denials,
+            errors=self._errors,
+            tracked_keys=len(self._key_counters),
+            keys={
+                key.removeprefix(f"{_KEY_PREFIX}:"): RateLimitKeyCounters(**counters)
+                for key, counters in self._key_counters.items()
+            },
+        )
@@ -15,7 +15,7 @@ See ADR-001 for architecture details.
 """
 
 import secrets
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Literal, TypeVar
 from uuid import UUID, uuid4
@@ -26,21 +26,26 @@ from sqlalchemy.exc import IntegrityError, OperationalError
 from apps.api.config import get_settings
 from apps.api.exceptions.base import APIError
 from apps.api.exceptions.session import SessionNotFoundError
+from apps.api.exceptions.validation import ValidationError
 from apps.api.services.session_cache_manager import SessionCacheManager
 from apps.api.services.session_lock_manager import SessionLockManager
 from apps.api.services.session_metadata_manager import SessionMetadataManager
 from apps.api.services.session_models import (
     Session,
     SessionListResult,
+    TranscriptMessage,
+    TranscriptPage,
 )
 from apps.api.types import JsonValue
 from apps.api.utils.crypto import hash_api_key
+from apps.api.utils.pagination import KeysetCursor, decode_cursor, encode_cursor
 from apps.api.utils.session_utils import parse_session_status
 
 T = TypeVar("T")
 
 if TYPE_CHECKING:
     from apps.api.models.session import Session as SessionModel
+    from apps.api.models.session import SessionMessage
     from apps.api.protocols import Cache, SessionRepositoryProtocol
 
 logger = structlog.get_logger(__name__)
@@ -354,14 +359,22 @@ class SessionService:
         project_id: str | None = None,
         tags: list[str] | None = None,
         search: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> SessionListResult:
         """List sessions with pagination using bulk cache reads or DB repository.
 
         When current_api_key is provided and db_repo is available, uses efficient
         indexed DB query. Otherwise, falls back to cache scan.
 
+        Offset mode (no cursor) pages by ``page``. Cursor mode seeks past the
+        (created_at, id) of the last session of the previous page, so deep
+        pages cost the same as the first; the first page is read the same way,
+        since there is nothing to skip. Both modes return ``next_cursor``
+        when more sessions follow.
+
         Args:
-            page: Page number (1-indexed).
+            page: Page number (1-indexed, ignored in cursor mode).
             page_size: Number of sessions per page.
             current_api_key: API key for ownership filtering.
                            If provided, only returns sessions owned by this key.
@@ -369,29 +382,62 @@ class SessionService:
             project_id: Filter by metadata project_id.
             tags: Filter by metadata tags (must contain all tags).
             search: Case-insensitive metadata title search.
+            cursor: Opaque next_cursor from a previous page (enables cursor mode).
+            include_total: Return the filtered total (None otherwise).
 
         Returns:
             Paginated session list.
+
+        Raises:
+            ValidationError: If the cursor is malformed.
         """
+        after = decode_cursor(cursor) if cursor is not None else None
+
         # Use db_repo for owner-filtered queries (efficient indexed lookup)
         if current_api_key is not None and self._db_repo is not None:
-            offset = (page - 1) * page_size
-            db_sessions, total = await self._db_repo.list_sessions(
-                owner_api_key=current_api_key,
-                limit=page_size,
-                offset=offset,
-                mode=mode,
-                project_id=project_id,
-                tags=tags,
-                search=search,
-            )
+            if after is not None or page == 1:
+                if after is not None:
+                    try:
+                        UUID(after.id)
+                    except ValueError as e:
+                        raise ValidationError(
+                            "Invalid pagination cursor", field="cursor"
+                        ) from e
+                (
+                    db_sessions,
+                    has_more,
+                    db_total,
+                ) = await self._db_repo.list_sessions_keyset(
+                    owner_api_key=current_api_key,
+                    limit=page_size,
+                    after=after,
+                    include_total=include_total,
+                    mode=mode,
+                    project_id=project_id,
+                    tags=tags,
+                    search=search,
+                )
+            else:
+                offset = (page - 1) * page_size
+                db_sessions, total = await self._db_repo.list_sessions(
+                    owner_api_key=current_api_key,
+                    limit=page_size,
+                    offset=offset,
+                    mode=mode,
+                    project_id=project_id,
+                    tags=tags,
+                    search=search,
+                )
+                has_more = offset + len(db_sessions) < total
+                db_total = total if include_total else None
             # Convert DB models to service Session objects
             sessions = [self._map_db_to_service(s) for s in db_sessions]
             return SessionListResult(
                 sessions=sessions,
-                total=total,
+                total=db_total,
                 page=page,
                 page_size=page_size,
+                next_cursor=self._next_cursor(sessions, has_more),
             )
 
         # Use owner index for cache-based owner filtering (efficient)
@@ -413,8 +459,8 @@ class SessionService:
             )
             cached_sessions = await self._cache_manager.list_all_sessions(max_keys=1000)
 
-        # Sort by created_at descending
-        cached_sessions.sort(key=lambda s: s.created_at, reverse=True)
+        # Sort by (created_at, id) descending to match the DB keyset order
+        cached_sessions.sort(key=lambda s: (s.created_at, s.id), reverse=True)
 
         # Apply metadata filters for cache-backed listing paths
         filtered_sessions = [
@@ -425,17 +471,35 @@ class SessionService:
 
         # Calculate pagination
         total = len(filtered_sessions)
-        start = (page - 1) * page_size
-        end = start + page_size
-        page_sessions = filtered_sessions[start:end]
+        if after is not None:
+            remaining = [
+                s
+                for s in filtered_sessions
+                if (s.created_at, s.id) < (after.created_at, after.id)
+            ]
+            page_sessions = remaining[:page_size]
+            has_more = len(remaining) > page_size
+        else:
+            start = (page - 1) * page_size
+            page_sessions = filtered_sessions[start : start + page_size]
+            has_more = start + page_size < total
 
         return SessionListResult(
             sessions=page_sessions,
-            total=total,
+            total=total if include_total else None,
             page=page,
             page_size=page_size,
+            next_cursor=self._next_cursor(page_sessions, has_more),
         )
 
+    @staticmethod
+    def _next_cursor(sessions: list[Session], has_more: bool) -> str | None:
+        """Build the cursor for the page after the given sessions."""
+        if not has_more or not sessions:
+            return None
+        last = sessions[-1]
+        return encode_cursor(last.created_at, last.id)
+
     async def update_session(
         self,
         session_id: str,
@@ -681,6 +745,112 @@ class SessionService:
 
         return None
 
+    async def list_messages(
+        self,
+        session_id: str,
+        current_api_key: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> TranscriptPage:
+        """List a page of a session's transcript, oldest first.
+
+        Args:
+            session_id: Session ID whose transcript to read.
+            current_api_key: API key for ownership enforcement.
+            limit: Maximum messages per page.
+            cursor: Opaque next_cursor from a previous page.
+
+        Returns:
+            Page of messages with the cursor of the next page.
+
+        Raises:
+            SessionNotFoundError: If the session doesn't exist or isn't owned
+                by current_api_key.
+            ValidationError: If the cursor is malformed.
+        """
+        after = self._decode_message_cursor(cursor)
+        await self._require_session(session_id, current_api_key)
+        if self._db_repo is None:
+            return TranscriptPage(messages=[])
+
+        rows, has_more = await self._db_repo.list_messages_keyset(
+            UUID(session_id), limit=limit, after=after
+        )
+        messages = [self._map_message(row) for row in rows]
+        next_cursor = None
+        if has_more and messages:
+            last = messages[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return TranscriptPage(messages=messages, next_cursor=next_cursor)
+
+    async def stream_messages(
+        self,
+        session_id: str,
+        current_api_key: str | None = None,
+        cursor: str | None = None,
+    ) -> AsyncIterator[TranscriptMessage]:
+        """Open a constant-memory stream over a session's whole transcript.
+
+        Ownership and the cursor are checked before this returns, so errors
+        surface before a streaming response has started.
+
+        Args:
+            session_id: Session ID whose transcript to export.
+            current_api_key: API key for ownership enforcement.
+            cursor: Opaque cursor to resume an export after a given message.
+
+        Returns:
+            Async iterator over messages, oldest first.
+
+        Raises:
+            SessionNotFoundError: If the session doesn't exist or isn't owned
+                by current_api_key.
+            ValidationError: If the cursor is malformed.
+        """
+        after = self._decode_message_cursor(cursor)
+        await self._require_session(session_id, current_api_key)
+        return self._iter_messages(UUID(session_id), after)
+
+    async def _iter_messages(
+        self, session_id: UUID, after: KeysetCursor | None
+    ) -> AsyncIterator[TranscriptMessage]:
+        """Yield transcript messages from the repository's server-side cursor."""
+        if self._db_repo is None:
+            return
+        async for row in self._db_repo.stream_messages(session_id, after=after):
+            yield self._map_message(row)
+
+    async def _require_session(
+        self, session_id: str, current_api_key: str | None
+    ) -> None:
+        """Raise SessionNotFoundError unless the session is visible to the key."""
+        session = await self.get_session(session_id, current_api_key=current_api_key)
+        if not session:
+            raise SessionNotFoundError(session_id)
+
+    @staticmethod
+    def _decode_message_cursor(cursor: str | None) -> KeysetCursor | None:
+        """Decode a transcript cursor, validating its message id."""
+        if cursor is None:
+            return None
+        after = decode_cursor(cursor)
+        try:
+            UUID(after.id)
+        except ValueError as e:
+            raise ValidationError("Invalid pagination cursor", field="cursor") from e
+        return after
+
+    @staticmethod
+    def _map_message(row: "SessionMessage") -> TranscriptMessage:
+        """Map a SessionMessage row to the service TranscriptMessage."""
+        return TranscriptMessage(
+            id=str(row.id),
+            session_id=str(row.session_id),
+            message_type=row.message_type,
+            content=dict(row.content),
+            created_at=row.created_at,
+        )
+
     async def _cache_session(self, session: Session) -> None:
         """Cache a session in Redis and update owner index.
 
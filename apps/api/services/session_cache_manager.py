@@ -33,7 +33,8 @@ class SessionCacheManager:
         Both the session data key and the owner index set receive TTLs
         matching ``self._ttl`` so stale entries are automatically evicted.
         The owner index TTL is refreshed on every write, keeping it alive
-        as long as sessions are actively cached.
+        as long as sessions are actively cached. All writes go out in one
+        pipelined round-trip.
         """
         if self._cache is None:
             return
@@ -51,13 +52,16 @@ class SessionCacheManager:
             "session_metadata": session.session_metadata,
         }
 
-        await self._cache.set_json(self.cache_key(session.id), data, self._ttl)
+        pipe = self._cache.pipeline()
+        pipe.set_json(self.cache_key(session.id), data, self._ttl)
 
         if session.owner_api_key_hash:
             owner_index_key = f"session:owner:{session.owner_api_key_hash}"
-            await self._cache.add_to_set(owner_index_key, session.id)
+            pipe.add_to_set(owner_index_key, session.id)
             # Keep owner index alive as long as the newest session entry
-            await self._cache.expire(owner_index_key, self._ttl)
+            pipe.expire(owner_index_key, self._ttl)
+
+        await pipe.execute()
 
     async def get_cached_session(self, session_id: str) -> Session | None:
         """Read and parse a session from cache, deleting corrupt payloads."""
@@ -129,11 +133,14 @@ class SessionCacheManager:
         if self._cache is None:
             return False
 
+        pipe = self._cache.pipeline()
         if owner_api_key_hash:
             owner_index_key = f"session:owner:{owner_api_key_hash}"
-            await self._cache.remove_from_set(owner_index_key, session_id)
+            pipe.remove_from_set(owner_index_key, session_id)
+        pipe.delete(self.cache_key(session_id))
 
-        return await self._cache.delete(self.cache_key(session_id))
+        results = await pipe.execute()
+        return bool(results[-1])
 
     async def session_exists(self, session_id: str) -> bool:
         """Check whether a session exists in cache."""
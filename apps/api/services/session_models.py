@@ -45,6 +45,26 @@ class SessionListResult:
     """Result of listing sessions."""
 
     sessions: list[Session]
-    total: int
+    total: int | None
     page: int
     page_size: int
+    next_cursor: str | None = None
+
+
+@dataclass
+class TranscriptMessage:
+    """One persisted transcript message of a session."""
+
+    id: str
+    session_id: str
+    message_type: str
+    content: dict[str, object]
+    created_at: datetime
+
+
+@dataclass
+class TranscriptPage:
+    """Result of listing a page of transcript messages."""
+
+    messages: list[TranscriptMessage]
+    next_cursor: str | None = None
@@ -88,8 +88,10 @@ class SkillCrudService:
             share_url=None,
         )
 
-        await self._cache.set_json(self._skill_key(skill_id), skill.__dict__)
-        await self._cache.add_to_set(self._INDEX_KEY, skill_id)
+        pipe = self._cache.pipeline()
+        pipe.set_json(self._skill_key(skill_id), skill.__dict__)
+        pipe.add_to_set(self._INDEX_KEY, skill_id)
+        await pipe.execute()
         return skill
 
     async def get_skill(self, skill_id: str) -> SkillRecord | None:
@@ -139,5 +141,8 @@ class SkillCrudService:
 
     async def delete_skill(self, skill_id: str) -> bool:
         """<summary>Delete a skill.</summary>"""
-        await self._cache.remove_from_set(self._INDEX_KEY, skill_id)
-        return await self._cache.delete(self._skill_key(skill_id))
+        pipe = self._cache.pipeline()
+        pipe.remove_from_set(self._INDEX_KEY, skill_id)
+        pipe.delete(self._skill_key(skill_id))
+        _, deleted = await pipe.execute()
+        return bool(deleted)
@@ -82,8 +82,10 @@ class SlashCommandService:
             updated_at=None,
         )
 
-        await self._cache.set_json(self._command_key(command_id), command.__dict__)
-        await self._cache.add_to_set(self._INDEX_KEY, command_id)
+        pipe = self._cache.pipeline()
+        pipe.set_json(self._command_key(command_id), command.__dict__)
+        pipe.add_to_set(self._INDEX_KEY, command_id)
+        await pipe.execute()
         return command
 
     async def get_command(self, command_id: str) -> SlashCommandRecord | None:
@@ -129,5 +131,8 @@ class SlashCommandService:
 
     async def delete_command(self, command_id: str) -> bool:
         """<summary>Delete a slash command.</summary>"""
-        await self._cache.remove_from_set(self._INDEX_KEY, command_id)
-        return await self._cache.delete(self._command_key(command_id))
+        pipe = self._cache.pipeline()
+        pipe.remove_from_set(self._INDEX_KEY, command_id)
+        pipe.delete(self._command_key(command_id))
+        _, deleted = await pipe.execute()
+        return bool(deleted)
@@ -61,8 +61,10 @@ class ToolPresetService:
             created_at=datetime.now(UTC).isoformat(),
         )
 
-        await self._cache.set_json(self._preset_key(preset.id), preset.__dict__)
-        await self._cache.add_to_set(self._INDEX_KEY, preset.id)
+        pipe = self._cache.pipeline()
+        pipe.set_json(self._preset_key(preset.id), preset.__dict__)
+        pipe.add_to_set(self._INDEX_KEY, preset.id)
+        await pipe.execute()
         return preset
 
     async def list_presets(self) -> list[ToolPreset]:
@@ -138,5 +140,8 @@ class ToolPresetService:
 
     async def delete_preset(self, preset_id: str) -> bool:
         """Delete a tool preset by ID."""
-        await self._cache.remove_from_set(self._INDEX_KEY, preset_id)
-        return await self._cache.delete(self._preset_key(preset_id))
+        pipe = self._cache.pipeline()
+        pipe.remove_from_set(self._INDEX_KEY, preset_id)
+        pipe.delete(self._preset_key(preset_id))
+        _, deleted = await pipe.execute()
+        return bool(deleted)
@@ -0,0 +1,317 @@
+"""Write-behind recorder persisting stream transcripts to session_messages.
+
+StreamQueryRunner hands each mapped message event to this recorder instead of
+inserting it inline, so a query stream never waits on a database round-trip
+per event. Only streams whose route creates the session row (/query SSE,
+resume and fork) are recorded; WebSocket and OpenAI-compatible streams have
+no row for session_messages to reference. A single flusher task drains the buffer and writes rows with
+batched multi-row INSERTs, flushing when ``batch_size`` rows are waiting or
+``flush_interval_seconds`` after the first row of a batch was queued.
+
+The buffer is bounded. When the database falls behind and the buffer is
+full, ``record`` waits for room (backpressure on the stream) for up to
+``backpressure_timeout_seconds`` before dropping the row, so a database
+outage degrades transcripts rather than stalling queries indefinitely.
+
+Failed writes are retried with exponential backoff. A batch rejected for a
+constraint violation (typically a session row that was never created) is
+retried one session at a time so rows of other sessions still land.
+"""
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, TypedDict
+from uuid import UUID
+
+import structlog
+
+from apps.api.adapters.session_repo import SessionRepository
+from apps.api.exceptions.base import APIError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from apps.api.config import Settings
+    from apps.api.types import JsonValue
+
+logger = structlog.get_logger(__name__)
+
+
+class TranscriptRecorderMetrics(TypedDict):
+    """Snapshot of transcript recorder counters."""
+
+    queued: int
+    capacity: int
+    in_flight: int
+    recorded: int
+    written: int
+    batches: int
+    retries: int
+    failed: int
+    dropped: int
+
+
+@dataclass(slots=True)
+class TranscriptEntry:
+    """One transcript row waiting to be written."""
+
+    session_id: UUID
+    message_type: str
+    content: dict[str, "JsonValue"]
+    created_at: datetime
+
+    def as_row(self) -> dict[str, object]:
+        """Return the column values for a session_messages INSERT."""
+        return {
+            "session_id": self.session_id,
+            "message_type": self.message_type,
+            "content": self.content,
+            "created_at": self.created_at,
+        }
+
+
+class TranscriptRecorder:
+    """Bounded write-behind buffer flushed to session_messages in batches."""
+
+    def __init__(
+        self,
+        session_maker: "async_sessionmaker[AsyncSession]",
+        *,
+        max_size: int = 1000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 0.25,
+        backpressure_timeout_seconds: float = 5.0,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 0.5,
+    ) -> None:
+        """Initialize recorder.
+
+        Args:
+            session_maker: Factory for the database sessions used by flushes.
+            max_size: Max rows buffered before ``record`` applies backpressure.
+            batch_size: Max rows per multi-row INSERT.
+            flush_interval_seconds: Max delay between queuing a row and
+                flushing the batch that contains it.
+            backpressure_timeout_seconds: Max wait for buffer room before a
+                row is dropped.
+            max_attempts: Write attempts per batch, including the first.
+            retry_backoff_seconds: Delay before the first retry; doubles after.
+        """
+        self._session_maker = session_maker
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        self._backpressure_timeout = backpressure_timeout_seconds
+        self._max_attempts = max_attempts
+        self._retry_backoff = retry_backoff_seconds
+        self._queue: asyncio.Queue[TranscriptEntry] = asyncio.Queue(maxsize=max_size)
+        self._flusher: asyncio.Task[None] | None = None
+        self._closed = False
+        self._in_flight = 0
+        self._recorded = 0
+        self._written = 0
+        self._batches = 0
+        self._retries = 0
+        self._failed = 0
+        self._dropped = 0
+
+    @classmethod
+    def from_settings(
+        cls,
+        session_maker: "async_sessionmaker[AsyncSession]",
+        settings: "Settings",
+    ) -> "TranscriptRecorder":
+        """Build a recorder from application settings.
+
+        Args:
+            session_maker: Factory for the database sessions used by flushes.
+            settings: Application settings.
+
+        Returns:
+            Unstarted TranscriptRecorder.
+        """
+        return cls(
+            session_maker,
+            max_size=settings.transcript_buffer_size,
+            batch_size=settings.transcript_flush_batch_size,
+            flush_interval_seconds=settings.transcript_flush_interval_ms / 1000,
+            backpressure_timeout_seconds=(
+                settings.transcript_backpressure_timeout_seconds
+            ),
+            max_attempts=settings.transcript_max_attempts,
+        )
+
+    def start(self) -> None:
+        """Start the flusher task. Safe to call multiple times."""
+        if self._flusher is not None:
+            return
+        self._closed = False
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Stop accepting rows and flush what is buffered.
+
+        Rows still buffered when the timeout expires are dropped.
+
+        Args:
+            timeout: Max seconds to wait for buffered rows to be written.
+        """
+        self._closed = True
+        flusher, self._flusher = self._flusher, None
+        if flusher is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except TimeoutError:
+            logger.warning(
+                "transcript_drain_timeout",
+                remaining=self._queue.qsize() + self._in_flight,
+            )
+        flusher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await flusher
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._dropped += 1
+
+    async def record(
+        self,
+        session_id: str,
+        message_type: str,
+        content: dict[str, "JsonValue"],
+    ) -> bool:
+        """Buffer a transcript row, waiting for room if the buffer is full.
+
+        Args:
+            session_id: Session the message belongs to.
+            message_type: Type of message (user, assistant, system, result).
+            content: Message content.
+
+        Returns:
+            True if buffered, False if dropped (recorder closed, session id
+            not a UUID, or no room within the backpressure timeout).
+        """
+        if self._closed:
+            self._dropped += 1
+            return False
+        try:
+            session_uuid = UUID(session_id)
+        except ValueError:
+            self._dropped += 1
+            return False
+
+        entry = TranscriptEntry(
+            session_id=session_uuid,
+            message_type=message_type,
+            content=content,
+            created_at=datetime.now(UTC),
+        )
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(
+                    self._queue.put(entry), timeout=self._backpressure_timeout
+                )
+            except TimeoutError:
+                self._dropped += 1
+                logger.warning(
+                    "transcript_entry_dropped",
+                    session_id=session_id,
+                    message_type=message_type,
+                )
+                return False
+        self._recorded += 1
+        return True
+
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    )
+                except TimeoutError:
+                    break
+            self._in_flight = len(batch)
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                # Never let one bad batch stop the flusher
+                self._failed += len(batch)
+                logger.warning("transcript_write_failed", rows=len(batch), error=str(e))
+            finally:
+                self._in_flight = 0
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write_batch(self, batch: list[TranscriptEntry]) -> None:
+        try:
+            await self._write_with_retry(batch)
+        except APIError as e:
+            if e.status_code != 409:
+                self._fail(batch, e)
+                return
+            # Isolate the session(s) whose rows violate constraints
+            by_session: dict[UUID, list[TranscriptEntry]] = {}
+            for entry in batch:
+                by_session.setdefault(entry.session_id, []).append(entry)
+            for entries in by_session.values():
+                try:
+                    await self._write_with_retry(entries)
+                except APIError as session_error:
+                    self._fail(entries, session_error)
+
+    async def _write_with_retry(self, entries: list[TranscriptEntry]) -> None:
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                async with self._session_maker() as db:
+                    await SessionRepository(db).add_messages(
+                        [entry.as_row() for entry in entries]
+                    )
+            except APIError as e:
+                if e.status_code == 409 or attempt == self._max_attempts:
+                    raise
+                self._retries += 1
+                await asyncio.sleep(self._retry_backoff * 2 ** (attempt - 1))
+            else:
+                self._written += len(entries)
+                self._batches += 1
+                return
+
+    def _fail(self, entries: list[TranscriptEntry], error: APIError) -> None:
+        self._failed += len(entries)
+        logger.warning(
+            "transcript_write_failed",
+            rows=len(entries),
+            session_ids=sorted({str(entry.session_id) for entry in entries}),
+            code=error.code,
+            error=error.message,
+        )
+
+    def metrics(self) -> TranscriptRecorderMetrics:
+        """Return recorder counters.
+
+        Returns:
+            Buffer depth, capacity and record/write/retry/failure/drop totals.
+        """
+        return TranscriptRecorderMetrics(
+            queued=self._queue.qsize(),
+            capacity=self._max_size,
+            in_flight=self._in_flight,
+            recorded=self._recorded,
+            written=self._written,
+            batches=self._batches,
+            retries=self._retries,
+            failed=self._failed,
+            dropped=self._dropped,
+        )
@@ -6,12 +6,19 @@ for agent lifecycle hooks (PreToolUse, PostToolUse, Stop, etc.).
 
 import asyncio
 import re
-from typing import Literal, cast
+import time
+from typing import TYPE_CHECKING, Literal, cast
 
 import httpx
 import structlog
 
 from apps.api.schemas.requests.config import HooksConfigSchema, HookWebhookSchema
+from apps.api.utils.json_codec import get_json_codec
+
+if TYPE_CHECKING:
+    from apps.api.services.hook_decision_cache import HookDecisionCache
+    from apps.api.services.webhook_delivery import WebhookDeliveryQueue
+    from apps.api.services.webhook_http import WebhookHttpPool
 
 logger = structlog.get_logger()
 
@@ -29,6 +36,12 @@ HookEventType = Literal[
 
 DecisionType = Literal["allow", "deny", "ask"]
 
+# Hooks whose response cannot change the outcome; delivered in the background
+# when a delivery queue is attached.
+BACKGROUND_HOOK_EVENTS: frozenset[HookEventType] = frozenset(
+    {"PostToolUse", "Stop", "SubagentStop"}
+)
+
 
 class WebhookPayload:
     """Type-safe structure for webhook request payloads."""
@@ -76,6 +89,9 @@ class WebhookService:
         self,
         http_client: httpx.AsyncClient | None = None,
         default_timeout: float = 30.0,
+        http_pool: "WebhookHttpPool | None" = None,
+        decision_cache: "HookDecisionCache | None" = None,
+        delivery_queue: "WebhookDeliveryQueue | None" = None,
     ) -> None:
         """Initialize WebhookService.
 
@@ -83,8 +99,18 @@ class WebhookService:
             http_client: Optional custom HTTP client for making requests.
                          If not provided, a new client will be created per request.
             default_timeout: Default timeout in seconds for webhook requests.
+            http_pool: Shared app-lifetime connection pool. Takes precedence
+                       over http_client and records hook latency histograms.
+            decision_cache: Cache for PreToolUse hooks that opt in through
+                            HookWebhookSchema.decision_cache.
+            delivery_queue: Background queue for PostToolUse, Stop and
+                            SubagentStop hooks. When set, those hooks return
+                            as soon as the event is queued.
         """
         self._http_client = http_client
+        self._http_pool = http_pool
+        self._decision_cache = decision_cache
+        self._delivery_queue = delivery_queue
         self._default_timeout = default_timeout
         self._logger = logger.bind(service="webhook")
 
@@ -131,7 +157,8 @@ class WebhookService:
 
         Returns:
             Dictionary containing the webhook response with 'decision' field.
-            On error/timeout, returns default allow response.
+            On error/timeout, returns default allow response. Hooks handed to
+            the delivery queue return an acknowledgement instead.
         """
         # Check if hook should be executed based on matcher
         if tool_name and not self.should_execute_hook(hook_config, tool_name):
@@ -147,13 +174,38 @@ class WebhookService:
             result_data=result_data,
         )
 
+        if self._delivery_queue is not None and hook_event in BACKGROUND_HOOK_EVENTS:
+            return self._enqueue(self._delivery_queue, hook_event, hook_config, payload)
+
+        decision_cache = (
+            self._decision_cache
+            if hook_event == "PreToolUse" and hook_config.decision_cache is not None
+            else None
+        )
+        if decision_cache is not None:
+            cached = await decision_cache.get(hook_config, payload)
+            if cached is not None:
+                return cached
+
+        start = time.perf_counter()
+        failed = True
         try:
-            response = await self._make_request(
-                url=str(hook_config.url),
-                json=payload,
-                headers=hook_config.headers,
-                timeout=hook_config.timeout,
-            )
+            if decision_cache is not None:
+                response, cache_control = await self._fetch(
+                    url=str(hook_config.url),
+                    json=payload,
+                    headers=hook_config.headers,
+                    timeout=hook_config.timeout,
+                )
+                await decision_cache.put(hook_config, payload, response, cache_control)
+            else:
+                response = await self._make_request(
+                    url=str(hook_config.url),
+                    json=payload,
+                    headers=hook_config.headers,
+                    timeout=hook_config.timeout,
+                )
+            failed = False
             return response
         except TimeoutError:
             self._logger.warning(
@@ -200,6 +252,50 @@ class WebhookService:
                 hook_event,
                 f"Invalid JSON response: {e!s}",
             )
+        finally:
+            if self._http_pool is not None:
+                self._http_pool.observe(
+                    hook_event,
+                    (time.perf_counter() - start) * 1000,
+                    error=failed,
+                )
+
+    def _enqueue(
+        self,
+        delivery_queue: "WebhookDeliveryQueue",
+        hook_event: HookEventType,
+        hook_config: HookWebhookSchema,
+        payload: dict[str, object],
+    ) -> dict[str, object]:
+        """Hand an observational hook to the background delivery queue.
+
+        Args:
+            delivery_queue: Queue to submit the event to.
+            hook_event: Type of hook event.
+            hook_config: Webhook configuration with URL, headers, timeout.
+            payload: Webhook request payload.
+
+        Returns:
+            Acknowledgement; 'queued' is False if the event was dropped.
+        """
+        from apps.api.services.webhook_delivery import WebhookDelivery
+
+        queued = delivery_queue.submit(
+            WebhookDelivery(
+                hook_event=hook_event,
+                url=str(hook_config.url),
+                payload=payload,
+                headers=hook_config.headers,
+                timeout=hook_config.timeout,
+            )
+        )
+        if queued:
+            return {"acknowledged": True, "queued": True}
+        return {
+            "acknowledged": False,
+            "queued": False,
+            "reason": "Webhook delivery queue full or closed",
+        }
 
     def should_execute_hook(
         self,
@@ -315,6 +411,33 @@ class WebhookService:
         Returns:
             Parsed JSON response from webhook.
 
+        Raises:
+            asyncio.TimeoutError: If request times out.
+            ConnectionError: If connection fails.
+            WebhookHttpError: If HTTP status indicates error.
+            ValueError: If response is not valid JSON.
+        """
+        data, _ = await self._fetch(url, json, headers, timeout)
+        return data
+
+    async def _fetch(
+        self,
+        url: str,
+        json: dict[str, object],
+        headers: dict[str, str],
+        timeout: int,
+    ) -> tuple[dict[str, object], str | None]:
+        """POST to a webhook URL and return the body with its Cache-Control.
+
+        Args:
+            url: Webhook URL to call.
+            json: JSON payload to send.
+            headers: HTTP headers to include.
+            timeout: Request timeout in seconds.
+
+        Returns:
+            Parsed JSON response and the Cache-Control header (None if absent).
+
         Raises:
             asyncio.TimeoutError: If request times out.
             ConnectionError: If connection fails.
@@ -325,13 +448,26 @@ class WebhookService:
             "Content-Type": "application/json",
             **headers,
         }
+        codec = get_json_codec()
+        body = codec.dumps(json)
 
-        if self._http_client:
+        if self._http_pool is not None:
+            # Shared pool: reuses connections and waits for a per-host slot
+            response = await asyncio.wait_for(
+                self._http_pool.post(
+                    url,
+                    content=body,
+                    headers=request_headers,
+                    timeout=timeout,
+                ),
+                timeout=timeout,
+            )
+        elif self._http_client:
             # Use provided client
             response = await asyncio.wait_for(
                 self._http_client.post(
                     url,
-                    json=json,
+                    content=body,
                     headers=request_headers,
                 ),
                 timeout=timeout,
@@ -342,7 +478,7 @@ class WebhookService:
                 response = await asyncio.wait_for(
                     client.post(
                         url,
-                        json=json,
+                        content=body,
                         headers=request_headers,
                     ),
                     timeout=timeout,
@@ -352,23 +488,34 @@ class WebhookService:
             raise WebhookHttpError(response.status_code, response.text)
 
         try:
-            # httpx.Response.json() returns Any, explicitly cast to expected type
-            json_response = response.json()
-            return cast("dict[str, object]", json_response)
+            # Decode the body bytes directly, without an intermediate str
+            data = cast("dict[str, object]", codec.loads(response.content))
         except ValueError as e:
             raise ValueError(f"Invalid JSON response: {e}") from e
+        return data, response.headers.get("cache-control")
 
 
 # Factory function for dependency injection
 def create_webhook_service(
     http_client: httpx.AsyncClient | None = None,
+    http_pool: "WebhookHttpPool | None" = None,
+    decision_cache: "HookDecisionCache | None" = None,
+    delivery_queue: "WebhookDeliveryQueue | None" = None,
 ) -> WebhookService:
     """Create a WebhookService instance.
 
     Args:
         http_client: Optional HTTP client for making requests.
+        http_pool: Optional shared connection pool (preferred over http_client).
+        decision_cache: Optional cache for opted-in PreToolUse decisions.
+        delivery_queue: Optional background queue for observational hooks.
 
     Returns:
         Configured WebhookService instance.
     """
-    return WebhookService(http_client=http_client)
+    return WebhookService(
+        http_client=http_client,
+        http_pool=http_pool,
+        decision_cache=decision_cache,
+        delivery_queue=delivery_queue,
+    )
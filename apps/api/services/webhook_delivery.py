@@ -0,0 +1,340 @@
+"""Background delivery queue for observational webhook hooks.
+
+PostToolUse, Stop and SubagentStop responses cannot change the outcome of a
+turn, so WebhookService hands them to this queue instead of awaiting the
+HTTP call. A fixed pool of worker tasks drains per-destination buffers,
+retries transient failures (timeouts, connection errors, 429 and 5xx) with
+exponential backoff, and records latency on the shared WebhookHttpPool.
+
+With ``max_batch_size > 1`` events queued for the same URL and headers are
+sent together as ``{"events": [payload, ...]}``; a single event is always
+sent as the plain payload, exactly as a synchronous hook call would.
+
+The queue is bounded. When it is full a new event is dropped
+(``drop_newest``) or the oldest queued event is discarded to make room
+(``drop_oldest``), and the drop is counted in the metrics.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal, TypedDict
+
+import httpx
+import structlog
+
+from apps.api.utils.json_codec import get_json_codec
+
+if TYPE_CHECKING:
+    from apps.api.config import Settings
+    from apps.api.services.webhook_http import WebhookHttpPool
+
+logger = structlog.get_logger(__name__)
+
+OverflowPolicy = Literal["drop_newest", "drop_oldest"]
+
+_BatchKey = tuple[str, tuple[tuple[str, str], ...], int]
+
+
+class WebhookDeliveryMetrics(TypedDict):
+    """Snapshot of delivery queue counters."""
+
+    queued: int
+    in_flight: int
+    capacity: int
+    workers: int
+    enqueued: int
+    delivered: int
+    batches: int
+    retries: int
+    failed: int
+    dropped: int
+
+
+@dataclass(slots=True)
+class WebhookDelivery:
+    """One hook event waiting to be POSTed."""
+
+    hook_event: str
+    url: str
+    payload: dict[str, object]
+    headers: dict[str, str] = field(default_factory=dict)
+    timeout: int = 30
+
+    @property
+    def batch_key(self) -> _BatchKey:
+        """Destination identity; only events with equal keys share a POST."""
+        return (self.url, tuple(sorted(self.headers.items())), self.timeout)
+
+
+class _DeliveryError(Exception):
+    """Failed delivery attempt."""
+
+    def __init__(self, message: str, *, retryable: bool) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class WebhookDeliveryQueue:
+    """Bounded queue with a worker pool for fire-and-forget webhook delivery."""
+
+    def __init__(
+        self,
+        http_pool: "WebhookHttpPool",
+        *,
+        max_size: int = 1000,
+        workers: int = 4,
+        max_batch_size: int = 1,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 0.5,
+        overflow: OverflowPolicy = "drop_newest",
+    ) -> None:
+        """Initialize queue.
+
+        Args:
+            http_pool: Shared connection pool used for every POST.
+            max_size: Max events waiting for delivery.
+            workers: Number of concurrent delivery tasks.
+            max_batch_size: Max events combined into one POST per destination.
+            max_attempts: Attempts per batch, including the first.
+            retry_backoff_seconds: Delay before the first retry; doubles after.
+            overflow: What to drop when the queue is full.
+        """
+        self._http_pool = http_pool
+        self._max_size = max_size
+        self._worker_count = workers
+        self._max_batch_size = max_batch_size
+        self._max_attempts = max_attempts
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._overflow = overflow
+        self._buffers: dict[_BatchKey, deque[WebhookDelivery]] = {}
+        self._ready: asyncio.Queue[_BatchKey] = asyncio.Queue()
+        self._workers: list[asyncio.Task[None]] = []
+        self._size = 0
+        self._in_flight = 0
+        self._closed = False
+        self._enqueued = 0
+        self._delivered = 0
+        self._batches = 0
+        self._retries = 0
+        self._failed = 0
+        self._dropped = 0
+
+    @classmethod
+    def from_settings(
+        cls, http_pool: "WebhookHttpPool", settings: "Settings"
+    ) -> "WebhookDeliveryQueue":
+        """Build a queue from application settings.
+
+        Args:
+            http_pool: Shared connection pool used for every POST.
+            settings: Application settings.
+
+        Returns:
+            Unstarted WebhookDeliveryQueue.
+        """
+        return cls(
+            http_pool,
+            max_size=settings.webhook_delivery_queue_size,
+            workers=settings.webhook_delivery_workers,
+            max_batch_size=settings.webhook_delivery_max_batch_size,
+            max_attempts=settings.webhook_delivery_max_attempts,
+            retry_backoff_seconds=settings.webhook_delivery_retry_backoff_seconds,
+            overflow=settings.webhook_delivery_overflow,
+        )
+
+    def start(self) -> None:
+        """Start the worker tasks. Safe to call multiple times."""
+        if self._workers:
+            return
+        self._closed = False
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self._worker_count)
+        ]
+
+    def submit(self, delivery: WebhookDelivery) -> bool:
+        """Queue an event for background delivery without waiting.
+
+        Args:
+            delivery: Event to deliver.
+
+        Returns:
+            True if queued, False if dropped (queue closed or full under
+            the drop_newest policy).
+        """
+        if self._closed:
+            self._dropped += 1
+            return False
+        if self._size >= self._max_size:
+            self._dropped += 1
+            if self._overflow == "drop_newest" or not self._drop_oldest():
+                logger.warning(
+                    "webhook_delivery_dropped",
+                    hook_event=delivery.hook_event,
+                    url=delivery.url,
+                    overflow=self._overflow,
+                )
+                return False
+
+        key = delivery.batch_key
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = deque()
+            self._buffers[key] = buffer
+            self._ready.put_nowait(key)
+        buffer.append(delivery)
+        self._size += 1
+        self._enqueued += 1
+        return True
+
+    def _drop_oldest(self) -> bool:
+        for key, buffer in self._buffers.items():
+            if buffer:
+                dropped = buffer.popleft()
+                self._size -= 1
+                if not buffer:
+                    del self._buffers[key]
+                logger.warning(
+                    "webhook_delivery_dropped",
+                    hook_event=dropped.hook_event,
+                    url=dropped.url,
+                    overflow=self._overflow,
+                )
+                return True
+        return False
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Stop accepting events, drain the queue, then stop the workers.
+
+        Events still queued when the timeout expires are dropped.
+
+        Args:
+            timeout: Max seconds to wait for queued events to be delivered.
+        """
+        self._closed = True
+        if self._workers:
+            try:
+                await asyncio.wait_for(self._ready.join(), timeout=timeout)
+            except TimeoutError:
+                logger.warning(
+                    "webhook_delivery_drain_timeout",
+                    remaining=self._size + self._in_flight,
+                )
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        for task in workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._dropped += self._size
+        self._size = 0
+        self._buffers.clear()
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._ready.get()
+            try:
+                buffer = self._buffers.get(key)
+                if not buffer:
+                    continue
+                batch = [
+                    buffer.popleft()
+                    for _ in range(min(len(buffer), self._max_batch_size))
+                ]
+                self._size -= len(batch)
+                if buffer:
+                    # Let another worker pick up the rest of this destination
+                    self._ready.put_nowait(key)
+                else:
+                    del self._buffers[key]
+                self._in_flight += len(batch)
+                try:
+                    await self._deliver(batch)
+                finally:
+                    self._in_flight -= len(batch)
+            finally:
+                self._ready.task_done()
+
+    async def _deliver(self, batch: list[WebhookDelivery]) -> None:
+        for attempt in range(1, self._max_attempts + 1):
+            start = time.perf_counter()
+            try:
+                await self._post(batch)
+            except _DeliveryError as e:
+                self._observe(batch, start, error=True)
+                if not e.retryable or attempt == self._max_attempts:
+                    self._failed += len(batch)
+                    logger.warning(
+                        "webhook_delivery_failed",
+                        url=batch[0].url,
+                        events=len(batch),
+                        attempts=attempt,
+                        error=str(e),
+                    )
+                    return
+                self._retries += 1
+                await asyncio.sleep(self._retry_backoff_seconds * 2 ** (attempt - 1))
+            else:
+                self._observe(batch, start, error=False)
+                self._delivered += len(batch)
+                self._batches += 1
+                return
+
+    async def _post(self, batch: list[WebhookDelivery]) -> None:
+        first = batch[0]
+        body: object = (
+            first.payload
+            if len(batch) == 1
+            else {"events": [delivery.payload for delivery in batch]}
+        )
+        try:
+            response = await asyncio.wait_for(
+                self._http_pool.post(
+                    first.url,
+                    content=get_json_codec().dumps(body),
+                    headers={"Content-Type": "application/json", **first.headers},
+                    timeout=first.timeout,
+                ),
+                timeout=first.timeout,
+            )
+        except TimeoutError as e:
+            raise _DeliveryError(
+                f"Webhook timeout after {first.timeout}s", retryable=True
+            ) from e
+        except httpx.RequestError as e:
+            raise _DeliveryError(
+                f"Webhook connection error: {e!s}", retryable=True
+            ) from e
+        if response.status_code >= 400:
+            raise _DeliveryError(
+                f"HTTP {response.status_code}",
+                retryable=response.status_code == 429 or response.status_code >= 500,
+            )
+
+    def _observe(
+        self, batch: list[WebhookDelivery], start: float, *, error: bool
+    ) -> None:
+        latency_ms = (time.perf_counter() - start) * 1000
+        for delivery in batch:
+            self._http_pool.observe(delivery.hook_event, latency_ms, error=error)
+
+    def metrics(self) -> WebhookDeliveryMetrics:
+        """Return queue counters.
+
+        Returns:
+            Queue depth, capacity and delivery/retry/failure/drop totals.
+        """
+        return WebhookDeliveryMetrics(
+            queued=self._size,
+            in_flight=self._in_flight,
+            capacity=self._max_size,
+            workers=len(self._workers),
+            enqueued=self._enqueued,
+            delivered=self._delivered,
+            batches=self._batches,
+            retries=self._retries,
+            failed=self._failed,
+            dropped=self._dropped,
+        )
@@ -0,0 +1,241 @@
+"""Shared HTTP connection pool for webhook hook calls.
+
+One WebhookHttpPool lives for the lifetime of the application (owned by
+AppState) so hook calls reuse TCP/TLS connections, and HTTP/2 streams when
+the ``h2`` package is installed, instead of opening a new client per call.
+Concurrent requests to any one host are capped by a per-host semaphore on top
+of httpx's pool-wide connection limits, and call latency is recorded in a
+fixed-bucket histogram per hook event type.
+"""
+
+import asyncio
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, TypedDict
+
+import httpx
+import structlog
+
+if TYPE_CHECKING:
+    from apps.api.config import Settings
+
+logger = structlog.get_logger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+
+
+class HookLatencyMetrics(TypedDict):
+    """Latency histogram for one hook event type."""
+
+    count: int
+    errors: int
+    sum_ms: float
+    buckets: dict[str, int]
+
+
+class WebhookHttpMetrics(TypedDict):
+    """Snapshot of webhook pool state and hook latencies."""
+
+    http2: bool
+    max_connections: int
+    max_connections_per_host: int
+    hosts: int
+    in_flight: int
+    hooks: dict[str, HookLatencyMetrics]
+
+
+class _LatencyHistogram:
+    """Cumulative latency histogram with fixed bucket bounds."""
+
+    __slots__ = ("count", "counts", "errors", "sum_ms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.sum_ms = 0.0
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, latency_ms: float, *, error: bool) -> None:
+        self.count += 1
+        self.sum_ms += latency_ms
+        if error:
+            self.errors += 1
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                self.counts[index] += 1
+                return
+        self.counts[-1] += 1
+
+    def snapshot(self) -> HookLatencyMetrics:
+        buckets: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip(
+            (*(f"{b:g}" for b in LATENCY_BUCKETS_MS), "+Inf"),
+            self.counts,
+            strict=True,
+        ):
+            cumulative += count
+            buckets[bound] = cumulative
+        return HookLatencyMetrics(
+            count=self.count,
+            errors=self.errors,
+            sum_ms=round(self.sum_ms, 2),
+            buckets=buckets,
+        )
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class WebhookHttpPool:
+    """App-lifetime httpx client with per-host limits and hook latency metrics."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        max_connections: int,
+        max_connections_per_host: int,
+        http2: bool = False,
+    ) -> None:
+        """Initialize pool.
+
+        Args:
+            client: Shared client used for every webhook request.
+            max_connections: Pool-wide connection limit configured on the client.
+            max_connections_per_host: Max concurrent requests to one host.
+            http2: Whether the client negotiates HTTP/2.
+        """
+        self._client = client
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._http2 = http2
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._in_flight = 0
+        self._latency: dict[str, _LatencyHistogram] = {}
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "WebhookHttpPool":
+        """Build a pool from application settings.
+
+        HTTP/2 is only enabled when requested and the ``h2`` package is
+        installed; otherwise the client falls back to HTTP/1.1 keep-alive.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            WebhookHttpPool with a configured httpx client.
+        """
+        http2 = settings.webhook_http2 and _http2_available()
+        if settings.webhook_http2 and not http2:
+            logger.warning(
+                "webhook_http2_unavailable",
+                reason="h2 package not installed; using HTTP/1.1",
+            )
+        client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.webhook_max_connections,
+                max_keepalive_connections=settings.webhook_max_keepalive_connections,
+                keepalive_expiry=settings.webhook_keepalive_expiry_seconds,
+            ),
+        )
+        return cls(
+            client,
+            max_connections=settings.webhook_max_connections,
+            max_connections_per_host=settings.webhook_max_connections_per_host,
+            http2=http2,
+        )
+
+    def _host_slot(self, url: httpx.URL) -> asyncio.Semaphore:
+        host = f"{url.scheme}://{url.host}:{url.port or ''}"
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self._max_connections_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    async def post(
+        self,
+        url: str,
+        *,
+        content: bytes,
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> httpx.Response:
+        """POST a request body, waiting for a free slot on the target host.
+
+        Args:
+            url: Webhook URL.
+            content: Encoded request body.
+            headers: Request headers.
+            timeout: Per-request timeout in seconds.
+
+        Returns:
+            HTTP response with the body read.
+        """
+        async with self._host_slot(httpx.URL(url)):
+            self._in_flight += 1
+            try:
+                return await self._client.post(
+                    url,
+                    content=content,
+                    headers=headers,
+                    timeout=timeout,
+                )
+            finally:
+                self._in_flight -= 1
+
+    def observe(self, hook_event: str, latency_ms: float, *, error: bool) -> None:
+        """Record one hook call in the event type's latency histogram.
+
+        Args:
+            hook_event: Hook event type (PreToolUse, PostToolUse, ...).
+            latency_ms: Wall-clock latency of the call in milliseconds.
+            error: Whether the call failed (timeout, HTTP or JSON error).
+        """
+        histogram = self._latency.get(hook_event)
+        if histogram is None:
+            histogram = _LatencyHistogram()
+            self._latency[hook_event] = histogram
+        histogram.observe(latency_ms, error=error)
+
+    def metrics(self) -> WebhookHttpMetrics:
+        """Return pool state and per-event latency histograms.
+
+        Returns:
+            Pool configuration, in-flight count and cumulative histograms.
+        """
+        return WebhookHttpMetrics(
+            http2=self._http2,
+            max_connections=self._max_connections,
+            max_connections_per_host=self._max_connections_per_host,
+            hosts=len(self._host_slots),
+            in_flight=self._in_flight,
+            hooks={
+                event: histogram.snapshot()
+                for event, histogram in sorted(self._latency.items())
+            },
+        )
+
+    async def close(self) -> None:
+        """Close the shared client and its pooled connections."""
+        await self._client.aclose()
@@ -0,0 +1,144 @@
+"""Pluggable JSON codec for hot-path payloads.
+
+Cache values, streaming events and webhook bodies are encoded and decoded
+through the process-wide codec returned by get_json_codec(). The orjson codec
+works on bytes end to end: Redis replies and HTTP bodies are parsed without
+first being decoded to str, and encoded bytes go to the wire as-is. The
+stdlib codec is the fallback when orjson is not installed and produces the
+same output as ``json.dumps`` with default arguments.
+
+Both codecs accept the same inputs: orjson is configured to allow non-string
+dict keys, and values it cannot encode (e.g. integers wider than 64 bits)
+fall back to the stdlib encoder.
+"""
+
+import json
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from apps.api.config import Settings
+
+
+class JsonCodec(Protocol):
+    """Encoder/decoder for JSON payloads."""
+
+    name: str
+
+    def dumps(self, value: object) -> bytes:
+        """Encode a value as UTF-8 JSON bytes."""
+        ...
+
+    def dumps_str(self, value: object) -> str:
+        """Encode a value as a JSON string."""
+        ...
+
+    def loads(self, data: bytes | str) -> object:
+        """Decode JSON bytes or text."""
+        ...
+
+
+class StdlibJsonCodec:
+    """JSON codec backed by the standard library ``json`` module."""
+
+    name = "stdlib"
+
+    def dumps(self, value: object) -> bytes:
+        """Encode a value as UTF-8 JSON bytes."""
+        return json.dumps(value).encode("utf-8")
+
+    def dumps_str(self, value: object) -> str:
+        """Encode a value as a JSON string."""
+        return json.dumps(value)
+
+    def loads(self, data: bytes | str) -> object:
+        """Decode JSON bytes or text."""
+        return json.loads(data)
+
+
+class OrjsonJsonCodec:
+    """JSON codec backed by orjson (compact output, UTF-8 bytes)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize codec.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value: object) -> bytes:
+        """Encode a value as UTF-8 JSON bytes."""
+        try:
+            return self._orjson.dumps(value, option=self._options)
+        except self._orjson.JSONEncodeError:
+            # Out-of-range integers and similar; keep stdlib semantics
+            return json.dumps(value).encode("utf-8")
+
+    def dumps_str(self, value: object) -> str:
+        """Encode a value as a JSON string."""
+        return self.dumps(value).decode("utf-8")
+
+    def loads(self, data: bytes | str) -> object:
+        """Decode JSON bytes or text."""
+        return self._orjson.loads(data)
+
+
+def create_json_codec(name: str) -> JsonCodec:
+    """Create a codec by name.
+
+    Args:
+        name: "orjson", "stdlib", or "auto" (orjson when installed).
+
+    Returns:
+        JSON codec instance.
+
+    Raises:
+        RuntimeError: If orjson is requested explicitly but not installed.
+        ValueError: If the name is unknown.
+    """
+    if name == "stdlib":
+        return StdlibJsonCodec()
+    if name not in ("auto", "orjson"):
+        raise ValueError(f"Unknown JSON codec: {name}")
+    try:
+        return OrjsonJsonCodec()
+    except ImportError as e:
+        if name == "auto":
+            return StdlibJsonCodec()
+        raise RuntimeError(
+            "JSON_CODEC=orjson but orjson is not installed. "
+            "Install it with: uv add orjson"
+        ) from e
+
+
+_json_codec: JsonCodec | None = None
+
+
+def get_json_codec(settings: "Settings | None" = None) -> JsonCodec:
+    """Get the process-wide JSON codec.
+
+    Args:
+        settings: Settings to read ``json_codec`` from (defaults to global).
+
+    Returns:
+        Shared codec selected by settings.
+    """
+    global _json_codec
+    if _json_codec is None:
+        if settings is None:
+            from apps.api.config import get_settings
+
+            settings = get_settings()
+        _json_codec = create_json_codec(settings.json_codec)
+    return _json_codec
+
+
+def reset_json_codec() -> None:
+    """Reset the process-wide JSON codec (for testing)."""
+    global _json_codec
+    _json_codec = None
@@ -0,0 +1,59 @@
+"""Opaque keyset pagination cursors.
+
+A cursor encodes the sort key of the last row on a page, ``(created_at, id)``,
+so the next page is a seek (``WHERE (created_at, id) < cursor``) against an
+index instead of an OFFSET scan over every preceding row. Clients treat the
+value as opaque; its format may change without notice.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import NamedTuple
+
+from apps.api.exceptions import ValidationError
+
+
+class KeysetCursor(NamedTuple):
+    """Sort key of the last row returned on a page."""
+
+    created_at: datetime
+    id: str
+
+
+def encode_cursor(created_at: datetime, row_id: object) -> str:
+    """Encode a row's sort key as an opaque URL-safe cursor.
+
+    Args:
+        created_at: Row creation timestamp.
+        row_id: Row identifier (tie-breaker for equal timestamps).
+
+    Returns:
+        URL-safe base64 cursor string without padding.
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> KeysetCursor:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a previous page.
+
+    Returns:
+        Decoded sort key.
+
+    Raises:
+        ValidationError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode()
+        created_raw, row_id = raw.split("|", 1)
+        created_at = datetime.fromisoformat(created_raw)
+    except (ValueError, UnicodeError, binascii.Error) as e:
+        raise ValidationError("Invalid pagination cursor", field="cursor") from e
+    if not row_id:
+        raise ValidationError("Invalid pagination cursor", field="cursor")
+    return KeysetCursor(created_at=created_at, id=row_id)
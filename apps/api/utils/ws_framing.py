@@ -0,0 +1,217 @@
+"""Compact wire formats for the /query/ws WebSocket endpoint.
+
+Without a negotiated subprotocol the endpoint speaks its original JSON text
+protocol (``{"type": "sse_event", "event": ..., "data": ...}`` plus ``ack``
+and ``error`` objects). High-volume clients can offer one of these in the
+``Sec-WebSocket-Protocol`` header instead:
+
+- ``agent.compact.v1``: binary frames holding UTF-8 JSON arrays. Event
+  payloads are the cached StreamEvent JSON bytes, sent without re-encoding.
+- ``agent.msgpack.v1``: the same arrays encoded as MessagePack. Offered only
+  when the optional ``msgpack`` package is installed.
+
+Event frames are ``[code, data]`` where ``code`` comes from EVENT_CODES (or
+is the event name for events without a code). Partial content deltas are
+sent as ``[FRAME_PARTIAL_DELTA, index, kind, fragment]`` with ``kind`` from
+DELTA_KINDS, dropping the wrapper and null fields of the full partial event.
+Acks and errors are ``[FRAME_ACK, message]`` and ``[FRAME_ERROR, message]``.
+Frames belonging to a multiplexed query carry its ``request_id`` as an
+extra trailing element.
+Client messages keep the JSON object format; msgpack clients may also send
+them as MessagePack binary frames.
+"""
+
+from typing import TYPE_CHECKING, Final, cast
+
+from apps.api.utils.json_codec import get_json_codec
+
+if TYPE_CHECKING:
+    from apps.api.services.agent.types import StreamEvent
+
+SUBPROTOCOL_COMPACT: Final = "agent.compact.v1"
+SUBPROTOCOL_MSGPACK: Final = "agent.msgpack.v1"
+
+EVENT_CODES: Final[dict[str, int]] = {
+    "init": 1,
+    "message": 2,
+    "question": 3,
+    "partial": 4,
+    "todo": 5,
+    "result": 6,
+    "error": 7,
+    "done": 8,
+}
+FRAME_PARTIAL_DELTA: Final = 9
+FRAME_ACK: Final = 10
+FRAME_ERROR: Final = 11
+
+# Delta type -> (payload field carrying the fragment, kind code)
+DELTA_KINDS: Final[dict[str, tuple[str, int]]] = {
+    "text_delta": ("text", 0),
+    "thinking_delta": ("thinking", 1),
+    "input_json_delta": ("partial_json", 2),
+}
+
+_CODE_JSON: Final[dict[str, bytes]] = {
+    name: str(code).encode() for name, code in EVENT_CODES.items()
+}
+
+
+def _partial_delta_frame(event: "StreamEvent") -> list[object] | None:
+    """Return the delta-only frame for a partial content delta, if it is one."""
+    if event.event != "partial":
+        return None
+    payload = event.payload
+    delta = payload.get("delta")
+    if payload.get("type") != "content_block_delta" or not isinstance(delta, dict):
+        return None
+    delta_dict = cast("dict[str, object]", delta)
+    kind = DELTA_KINDS.get(cast("str", delta_dict.get("type")))
+    if kind is None:
+        return None
+    field, kind_code = kind
+    return [
+        FRAME_PARTIAL_DELTA,
+        payload.get("index", 0),
+        kind_code,
+        delta_dict.get(field) or "",
+    ]
+
+
+def _tagged(frame: list[object], request_id: str | None) -> list[object]:
+    if request_id is not None:
+        frame.append(request_id)
+    return frame
+
+
+class CompactFrameCodec:
+    """Compact JSON array frames (``agent.compact.v1``)."""
+
+    subprotocol: str = SUBPROTOCOL_COMPACT
+
+    def encode_event(
+        self, event: "StreamEvent", request_id: str | None = None
+    ) -> bytes:
+        """Encode a stream event as a compact frame.
+
+        Args:
+            event: Stream event to send.
+            request_id: Multiplexed query the event belongs to, if any.
+
+        Returns:
+            Binary frame payload.
+        """
+        delta = _partial_delta_frame(event)
+        if delta is not None:
+            return self._pack(_tagged(delta, request_id))
+        codec = get_json_codec()
+        code = _CODE_JSON.get(event.event) or codec.dumps(event.event)
+        tail = b"]" if request_id is None else b"," + codec.dumps(request_id) + b"]"
+        # Splice the cached payload JSON instead of re-encoding it
+        return b"".join((b"[", code, b",", event.json_bytes, tail))
+
+    def encode_control(
+        self, frame_type: int, message: str, request_id: str | None = None
+    ) -> bytes:
+        """Encode an ack or error frame.
+
+        Args:
+            frame_type: FRAME_ACK or FRAME_ERROR.
+            message: Human-readable message.
+            request_id: Multiplexed query the frame refers to, if any.
+
+        Returns:
+            Binary frame payload.
+        """
+        return self._pack(_tagged([frame_type, message], request_id))
+
+    def decode(self, data: str | bytes) -> object:
+        """Decode a client message.
+
+        Args:
+            data: Text or binary frame payload.
+
+        Returns:
+            Decoded message.
+
+        Raises:
+            ValueError: If the payload cannot be decoded.
+        """
+        return get_json_codec().loads(data)
+
+    def _pack(self, value: object) -> bytes:
+        return get_json_codec().dumps(value)
+
+
+class MsgpackFrameCodec(CompactFrameCodec):
+    """MessagePack array frames (``agent.msgpack.v1``)."""
+
+    subprotocol: str = SUBPROTOCOL_MSGPACK
+
+    def __init__(self) -> None:
+        """Initialize codec.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def encode_event(
+        self, event: "StreamEvent", request_id: str | None = None
+    ) -> bytes:
+        """Encode a stream event as a MessagePack frame.
+
+        Args:
+            event: Stream event to send.
+            request_id: Multiplexed query the event belongs to, if any.
+
+        Returns:
+            Binary frame payload.
+        """
+        frame = _partial_delta_frame(event) or [
+            EVENT_CODES.get(event.event, event.event),
+            event.payload,
+        ]
+        return self._pack(_tagged(frame, request_id))
+
+    def decode(self, data: str | bytes) -> object:
+        """Decode a client message (MessagePack binary or JSON text).
+
+        Args:
+            data: Text or binary frame payload.
+
+        Returns:
+            Decoded message.
+
+        Raises:
+            ValueError: If the payload cannot be decoded.
+        """
+        if isinstance(data, str):
+            return get_json_codec().loads(data)
+        return self._msgpack.unpackb(data)
+
+    def _pack(self, value: object) -> bytes:
+        return cast("bytes", self._msgpack.packb(value))
+
+
+def negotiate_frame_codec(offered: str | None) -> CompactFrameCodec | None:
+    """Pick the first supported subprotocol the client offered.
+
+    Args:
+        offered: ``Sec-WebSocket-Protocol`` header value (comma-separated).
+
+    Returns:
+        Codec for the chosen subprotocol, or None for the default JSON protocol.
+    """
+    for raw_name in (offered or "").split(","):
+        name = raw_name.strip()
+        if name == SUBPROTOCOL_COMPACT:
+            return CompactFrameCodec()
+        if name == SUBPROTOCOL_MSGPACK:
+            try:
+                return MsgpackFrameCodec()
+            except ImportError:
+                continue
+    return None
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: stdlib vs orjson codec on hot-path payloads.
+
+Times the JSON work done per operation for realistic payloads:
+
+- session: cached session record (SessionCacheManager.cache_session shape),
+  encoded for SET and decoded from the raw Redis reply bytes
+- message: assistant message with text and tool_use blocks, encoded for
+  the cache and decoded from bytes
+- sse: building the SSE frame for a streamed assistant message event
+
+The "before" column is the previous path (``json.dumps`` then ``.encode()``
+for writes, ``.decode("utf-8")`` then ``json.loads`` for reads, str frame
+then ``.encode()`` for SSE). The "after" column is the selected codec working
+on bytes end to end.
+
+Usage:
+    uv run python scripts/bench_json_codec.py [--ops N] [--codec orjson]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from apps.api.schemas.responses import (
+    ContentBlockSchema,
+    MessageEvent,
+    MessageEventData,
+    UsageSchema,
+)
+from apps.api.utils.json_codec import JsonCodec, create_json_codec
+
+_SEP = "\r\n"
+
+
+def _session_payload() -> dict[str, object]:
+    """Build a cached session record."""
+    now = datetime.now(UTC).isoformat()
+    return {
+        "id": "5b0f6a3e-1c1b-4f57-9a63-6f7c1a4e2d10",
+        "model": "sonnet",
+        "status": "active",
+        "created_at": now,
+        "updated_at": now,
+        "total_turns": 7,
+        "total_cost_usd": 0.0421,
+        "parent_session_id": None,
+        "owner_api_key_hash": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+        "session_metadata": {"project": "api", "tags": ["bench", "json"]},
+    }
+
+
+def _message_payload() -> dict[str, object]:
+    """Build an assistant message event payload."""
+    event = MessageEvent(
+        data=MessageEventData(
+            type="assistant",
+            content=[
+                ContentBlockSchema(
+                    type="text", text="Here is the change you asked for. " * 30
+                ),
+                ContentBlockSchema(
+                    type="tool_use",
+                    id="toolu_01",
+                    name="Edit",
+                    input={
+                        "file_path": "/srv/app/services/session.py",
+                        "old_string": "return None\n" * 5,
+                        "new_string": "raise SessionNotFoundError(session_id)\n" * 5,
+                    },
+                ),
+            ],
+            model="sonnet",
+            usage=UsageSchema(input_tokens=4200, output_tokens=860),
+        )
+    )
+    return event.data.model_dump()
+
+
+def stdlib_write(payload: dict[str, object]) -> bytes:
+    """Previous cache write: dump to str, then encode."""
+    return json.dumps(payload).encode("utf-8")
+
+
+def stdlib_read(raw: bytes) -> object:
+    """Previous cache read: decode reply bytes, then parse."""
+    return json.loads(raw.decode("utf-8"))
+
+
+def stdlib_sse(payload: dict[str, object]) -> bytes:
+    """Previous SSE frame: str frame around json.dumps, then encode."""
+    return f"event: message{_SEP}data: {json.dumps(payload)}{_SEP}{_SEP}".encode()
+
+
+def codec_sse(codec: JsonCodec, payload: dict[str, object]) -> bytes:
+    """Codec SSE frame: splice encoded bytes into the frame."""
+    return b"".join(
+        (
+            f"event: message{_SEP}data: ".encode(),
+            codec.dumps(payload),
+            _SEP.encode(),
+            _SEP.encode(),
+        )
+    )
+
+
+def _per_op_us(func: Callable[[], object], ops: int) -> float:
+    best = min(timeit.Timer(func).repeat(repeat=5, number=ops))
+    return best / ops * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print per-operation timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--codec", choices=["orjson", "stdlib"], default="orjson")
+    args = parser.parse_args()
+
+    codec = create_json_codec(args.codec)
+    session = _session_payload()
+    message = _message_payload()
+    session_raw = stdlib_write(session)
+    message_raw = stdlib_write(message)
+
+    rows: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        (
+            "session write",
+            lambda: stdlib_write(session),
+            lambda: codec.dumps(session),
+        ),
+        (
+            "session read",
+            lambda: stdlib_read(session_raw),
+            lambda: codec.loads(session_raw),
+        ),
+        (
+            "message write",
+            lambda: stdlib_write(message),
+            lambda: codec.dumps(message),
+        ),
+        (
+            "message read",
+            lambda: stdlib_read(message_raw),
+            lambda: codec.loads(message_raw),
+        ),
+        ("sse frame", lambda: stdlib_sse(message), lambda: codec_sse(codec, message)),
+    ]
+
+    print(f"codec: {codec.name}")
+    print(f"{'operation':<14} {'before (us)':>12} {'after (us)':>11} {'speedup':>8}")
+    for name, before, after in rows:
+        before_us = _per_op_us(before, args.ops)
+        after_us = _per_op_us(after, args.ops)
+        print(
+            f"{name:<14} {before_us:>12.2f} {after_us:>11.2f} "
+            f"{before_us / after_us:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark: one-at-a-time vs batched memory ingestion.
+
+Runs BulkMemoryIngestor against an in-process TEI/Qdrant stand-in whose
+latency is modelled as a fixed round-trip cost per request plus a per-item
+cost (embedding compute, point indexing):
+
+- before: one embedding request and one upsert per memory, in sequence,
+  which is what mem0 does for every fact it stores
+- after: batched embedding requests (several in flight) and bulk upserts
+
+Usage:
+    uv run python scripts/bench_memory_bulk.py [--items 500] [--rtt-ms 5]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from apps.api.adapters.memory_bulk import BulkMemoryIngestor, BulkMemoryItem
+
+_DIMS = 1024
+
+
+def _stand_in(
+    rtt_ms: float, embed_item_ms: float, upsert_item_ms: float
+) -> httpx.MockTransport:
+    """TEI /v1/embeddings and Qdrant points upsert with modelled latency."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path.endswith("/v1/embeddings"):
+            texts = body["input"]
+            await asyncio.sleep((rtt_ms + embed_item_ms * len(texts)) / 1000)
+            data = [{"index": i, "embedding": [0.0] * _DIMS} for i in range(len(texts))]
+            return httpx.Response(200, json={"data": data})
+        points = body["points"]
+        await asyncio.sleep((rtt_ms + upsert_item_ms * len(points)) / 1000)
+        return httpx.Response(200, json={"status": "ok"})
+
+    return httpx.MockTransport(handler)
+
+
+async def _run(
+    items: list[BulkMemoryItem],
+    transport: httpx.MockTransport,
+    *,
+    embed_batch_size: int,
+    upsert_batch_size: int,
+    concurrency: int,
+) -> tuple[float, int, int]:
+    ingestor = BulkMemoryIngestor(
+        httpx.AsyncClient(transport=transport),
+        tei_url="http://tei.local",
+        tei_api_key="bench",
+        qdrant_url="http://qdrant.local",
+        collection_name="mem0_memories",
+        agent_id="main",
+        embed_batch_size=embed_batch_size,
+        upsert_batch_size=upsert_batch_size,
+        concurrency=concurrency,
+    )
+    started = time.perf_counter()
+    result = await ingestor.ingest("bench-user", items)
+    elapsed = time.perf_counter() - started
+    await ingestor.close()
+    return elapsed, result["embed_requests"], result["upsert_requests"]
+
+
+async def main() -> None:
+    """Run both ingestion modes and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=5.0)
+    parser.add_argument("--embed-item-ms", type=float, default=0.5)
+    parser.add_argument("--upsert-item-ms", type=float, default=0.05)
+    parser.add_argument("--embed-batch-size", type=int, default=32)
+    parser.add_argument("--upsert-batch-size", type=int, default=256)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    items = [
+        BulkMemoryItem(text=f"Project fact number {i}", metadata={"n": i})
+        for i in range(args.items)
+    ]
+    transport = _stand_in(args.rtt_ms, args.embed_item_ms, args.upsert_item_ms)
+    modes = {
+        "one-at-a-time": {
+            "embed_batch_size": 1,
+            "upsert_batch_size": 1,
+            "concurrency": 1,
+        },
+        "batched": {
+            "embed_batch_size": args.embed_batch_size,
+            "upsert_batch_size": args.upsert_batch_size,
+            "concurrency": args.concurrency,
+        },
+    }
+
+    print(
+        f"{args.items} memories, rtt {args.rtt_ms}ms, "
+        f"embed {args.embed_item_ms}ms/item, upsert {args.upsert_item_ms}ms/item"
+    )
+    print(f"{'mode':<14} {'seconds':>8} {'mem/s':>9} {'embed req':>10} {'upserts':>8}")
+    baseline = 0.0
+    for name, options in modes.items():
+        elapsed, embeds, upserts = await _run(items, transport, **options)
+        baseline = baseline or elapsed
+        print(
+            f"{name:<14} {elapsed:>8.2f} {args.items / elapsed:>9.0f} "
+            f"{embeds:>10} {upserts:>8}"
+        )
+    print(f"speedup: {baseline / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: CPU and allocations of single-query result aggregation.
+
+Compares the previous single-query path, where every event was encoded to an
+SSE-style JSON string and parsed back by the aggregator, against reading the
+typed StreamEvent payload directly. The legacy path also mapped per-token
+partial deltas the aggregator then discarded; the fast path disables them.
+
+Usage:
+    uv run python scripts/bench_single_query.py [--turns N] [--deltas N]
+"""
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from apps.api.schemas.responses import (
+    ContentBlockSchema,
+    MessageEventData,
+    UsageSchema,
+)
+from apps.api.services.agent.single_query_aggregator import SingleQueryAggregator
+from apps.api.services.agent.types import StreamEvent
+
+
+def _turn_payload(turn: int) -> dict[str, object]:
+    """Build a representative assistant message payload for one turn."""
+    return MessageEventData(
+        type="assistant",
+        content=[
+            ContentBlockSchema(
+                type="text", text=f"Turn {turn}. " + "Lorem ipsum. " * 40
+            ),
+            ContentBlockSchema(
+                type="tool_use",
+                id=f"toolu_{turn:04d}",
+                name="Read",
+                input={"file_path": f"/srv/app/module_{turn}.py", "limit": 200},
+            ),
+        ],
+        model="sonnet",
+        usage=UsageSchema(input_tokens=1200, output_tokens=350),
+    ).model_dump()
+
+
+def legacy(payloads: list[dict[str, object]], deltas: int) -> SingleQueryAggregator:
+    """Old path: map partial deltas, encode each event, parse it back."""
+    aggregator = SingleQueryAggregator()
+    for payload in payloads:
+        for index in range(deltas):
+            partial = StreamEvent(
+                "partial",
+                {"type": "content_block_delta", "index": index, "text": "ipsum "},
+            )
+            aggregator.handle_event({"event": partial.event, "data": partial.data})
+        event = StreamEvent("message", payload)
+        aggregator.handle_event({"event": event.event, "data": event.data})
+    return aggregator
+
+
+def fast(payloads: list[dict[str, object]], _deltas: int) -> SingleQueryAggregator:
+    """New path: no partial deltas, typed payloads read directly."""
+    aggregator = SingleQueryAggregator()
+    for payload in payloads:
+        aggregator.handle_event(StreamEvent("message", payload))
+    return aggregator
+
+
+Runner = Callable[[list[dict[str, object]], int], SingleQueryAggregator]
+
+
+def _per_response_ms(
+    func: Runner, payloads: list[dict[str, object]], deltas: int
+) -> float:
+    timer = timeit.Timer(lambda: func(payloads, deltas))
+    best = min(timer.repeat(repeat=5, number=20))
+    return best / 20 * 1000
+
+
+def _allocations_kib(
+    func: Runner, payloads: list[dict[str, object]], deltas: int
+) -> tuple[float, float]:
+    tracemalloc.start()
+    func(payloads, deltas)
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = sum(stat.size for stat in snapshot.statistics("filename"))
+    return peak / 1024, retained / 1024
+
+
+def main() -> None:
+    """Run the benchmark and print per-response timings and allocations."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--deltas", type=int, default=50)
+    args = parser.parse_args()
+
+    payloads = [_turn_payload(turn) for turn in range(args.turns)]
+    before_ms = _per_response_ms(legacy, payloads, args.deltas)
+    after_ms = _per_response_ms(fast, payloads, args.deltas)
+    before_peak, before_retained = _allocations_kib(legacy, payloads, args.deltas)
+    after_peak, after_retained = _allocations_kib(fast, payloads, args.deltas)
+
+    print(f"{args.turns} turns, {args.deltas} partial deltas per turn")
+    print(f"{'metric':<16} {'before':>10} {'after':>10} {'ratio':>8}")
+    for name, before, after in [
+        ("cpu (ms)", before_ms, after_ms),
+        ("peak (KiB)", before_peak, after_peak),
+        ("retained (KiB)", before_retained, after_retained),
+    ]:
+        print(f"{name:<16} {before:>10.2f} {after:>10.2f} {before / after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-event CPU of the streaming event pipeline.
+
+Compares the previous dict-of-JSON-strings pipeline (dump in format_sse,
+re-parse in the route for metadata, re-encode for the wire) against
+StreamEvent, which keeps the structured payload and encodes once at the edge.
+
+Usage:
+    uv run python scripts/bench_stream_events.py [--events N]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sse_starlette.event import ServerSentEvent
+
+from apps.api.schemas.responses import (
+    ContentBlockSchema,
+    MessageEvent,
+    MessageEventData,
+    UsageSchema,
+)
+from apps.api.services.agent.types import StreamEvent
+
+
+def _sample_payload() -> dict[str, object]:
+    """Build a representative assistant message payload."""
+    event = MessageEvent(
+        data=MessageEventData(
+            type="assistant",
+            content=[
+                ContentBlockSchema(
+                    type="text", text="Lorem ipsum dolor sit amet. " * 20
+                ),
+                ContentBlockSchema(
+                    type="tool_use",
+                    id="toolu_01",
+                    name="Read",
+                    input={"file_path": "/srv/app/main.py", "limit": 200},
+                ),
+            ],
+            model="sonnet",
+            usage=UsageSchema(input_tokens=1200, output_tokens=350),
+        )
+    )
+    return event.data.model_dump()
+
+
+def legacy_sse(payload: dict[str, object]) -> bytes:
+    """Old SSE path: dump, re-parse for metadata, encode via sse-starlette."""
+    event = {"event": "message", "data": json.dumps(payload)}
+    json.loads(event["data"])  # QueryStreamEventGenerator metadata tracking
+    return ServerSentEvent(**event, sep="\r\n").encode()
+
+
+def typed_sse(payload: dict[str, object]) -> bytes:
+    """New SSE path: typed event, payload read directly, encoded once."""
+    event = StreamEvent("message", payload)
+    _ = event.payload.get("type")  # metadata tracking reads the payload
+    return event.encode_sse()
+
+
+def legacy_websocket(payload: dict[str, object]) -> str:
+    """Old WebSocket path: dump, parse back, re-dump the frame."""
+    event = {"event": "message", "data": json.dumps(payload)}
+    frame = {
+        "type": "sse_event",
+        "event": event["event"],
+        "data": json.loads(event["data"]),
+    }
+    return json.dumps(frame, separators=(",", ":"))
+
+
+def typed_websocket(payload: dict[str, object]) -> str:
+    """New WebSocket path: splice the cached payload JSON into the frame."""
+    event = StreamEvent("message", payload)
+    return (
+        f'{{"type":"sse_event","event":{json.dumps(event.event)},"data":{event.data}}}'
+    )
+
+
+def _per_event_us(func: object, payload: dict[str, object], events: int) -> float:
+    timer = timeit.Timer(lambda: func(payload))  # type: ignore[operator]
+    best = min(timer.repeat(repeat=5, number=events))
+    return best / events * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print per-event timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20_000)
+    args = parser.parse_args()
+
+    payload = _sample_payload()
+    rows = [
+        ("SSE", legacy_sse, typed_sse),
+        ("WebSocket", legacy_websocket, typed_websocket),
+    ]
+
+    print(f"{'path':<10} {'before (us)':>12} {'after (us)':>11} {'speedup':>8}")
+    for name, before, after in rows:
+        before_us = _per_event_us(before, payload, args.events)
+        after_us = _per_event_us(after, payload, args.events)
+        print(
+            f"{name:<10} {before_us:>12.2f} {after_us:>11.2f} "
+            f"{before_us / after_us:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: bytes on the wire and CPU per event for /query/ws formats.
+
+Compares the WebSocket frame formats over a representative multi-turn stream
+with partial messages enabled:
+
+- legacy: parse the event JSON back to a dict and re-encode the wrapper
+- json: default protocol, cached payload JSON spliced into the wrapper
+- compact: agent.compact.v1 arrays with delta-only partial frames
+- msgpack: agent.msgpack.v1 (skipped when msgpack is not installed)
+
+Deflate columns simulate permessage-deflate with context takeover (one
+compressor per connection, sync-flushed per message) to show how much each
+format still gains from compression and what that costs.
+
+Usage:
+    uv run python scripts/bench_ws_framing.py [--turns N] [--deltas N]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from apps.api.routes.websocket import _encode_event_frame
+from apps.api.schemas.responses import (
+    ContentBlockSchema,
+    ContentDeltaSchema,
+    DoneEventData,
+    MessageEventData,
+    PartialMessageEventData,
+    UsageSchema,
+)
+from apps.api.services.agent.types import StreamEvent
+from apps.api.utils.ws_framing import CompactFrameCodec, MsgpackFrameCodec
+
+Stream = list[tuple[str, dict[str, object]]]
+Encoder = Callable[[StreamEvent], str | bytes]
+
+
+def _stream(turns: int, deltas: int) -> Stream:
+    """Build a multi-turn event stream with partial deltas."""
+    events: Stream = []
+    for turn in range(turns):
+        events.append(
+            (
+                "partial",
+                PartialMessageEventData(
+                    type="content_block_start",
+                    index=0,
+                    content_block=ContentBlockSchema(type="text", text=""),
+                ).model_dump(),
+            )
+        )
+        events.extend(
+            (
+                "partial",
+                PartialMessageEventData(
+                    type="content_block_delta",
+                    index=0,
+                    delta=ContentDeltaSchema(type="text_delta", text=" lorem"),
+                ).model_dump(),
+            )
+            for _ in range(deltas)
+        )
+        events.append(
+            (
+                "partial",
+                PartialMessageEventData(
+                    type="content_block_stop", index=0
+                ).model_dump(),
+            )
+        )
+        events.append(
+            (
+                "message",
+                MessageEventData(
+                    type="assistant",
+                    content=[
+                        ContentBlockSchema(
+                            type="text", text=f"Turn {turn}." + " lorem" * deltas
+                        ),
+                        ContentBlockSchema(
+                            type="tool_use",
+                            id=f"toolu_{turn:04d}",
+                            name="Read",
+                            input={"file_path": f"/srv/app/module_{turn}.py"},
+                        ),
+                    ],
+                    model="sonnet",
+                    usage=UsageSchema(input_tokens=1200, output_tokens=350),
+                ).model_dump(),
+            )
+        )
+    events.append(("done", DoneEventData(reason="completed").model_dump()))
+    return events
+
+
+def legacy(event: StreamEvent) -> str:
+    """Old path: parse the SSE data back and re-encode the whole frame."""
+    frame = {"type": "sse_event", "event": event.event, "data": json.loads(event.data)}
+    return json.dumps(frame, separators=(",", ":"), ensure_ascii=False)
+
+
+def _run(encode: Encoder, stream: Stream) -> list[bytes]:
+    frames = []
+    for name, payload in stream:
+        frame = encode(StreamEvent(name, payload))
+        frames.append(frame.encode() if isinstance(frame, str) else frame)
+    return frames
+
+
+def _deflate(frames: list[bytes]) -> int:
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    total = 0
+    for frame in frames:
+        chunk = compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        total += len(chunk) - 4  # RFC 7692 drops the trailing 00 00 ff ff
+    return total
+
+
+def _best_us(func: Callable[[], object], count: int) -> float:
+    best = min(timeit.Timer(func).repeat(repeat=5, number=1))
+    return best / count * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print per-event sizes and timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--deltas", type=int, default=100)
+    args = parser.parse_args()
+
+    stream = _stream(args.turns, args.deltas)
+    count = len(stream)
+    formats: list[tuple[str, Encoder]] = [
+        ("legacy", legacy),
+        ("json", _encode_event_frame),
+        ("compact", CompactFrameCodec().encode_event),
+    ]
+    try:
+        formats.append(("msgpack", MsgpackFrameCodec().encode_event))
+    except ImportError:
+        print("msgpack not installed; skipping agent.msgpack.v1")
+
+    print(f"{count} events ({args.turns} turns, {args.deltas} deltas per turn)")
+    print(
+        f"{'format':<8} {'us/event':>9} {'bytes/event':>12} "
+        f"{'deflated':>9} {'deflate us':>11}"
+    )
+    for name, encode in formats:
+        frames = _run(encode, stream)
+        encode_us = _best_us(lambda encode=encode: _run(encode, stream), count)
+        deflate_us = _best_us(lambda frames=frames: _deflate(frames), count)
+        raw = sum(len(frame) for frame in frames) / count
+        deflated = _deflate(frames) / count
+        print(
+            f"{name:<8} {encode_us:>9.2f} {raw:>12.1f} "
+            f"{deflated:>9.1f} {deflate_us:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """Seed project documentation into Mem0 memory system.
 
+By default each document goes through mem0 LLM extraction. With ``--bulk``
+the documents are stored verbatim using batched TEI embedding and a bulk
+Qdrant upsert (no extraction or graph writes).
+
 Usage:
-    uv run python scripts/seed_memories.py
+    uv run python scripts/seed_memories.py [--bulk]
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -13,20 +18,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from apps.api.adapters.memory import Mem0MemoryAdapter
+from apps.api.adapters.memory_bulk import BulkMemoryIngestor, BulkMemoryItem
 from apps.api.config import get_settings
 from apps.api.utils.crypto import hash_api_key
 
 
-async def seed_documentation():
+async def seed_documentation(bulk: bool = False):
     """Seed project documentation into memory system."""
     print("=" * 60)
     print("Mem0 Memory Seeding Script")
     print("=" * 60)
 
-    # Initialize adapter
-    print("\nInitializing Mem0 adapter...")
     settings = get_settings()
-    adapter = Mem0MemoryAdapter(settings)
 
     # Use default API key from .env
     api_key = (
@@ -107,6 +110,14 @@ async def seed_documentation():
         },
     ]
 
+    if bulk:
+        await _seed_bulk(settings, user_id, docs)
+        return
+
+    # Initialize adapter
+    print("\nInitializing Mem0 adapter...")
+    adapter = Mem0MemoryAdapter(settings)
+
     # Seed each document
     print(f"\nSeeding {len(docs)} documents...\n")
     success_count = 0
@@ -140,5 +151,42 @@ async def seed_documentation():
     print("=" * 60)
 
 
+async def _seed_bulk(settings, user_id, docs):
+    """Store documents verbatim with batched embedding and upsert."""
+    print(f"\nBulk seeding {len(docs)} documents...\n")
+    ingestor = BulkMemoryIngestor.from_settings(settings)
+    items = [
+        BulkMemoryItem(
+            text=" ".join(doc["content"].split()),
+            metadata={
+                "source": doc["name"].lower().replace(" ", "_"),
+                "type": "documentation",
+            },
+        )
+        for doc in docs
+    ]
+    try:
+        result = await ingestor.ingest(user_id, items)
+    finally:
+        await ingestor.close()
+
+    seconds = result["duration_ms"] / 1000
+    print("=" * 60)
+    print("Seeding Complete!")
+    print(f"  Stored: {len(result['ids'])} memories ({result['skipped']} duplicates)")
+    print(
+        f"  Requests: {result['embed_requests']} embed, "
+        f"{result['upsert_requests']} upsert"
+    )
+    print(f"  Throughput: {len(result['ids']) / max(seconds, 1e-9):.1f} memories/s")
+    print("=" * 60)
+
+
 if __name__ == "__main__":
-    asyncio.run(seed_documentation())
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="store documents verbatim via batched TEI/Qdrant writes",
+    )
+    asyncio.run(seed_documentation(bulk=parser.parse_args().bulk))
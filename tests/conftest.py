@@ -442,6 +442,7 @@ def mock_cache() -> MagicMock:
     from unittest.mock import AsyncMock
 
     from apps.api.adapters.cache import RedisCache
+    from tests.helpers.cache_pipeline import pipeline_factory
 
     cache = AsyncMock(spec=RedisCache)
     # Set up common async methods
@@ -452,6 +453,7 @@ def mock_cache() -> MagicMock:
     cache.remove_from_set.return_value = True
     cache.delete.return_value = True
     cache.set_members.return_value = set()
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -0,0 +1,68 @@
+"""Pipeline stand-in for in-memory and mocked caches."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any, cast
+
+_QUEUEABLE = frozenset(
+    {
+        "cache_set",
+        "set_json",
+        "delete",
+        "expire",
+        "incr",
+        "add_to_set",
+        "remove_from_set",
+        "add_to_sorted_set",
+        "remove_from_sorted_set",
+        "remove_from_sorted_set_by_score",
+    }
+)
+
+
+class SequentialPipeline:
+    """CachePipeline that replays queued commands on a cache one at a time.
+
+    Lets fakes and AsyncMock caches support ``cache.pipeline()`` without a
+    Redis server; each command still reaches the cache's own method, so
+    existing call assertions (e.g. ``cache.set_json.assert_called_once()``)
+    keep working.
+    """
+
+    def __init__(self, cache: object) -> None:
+        self._cache = cache
+        self._queued: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name not in _QUEUEABLE:
+            raise AttributeError(name)
+
+        def queue(*args: Any) -> None:
+            self._queued.append((name, args))
+
+        return queue
+
+    async def execute(self) -> list[object]:
+        queued, self._queued = self._queued, []
+        results: list[object] = []
+        for name, args in queued:
+            method = cast(
+                "Callable[..., Awaitable[object]]", getattr(self._cache, name)
+            )
+            results.append(await method(*args))
+        return results
+
+
+def pipeline_factory(cache: object) -> Callable[..., SequentialPipeline]:
+    """Build a ``pipeline()`` replacement bound to a cache.
+
+    Args:
+        cache: Fake or mock cache the pipeline replays commands on.
+
+    Returns:
+        Callable accepting the ``transaction`` keyword like Cache.pipeline.
+    """
+
+    def pipeline(*, transaction: bool = True) -> SequentialPipeline:
+        return SequentialPipeline(cache)
+
+    return pipeline
@@ -37,7 +37,7 @@ async def test_list_sessions_pagination(
     # ACT
     response = await async_client.get(
         "/api/v1/sessions",
-        params={"page": 1, "page_size": 10},
+        params={"page": 1, "page_size": 10, "include_total": True},
         headers=auth_headers,
     )
 
@@ -767,7 +767,7 @@ async def test_list_sessions_filter_by_tags(
     # ACT - Filter by tag
     response = await async_client.get(
         "/api/v1/sessions",
-        params={"tags": [test_tag]},
+        params={"tags": [test_tag], "include_total": True},
         headers=auth_headers,
     )
 
@@ -26,6 +26,7 @@ from starlette.websockets import WebSocketState as StarletteWebSocketState
 
 from apps.api.services.session import SessionService
 from apps.api.types import JsonValue
+from tests.helpers.cache_pipeline import SequentialPipeline
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
@@ -111,6 +112,10 @@ class InMemoryCache:
     async def get_json(self, key: str) -> dict[str, JsonValue] | None:
         return self._store.get(key)
 
+    def pipeline(self, *, transaction: bool = True) -> SequentialPipeline:
+        """Batch writes, replayed one at a time."""
+        return SequentialPipeline(self)
+
     async def set_json(
         self, key: str, value: dict[str, JsonValue], ttl: int | None = None
     ) -> bool:
@@ -11,6 +11,7 @@ from httpx import AsyncClient
 
 from apps.api.routes.query_stream import QueryStreamEventGenerator
 from apps.api.schemas.requests.query import QueryRequest
+from apps.api.services.agent.types import StreamEvent
 
 
 class TestQueueBackpressure:
@@ -27,10 +28,9 @@ class TestQueueBackpressure:
         # Generate 150 events (more than queue maxsize=100)
         async def generate_many_events():
             for i in range(150):
-                yield {
-                    "event": "message",
-                    "data": json.dumps({"type": "assistant", "content": f"Event {i}"}),
-                }
+                yield StreamEvent(
+                    "message", {"type": "assistant", "content": f"Event {i}"}
+                )
 
         mock_agent_service.query_stream = AsyncMock(return_value=generate_many_events())
         mock_agent_service.interrupt = AsyncMock()
@@ -96,10 +96,9 @@ class TestQueueBackpressure:
         async def infinite_events():
             i = 0
             while True:
-                yield {
-                    "event": "message",
-                    "data": json.dumps({"type": "assistant", "content": f"Event {i}"}),
-                }
+                yield StreamEvent(
+                    "message", {"type": "assistant", "content": f"Event {i}"}
+                )
                 i += 1
                 await asyncio.sleep(0.01)
 
@@ -160,10 +159,9 @@ class TestQueueBackpressure:
         # Producer generates 200 events as fast as possible
         async def fast_events():
             for i in range(200):
-                yield {
-                    "event": "message",
-                    "data": json.dumps({"type": "assistant", "content": f"Event {i}"}),
-                }
+                yield StreamEvent(
+                    "message", {"type": "assistant", "content": f"Event {i}"}
+                )
 
         mock_agent_service.query_stream = AsyncMock(return_value=fast_events())
         mock_agent_service.interrupt = AsyncMock()
@@ -213,10 +211,9 @@ class TestQueueBackpressure:
         async def events_then_error():
             # Generate enough events to fill queue
             for i in range(110):
-                yield {
-                    "event": "message",
-                    "data": json.dumps({"type": "assistant", "content": f"Event {i}"}),
-                }
+                yield StreamEvent(
+                    "message", {"type": "assistant", "content": f"Event {i}"}
+                )
             # Then raise an error
             raise RuntimeError("Producer error!")
 
@@ -248,9 +245,10 @@ class TestQueueBackpressure:
 
         async for event in generator.generate():
             events_consumed += 1
-            if event.get("event") == "error":
+            if event.startswith(b"event: error"):
                 error_event_received = True
-                error_data = json.loads(event.get("data", "{}"))
+                data_line = event.split(b"data: ", 1)[1].split(b"\r\n", 1)[0]
+                error_data = json.loads(data_line)
                 assert "error" in error_data
                 break
 
@@ -270,10 +268,9 @@ class TestQueueBackpressure:
 
         async def fast_producer():
             for i in range(150):
-                yield {
-                    "event": "message",
-                    "data": json.dumps({"type": "assistant", "content": f"Event {i}"}),
-                }
+                yield StreamEvent(
+                    "message", {"type": "assistant", "content": f"Event {i}"}
+                )
                 # No delay - produce as fast as possible
 
         mock_agent_service.query_stream = AsyncMock(return_value=fast_producer())
@@ -333,23 +330,18 @@ class TestSessionLifecycle:
         mock_agent_service = MagicMock()
 
         async def events_with_init():
-            yield {
-                "event": "init",
-                "data": json.dumps(
-                    {
-                        "session_id": "test-session-abc",
-                        "model": "sonnet",
-                        "tools": [],
-                        "mcp_servers": [],
-                        "plugins": [],
-                        "commands": [],
-                    }
-                ),
-            }
-            yield {
-                "event": "message",
-                "data": json.dumps({"type": "assistant", "content": "Hello"}),
-            }
+            yield StreamEvent(
+                "init",
+                {
+                    "session_id": "test-session-abc",
+                    "model": "sonnet",
+                    "tools": [],
+                    "mcp_servers": [],
+                    "plugins": [],
+                    "commands": [],
+                },
+            )
+            yield StreamEvent("message", {"type": "assistant", "content": "Hello"})
 
         mock_agent_service.query_stream = AsyncMock(return_value=events_with_init())
         mock_agent_service.interrupt = AsyncMock()
@@ -393,34 +385,27 @@ class TestSessionLifecycle:
         mock_agent_service = MagicMock()
 
         async def events_with_result():
-            yield {
-                "event": "init",
-                "data": json.dumps(
-                    {
-                        "session_id": "test-session-xyz",
-                        "model": "sonnet",
-                        "tools": [],
-                        "mcp_servers": [],
-                        "plugins": [],
-                        "commands": [],
-                    }
-                ),
-            }
-            yield {
-                "event": "message",
-                "data": json.dumps({"type": "assistant", "content": "Response"}),
-            }
-            yield {
-                "event": "result",
-                "data": json.dumps(
-                    {
-                        "session_id": "test-session-xyz",
-                        "is_error": False,
-                        "turns": 2,
-                        "total_cost_usd": 0.05,
-                    }
-                ),
-            }
+            yield StreamEvent(
+                "init",
+                {
+                    "session_id": "test-session-xyz",
+                    "model": "sonnet",
+                    "tools": [],
+                    "mcp_servers": [],
+                    "plugins": [],
+                    "commands": [],
+                },
+            )
+            yield StreamEvent("message", {"type": "assistant", "content": "Response"})
+            yield StreamEvent(
+                "result",
+                {
+                    "session_id": "test-session-xyz",
+                    "is_error": False,
+                    "turns": 2,
+                    "total_cost_usd": 0.05,
+                },
+            )
 
         mock_agent_service.query_stream = AsyncMock(return_value=events_with_result())
         mock_agent_service.interrupt = AsyncMock()
@@ -115,7 +115,9 @@ class TestSessionServiceCacheHashing:
         assert session_id not in plaintext_members
 
         # Verify list_sessions uses the hashed index (cache hit)
-        result = await session_service.list_sessions(current_api_key=api_key)
+        result = await session_service.list_sessions(
+            current_api_key=api_key, include_total=True
+        )
         assert result.total >= 1
         session_found = any(s.id == session_id for s in result.sessions)
         assert session_found, "Session should be found via hashed owner index"
@@ -193,7 +195,9 @@ class TestSessionServiceCacheHashing:
             assert session_id not in plaintext_members
 
         # List sessions by owner (should use hashed cache index)
-        result = await session_service.list_sessions(current_api_key=api_key)
+        result = await session_service.list_sessions(
+            current_api_key=api_key, include_total=True
+        )
 
         # Should return at least our 3 sessions
         assert result.total >= 3
@@ -471,7 +471,8 @@ class TestSessionListPagination:
         # Use a deterministic filter that guarantees no results
         # Query for sessions with a guaranteed non-existent tag
         response = await async_client.get(
-            "/api/v1/sessions?page=1&page_size=10&tags=nonexistent-tag-xyz-12345",
+            "/api/v1/sessions?page=1&page_size=10&tags=nonexistent-tag-xyz-12345"
+            "&include_total=true",
             headers=auth_headers,
         )
         assert response.status_code == 200
@@ -513,7 +514,7 @@ class TestSessionListPagination:
 
             # Request page 2 with page_size=2 (should return 1 item)
             response = await async_client.get(
-                "/api/v1/sessions?page=2&page_size=2",
+                "/api/v1/sessions?page=2&page_size=2&include_total=true",
                 headers=auth_headers,
             )
             assert response.status_code == 200
@@ -558,7 +559,7 @@ class TestSessionListPagination:
 
             # Request page 10 (beyond available data)
             response = await async_client.get(
-                "/api/v1/sessions?page=10&page_size=10",
+                "/api/v1/sessions?page=10&page_size=10&include_total=true",
                 headers=auth_headers,
             )
             assert response.status_code == 200
@@ -18,6 +18,7 @@ from starlette.websockets import WebSocketState
 
 from apps.api.services.session import SessionService
 from apps.api.types import JsonValue
+from tests.helpers.cache_pipeline import SequentialPipeline
 from tests.mocks.claude_sdk import AssistantMessage
 
 if TYPE_CHECKING:
@@ -174,6 +175,10 @@ class InMemoryCache:
         """Get JSON value from cache."""
         return self._store.get(key)
 
+    def pipeline(self, *, transaction: bool = True) -> SequentialPipeline:
+        """Batch writes, replayed one at a time."""
+        return SequentialPipeline(self)
+
     async def set_json(
         self, key: str, value: dict[str, JsonValue], ttl: int | None = None
     ) -> bool:
@@ -389,6 +389,53 @@ class TestCacheSetOperations:
         assert members == set()
 
 
+class TestCacheSortedSetOperations:
+    """Tests for sorted-set index operations."""
+
+    @pytest.mark.anyio
+    async def test_sorted_set_rank_and_range_use_reverse_commands(self) -> None:
+        """Test descending rank/range map to ZREVRANK and ZRANGE ... REV."""
+        mock_client = AsyncMock()
+        mock_client.zrevrank.return_value = 2
+        mock_client.zrange.return_value = [b"msg_3", b"msg_4"]
+
+        cache = RedisCache(mock_client)
+
+        rank = await cache.sorted_set_rank("idx", "msg_2", descending=True)
+        members = await cache.sorted_set_range("idx", 3, 4, descending=True)
+
+        assert rank == 2
+        assert members == ["msg_3", "msg_4"]
+        mock_client.zrevrank.assert_called_once_with("idx", b"msg_2")
+        mock_client.zrange.assert_called_once_with("idx", 3, 4, desc=True)
+
+    @pytest.mark.anyio
+    async def test_add_and_remove_sorted_set_members(self) -> None:
+        """Test ZADD scores a member and ZREM removes several at once."""
+        mock_client = AsyncMock()
+        mock_client.zadd.return_value = 1
+        mock_client.zrem.return_value = 2
+
+        cache = RedisCache(mock_client)
+
+        assert await cache.add_to_sorted_set("idx", "msg_1", 1.5) is True
+        assert await cache.remove_from_sorted_set("idx", "msg_1", "msg_2") == 2
+        assert await cache.remove_from_sorted_set("idx") == 0
+        mock_client.zadd.assert_called_once_with("idx", {b"msg_1": 1.5})
+        mock_client.zrem.assert_called_once_with("idx", b"msg_1", b"msg_2")
+
+    @pytest.mark.anyio
+    async def test_remove_sorted_set_members_by_score(self) -> None:
+        """Test a score range maps to ZREMRANGEBYSCORE."""
+        mock_client = AsyncMock()
+        mock_client.zremrangebyscore.return_value = 3
+
+        cache = RedisCache(mock_client)
+
+        assert await cache.remove_from_sorted_set_by_score("idx", "-inf", 10.0) == 3
+        mock_client.zremrangebyscore.assert_called_once_with("idx", "-inf", 10.0)
+
+
 class TestCacheLocking:
     """Tests for distributed locking (acquire_lock, release_lock)."""
 
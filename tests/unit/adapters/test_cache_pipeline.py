@@ -0,0 +1,257 @@
+"""Round-trip accounting for RedisCache pipelines and the writes that use them."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+from apps.api.adapters.cache import RedisCache
+from apps.api.services.agents import AgentService
+from apps.api.services.assistants.message_service import MessageService
+from apps.api.services.checkpoint import CheckpointService
+from apps.api.services.mcp_server_configs import McpServerConfigService
+from apps.api.services.session_cache_manager import SessionCacheManager
+from apps.api.services.session_models import Session
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class RoundTripRedis:
+    """In-memory stand-in for redis.asyncio.Redis that counts round-trips.
+
+    Every awaited command is one round-trip; a pipeline costs one round-trip
+    on execute() however many commands it carries.
+    """
+
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self.strings: dict[str, bytes] = {}
+        self.sets: dict[str, set[bytes]] = {}
+        self.zsets: dict[str, dict[bytes, float]] = {}
+        self.ttls: dict[str, int] = {}
+
+    def _apply(self, name: str, *args: Any, **kwargs: Any) -> object:
+        return getattr(self, f"_cmd_{name}")(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[object]]:
+        if not hasattr(type(self), f"_cmd_{name}"):
+            raise AttributeError(name)
+
+        async def command(*args: Any, **kwargs: Any) -> object:
+            self.round_trips += 1
+            return self._apply(name, *args, **kwargs)
+
+        return command
+
+    def pipeline(self, transaction: bool = True) -> RoundTripPipeline:
+        return RoundTripPipeline(self)
+
+    def _cmd_get(self, key: str) -> bytes | None:
+        return self.strings.get(key)
+
+    def _cmd_set(self, key: str, value: bytes) -> bool:
+        self.strings[key] = value
+        return True
+
+    def _cmd_setex(self, key: str, ttl: int, value: bytes) -> bool:
+        self.ttls[key] = ttl
+        return self._cmd_set(key, value)
+
+    def _cmd_delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            for store in (self.strings, self.sets, self.zsets):
+                if store.pop(key, None) is not None:
+                    removed += 1
+        return removed
+
+    def _cmd_expire(self, key: str, ttl: int) -> bool:
+        self.ttls[key] = ttl
+        return True
+
+    def _cmd_incr(self, key: str) -> int:
+        value = int(self.strings.get(key, b"0")) + 1
+        self.strings[key] = str(value).encode()
+        return value
+
+    def _cmd_sadd(self, key: str, *values: bytes) -> int:
+        members = self.sets.setdefault(key, set())
+        added = len(set(values) - members)
+        members.update(values)
+        return added
+
+    def _cmd_srem(self, key: str, *values: bytes) -> int:
+        members = self.sets.get(key, set())
+        removed = len(members & set(values))
+        members.difference_update(values)
+        return removed
+
+    def _cmd_zadd(self, key: str, mapping: dict[bytes, float]) -> int:
+        zset = self.zsets.setdefault(key, {})
+        added = len(mapping.keys() - zset.keys())
+        zset.update(mapping)
+        return added
+
+    def _cmd_zrem(self, key: str, *members: bytes) -> int:
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(m, None) is not None for m in members)
+
+    def _cmd_zremrangebyscore(
+        self, key: str, min_score: float | str, max_score: float | str
+    ) -> int:
+        zset = self.zsets.get(key, {})
+        doomed = [
+            m for m, s in zset.items() if float(min_score) <= s <= float(max_score)
+        ]
+        return sum(zset.pop(m) is not None for m in doomed)
+
+
+class RoundTripPipeline:
+    """Buffers commands for RoundTripRedis and sends them in one round-trip."""
+
+    def __init__(self, client: RoundTripRedis) -> None:
+        self._client = client
+        self._queued: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., RoundTripPipeline]:
+        if not hasattr(RoundTripRedis, f"_cmd_{name}"):
+            raise AttributeError(name)
+
+        def queue(*args: Any, **kwargs: Any) -> RoundTripPipeline:
+            self._queued.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[object]:
+        self._client.round_trips += 1
+        queued, self._queued = self._queued, []
+        return [self._client._apply(name, *a, **kw) for name, a, kw in queued]
+
+
+@pytest.fixture
+def redis_client() -> RoundTripRedis:
+    return RoundTripRedis()
+
+
+@pytest.fixture
+def cache(redis_client: RoundTripRedis) -> RedisCache:
+    return RedisCache(cast("Any", redis_client))
+
+
+@pytest.mark.anyio
+async def test_pipeline_executes_in_one_round_trip(
+    cache: RedisCache, redis_client: RoundTripRedis
+) -> None:
+    redis_client.strings["old"] = b"x"
+    pipe = cache.pipeline()
+    pipe.set_json("doc", {"a": 1}, 60)
+    pipe.cache_set("plain", "v")
+    pipe.add_to_set("idx", "doc")
+    pipe.add_to_sorted_set("zidx", "doc", 1.5)
+    pipe.remove_from_sorted_set("zidx")
+    pipe.expire("idx", 60)
+    pipe.incr("version")
+    pipe.remove_from_set("idx", "missing")
+    pipe.delete("old")
+    pipe.remove_from_sorted_set_by_score("zidx", "-inf", 1.0)
+
+    results = await pipe.execute()
+
+    assert redis_client.round_trips == 1
+    assert results == [True, True, True, True, 0, True, 1, False, True, 0]
+    assert json.loads(redis_client.strings["doc"]) == {"a": 1}
+    assert redis_client.ttls == {"doc": 60, "idx": 60}
+
+
+@pytest.mark.anyio
+async def test_empty_pipeline_sends_nothing(
+    cache: RedisCache, redis_client: RoundTripRedis
+) -> None:
+    pipe = cache.pipeline()
+    pipe.remove_from_sorted_set("zidx")
+
+    assert await pipe.execute() == [0]
+    assert redis_client.round_trips == 0
+
+
+def _session(owner: str | None = "owner-hash") -> Session:
+    now = datetime.now(UTC)
+    return Session(
+        id="11111111-1111-1111-1111-111111111111",
+        model="sonnet",
+        status="active",
+        created_at=now,
+        updated_at=now,
+        owner_api_key_hash=owner,
+    )
+
+
+async def _cache_session(cache: RedisCache) -> None:
+    await SessionCacheManager(cache, ttl=60).cache_session(_session())
+
+
+async def _delete_session(cache: RedisCache) -> None:
+    await SessionCacheManager(cache, ttl=60).delete_session(_session().id, "owner-hash")
+
+
+async def _create_checkpoint(cache: RedisCache) -> None:
+    await CheckpointService(cache=cache).create_checkpoint("s1", "u1", ["a.py"])
+
+
+async def _create_agent(cache: RedisCache) -> None:
+    await AgentService(cache).create_agent("a", "d", "p", None, None)
+
+
+async def _delete_agent(cache: RedisCache) -> None:
+    await AgentService(cache).delete_agent("agent-1")
+
+
+async def _create_mcp_server(cache: RedisCache) -> None:
+    await McpServerConfigService(cache).create_server_for_api_key(
+        "key", "srv", "stdio", {"command": "run"}
+    )
+
+
+async def _delete_mcp_server(cache: RedisCache) -> None:
+    await McpServerConfigService(cache).delete_server_for_api_key("key", "srv")
+
+
+async def _create_message(cache: RedisCache) -> None:
+    await MessageService(cache=cache).create_message("thread_1", "user", "hi")
+
+
+async def _delete_message(cache: RedisCache) -> None:
+    await MessageService(cache=cache).delete_message("thread_1", "msg_1")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("operation", "round_trips"),
+    [
+        (_cache_session, 1),
+        (_delete_session, 1),
+        # Reads the session checkpoint list, then writes everything at once
+        (_create_checkpoint, 2),
+        (_create_agent, 1),
+        (_delete_agent, 1),
+        # Existence check, then record + index + version bump
+        (_create_mcp_server, 2),
+        (_delete_mcp_server, 1),
+        (_create_message, 1),
+        (_delete_message, 1),
+    ],
+)
+async def test_round_trips_per_operation(
+    cache: RedisCache,
+    redis_client: RoundTripRedis,
+    operation: Callable[[RedisCache], Awaitable[None]],
+    round_trips: int,
+) -> None:
+    await operation(cache)
+
+    assert redis_client.round_trips == round_trips
@@ -0,0 +1,123 @@
+"""Tests for batched memory ingestion via TEI and Qdrant."""
+
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from apps.api.adapters.memory_bulk import BulkMemoryIngestor, BulkMemoryItem
+from apps.api.exceptions import MemoryIngestionError, ServiceUnavailableError
+from apps.api.protocols import MemoryProtocol
+from apps.api.services.memory import MemoryService
+from apps.api.services.memory_search_cache import MemorySearchCache
+
+
+class StandIn:
+    """TEI embeddings and Qdrant upsert endpoints recording requests."""
+
+    def __init__(self, fail_upsert_after: int | None = None) -> None:
+        self.embed_batches: list[list[str]] = []
+        self.upserts: list[list[dict[str, object]]] = []
+        self.fail_upsert_after = fail_upsert_after
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path == "/v1/embeddings":
+            self.embed_batches.append(body["input"])
+            data = [
+                {"index": i, "embedding": [float(len(text)), 1.0]}
+                for i, text in reversed(list(enumerate(body["input"])))
+            ]
+            return httpx.Response(200, json={"data": data})
+        assert request.url.path == "/collections/mem0_memories/points"
+        assert request.url.params["wait"] == "true"
+        if self.fail_upsert_after == len(self.upserts):
+            return httpx.Response(500, json={"status": "error"})
+        self.upserts.append(body["points"])
+        return httpx.Response(200, json={"status": "ok"})
+
+
+def _ingestor(stand_in: StandIn) -> BulkMemoryIngestor:
+    return BulkMemoryIngestor(
+        httpx.AsyncClient(transport=httpx.MockTransport(stand_in.handler)),
+        tei_url="http://tei.local/",
+        tei_api_key="tei-key",
+        qdrant_url="http://qdrant.local",
+        collection_name="mem0_memories",
+        agent_id="main",
+        embed_batch_size=2,
+        upsert_batch_size=4,
+    )
+
+
+def _items(count: int) -> list[BulkMemoryItem]:
+    return [BulkMemoryItem(text=f"fact {i}", metadata={"n": i}) for i in range(count)]
+
+
+@pytest.mark.anyio
+async def test_items_are_embedded_and_upserted_in_batches() -> None:
+    stand_in = StandIn()
+
+    result = await _ingestor(stand_in).ingest("user-1", _items(5))
+
+    assert [len(b) for b in stand_in.embed_batches] == [2, 2, 1]
+    assert [len(p) for p in stand_in.upserts] == [4, 1]
+    assert (result["embed_requests"], result["upsert_requests"]) == (3, 2)
+    points = [p for batch in stand_in.upserts for p in batch]
+    assert result["ids"] == [p["id"] for p in points]
+    first = points[0]
+    assert first["vector"] == [6.0, 1.0]
+    payload = first["payload"]
+    assert isinstance(payload, dict)
+    assert payload["data"] == "fact 0"
+    assert (payload["user_id"], payload["agent_id"], payload["n"]) == (
+        "user-1",
+        "main",
+        0,
+    )
+    assert {"hash", "created_at"} <= payload.keys()
+
+
+@pytest.mark.anyio
+async def test_duplicate_texts_are_stored_once() -> None:
+    stand_in = StandIn()
+    items = [BulkMemoryItem(text="same"), BulkMemoryItem(text="same")]
+
+    result = await _ingestor(stand_in).ingest("user-1", items)
+
+    assert (len(result["ids"]), result["skipped"]) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_failed_upsert_reports_ingested_count() -> None:
+    stand_in = StandIn(fail_upsert_after=1)
+
+    with pytest.raises(MemoryIngestionError) as exc_info:
+        await _ingestor(stand_in).ingest("user-1", _items(6))
+
+    assert exc_info.value.status_code == 502
+    assert exc_info.value.details == {"ingested": 4}
+
+
+@pytest.mark.anyio
+async def test_service_bulk_add_invalidates_search_cache() -> None:
+    cache = MemorySearchCache(max_entries=8, ttl_seconds=60)
+    service = MemoryService(
+        AsyncMock(spec=MemoryProtocol),
+        search_cache=cache,
+        bulk_ingestor=_ingestor(StandIn()),
+    )
+
+    result = await service.bulk_add_memories(_items(2), user_id="user-1")
+
+    assert len(result["ids"]) == 2
+    assert cache.metrics()["invalidations"] == 1
+
+
+@pytest.mark.anyio
+async def test_service_without_ingestor_is_unavailable() -> None:
+    service = MemoryService(AsyncMock(spec=MemoryProtocol))
+
+    with pytest.raises(ServiceUnavailableError):
+        await service.bulk_add_memories(_items(1), user_id="user-1")
@@ -0,0 +1,125 @@
+"""Tests for the dedicated mem0 thread pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from apps.api.adapters.memory_executor import MemoryExecutor
+from apps.api.exceptions import MemoryBusyError
+
+
+def _executor(
+    search: int = 1, add: int = 1, max_queue_depth: int = 1
+) -> MemoryExecutor:
+    return MemoryExecutor(
+        threads=4,
+        limits={"search": search, "add": add, "read": 1, "delete": 1},
+        max_queue_depth=max_queue_depth,
+    )
+
+
+def _blocking(release: threading.Event, value: str = "done") -> str:
+    release.wait(timeout=5)
+    return value
+
+
+@pytest.mark.anyio
+async def test_operation_limit_queues_extra_calls() -> None:
+    executor = _executor(search=1)
+    release = threading.Event()
+
+    first = asyncio.create_task(executor.run("search", _blocking, release=release))
+    second = asyncio.create_task(
+        executor.run("search", _blocking, release=release, value="second")
+    )
+    await asyncio.sleep(0.05)
+    ops = executor.metrics()["operations"]
+    assert (ops["search"]["running"], ops["search"]["waiting"]) == (1, 1)
+
+    release.set()
+    assert await asyncio.gather(first, second) == ["done", "second"]
+    search = executor.metrics()["operations"]["search"]
+    assert search["completed"] == 2
+    assert search["wait_ms_max"] > 0
+    executor.shutdown()
+
+
+@pytest.mark.anyio
+async def test_saturated_queue_sheds_new_calls() -> None:
+    executor = _executor(search=1, max_queue_depth=1)
+    release = threading.Event()
+    running = asyncio.create_task(executor.run("search", _blocking, release=release))
+    queued = asyncio.create_task(executor.run("search", _blocking, release=release))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(MemoryBusyError) as exc_info:
+        await executor.run("search", _blocking, release=release)
+
+    assert exc_info.value.status_code == 503
+    release.set()
+    await asyncio.gather(running, queued)
+    assert executor.metrics()["operations"]["search"]["rejected"] == 1
+    executor.shutdown()
+
+
+@pytest.mark.anyio
+async def test_busy_extractions_do_not_block_searches() -> None:
+    executor = _executor(search=1, add=1)
+    release = threading.Event()
+    extraction = asyncio.create_task(executor.run("add", _blocking, release=release))
+    await asyncio.sleep(0.05)
+
+    result = await asyncio.wait_for(
+        executor.run("search", lambda: "memories"), timeout=1
+    )
+
+    assert result == "memories"
+    release.set()
+    await extraction
+    executor.shutdown()
+
+
+@pytest.mark.anyio
+async def test_cancelled_call_holds_slot_until_thread_finishes() -> None:
+    executor = _executor(search=1)
+    release = threading.Event()
+    running = asyncio.create_task(executor.run("search", _blocking, release=release))
+    await asyncio.sleep(0.05)
+
+    running.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running
+    await asyncio.sleep(0.05)
+
+    search = executor.metrics()["operations"]["search"]
+    assert (search["running"], search["completed"]) == (1, 0)
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(executor.run("search", lambda: "next"), timeout=0.1)
+
+    release.set()
+    assert await executor.run("search", lambda: "next") == "next"
+    search = executor.metrics()["operations"]["search"]
+    assert (search["running"], search["waiting"], search["completed"]) == (0, 0, 2)
+    executor.shutdown()
+
+
+@pytest.mark.anyio
+async def test_call_counts_as_waiting_until_its_thread_starts() -> None:
+    executor = MemoryExecutor(
+        threads=1,
+        limits={"search": 1, "add": 1, "read": 1, "delete": 1},
+        max_queue_depth=1,
+    )
+    release = threading.Event()
+    extraction = asyncio.create_task(executor.run("add", _blocking, release=release))
+    search = asyncio.create_task(executor.run("search", lambda: "memories"))
+    await asyncio.sleep(0.05)
+
+    ops = executor.metrics()["operations"]
+    assert (ops["search"]["running"], ops["search"]["waiting"]) == (0, 1)
+
+    release.set()
+    assert await asyncio.gather(extraction, search) == ["done", "memories"]
+    assert executor.metrics()["operations"]["search"]["waiting"] == 0
+    executor.shutdown()
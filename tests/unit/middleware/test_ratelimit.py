@@ -3,18 +3,25 @@
 Tests client IP extraction, API key handling, and rate limit responses.
 """
 
-from unittest.mock import MagicMock
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import Request
 from slowapi.errors import RateLimitExceeded
+from starlette.responses import Response
 
 from apps.api.middleware.ratelimit import (
+    RateLimitMiddleware,
+    classify_path,
     get_api_key,
     get_client_ip,
     get_query_rate_limit,
+    get_rate_limit_client_id,
     rate_limit_handler,
 )
+from apps.api.services.rate_limiter import RateLimitDecision
 
 
 @pytest.fixture
@@ -200,8 +207,6 @@ class TestRateLimitHandler:
         assert response.headers["Retry-After"] == "45"
 
         # Check JSON body
-        import json
-
         body = json.loads(bytes(response.body))
         assert body["error"]["code"] == "RATE_LIMIT_EXCEEDED"
 
@@ -220,3 +225,92 @@ class TestRateLimitCalculation:
         limit = get_query_rate_limit()
 
         assert limit == "10/minute"
+
+
+class TestRateLimitMiddleware:
+    """Tests for the shared Redis rate limit middleware."""
+
+    def _request(self, path: str, limiter: object) -> MagicMock:
+        request = MagicMock(spec=Request)
+        request.url.path = path
+        request.method = "POST"
+        request.headers = {"X-API-Key": "secret-key"}
+        request.app.state.app_state = SimpleNamespace(rate_limiter=limiter)
+        return request
+
+    def test_classify_path(self) -> None:
+        assert classify_path("/api/v1/query/stream") == "query"
+        assert classify_path("/v1/chat/completions") == "query"
+        assert classify_path("/api/v1/sessions/abc/messages") == "session"
+        assert classify_path("/api/v1/skills") == "general"
+
+    def test_client_id_hashes_api_key(self, mock_request: MagicMock) -> None:
+        mock_request.headers = {"X-API-Key": "secret-key"}
+
+        client_id = get_rate_limit_client_id(mock_request)
+
+        assert client_id.startswith("key:")
+        assert "secret-key" not in client_id
+
+    @pytest.mark.anyio
+    async def test_allowed_request_gets_rate_limit_headers(self) -> None:
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock(
+            return_value=RateLimitDecision(
+                allowed=True,
+                limit=10,
+                remaining=7,
+                reset_after_seconds=18,
+                retry_after_seconds=0,
+            )
+        )
+        call_next = AsyncMock(return_value=Response(content=b"OK"))
+        middleware = RateLimitMiddleware(app=MagicMock())
+
+        response = await middleware.dispatch(
+            self._request("/api/v1/query", limiter), call_next
+        )
+
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "10"
+        assert response.headers["X-RateLimit-Remaining"] == "7"
+        assert response.headers["X-RateLimit-Reset"] == "18"
+        assert limiter.acquire.await_args.args[0] == "query"
+
+    @pytest.mark.anyio
+    async def test_limited_request_is_rejected_with_retry_after(self) -> None:
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock(
+            return_value=RateLimitDecision(
+                allowed=False,
+                limit=10,
+                remaining=0,
+                reset_after_seconds=60,
+                retry_after_seconds=6,
+            )
+        )
+        call_next = AsyncMock()
+        middleware = RateLimitMiddleware(app=MagicMock())
+
+        response = await middleware.dispatch(
+            self._request("/api/v1/query", limiter), call_next
+        )
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "6"
+        body = json.loads(bytes(response.body))
+        assert body["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+        call_next.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_passes_through_without_limiter_or_on_public_path(self) -> None:
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+        call_next = AsyncMock(return_value=Response(content=b"OK"))
+        middleware = RateLimitMiddleware(app=MagicMock())
+
+        await middleware.dispatch(self._request("/api/v1/query", None), call_next)
+        await middleware.dispatch(self._request("/health", limiter), call_next)
+
+        assert call_next.await_count == 2
+        limiter.acquire.assert_not_awaited()
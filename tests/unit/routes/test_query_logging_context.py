@@ -71,56 +71,6 @@ class TestQueryErrorLoggingContext:
 class TestQueryStreamErrorLoggingContext:
     """Test that query_stream.py error logs include rich debugging context."""
 
-    @pytest.mark.unit
-    def test_init_parse_error_includes_context(self) -> None:
-        """Init event parse error must include session_id, api_key_hash, and prompt_preview."""
-        query_stream_py = Path("apps/api/routes/query_stream.py")
-        content = query_stream_py.read_text()
-
-        # Find the init event parse error log (json.JSONDecodeError handler)
-        lines = content.split("\n")
-        log_start = None
-        for i, line in enumerate(lines):
-            if (
-                '"Failed to parse init event"' in line
-                or "'Failed to parse init event'" in line
-            ):
-                log_start = i
-                break
-
-        assert log_start is not None, "Init parse error log not found"
-
-        # Go backwards to find logger.error( line
-        actual_start = log_start
-        for i in range(log_start, max(0, log_start - 5), -1):
-            if "logger.error(" in lines[i]:
-                actual_start = i
-                break
-
-        # Extract log call forward
-        log_block = []
-        paren_depth = 0
-        for i in range(actual_start, min(actual_start + 20, len(lines))):
-            log_block.append(lines[i])
-            paren_depth += lines[i].count("(") - lines[i].count(")")
-            if paren_depth == 0 and i > actual_start:
-                break
-
-        log_text = "\n".join(log_block)
-
-        # Verify required context fields
-        assert "session_id=" in log_text, "Missing session_id in log"
-        assert "api_key_hash=" in log_text, "Missing api_key_hash in log"
-        assert "hash_api_key(self.api_key)" in log_text, (
-            "api_key_hash should use hash_api_key()"
-        )
-        assert "prompt_preview=" in log_text, "Missing prompt_preview in log"
-        assert "[:100]" in log_text, "prompt_preview should truncate to 100 chars"
-        assert "error_id=" in log_text, "Missing error_id in log"
-        assert "ERR_INIT_PARSE_FAILED" in log_text, (
-            "error_id should be ERR_INIT_PARSE_FAILED"
-        )
-
     @pytest.mark.unit
     def test_session_create_error_includes_context(self) -> None:
         """Session create error must include session_id, api_key_hash, and prompt_preview."""
@@ -171,56 +121,6 @@ class TestQueryStreamErrorLoggingContext:
             "error_id should be ERR_SESSION_CREATE_FAILED"
         )
 
-    @pytest.mark.unit
-    def test_result_parse_error_includes_context(self) -> None:
-        """Result event parse error must include session_id, api_key_hash, and prompt_preview."""
-        query_stream_py = Path("apps/api/routes/query_stream.py")
-        content = query_stream_py.read_text()
-
-        # Find the result parse error log
-        lines = content.split("\n")
-        log_start = None
-        for i, line in enumerate(lines):
-            if (
-                '"failed_to_parse_result_event"' in line
-                or "'failed_to_parse_result_event'" in line
-            ):
-                log_start = i
-                break
-
-        assert log_start is not None, "Result parse error log not found"
-
-        # Go backwards to find logger.error( line
-        actual_start = log_start
-        for i in range(log_start, max(0, log_start - 5), -1):
-            if "logger.error(" in lines[i]:
-                actual_start = i
-                break
-
-        # Extract log call forward
-        log_block = []
-        paren_depth = 0
-        for i in range(actual_start, min(actual_start + 20, len(lines))):
-            log_block.append(lines[i])
-            paren_depth += lines[i].count("(") - lines[i].count(")")
-            if paren_depth == 0 and i > actual_start:
-                break
-
-        log_text = "\n".join(log_block)
-
-        # Verify required context fields
-        assert "session_id=" in log_text, "Missing session_id in log"
-        assert "api_key_hash=" in log_text, "Missing api_key_hash in log"
-        assert "hash_api_key(self.api_key)" in log_text, (
-            "api_key_hash should use hash_api_key()"
-        )
-        assert "prompt_preview=" in log_text, "Missing prompt_preview in log"
-        assert "[:100]" in log_text, "prompt_preview should truncate to 100 chars"
-        assert "error_id=" in log_text, "Missing error_id in log"
-        assert "ERR_RESULT_PARSE_FAILED" in log_text, (
-            "error_id should be ERR_RESULT_PARSE_FAILED"
-        )
-
     @pytest.mark.unit
     def test_producer_error_includes_context(self) -> None:
         """Producer error must include session_id, api_key_hash, and prompt_preview."""
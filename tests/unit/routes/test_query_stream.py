@@ -1,34 +1,49 @@
 """Unit tests for query stream event generator.
 
 Tests verify error handling logic in QueryStreamEventGenerator:
-- JSON parsing failure logging (Critical Issue #8)
+- Metadata tracking from structured event payloads
 - Session initialization error handling
 """
 
-import json
+from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from apps.api.routes.query_stream import QueryStreamEventGenerator
 from apps.api.schemas.requests.query import QueryRequest
+from apps.api.services.agent.types import StreamEvent
+from apps.api.utils.json_codec import get_json_codec
 
 
 class TestQueryStreamEventGenerator:
     """Unit tests for QueryStreamEventGenerator error handling."""
 
     @pytest.mark.anyio
-    async def test_track_event_metadata_logs_json_parse_failure(self) -> None:
-        """Result event JSON parse failures must log with context.
-
-        Critical Issue #8 from Phase 2 audit:
-        - Must log with error_id="ERR_RESULT_PARSE_FAILED"
-        - Must include: session_id, error, event_data (truncated)
-        """
-        # Create generator with mocked dependencies
+    async def test_track_event_metadata_ignores_malformed_result_fields(self) -> None:
+        """Result payload fields of the wrong type must be ignored."""
         mock_request = MagicMock()
-        mock_request.is_disconnected = AsyncMock(return_value=False)
+        query = QueryRequest(prompt="test", max_turns=1)
 
+        generator = QueryStreamEventGenerator(
+            request=mock_request,
+            query=query,
+            api_key="test-key",
+            agent_service=MagicMock(),
+            session_service=MagicMock(),
+        )
+
+        generator._track_event_metadata(
+            "result", {"turns": "three", "total_cost_usd": None}
+        )
+
+        assert generator.num_turns == 0
+        assert generator.total_cost_usd is None
+
+    @pytest.mark.anyio
+    async def test_track_event_metadata_reads_result_payload(self) -> None:
+        """Valid result payloads should update metadata."""
+        mock_request = MagicMock()
         query = QueryRequest(prompt="test", max_turns=1)
         agent_service = MagicMock()
         session_service = MagicMock()
@@ -41,99 +56,108 @@ class TestQueryStreamEventGenerator:
             session_service=session_service,
         )
 
-        # Set session_id so it appears in logs
-        generator.session_id = "test-session-123"
+        generator._track_event_metadata("result", {"turns": 3, "total_cost_usd": 0.05})
 
-        # Track malformed result event with mock logger
-        with patch("apps.api.routes.query_stream.logger") as mock_logger:
-            malformed_json = "INVALID JSON{malformed"
-            generator._track_event_metadata("result", malformed_json)
-
-            # Verify error was logged
-            mock_logger.error.assert_called_once()
-            call_args = mock_logger.error.call_args
-
-            # Verify log message
-            assert call_args[0][0] == "failed_to_parse_result_event"
-
-            # Verify required fields in kwargs
-            kwargs = call_args[1]
-            assert "session_id" in kwargs
-            assert kwargs["session_id"] == "test-session-123"
-            assert "error" in kwargs
-            assert "Expecting value" in kwargs["error"]  # JSON decode error message
-            assert "event_data" in kwargs
-            assert (
-                kwargs["event_data"] == malformed_json[:500]
-            )  # Truncated to 500 chars
-            assert "error_id" in kwargs
-            assert kwargs["error_id"] == "ERR_RESULT_PARSE_FAILED"
+        assert generator.num_turns == 3
+        assert generator.total_cost_usd == 0.05
 
     @pytest.mark.anyio
-    async def test_track_event_metadata_parses_valid_json(self) -> None:
-        """Valid result events should parse without errors."""
+    async def test_handle_init_event_creates_session_from_payload(self) -> None:
+        """Init payloads should create the session without any JSON parsing."""
         mock_request = MagicMock()
         query = QueryRequest(prompt="test", max_turns=1)
-        agent_service = MagicMock()
         session_service = MagicMock()
+        session_service.create_session = AsyncMock()
 
         generator = QueryStreamEventGenerator(
             request=mock_request,
             query=query,
             api_key="test-key",
-            agent_service=agent_service,
+            agent_service=MagicMock(),
             session_service=session_service,
         )
 
-        # Track valid result event
-        with patch("apps.api.routes.query_stream.logger") as mock_logger:
-            valid_json = json.dumps({"turns": 3, "total_cost_usd": 0.05})
-            generator._track_event_metadata("result", valid_json)
-
-            # Verify NO error was logged
-            mock_logger.error.assert_not_called()
+        await generator._handle_init_event({"session_id": "sid-1", "model": "opus"})
 
-            # Verify metadata was extracted
-            assert generator.num_turns == 3
-            assert generator.total_cost_usd == 0.05
+        assert generator.session_id == "sid-1"
+        session_service.create_session.assert_awaited_once_with(
+            model="opus", session_id="sid-1", owner_api_key="test-key"
+        )
 
     @pytest.mark.anyio
-    async def test_handle_init_event_logs_parse_failure(self) -> None:
-        """Init event parse failures must log and emit error event."""
+    async def test_session_create_failure_queues_error_event(self) -> None:
+        """Session creation failures must log and emit an error event."""
         mock_request = MagicMock()
         query = QueryRequest(prompt="test", max_turns=1)
-        agent_service = MagicMock()
         session_service = MagicMock()
+        session_service.create_session = AsyncMock(side_effect=RuntimeError("db"))
 
         generator = QueryStreamEventGenerator(
             request=mock_request,
             query=query,
             api_key="test-key",
-            agent_service=agent_service,
+            agent_service=MagicMock(),
             session_service=session_service,
         )
 
-        # Try to handle malformed init event
-        with (
-            patch("apps.api.routes.query_stream.logger") as mock_logger,
-            pytest.raises(json.JSONDecodeError),
-        ):
-            await generator._handle_init_event("INVALID JSON")
+        with patch("apps.api.routes.query_stream.logger") as mock_logger:
+            await generator._handle_init_event({"session_id": "sid-1"})
 
-        # Verify error was logged
         mock_logger.error.assert_called_once()
-        call_args = mock_logger.error.call_args
-        assert call_args[0][0] == "Failed to parse init event"
+        assert mock_logger.error.call_args[0][0] == "Failed to create session"
 
-        # Verify error event was queued for client
         error_event = await generator.event_queue.get()
         assert error_event is not None
-        assert error_event["event"] == "error"
+        assert error_event.event == "error"
+        assert error_event.payload["error"] == "Session creation failed"
+        assert generator.is_error is True
 
-        # Parse error data
-        error_data = json.loads(error_event["data"])
-        assert "error" in error_data
-        assert "Session initialization failed" in error_data["error"]
+    @pytest.mark.anyio
+    async def test_generate_encodes_each_event_once(self) -> None:
+        """generate() yields SSE frames encoded from the cached payload."""
+        mock_request = MagicMock()
+        mock_request.is_disconnected = AsyncMock(return_value=False)
+        events = [
+            StreamEvent("init", {"session_id": "sid-1", "model": "sonnet"}),
+            StreamEvent("done", {"reason": "completed"}),
+        ]
+
+        stream_kwargs: dict[str, object] = {}
+
+        async def _stream(
+            *_args: object, **kwargs: object
+        ) -> AsyncGenerator[StreamEvent, None]:
+            stream_kwargs.update(kwargs)
+            for event in events:
+                yield event
+
+        agent_service = MagicMock()
+        agent_service.query_stream = _stream
+        session_service = MagicMock()
+        session_service.create_session = AsyncMock()
+        session_service.update_session = AsyncMock()
+
+        generator = QueryStreamEventGenerator(
+            request=mock_request,
+            query=QueryRequest(prompt="test", max_turns=1),
+            api_key="test-key",
+            agent_service=agent_service,
+            session_service=session_service,
+        )
+
+        frames = [frame async for frame in generator.generate()]
+
+        codec = get_json_codec()
+        assert frames == [
+            b"event: init\r\ndata: " + codec.dumps(events[0].payload) + b"\r\n\r\n",
+            b"event: done\r\ndata: " + codec.dumps(events[1].payload) + b"\r\n\r\n",
+        ]
+        assert all(
+            frame is event.encode_sse()
+            for frame, event in zip(frames, events, strict=True)
+        )
+        # /query creates the session row, so its transcript is recorded
+        assert stream_kwargs == {"record_transcript": True}
 
     @pytest.mark.anyio
     async def test_track_event_metadata_increments_turns(self) -> None:
@@ -153,9 +177,9 @@ class TestQueryStreamEventGenerator:
 
         # Track message events
         assert generator.num_turns == 0
-        generator._track_event_metadata("message", "{}")
+        generator._track_event_metadata("message", {})
         assert generator.num_turns == 1
-        generator._track_event_metadata("message", "{}")
+        generator._track_event_metadata("message", {})
         assert generator.num_turns == 2
 
     @pytest.mark.anyio
@@ -176,5 +200,5 @@ class TestQueryStreamEventGenerator:
 
         # Track error event
         assert generator.is_error is False
-        generator._track_event_metadata("error", json.dumps({"error": "test"}))
+        generator._track_event_metadata("error", {"error": "test"})
         assert generator.is_error is True
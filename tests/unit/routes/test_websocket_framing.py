@@ -0,0 +1,45 @@
+"""Unit tests for compact framing on the WebSocket query route."""
+
+import json
+from collections.abc import AsyncGenerator
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import WebSocket
+
+from apps.api.routes.websocket import _send_ack, _stream_query, frame_codec_ctx
+from apps.api.schemas.requests.query import QueryRequest
+from apps.api.services.agent import AgentService
+from apps.api.services.agent.types import StreamEvent
+from apps.api.utils.ws_framing import FRAME_ACK, CompactFrameCodec
+
+
+@pytest.mark.anyio
+async def test_negotiated_codec_sends_binary_frames() -> None:
+    websocket = AsyncMock()
+    agent_service = MagicMock()
+
+    async def _query_stream(
+        _request: QueryRequest, _api_key: str
+    ) -> AsyncGenerator[StreamEvent, None]:
+        yield StreamEvent("done", {"reason": "completed"})
+
+    agent_service.query_stream.side_effect = _query_stream
+
+    token = frame_codec_ctx.set(CompactFrameCodec())
+    try:
+        await _stream_query(
+            cast("WebSocket", websocket),
+            cast("AgentService", agent_service),
+            QueryRequest(prompt="test"),
+            "test-key",
+        )
+        await _send_ack(cast("WebSocket", websocket), "Query started")
+    finally:
+        frame_codec_ctx.reset(token)
+
+    frames = [json.loads(call.args[0]) for call in websocket.send_bytes.call_args_list]
+    assert frames == [[8, {"reason": "completed"}], [FRAME_ACK, "Query started"]]
+    websocket.send_text.assert_not_called()
+    websocket.send_json.assert_not_called()
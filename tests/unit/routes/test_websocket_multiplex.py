@@ -0,0 +1,268 @@
+"""Unit tests for request_id multiplexing on the WebSocket query route."""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Iterator
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import WebSocket
+
+from apps.api.routes.websocket import (
+    WebSocketMessageDict,
+    WebSocketState,
+    _process_websocket_message,
+)
+from apps.api.schemas.requests.query import QueryRequest
+from apps.api.services.agent import AgentService
+from apps.api.services.admission import AdmissionController
+from apps.api.services.agent.types import StreamEvent
+from apps.api.services.session import SessionService
+
+
+@pytest.fixture(autouse=True)
+def _settings() -> Iterator[None]:
+    with patch(
+        "apps.api.routes.websocket.get_settings",
+        return_value=MagicMock(
+            websocket_max_streams=2, websocket_credit_timeout_seconds=0.05
+        ),
+    ):
+        yield
+
+
+def _agent_service(events_per_query: int, release: asyncio.Event) -> MagicMock:
+    agent_service = MagicMock()
+
+    async def _query_stream(
+        request: QueryRequest, _api_key: str
+    ) -> AsyncGenerator[StreamEvent, None]:
+        yield StreamEvent("init", {"session_id": f"sess-{request.prompt}"})
+        for turn in range(events_per_query):
+            yield StreamEvent("message", {"type": "assistant", "turn": turn})
+        await release.wait()
+
+    agent_service.query_stream.side_effect = _query_stream
+    agent_service.interrupt = AsyncMock(return_value=True)
+    return agent_service
+
+
+async def _send(
+    websocket: AsyncMock,
+    agent_service: MagicMock,
+    state: WebSocketState,
+    message: dict[str, object],
+    session_service: MagicMock | None = None,
+    admission: AdmissionController | None = None,
+) -> None:
+    await _process_websocket_message(
+        cast("WebSocket", websocket),
+        cast("WebSocketMessageDict", message),
+        cast("AgentService", agent_service),
+        cast("SessionService", session_service or MagicMock()),
+        state,
+        "test-key",
+        admission,
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _events(websocket: AsyncMock) -> list[tuple[str, str]]:
+    frames = [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
+    return [(frame["request_id"], frame["event"]) for frame in frames]
+
+
+def _controls(websocket: AsyncMock) -> list[dict[str, object]]:
+    return [call.args[0] for call in websocket.send_json.call_args_list]
+
+
+async def _finish(state: WebSocketState, release: asyncio.Event) -> None:
+    tasks = [stream.task for stream in state.streams.values() if stream.task]
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.anyio
+async def test_tagged_prompts_run_concurrently_with_tagged_frames() -> None:
+    release = asyncio.Event()
+    websocket = AsyncMock()
+    agent_service = _agent_service(1, release)
+    state = WebSocketState()
+
+    await _send(
+        websocket,
+        agent_service,
+        state,
+        {"type": "prompt", "prompt": "a", "request_id": "r1"},
+    )
+    await _send(
+        websocket,
+        agent_service,
+        state,
+        {"type": "prompt", "prompt": "b", "request_id": "r2"},
+    )
+
+    assert set(state.streams) == {"r1", "r2"}
+    assert state.session_for("r2") == "sess-b"
+    assert sorted(_events(websocket)) == [
+        ("r1", "init"),
+        ("r1", "message"),
+        ("r2", "init"),
+        ("r2", "message"),
+    ]
+    assert _controls(websocket) == [
+        {"type": "ack", "message": "Query started", "request_id": "r1"},
+        {"type": "ack", "message": "Query started", "request_id": "r2"},
+    ]
+
+    await _finish(state, release)
+    assert state.streams == {}
+
+
+@pytest.mark.anyio
+async def test_stream_pauses_without_credit_and_others_continue() -> None:
+    release = asyncio.Event()
+    websocket = AsyncMock()
+    agent_service = _agent_service(3, release)
+    state = WebSocketState()
+
+    await _send(
+        websocket,
+        agent_service,
+        state,
+        {"type": "prompt", "prompt": "a", "request_id": "r1", "credits": 2},
+    )
+    await _send(
+        websocket,
+        agent_service,
+        state,
+        {"type": "prompt", "prompt": "b", "request_id": "r2"},
+    )
+
+    assert _events(websocket).count(("r1", "message")) == 1
+    assert _events(websocket).count(("r2", "message")) == 3
+
+    await _send(
+        websocket,
+        agent_service,
+        state,
+        {"type": "credit", "request_id": "r1", "credits": 5},
+    )
+
+    assert _events(websocket).count(("r1", "message")) == 3
+    await _finish(state, release)
+
+
+@pytest.mark.anyio
+async def test_interrupt_is_routed_to_the_tagged_session() -> None:
+    release = asyncio.Event()
+    websocket = AsyncMock()
+    agent_service = _agent_service(0, release)
+    session_service = MagicMock()
+    session_service.get_session = AsyncMock(return_value=object())
+    state = WebSocketState()
+
+    await _send(
+        websocket,
+        agent_service,
+        state,
+        {"type": "prompt", "prompt": "a", "request_id": "r1"},
+    )
+    await _send(
+        websocket,
+        agent_service,
+        state,
+        {"type": "interrupt", "request_id": "r1"},
+        session_service,
+    )
+
+    agent_service.interrupt.assert_awaited_once_with("sess-a")
+    assert _controls(websocket)[-1] == {
+        "type": "ack",
+        "message": "Query interrupted",
+        "request_id": "r1",
+    }
+    await _finish(state, release)
+
+
+@pytest.mark.anyio
+async def test_unknown_request_ids_and_stream_limit_are_rejected() -> None:
+    release = asyncio.Event()
+    websocket = AsyncMock()
+    agent_service = _agent_service(0, release)
+    state = WebSocketState()
+
+    await _send(
+        websocket,
+        agent_service,
+        state,
+        {"type": "answer", "request_id": "nope", "answer": "y"},
+    )
+    for request_id in ("r1", "r2", "r3"):
+        await _send(
+            websocket,
+            agent_service,
+            state,
+            {"type": "prompt", "prompt": request_id, "request_id": request_id},
+        )
+
+    errors = [c for c in _controls(websocket) if c["type"] == "error"]
+    assert errors == [
+        {"type": "error", "message": "Unknown request_id: nope", "request_id": "nope"},
+        {
+            "type": "error",
+            "message": "Too many concurrent queries on this connection (max 2)",
+            "request_id": "r3",
+        },
+    ]
+    assert set(state.streams) == {"r1", "r2"}
+    await _finish(state, release)
+
+
+@pytest.mark.anyio
+async def test_stream_without_credit_times_out_and_releases_slot() -> None:
+    websocket = AsyncMock()
+    closed = asyncio.Event()
+    agent_service = MagicMock()
+
+    async def _query_stream(
+        _request: QueryRequest, _api_key: str
+    ) -> AsyncGenerator[StreamEvent, None]:
+        try:
+            for turn in range(3):
+                yield StreamEvent("message", {"type": "assistant", "turn": turn})
+        finally:
+            closed.set()
+
+    agent_service.query_stream.side_effect = _query_stream
+    admission = AdmissionController(
+        max_in_flight=1,
+        max_in_flight_per_key=1,
+        max_queued=1,
+        max_queued_per_key=1,
+        queue_timeout_seconds=1,
+    )
+    state = WebSocketState()
+
+    await _send(
+        websocket,
+        agent_service,
+        state,
+        {"type": "prompt", "prompt": "a", "request_id": "r1", "credits": 1},
+        admission=admission,
+    )
+    task = state.streams["r1"].task
+    assert task is not None
+    await asyncio.wait_for(task, timeout=1)
+
+    assert closed.is_set()
+    assert _events(websocket) == [("r1", "message")]
+    assert _controls(websocket)[-1] == {
+        "type": "error",
+        "message": "No credit granted in time; query cancelled",
+        "request_id": "r1",
+    }
+    assert admission.metrics()["in_flight"] == 0
+    assert state.streams == {}
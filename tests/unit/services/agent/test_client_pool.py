@@ -0,0 +1,237 @@
+"""Unit tests for the warm SDK client pool."""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from typing import ClassVar
+from unittest.mock import MagicMock
+
+import pytest
+from claude_agent_sdk import ClaudeAgentOptions
+from pydantic import SecretStr
+
+from apps.api.config import Settings
+from apps.api.schemas.requests.query import QueryRequest
+from apps.api.services.agent.client_pool import (
+    SdkClientPool,
+    _PooledClient,
+    fingerprint_options,
+    is_poolable,
+)
+from apps.api.services.agent.handlers import MessageHandler
+from apps.api.services.agent.query_executor import QueryExecutor
+from apps.api.services.agent.types import StreamContext
+
+
+class FakeSdkClient:
+    """Minimal stand-in for ClaudeSDKClient with connect/disconnect tracking."""
+
+    instances: ClassVar[list["FakeSdkClient"]] = []
+
+    def __init__(self, options: object) -> None:
+        self.options = options
+        self.connected = False
+        self.disconnected = False
+        FakeSdkClient.instances.append(self)
+
+    async def connect(self) -> None:
+        self.connected = True
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+
+@pytest.fixture
+def fake_sdk(mock_claude_sdk: MagicMock) -> type[FakeSdkClient]:
+    """Route ClaudeSDKClient construction to FakeSdkClient."""
+    FakeSdkClient.instances = []
+    mock_claude_sdk.side_effect = FakeSdkClient
+    return FakeSdkClient
+
+
+def _settings(**overrides: object) -> Settings:
+    return Settings(
+        api_key=SecretStr("test-key"),
+        debug=True,
+        sdk_pool_enabled=True,
+        **overrides,
+    )
+
+
+async def _drain(pool: SdkClientPool) -> None:
+    """Wait for background spawn tasks to finish."""
+    while pool._spawn_tasks or pool._tasks:
+        await asyncio.gather(*pool._spawn_tasks, *pool._tasks)
+
+
+def test_fingerprint_is_stable_and_option_sensitive() -> None:
+    base = ClaudeAgentOptions(model="sonnet", allowed_tools=["Read"], cwd="/tmp")
+    same = ClaudeAgentOptions(model="sonnet", allowed_tools=["Read"], cwd="/tmp")
+    other = ClaudeAgentOptions(model="opus", allowed_tools=["Read"], cwd="/tmp")
+
+    assert fingerprint_options(base) == fingerprint_options(same)
+    assert fingerprint_options(base) != fingerprint_options(other)
+
+
+def test_resumed_sessions_are_not_poolable() -> None:
+    assert is_poolable(ClaudeAgentOptions(model="sonnet"))
+    assert not is_poolable(ClaudeAgentOptions(resume="session-1"))
+    assert not is_poolable(ClaudeAgentOptions(continue_conversation=True))
+
+
+@pytest.mark.anyio
+async def test_repeated_fingerprint_is_served_warm(
+    fake_sdk: type[FakeSdkClient],
+) -> None:
+    pool = SdkClientPool(_settings())
+    options = ClaudeAgentOptions(model="sonnet")
+
+    for _ in range(2):
+        async with pool.lease(options) as client:
+            assert client.connected
+        await _drain(pool)
+
+    assert pool.idle_count == 1
+    warm = fake_sdk.instances[-1]
+
+    async with pool.lease(options) as client:
+        assert client is warm
+
+    metrics = pool.metrics()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 2
+    assert metrics["hit_rate"] == pytest.approx(1 / 3, abs=1e-3)
+    assert metrics["spawned"] >= 3
+    await pool.close()
+
+
+@pytest.mark.anyio
+async def test_single_use_clients_are_disconnected_after_lease(
+    fake_sdk: type[FakeSdkClient],
+) -> None:
+    pool = SdkClientPool(_settings(sdk_pool_min_idle_per_key=0))
+    options = ClaudeAgentOptions(model="sonnet")
+
+    async with pool.lease(options) as client:
+        pass
+
+    assert client.disconnected
+    assert pool.idle_count == 0
+
+
+@pytest.mark.anyio
+async def test_failed_lease_discards_client(fake_sdk: type[FakeSdkClient]) -> None:
+    pool = SdkClientPool(_settings(sdk_pool_min_idle_per_key=0))
+    options = ClaudeAgentOptions(model="sonnet")
+
+    with pytest.raises(RuntimeError):
+        async with pool.lease(options) as client:
+            raise RuntimeError("boom")
+
+    assert client.disconnected
+    assert pool.idle_count == 0
+
+
+@pytest.mark.anyio
+async def test_leased_client_is_never_leased_again(
+    fake_sdk: type[FakeSdkClient],
+) -> None:
+    pool = SdkClientPool(_settings(sdk_pool_min_idle_per_key=0))
+    options = ClaudeAgentOptions(model="sonnet")
+
+    async with pool.lease(options) as first:
+        pass
+    async with pool.lease(options) as second:
+        pass
+
+    assert first is not second
+    assert first.disconnected
+    assert pool.metrics()["hits"] == 0
+
+
+@pytest.mark.anyio
+async def test_expired_idle_client_is_evicted(fake_sdk: type[FakeSdkClient]) -> None:
+    pool = SdkClientPool(_settings())
+    options = ClaudeAgentOptions(model="sonnet")
+    assert await pool.prewarm(options) == 1
+
+    key = fingerprint_options(options)
+    stale = pool._idle[key][0]
+    stale.created_at -= 10_000
+
+    async with pool.lease(options) as client:
+        assert client is not stale.client
+    await _drain(pool)
+
+    assert stale.client.disconnected
+    assert pool.metrics()["evicted"] == 1
+    await pool.close()
+
+
+@pytest.mark.anyio
+async def test_idle_capacity_evicts_oldest(fake_sdk: type[FakeSdkClient]) -> None:
+    pool = SdkClientPool(_settings(sdk_pool_max_idle=2))
+
+    for model in ("a", "b", "c"):
+        options = ClaudeAgentOptions(model=model)
+        pool._put_idle(
+            _PooledClient(
+                client=await pool._spawn(options),
+                fingerprint=fingerprint_options(options),
+                created_at=time.monotonic(),
+            )
+        )
+    await _drain(pool)
+
+    assert pool.idle_count == 2
+    assert fake_sdk.instances[0].disconnected
+    assert pool.metrics()["evicted"] == 1
+    await pool.close()
+
+
+@pytest.mark.anyio
+async def test_close_disconnects_idle_clients(fake_sdk: type[FakeSdkClient]) -> None:
+    pool = SdkClientPool(_settings(sdk_pool_min_idle_per_key=2))
+    await pool.prewarm(ClaudeAgentOptions(model="sonnet"), count=2)
+
+    await pool.close()
+
+    assert pool.idle_count == 0
+    assert all(client.disconnected for client in fake_sdk.instances)
+    assert pool.metrics()["enabled"] is False
+
+
+class FakeQueryClient(FakeSdkClient):
+    """Fake client that accepts a prompt and yields no SDK messages."""
+
+    async def query(self, prompt: str) -> None:
+        self.prompt = prompt
+
+    async def receive_response(self) -> AsyncGenerator[object, None]:
+        for message in ():
+            yield message
+
+
+@pytest.mark.anyio
+async def test_query_executor_leases_from_pool(mock_claude_sdk: MagicMock) -> None:
+    FakeSdkClient.instances = []
+    mock_claude_sdk.side_effect = FakeQueryClient
+    pool = SdkClientPool(_settings())
+    executor = QueryExecutor(MessageHandler(), client_pool=pool)
+    commands_service = MagicMock()
+    commands_service.parse_command.return_value = None
+    ctx = StreamContext(session_id="s1", model="sonnet", start_time=0.0)
+
+    events = [
+        event
+        async for event in executor.execute(
+            QueryRequest(prompt="hello"), ctx, commands_service
+        )
+    ]
+
+    client = FakeSdkClient.instances[0]
+    assert events == []
+    assert isinstance(client, FakeQueryClient)
+    assert client.prompt == "hello"
+    assert client.disconnected
+    assert pool.metrics()["misses"] == 1
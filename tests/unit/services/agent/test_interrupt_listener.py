@@ -0,0 +1,177 @@
+"""Unit tests for push-based interrupt delivery."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+from pydantic import SecretStr
+
+from apps.api.config import Settings
+from apps.api.services.agent.interrupt_listener import InterruptListener
+from apps.api.services.agent.session_tracker import AgentSessionTracker
+
+
+class FakePubSubCache:
+    """In-memory cache implementing the pub/sub and marker calls used here."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.subscribers: list[asyncio.Queue[str]] = []
+        self.exists_calls = 0
+        self.fail_subscribe = 0
+
+    async def cache_set(self, key: str, value: str, ttl: int | None = None) -> bool:
+        self.store[key] = value
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self.store.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        self.exists_calls += 1
+        return key in self.store
+
+    async def publish(self, channel: str, message: str) -> int:
+        for queue in self.subscribers:
+            queue.put_nowait(message)
+        return len(self.subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[AsyncIterator[str]]:
+        if self.fail_subscribe:
+            self.fail_subscribe -= 1
+            raise ConnectionError("redis down")
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        self.subscribers.append(queue)
+
+        async def messages() -> AsyncIterator[str]:
+            while True:
+                yield await queue.get()
+
+        try:
+            yield messages()
+        finally:
+            self.subscribers.remove(queue)
+
+
+def _settings() -> Settings:
+    return Settings(api_key=SecretStr("test-key"), debug=True)
+
+
+async def _until(predicate: object, timeout: float = 1.0) -> None:
+    async def wait() -> None:
+        while not predicate():  # type: ignore[operator]
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait(), timeout)
+
+
+@pytest.mark.anyio
+async def test_published_interrupt_sets_local_flag_without_polling() -> None:
+    cache = FakePubSubCache()
+    listener = InterruptListener(cache, _settings())  # type: ignore[arg-type]
+    await listener.start()
+    tracker = AgentSessionTracker(
+        cache,  # type: ignore[arg-type]
+        settings=_settings(),
+        interrupt_listener=listener,
+    )
+
+    await tracker.register("s1")
+    exists_after_register = cache.exists_calls
+    assert await tracker.is_interrupted("s1") is False
+
+    # Interrupt arrives from another instance via pub/sub only
+    await cache.publish("agent:interrupts", "s1")
+    await _until(lambda: listener.is_interrupted("s1"))
+
+    assert await tracker.is_interrupted("s1") is True
+    assert cache.exists_calls == exists_after_register
+    await listener.close()
+
+
+@pytest.mark.anyio
+async def test_mark_interrupted_writes_marker_and_publishes() -> None:
+    cache = FakePubSubCache()
+    listener = InterruptListener(cache, _settings())  # type: ignore[arg-type]
+    await listener.start()
+    tracker = AgentSessionTracker(
+        cache,  # type: ignore[arg-type]
+        settings=_settings(),
+        interrupt_listener=listener,
+    )
+    await tracker.register("s1")
+
+    await tracker.mark_interrupted("s1")
+
+    assert cache.store["interrupted:s1"] == "true"
+    assert listener.is_interrupted("s1")
+    await listener.close()
+
+
+@pytest.mark.anyio
+async def test_register_picks_up_interrupt_sent_before_watch() -> None:
+    cache = FakePubSubCache()
+    cache.store["interrupted:s1"] = "true"
+    listener = InterruptListener(cache, _settings())  # type: ignore[arg-type]
+    await listener.start()
+    tracker = AgentSessionTracker(
+        cache,  # type: ignore[arg-type]
+        settings=_settings(),
+        interrupt_listener=listener,
+    )
+
+    await tracker.register("s1")
+
+    assert await tracker.is_interrupted("s1") is True
+    await listener.close()
+
+
+@pytest.mark.anyio
+async def test_falls_back_to_marker_while_unsubscribed() -> None:
+    cache = FakePubSubCache()
+    listener = InterruptListener(cache, _settings())  # type: ignore[arg-type]
+    tracker = AgentSessionTracker(
+        cache,  # type: ignore[arg-type]
+        settings=_settings(),
+        interrupt_listener=listener,
+    )
+    await tracker.register("s1")
+    cache.store["interrupted:s1"] = "true"
+
+    assert not listener.is_watching("s1")
+    calls = cache.exists_calls
+    assert await tracker.is_interrupted("s1") is True
+    assert cache.exists_calls == calls + 1
+
+
+@pytest.mark.anyio
+async def test_resubscribe_resyncs_missed_interrupts() -> None:
+    cache = FakePubSubCache()
+    cache.fail_subscribe = 1
+    listener = InterruptListener(cache, _settings())  # type: ignore[arg-type]
+    listener.watch("s1")
+    await listener.start()
+    assert not listener.is_listening
+
+    # Marker written while the subscription was down
+    cache.store["interrupted:s1"] = "true"
+    await _until(lambda: listener.is_listening)
+
+    assert listener.is_interrupted("s1")
+    await listener.close()
+    assert not listener.is_listening
+
+
+def test_unwatch_is_refcounted() -> None:
+    listener = InterruptListener(FakePubSubCache(), _settings())  # type: ignore[arg-type]
+    listener.watch("s1")
+    listener.watch("s1")
+
+    listener.unwatch("s1")
+    listener.set_interrupted("s1")
+    assert listener.is_interrupted("s1")
+
+    listener.unwatch("s1")
+    assert not listener.is_interrupted("s1")
@@ -0,0 +1,126 @@
+"""Tests for memory retrieval overlapping SDK client startup in QueryExecutor."""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from typing import ClassVar
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.api.config import Settings
+from apps.api.schemas.requests.query import QueryRequest
+from apps.api.services.agent.handlers import MessageHandler
+from apps.api.services.agent.query_executor import QueryExecutor
+from apps.api.services.agent.types import StreamContext
+
+CONNECT_SECONDS = 0.2
+MEMORIES = "RELEVANT MEMORIES:\n- Prefers short answers"
+
+
+class SlowClient:
+    """SDK client stand-in whose connect takes CONNECT_SECONDS."""
+
+    instances: ClassVar[list["SlowClient"]] = []
+
+    def __init__(self, options: object) -> None:
+        self.options = options
+        self.prompt: str | None = None
+        SlowClient.instances.append(self)
+
+    async def __aenter__(self) -> "SlowClient":
+        await asyncio.sleep(CONNECT_SECONDS)
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def query(self, prompt: str) -> None:
+        self.prompt = prompt
+
+    async def receive_response(self) -> AsyncGenerator[object, None]:
+        yield MagicMock()
+
+
+class SlowMemory:
+    """Memory service stand-in whose search takes a configurable time."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    async def format_memory_context(self, query: str, user_id: str) -> str:
+        await asyncio.sleep(self.delay)
+        return MEMORIES
+
+    async def add_memory(self, **kwargs: object) -> list[object]:
+        return []
+
+
+async def _run(
+    memory_delay: float,
+    prompt: str = "hello",
+    **settings: object,
+) -> tuple[SlowClient, StreamContext, float]:
+    SlowClient.instances = []
+    commands_service = MagicMock()
+    commands_service.parse_command.return_value = (
+        {"command": "review", "args": ""} if prompt.startswith("/") else None
+    )
+    executor = QueryExecutor(MessageHandler(), settings=Settings(**settings))
+    ctx = StreamContext(session_id="s1", model="sonnet", start_time=0.0)
+
+    started = time.perf_counter()
+    with patch("claude_agent_sdk.ClaudeSDKClient", SlowClient):
+        async for _ in executor.execute(
+            QueryRequest(prompt=prompt, system_prompt="Be terse."),
+            ctx,
+            commands_service,
+            memory_service=SlowMemory(memory_delay),  # type: ignore[arg-type]
+            api_key="key",
+        ):
+            pass
+    return SlowClient.instances[0], ctx, time.perf_counter() - started
+
+
+@pytest.mark.anyio
+async def test_memory_search_overlaps_client_connect() -> None:
+    client, ctx, elapsed = await _run(memory_delay=CONNECT_SECONDS)
+
+    assert elapsed < CONNECT_SECONDS * 1.75
+    assert client.prompt == f"{MEMORIES}\n\nhello"
+    assert client.options.system_prompt == "Be terse."
+    assert set(ctx.timings) >= {
+        "memory_search_ms",
+        "memory_wait_ms",
+        "sdk_connect_ms",
+        "first_message_ms",
+    }
+    assert ctx.timings["memory_wait_ms"] < CONNECT_SECONDS * 1000 / 2
+
+
+@pytest.mark.anyio
+async def test_query_proceeds_without_memories_after_deadline() -> None:
+    client, ctx, elapsed = await _run(memory_delay=5, memory_search_deadline_ms=300)
+
+    assert elapsed < 1
+    assert client.prompt == "hello"
+    assert ctx.timings["memory_search_ms"] == 300
+
+
+@pytest.mark.anyio
+async def test_system_prompt_placement_searches_before_connect() -> None:
+    client, _, elapsed = await _run(
+        memory_delay=0.05, memory_context_placement="system_prompt"
+    )
+
+    assert elapsed >= CONNECT_SECONDS + 0.05
+    assert client.prompt == "hello"
+    assert client.options.system_prompt == f"Be terse.\n\n{MEMORIES}"
+
+
+@pytest.mark.anyio
+async def test_slash_command_keeps_prompt_first() -> None:
+    client, _, _ = await _run(memory_delay=0, prompt="/review")
+
+    assert client.prompt == "/review"
+    assert client.options.system_prompt == f"Be terse.\n\n{MEMORIES}"
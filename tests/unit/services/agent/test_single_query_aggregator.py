@@ -1,7 +1,7 @@
 """Unit tests for SingleQueryAggregator."""
 
 from apps.api.services.agent.single_query_aggregator import SingleQueryAggregator
-from apps.api.services.agent.types import StreamContext
+from apps.api.services.agent.types import StreamContext, StreamEvent
 
 
 def test_single_query_aggregator_finalizes_result() -> None:
@@ -26,3 +26,60 @@ def test_single_query_aggregator_finalizes_result() -> None:
     assert result["total_cost_usd"] is None
     assert result["result"] is None
     assert result["structured_output"] is None
+
+
+def test_single_query_aggregator_reads_typed_payloads_without_encoding() -> None:
+    """Test typed events aggregate content and usage without JSON encoding."""
+    aggregator = SingleQueryAggregator()
+    events = [
+        StreamEvent(
+            "message",
+            {
+                "type": "assistant",
+                "content": [{"type": "text", "text": f"turn {turn}"}],
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+            },
+        )
+        for turn in range(3)
+    ]
+    events.append(StreamEvent("partial", {"type": "content_block_delta"}))
+
+    for event in events:
+        aggregator.handle_event(event)
+
+    assert [block["text"] for block in aggregator.content_blocks] == [
+        "turn 0",
+        "turn 1",
+        "turn 2",
+    ]
+    assert aggregator.usage_data == {"input_tokens": 30, "output_tokens": 15}
+    assert all(event._json is None for event in events)
+
+
+def test_single_query_aggregator_parses_sse_dicts() -> None:
+    """Test plain SSE dicts are still parsed and errors are tracked."""
+    aggregator = SingleQueryAggregator()
+
+    aggregator.handle_event(
+        {
+            "event": "message",
+            "data": '{"type": "assistant", "content": [{"type": "text", "text": "x"}]}',
+        }
+    )
+    aggregator.handle_event({"event": "message", "data": "not json"})
+    aggregator.handle_event({"event": "error", "data": "{}"})
+
+    assert aggregator.content_blocks == [{"type": "text", "text": "x"}]
+    assert aggregator.is_error is True
+
+
+def test_single_query_aggregator_skips_malformed_sse_data() -> None:
+    """Test an SSE dict with unparseable data is skipped without raising."""
+    aggregator = SingleQueryAggregator()
+
+    aggregator.handle_event({"event": "message", "data": "{not json"})
+    aggregator.handle_event({"event": "result", "data": ""})
+
+    assert aggregator.content_blocks == []
+    assert aggregator.usage_data is None
+    assert aggregator.is_error is False
@@ -7,6 +7,7 @@ import pytest
 
 from apps.api.schemas.requests.query import QueryRequest
 from apps.api.services.agent.single_query_runner import SingleQueryRunner
+from apps.api.services.agent.types import StreamContext, StreamEvent
 
 
 @pytest.mark.anyio
@@ -59,3 +60,32 @@ async def test_single_query_runner_handles_executor_error() -> None:
 
     assert result["is_error"] is True
     assert result["content"] == [{"type": "text", "text": "Error: Internal error"}]
+
+
+@pytest.mark.anyio
+async def test_single_query_runner_disables_partial_messages() -> None:
+    query_executor = MagicMock()
+    seen: list[tuple[bool, bool]] = []
+
+    async def _execute(
+        request: QueryRequest,
+        ctx: StreamContext,
+        _commands: object,
+        _memory_service: object = None,
+        _api_key: str = "",
+    ) -> AsyncGenerator[StreamEvent, None]:
+        seen.append((request.include_partial_messages, ctx.include_partial_messages))
+        yield StreamEvent(
+            "message",
+            {"type": "assistant", "content": [{"type": "text", "text": "hi"}]},
+        )
+
+    query_executor.execute.side_effect = _execute
+
+    runner = SingleQueryRunner(query_executor=query_executor)
+    request = QueryRequest(prompt="test", include_partial_messages=True)
+    result = await runner.run(request, MagicMock())
+
+    assert seen == [(False, False)]
+    assert request.include_partial_messages is True
+    assert result["content"] == [{"type": "text", "text": "hi"}]
@@ -0,0 +1,52 @@
+"""Unit tests for the typed StreamEvent."""
+
+import json
+from unittest.mock import patch
+
+from sse_starlette.event import ServerSentEvent
+
+from apps.api.services.agent.types import StreamEvent
+from apps.api.utils.json_codec import get_json_codec
+
+
+def test_payload_is_encoded_once_and_cached() -> None:
+    event = StreamEvent("message", {"type": "assistant", "content": []})
+    codec = get_json_codec()
+
+    with patch.object(codec, "dumps", wraps=codec.dumps) as dumps:
+        first = event.data
+        assert event.data is first
+        frame = event.encode_sse()
+        assert event.encode_sse() is frame
+        assert event.json_bytes.decode() == first
+
+    dumps.assert_called_once()
+
+
+def test_sse_frame_matches_sse_starlette_encoding() -> None:
+    event = StreamEvent("result", {"session_id": "s1", "is_error": False})
+
+    expected = ServerSentEvent(
+        event="result", data=get_json_codec().dumps_str(event.payload), sep="\r\n"
+    ).encode()
+
+    assert event.encode_sse() == expected
+
+
+def test_mapping_access_preserves_sse_dict_shape() -> None:
+    event = StreamEvent("done", {"reason": "completed"})
+
+    assert event["event"] == "done"
+    assert json.loads(event["data"]) == {"reason": "completed"}
+    assert event.get("missing") is None
+    expected = {"event": "done", "data": event.data}
+    assert dict(event) == expected
+    assert event == expected
+
+
+def test_repr_does_not_force_encoding() -> None:
+    event = StreamEvent("init", {"session_id": "s1"})
+
+    assert "init" in repr(event)
+    assert event._data is None
+    assert event._json is None
@@ -2,11 +2,13 @@
 
 from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 import pytest
 
 from apps.api.schemas.requests.query import QueryRequest
 from apps.api.services.agent.stream_query_runner import StreamQueryRunner
+from apps.api.services.agent.types import StreamEvent
 
 
 @pytest.mark.anyio
@@ -134,3 +136,102 @@ async def test_stream_query_runner_emits_error_on_exception() -> None:
 
     assert events[-1]["event"] == "done"
     assert {"event": "error", "data": "{}"} in events
+
+
+@pytest.mark.anyio
+async def test_stream_query_runner_records_transcript() -> None:
+    session_tracker = AsyncMock()
+    session_tracker.is_interrupted.return_value = False
+    query_executor = MagicMock()
+    stream_orchestrator = MagicMock()
+    stream_orchestrator.build_result_event.return_value = StreamEvent(
+        "result", {"session_id": "s", "is_error": False}
+    )
+    stream_orchestrator.build_done_event.return_value = StreamEvent(
+        "done", {"reason": "completed"}
+    )
+    transcript_recorder = AsyncMock()
+
+    async def _execute(
+        _request: QueryRequest,
+        _ctx: object,
+        _commands: object,
+        _memory_service: object = None,
+        _api_key: str = "",
+    ) -> AsyncGenerator[StreamEvent, None]:
+        yield StreamEvent("message", {"type": "assistant", "content": []})
+        yield StreamEvent("partial", {"type": "content_block_delta", "index": 0})
+
+    query_executor.execute.side_effect = _execute
+
+    runner = StreamQueryRunner(
+        session_tracker=session_tracker,
+        query_executor=query_executor,
+        stream_orchestrator=stream_orchestrator,
+        transcript_recorder=transcript_recorder,
+    )
+    session_id = str(uuid4())
+    request = QueryRequest(prompt="hello")
+
+    events = [
+        event
+        async for event in runner.run(
+            request,
+            MagicMock(),
+            session_id_override=session_id,
+            record_transcript=True,
+        )
+    ]
+
+    assert [e.event for e in events] == ["message", "partial", "result", "done"]
+    recorded = [call.args for call in transcript_recorder.record.await_args_list]
+    assert [(sid, message_type) for sid, message_type, _ in recorded] == [
+        (session_id, "user"),
+        (session_id, "assistant"),
+        (session_id, "result"),
+    ]
+    assert recorded[0][2] == {
+        "type": "user",
+        "content": [{"type": "text", "text": "hello"}],
+    }
+
+
+@pytest.mark.anyio
+async def test_stream_query_runner_skips_transcript_unless_requested() -> None:
+    session_tracker = AsyncMock()
+    session_tracker.is_interrupted.return_value = False
+    query_executor = MagicMock()
+    stream_orchestrator = MagicMock()
+    stream_orchestrator.build_result_event.return_value = StreamEvent(
+        "result", {"session_id": "s", "is_error": False}
+    )
+    stream_orchestrator.build_done_event.return_value = StreamEvent(
+        "done", {"reason": "completed"}
+    )
+    transcript_recorder = AsyncMock()
+
+    async def _execute(
+        _request: QueryRequest,
+        _ctx: object,
+        _commands: object,
+        _memory_service: object = None,
+        _api_key: str = "",
+    ) -> AsyncGenerator[StreamEvent, None]:
+        yield StreamEvent("message", {"type": "assistant", "content": []})
+
+    query_executor.execute.side_effect = _execute
+
+    runner = StreamQueryRunner(
+        session_tracker=session_tracker,
+        query_executor=query_executor,
+        stream_orchestrator=stream_orchestrator,
+        transcript_recorder=transcript_recorder,
+    )
+
+    # WebSocket and OpenAI streams never create the session row
+    events = [
+        event async for event in runner.run(QueryRequest(prompt="hi"), MagicMock())
+    ]
+
+    assert [e.event for e in events] == ["message", "result", "done"]
+    transcript_recorder.record.assert_not_awaited()
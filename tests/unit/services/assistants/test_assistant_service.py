@@ -7,6 +7,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from tests.helpers.cache_pipeline import pipeline_factory
+
 if TYPE_CHECKING:
     from apps.api.types import JsonValue
 
@@ -21,6 +23,7 @@ def mock_cache() -> AsyncMock:
     cache.exists = AsyncMock(return_value=False)
     cache.scan_keys = AsyncMock(return_value=[])
     cache.get_many_json = AsyncMock(return_value=[])
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from tests.helpers.cache_pipeline import pipeline_factory
+
 
 @pytest.fixture
 def mock_cache() -> AsyncMock:
@@ -12,8 +14,10 @@ def mock_cache() -> AsyncMock:
     cache.get_json = AsyncMock(return_value=None)
     cache.set_json = AsyncMock()
     cache.delete = AsyncMock(return_value=True)
-    cache.scan_keys = AsyncMock(return_value=[])
     cache.get_many_json = AsyncMock(return_value=[])
+    cache.sorted_set_rank = AsyncMock(return_value=None)
+    cache.sorted_set_range = AsyncMock(return_value=[])
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -136,8 +140,6 @@ class TestMessageServiceList:
         """List messages returns empty when none exist."""
         from apps.api.services.assistants.message_service import MessageService
 
-        mock_cache.scan_keys = AsyncMock(return_value=[])
-
         service = MessageService(cache=mock_cache)
         result = await service.list_messages("thread_abc123")
 
@@ -152,7 +154,7 @@ class TestMessageServiceList:
         """List messages returns available messages."""
         from apps.api.services.assistants.message_service import MessageService
 
-        mock_cache.scan_keys = AsyncMock(return_value=["message:thread_abc123:msg_1"])
+        mock_cache.sorted_set_range = AsyncMock(return_value=["msg_1"])
         mock_cache.get_many_json = AsyncMock(
             return_value=[
                 {
@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from tests.helpers.cache_pipeline import pipeline_factory
+
 
 @pytest.fixture
 def mock_cache() -> AsyncMock:
@@ -12,8 +14,10 @@ def mock_cache() -> AsyncMock:
     cache.get_json = AsyncMock(return_value=None)
     cache.set_json = AsyncMock()
     cache.delete = AsyncMock(return_value=True)
-    cache.scan_keys = AsyncMock(return_value=[])
     cache.get_many_json = AsyncMock(return_value=[])
+    cache.sorted_set_rank = AsyncMock(return_value=None)
+    cache.sorted_set_range = AsyncMock(return_value=[])
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -158,8 +162,6 @@ class TestRunServiceList:
         """List runs returns empty when none exist."""
         from apps.api.services.assistants.run_service import RunService
 
-        mock_cache.scan_keys = AsyncMock(return_value=[])
-
         service = RunService(cache=mock_cache, db_repo=mock_db_repo)
         result = await service.list_runs("thread_abc123")
 
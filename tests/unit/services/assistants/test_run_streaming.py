@@ -1,5 +1,7 @@
 """Unit tests for run streaming adapter (TDD - RED phase)."""
 
+import json
+
 import pytest
 
 
@@ -300,7 +302,8 @@ class TestFormatSSEEvent:
 
         assert "event: thread.run.created" in sse
         assert "data:" in sse
-        assert '"id": "run_abc123"' in sse
+        data_line = sse.split("data: ", 1)[1].strip()
+        assert json.loads(data_line) == {"id": "run_abc123", "status": "queued"}
 
     def test_format_done_marker_as_sse(self) -> None:
         """Format done marker as SSE data line."""
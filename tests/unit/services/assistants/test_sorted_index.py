@@ -0,0 +1,395 @@
+"""Unit tests for sorted-set index pagination of thread objects and assistants."""
+
+import json
+from fnmatch import fnmatch
+from unittest.mock import patch
+
+import pytest
+
+from apps.api.services.assistants.assistant_service import AssistantService
+from apps.api.services.assistants.message_service import (
+    MessageService,
+    thread_messages_index_key,
+)
+from apps.api.services.assistants.run_service import RunService
+from apps.api.services.assistants.sorted_index import (
+    page_merged_indexes,
+    page_sorted_index,
+)
+from apps.api.types import JsonValue
+from tests.helpers.cache_pipeline import SequentialPipeline
+
+
+class FakeSortedSetCache:
+    """In-memory cache implementing the JSON and sorted-set calls used here."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.scanned = False
+
+    def pipeline(self, *, transaction: bool = True) -> SequentialPipeline:
+        """Batch writes, replayed one at a time."""
+        return SequentialPipeline(self)
+
+    async def set_json(
+        self, key: str, value: dict[str, JsonValue], ttl: int | None = None
+    ) -> bool:
+        self.store[key] = json.dumps(value)
+        return True
+
+    async def get_json(self, key: str) -> dict[str, JsonValue] | None:
+        raw = self.store.get(key)
+        return json.loads(raw) if raw else None
+
+    async def get_many_json(self, keys: list[str]) -> list[dict[str, JsonValue] | None]:
+        return [await self.get_json(key) for key in keys]
+
+    async def delete(self, key: str) -> bool:
+        removed = self.store.pop(key, None) is not None
+        return self.zsets.pop(key, None) is not None or removed
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        return True
+
+    async def exists(self, key: str) -> bool:
+        return key in self.store or key in self.zsets
+
+    async def cache_set(self, key: str, value: str, ttl: int | None = None) -> bool:
+        self.store[key] = value
+        return True
+
+    async def scan_keys(self, pattern: str, max_keys: int = 1000) -> list[str]:
+        self.scanned = True
+        return [key for key in self.store if fnmatch(key, pattern)][:max_keys]
+
+    async def add_to_sorted_set(self, key: str, member: str, score: float) -> bool:
+        zset = self.zsets.setdefault(key, {})
+        added = member not in zset
+        zset[member] = score
+        return added
+
+    async def remove_from_sorted_set(self, key: str, *members: str) -> int:
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(m, None) is not None for m in members)
+
+    def _ordered(self, key: str, descending: bool) -> list[str]:
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda i: (i[1], i[0]))
+        members = [m for m, _ in items]
+        return members[::-1] if descending else members
+
+    async def sorted_set_rank(
+        self, key: str, member: str, *, descending: bool = False
+    ) -> int | None:
+        members = self._ordered(key, descending)
+        return members.index(member) if member in members else None
+
+    async def sorted_set_range(
+        self, key: str, start: int, stop: int, *, descending: bool = False
+    ) -> list[str]:
+        members = self._ordered(key, descending)
+        return members[start : None if stop == -1 else stop + 1]
+
+    async def sorted_set_score(self, key: str, member: str) -> float | None:
+        return self.zsets.get(key, {}).get(member)
+
+    async def sorted_set_range_by_score(
+        self,
+        key: str,
+        min_score: float | str,
+        max_score: float | str,
+        *,
+        descending: bool = False,
+        count: int | None = None,
+    ) -> list[tuple[str, float]]:
+        def within(score: float) -> bool:
+            lo, hi = str(min_score), str(max_score)
+            lo_ok = score > float(lo[1:]) if lo[0] == "(" else score >= float(lo)
+            hi_ok = score < float(hi[1:]) if hi[0] == "(" else score <= float(hi)
+            return lo_ok and hi_ok
+
+        zset = self.zsets.get(key, {})
+        rows = [(m, zset[m]) for m in self._ordered(key, descending) if within(zset[m])]
+        return rows if count is None else rows[:count]
+
+
+@pytest.fixture
+def cache() -> FakeSortedSetCache:
+    cache = FakeSortedSetCache()
+    for i in range(7):
+        cache.zsets.setdefault("idx", {})[f"m{i}"] = float(i)
+    return cache
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_after_cursor_walks_every_id_once(
+    cache: FakeSortedSetCache, order: str
+) -> None:
+    seen: list[str] = []
+    after: str | None = None
+    while True:
+        page = await page_sorted_index(
+            cache,  # type: ignore[arg-type]
+            "idx",
+            limit=3,
+            order=order,
+            after=after,
+        )
+        seen.extend(page.ids)
+        if not page.has_more:
+            break
+        after = page.ids[-1]
+
+    expected = [f"m{i}" for i in range(7)]
+    assert seen == (expected if order == "asc" else expected[::-1])
+
+
+@pytest.mark.anyio
+async def test_before_cursor_returns_preceding_page(
+    cache: FakeSortedSetCache,
+) -> None:
+    page = await page_sorted_index(
+        cache,  # type: ignore[arg-type]
+        "idx",
+        limit=2,
+        order="asc",
+        before="m4",
+    )
+
+    assert page.ids == ["m2", "m3"]
+    assert page.has_more is True
+
+
+@pytest.mark.anyio
+async def test_after_and_before_bound_the_window(
+    cache: FakeSortedSetCache,
+) -> None:
+    page = await page_sorted_index(
+        cache,  # type: ignore[arg-type]
+        "idx",
+        limit=10,
+        order="desc",
+        after="m5",
+        before="m1",
+    )
+
+    assert page.ids == ["m4", "m3", "m2"]
+    assert page.has_more is False
+
+
+@pytest.mark.anyio
+async def test_unknown_cursor_yields_empty_page(cache: FakeSortedSetCache) -> None:
+    page = await page_sorted_index(
+        cache,  # type: ignore[arg-type]
+        "idx",
+        limit=3,
+        after="gone",
+    )
+
+    assert page.ids == []
+    assert page.has_more is False
+
+
+@pytest.mark.anyio
+async def test_list_messages_reads_only_the_page_in_creation_order() -> None:
+    cache = FakeSortedSetCache()
+    service = MessageService(cache=cache)  # type: ignore[arg-type]
+    created = [
+        await service.create_message("thread_1", role="user", content=f"m{i}")
+        for i in range(5)
+    ]
+
+    with patch.object(cache, "get_many_json", wraps=cache.get_many_json) as mget:
+        first = await service.list_messages("thread_1", limit=2, order="asc")
+        # Only the first list of a thread scans for objects to backfill
+        cache.scanned = False
+        second = await service.list_messages(
+            "thread_1", limit=2, order="asc", after=first.last_id
+        )
+
+    assert [m.id for m in first.data + second.data] == [m.id for m in created[:4]]
+    assert first.has_more is True
+    assert all(len(call.args[0]) == 2 for call in mget.call_args_list[1:])
+    assert cache.scanned is False
+
+
+@pytest.mark.anyio
+async def test_delete_message_removes_it_from_the_index() -> None:
+    cache = FakeSortedSetCache()
+    service = MessageService(cache=cache)  # type: ignore[arg-type]
+    message = await service.create_message("thread_1", role="user", content="hi")
+
+    assert await service.delete_message("thread_1", message.id) is True
+
+    assert cache.zsets[thread_messages_index_key("thread_1")] == {}
+    result = await service.list_messages("thread_1")
+    assert result.data == []
+
+
+@pytest.mark.anyio
+async def test_list_prunes_expired_entries() -> None:
+    cache = FakeSortedSetCache()
+    service = RunService(cache=cache)  # type: ignore[arg-type]
+    run = await service.create_run("thread_1", assistant_id="asst_1", model="sonnet")
+    expired = await service.create_run(
+        "thread_1", assistant_id="asst_1", model="sonnet"
+    )
+    del cache.store[f"run:thread_1:{expired.id}"]
+
+    result = await service.list_runs("thread_1")
+
+    assert [r.id for r in result.data] == [run.id]
+    assert cache.zsets["thread_runs:thread_1"].keys() == {run.id}
+
+
+@pytest.mark.anyio
+async def test_threads_cached_before_the_index_are_backfilled() -> None:
+    cache = FakeSortedSetCache()
+    messages = MessageService(cache=cache)  # type: ignore[arg-type]
+    runs = RunService(cache=cache)  # type: ignore[arg-type]
+    created = [
+        await messages.create_message("thread_1", role="user", content=f"m{i}")
+        for i in range(3)
+    ]
+    run = await runs.create_run("thread_1", assistant_id="asst_1", model="sonnet")
+    # Simulate objects written before the per-thread indexes existed
+    for second, message in enumerate(created):
+        key = f"message:thread_1:{message.id}"
+        data = json.loads(cache.store[key])
+        cache.store[key] = json.dumps({**data, "created_at": 1_700_000_000 + second})
+    del cache.zsets[thread_messages_index_key("thread_1")]
+    del cache.zsets["thread_runs:thread_1"]
+
+    first = await messages.list_messages("thread_1", limit=2, order="asc")
+    second = await messages.list_messages(
+        "thread_1", limit=2, order="asc", after=first.last_id
+    )
+    run_page = await runs.list_runs("thread_1")
+
+    assert [m.id for m in first.data + second.data] == [m.id for m in created]
+    assert first.has_more is True
+    assert [r.id for r in run_page.data] == [run.id]
+    assert len(cache.zsets[thread_messages_index_key("thread_1")]) == 3
+
+
+@pytest.mark.anyio
+async def test_backfill_runs_when_thread_gains_objects_before_first_list() -> None:
+    cache = FakeSortedSetCache()
+    service = MessageService(cache=cache)  # type: ignore[arg-type]
+    old = await service.create_message("thread_1", role="user", content="old")
+    # Written before the index existed, then a new message arrives before any
+    # list: the index is no longer empty but still misses the old message
+    del cache.zsets[thread_messages_index_key("thread_1")]
+    new = await service.create_message("thread_1", role="user", content="new")
+    new_score = cache.zsets[thread_messages_index_key("thread_1")][new.id]
+
+    result = await service.list_messages("thread_1", order="asc")
+    cache.scanned = False
+    await service.list_messages("thread_1")
+
+    assert {m.id for m in result.data} == {old.id, new.id}
+    assert cache.zsets[thread_messages_index_key("thread_1")][new.id] == new_score
+    assert cache.scanned is False
+
+
+@pytest.fixture
+def merged_cache() -> FakeSortedSetCache:
+    cache = FakeSortedSetCache()
+    # Interleaved scores with a tie across indexes at 3.0
+    cache.zsets["a"] = {"a1": 1.0, "a3": 3.0, "a5": 5.0, "a6": 6.0}
+    cache.zsets["b"] = {"b2": 2.0, "b3": 3.0, "b4": 4.0}
+    return cache
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize("limit", [1, 2, 3])
+async def test_merged_after_cursor_walks_union_once(
+    merged_cache: FakeSortedSetCache, order: str, limit: int
+) -> None:
+    seen: list[str] = []
+    after: str | None = None
+    while True:
+        page = await page_merged_indexes(
+            merged_cache,  # type: ignore[arg-type]
+            ["a", "b"],
+            limit=limit,
+            order=order,
+            after=after,
+        )
+        seen.extend(page.ids)
+        if not page.has_more:
+            break
+        after = page.ids[-1]
+
+    expected = ["a1", "b2", "a3", "b3", "b4", "a5", "a6"]
+    assert seen == (expected if order == "asc" else expected[::-1])
+
+
+@pytest.mark.anyio
+async def test_merged_before_and_window(merged_cache: FakeSortedSetCache) -> None:
+    previous = await page_merged_indexes(
+        merged_cache,  # type: ignore[arg-type]
+        ["a", "b"],
+        limit=2,
+        order="desc",
+        before="b3",
+    )
+    window = await page_merged_indexes(
+        merged_cache,  # type: ignore[arg-type]
+        ["a", "b"],
+        limit=10,
+        order="asc",
+        after="b2",
+        before="a5",
+    )
+
+    assert previous.ids == ["a5", "b4"]
+    assert previous.has_more is True
+    assert window.ids == ["a3", "b3", "b4"]
+    assert window.has_more is False
+
+
+@pytest.mark.anyio
+async def test_cached_assistant_listing_is_owner_scoped_without_scan() -> None:
+    cache = FakeSortedSetCache()
+    service = AssistantService(cache=cache)  # type: ignore[arg-type]
+    public = await service.create_assistant(model="sonnet", name="public")
+    mine = await service.create_assistant(model="sonnet", owner_api_key="key-1")
+    await service.create_assistant(model="sonnet", owner_api_key="key-2")
+
+    first = await service.list_assistants(limit=1, order="asc", owner_api_key="key-1")
+    second = await service.list_assistants(
+        limit=1, order="asc", owner_api_key="key-1", after=first.last_id
+    )
+    everything = await service.list_assistants(limit=10)
+
+    assert [a.id for a in first.data + second.data] == [public.id, mine.id]
+    assert first.has_more is True
+    assert second.has_more is False
+    assert len(everything.data) == 3
+    assert cache.scanned is False
+
+    assert await service.delete_assistant(mine.id, "key-1") is True
+    remaining = await service.list_assistants(owner_api_key="key-1")
+    assert [a.id for a in remaining.data] == [public.id]
+
+
+@pytest.mark.anyio
+async def test_assistant_indexes_backfill_once_from_cached_assistants() -> None:
+    cache = FakeSortedSetCache()
+    service = AssistantService(cache=cache)  # type: ignore[arg-type]
+    public = await service.create_assistant(model="sonnet", name="public")
+    mine = await service.create_assistant(model="sonnet", owner_api_key="key-1")
+    other = await service.create_assistant(model="sonnet", owner_api_key="key-2")
+    # Assistants cached before the indexes existed
+    cache.zsets.clear()
+
+    assert await service.backfill_indexes() == 3
+    assert await service.backfill_indexes() == 0
+
+    scoped = await service.list_assistants(order="asc", owner_api_key="key-1")
+    everything = await service.list_assistants(order="asc")
+    assert [a.id for a in scoped.data] == [public.id, mine.id]
+    assert [a.id for a in everything.data] == [public.id, mine.id, other.id]
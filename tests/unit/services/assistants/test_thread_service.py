@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from tests.helpers.cache_pipeline import pipeline_factory
+
 
 @pytest.fixture
 def mock_session_service() -> AsyncMock:
@@ -23,6 +25,7 @@ def mock_cache() -> AsyncMock:
     cache.get_json = AsyncMock(return_value=None)
     cache.set_json = AsyncMock()
     cache.delete = AsyncMock(return_value=True)
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -0,0 +1,149 @@
+"""Unit tests for query admission control."""
+
+import asyncio
+
+import pytest
+
+from apps.api.exceptions import QueryRejectedError
+from apps.api.services.admission import AdmissionController
+
+
+def _controller(**kwargs: float) -> AdmissionController:
+    options: dict[str, float] = {
+        "max_in_flight": 2,
+        "max_in_flight_per_key": 2,
+        "max_queued": 10,
+        "max_queued_per_key": 10,
+        "queue_timeout_seconds": 5.0,
+        **kwargs,
+    }
+    return AdmissionController(**options)  # type: ignore[arg-type]
+
+
+async def _settle() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.anyio
+async def test_waiter_is_admitted_when_a_slot_frees() -> None:
+    controller = _controller(max_in_flight=1)
+    await controller.acquire("a")
+
+    waiter = asyncio.create_task(controller.acquire("b"))
+    await _settle()
+    assert not waiter.done()
+    assert controller.metrics()["queued"] == 1
+
+    controller.release("a")
+    await waiter
+
+    metrics = controller.metrics()
+    assert metrics["in_flight"] == 1
+    assert metrics["queued"] == 0
+    assert metrics["admitted"] == 2
+
+
+@pytest.mark.anyio
+async def test_saturated_key_does_not_block_other_keys() -> None:
+    controller = _controller(max_in_flight=3, max_in_flight_per_key=1)
+    await controller.acquire("a")
+
+    waiter = asyncio.create_task(controller.acquire("a"))
+    await _settle()
+    await asyncio.wait_for(controller.acquire("b"), timeout=1)
+
+    assert not waiter.done()
+    controller.release("a")
+    await waiter
+    assert controller.metrics()["in_flight"] == 2
+
+
+@pytest.mark.anyio
+async def test_waiters_are_served_round_robin_across_keys() -> None:
+    controller = _controller(max_in_flight=1)
+    await controller.acquire("a")
+    order: list[str] = []
+
+    async def wait(key: str, label: str) -> None:
+        await controller.acquire(key)
+        order.append(label)
+
+    tasks = [
+        asyncio.create_task(wait("a", "a1")),
+        asyncio.create_task(wait("a", "a2")),
+        asyncio.create_task(wait("a", "a3")),
+        asyncio.create_task(wait("b", "b1")),
+    ]
+    await _settle()
+    for key in ("a", "a", "b", "a"):
+        controller.release(key)
+        await _settle()
+    await asyncio.gather(*tasks)
+
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+@pytest.mark.anyio
+async def test_full_queues_shed_with_429_or_503() -> None:
+    controller = _controller(max_in_flight=1, max_queued=1, max_queued_per_key=1)
+    await controller.acquire("a")
+    waiter = asyncio.create_task(controller.acquire("a"))
+    await _settle()
+
+    with pytest.raises(QueryRejectedError) as key_error:
+        await controller.acquire("a")
+    with pytest.raises(QueryRejectedError) as overload_error:
+        await controller.acquire("b")
+
+    assert key_error.value.status_code == 429
+    assert overload_error.value.status_code == 503
+    assert overload_error.value.details["queue_position"] == 2
+    metrics = controller.metrics()
+    assert metrics["rejected_key_limit"] == 1
+    assert metrics["rejected_overloaded"] == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+@pytest.mark.anyio
+async def test_wait_past_deadline_is_shed_with_queue_position() -> None:
+    controller = _controller(max_in_flight=1, queue_timeout_seconds=0.05)
+    await controller.acquire("a")
+
+    with pytest.raises(QueryRejectedError) as exc_info:
+        await controller.acquire("b")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.details["queue_position"] == 1
+    metrics = controller.metrics()
+    assert metrics["timed_out"] == 1
+    assert metrics["queued"] == 0
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_leaves_the_queue() -> None:
+    controller = _controller(max_in_flight=1)
+    await controller.acquire("a")
+    waiter = asyncio.create_task(controller.acquire("b"))
+    await _settle()
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    controller.release("a")
+
+    metrics = controller.metrics()
+    assert metrics["queued"] == 0
+    assert metrics["in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_slot_releases_on_exit() -> None:
+    controller = _controller()
+
+    async with controller.slot("a"):
+        assert controller.metrics()["in_flight"] == 1
+
+    assert controller.metrics()["in_flight"] == 0
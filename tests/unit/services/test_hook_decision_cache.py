@@ -0,0 +1,183 @@
+"""Unit tests for the PreToolUse webhook decision cache."""
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from apps.api.schemas.requests.config import HooksConfigSchema, HookWebhookSchema
+from apps.api.services.hook_decision_cache import HookDecisionCache, cache_control_ttl
+from apps.api.services.webhook import WebhookService
+from apps.api.services.webhook_http import WebhookHttpPool
+
+
+class DictCache:
+    """Minimal JSON cache shared between HookDecisionCache instances."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, dict[str, object]] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get_json(self, key: str) -> dict[str, object] | None:
+        return self.values.get(key)
+
+    async def set_json(
+        self, key: str, value: dict[str, object], ttl: int | None = None
+    ) -> bool:
+        self.values[key] = value
+        self.ttls[key] = ttl
+        return True
+
+
+def _service(
+    cache: HookDecisionCache, cache_control: str | None = None
+) -> tuple[WebhookService, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        headers = {"Cache-Control": cache_control} if cache_control else {}
+        return httpx.Response(200, json={"decision": "allow"}, headers=headers)
+
+    pool = WebhookHttpPool(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_connections=10,
+        max_connections_per_host=10,
+    )
+    return WebhookService(http_pool=pool, decision_cache=cache), requests
+
+
+def _hook(**decision_cache: object) -> HookWebhookSchema:
+    return HookWebhookSchema.model_validate(
+        {"url": "https://hooks.example.com/pre", "decision_cache": decision_cache}
+    )
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, 60),
+        ("public", 60),
+        ("max-age=10", 10),
+        ("private, max-age=600", 60),
+        ("max-age=30, s-maxage=5", 5),
+        ("max-age=0", 0),
+        ("no-store", 0),
+        ("no-cache, max-age=30", 0),
+    ],
+)
+def test_cache_control_ttl(header: str | None, expected: float) -> None:
+    assert cache_control_ttl(header, 60) == expected
+
+
+@pytest.mark.anyio
+async def test_repeated_tool_call_skips_webhook() -> None:
+    cache = HookDecisionCache(max_hooks=8)
+    service, requests = _service(cache)
+    hook = _hook()
+
+    for _ in range(3):
+        result = await service.execute_hook(
+            "PreToolUse", hook, "s1", tool_name="Read", tool_input={"path": "a.py"}
+        )
+        assert result == {"decision": "allow"}
+    await service.execute_hook(
+        "PreToolUse", hook, "s1", tool_name="Read", tool_input={"path": "b.py"}
+    )
+
+    assert len(requests) == 2
+    metrics = cache.metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["stored"]) == (2, 2, 2)
+
+
+@pytest.mark.anyio
+async def test_key_fields_select_part_of_tool_input() -> None:
+    cache = HookDecisionCache(max_hooks=8)
+    service, requests = _service(cache)
+    hook = _hook(key_fields=["tool_name", "tool_input.command"])
+
+    await service.execute_hook(
+        "PreToolUse", hook, "s1", tool_name="Bash", tool_input={"command": "ls"}
+    )
+    await service.execute_hook(
+        "PreToolUse",
+        hook,
+        "s2",
+        tool_name="Bash",
+        tool_input={"command": "ls", "description": "list files"},
+    )
+
+    assert len(requests) == 1
+
+
+@pytest.mark.anyio
+async def test_no_store_response_is_not_cached() -> None:
+    cache = HookDecisionCache(max_hooks=8)
+    service, requests = _service(cache, cache_control="no-store")
+    hook = _hook()
+
+    for _ in range(2):
+        await service.execute_hook("PreToolUse", hook, "s1", tool_name="Read")
+
+    assert len(requests) == 2
+    assert cache.metrics()["entries"] == 0
+
+
+@pytest.mark.anyio
+async def test_hook_without_opt_in_is_never_cached() -> None:
+    cache = HookDecisionCache(max_hooks=8)
+    service, requests = _service(cache)
+    hook = HookWebhookSchema(url="https://hooks.example.com/pre")
+
+    for _ in range(2):
+        await service.execute_hook("PreToolUse", hook, "s1", tool_name="Read")
+
+    assert len(requests) == 2
+    assert cache.metrics()["misses"] == 0
+
+
+@pytest.mark.anyio
+async def test_max_entries_evicts_least_recent() -> None:
+    cache = HookDecisionCache(max_hooks=8)
+    hook = _hook(max_entries=2)
+
+    for tool in ("A", "B", "C"):
+        await cache.put(hook, {"tool_name": tool}, {"decision": "deny"})
+
+    assert await cache.get(hook, {"tool_name": "A"}) is None
+    assert await cache.get(hook, {"tool_name": "C"}) == {"decision": "deny"}
+    assert cache.metrics()["evicted"] == 1
+
+
+@pytest.mark.anyio
+async def test_redis_backing_shares_decisions_across_instances() -> None:
+    redis = DictCache()
+    hook = _hook(ttl_seconds=120)
+    payload: dict[str, object] = {"tool_name": "Read", "tool_input": {"path": "a"}}
+
+    await HookDecisionCache(8, redis=redis).put(
+        hook, payload, {"decision": "deny"}, "max-age=30"
+    )
+    other = HookDecisionCache(8, redis=redis)
+
+    assert await other.get(hook, payload) == {"decision": "deny"}
+    assert await other.get(hook, payload) == {"decision": "deny"}
+    assert list(redis.ttls.values()) == [30]
+    metrics = other.metrics()
+    assert (metrics["redis_hits"], metrics["hits"]) == (1, 1)
+
+
+def test_decision_cache_rejected_outside_pre_tool_use() -> None:
+    with pytest.raises(ValidationError, match="only supported for PreToolUse"):
+        HooksConfigSchema.model_validate(
+            {
+                "Stop": {
+                    "url": "https://hooks.example.com/stop",
+                    "decision_cache": {},
+                }
+            }
+        )
+
+
+def test_unknown_key_field_rejected() -> None:
+    with pytest.raises(ValidationError, match="Unsupported decision cache key"):
+        _hook(key_fields=["tool_result"])
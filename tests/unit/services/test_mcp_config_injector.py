@@ -154,3 +154,102 @@ async def test_inject_with_request_override(
     # Should have dict with server config
     assert call_args[1]["request_config"] is not None
     assert "request-server" in call_args[1]["request_config"]
+
+
+@pytest.fixture
+def cached_injector(mock_loader: Mock, mock_config_service: Mock) -> McpConfigInjector:
+    """Create injector with an MCP config cache."""
+    from apps.api.services.mcp_config_cache import McpConfigCache
+
+    mock_config_service.get_config_version = AsyncMock(return_value="1")
+    return McpConfigInjector(
+        config_loader=mock_loader,
+        config_service=mock_config_service,
+        cache=McpConfigCache(max_entries=8, ttl_seconds=60),
+    )
+
+
+@pytest.mark.anyio
+async def test_cached_inject_skips_reload_on_hit(
+    cached_injector: McpConfigInjector, mock_loader: Mock, mock_config_service: Mock
+) -> None:
+    """Test repeat injections for one API key reuse the cached merge."""
+    request = QueryRequest(prompt="test query", mcp_servers=None)
+
+    first = await cached_injector.inject(request, api_key="test-api-key")
+    second = await cached_injector.inject(request, api_key="test-api-key")
+
+    assert first.mcp_servers == second.mcp_servers
+    assert second.allowed_tools == ["mcp__merged-server__*"]
+    mock_config_service.list_servers_for_api_key.assert_awaited_once()
+    mock_loader.load_application_config.assert_called_once()
+    mock_loader.merge_configs.assert_called_once()
+    assert mock_config_service.get_config_version.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_cached_inject_reloads_after_version_bump(
+    cached_injector: McpConfigInjector, mock_config_service: Mock
+) -> None:
+    """Test a config write (version bump) invalidates the cached merge."""
+    request = QueryRequest(prompt="test query", mcp_servers=None)
+
+    await cached_injector.inject(request, api_key="test-api-key")
+    mock_config_service.get_config_version.return_value = "2"
+    await cached_injector.inject(request, api_key="test-api-key")
+
+    assert mock_config_service.list_servers_for_api_key.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_cached_inject_merges_request_override_with_cached_tiers(
+    cached_injector: McpConfigInjector, mock_loader: Mock, mock_config_service: Mock
+) -> None:
+    """Test request overrides are merged on top of cached server-side tiers."""
+    from apps.api.schemas.requests.config import McpServerConfigSchema
+
+    await cached_injector.inject(
+        QueryRequest(prompt="test query", mcp_servers=None), api_key="test-api-key"
+    )
+    request = QueryRequest(
+        prompt="test query",
+        mcp_servers={
+            "request-server": McpServerConfigSchema(command="request-cmd", type="stdio")
+        },
+    )
+
+    await cached_injector.inject(request, api_key="test-api-key")
+
+    mock_config_service.list_servers_for_api_key.assert_awaited_once()
+    assert mock_loader.merge_configs.call_count == 2
+    assert "request-server" in mock_loader.merge_configs.call_args[1]["request_config"]
+
+
+def test_mcp_config_cache_expires_and_evicts() -> None:
+    """Test cache entries expire after the TTL and evict least recently used."""
+    from unittest.mock import patch
+
+    from apps.api.services.mcp_config_cache import McpConfigCache, McpConfigCacheEntry
+
+    cache = McpConfigCache(max_entries=2, ttl_seconds=10)
+
+    def entry(loaded_at: float) -> McpConfigCacheEntry:
+        return McpConfigCacheEntry(
+            version="1",
+            loaded_at=loaded_at,
+            application_config={},
+            api_key_config={},
+            merged_schemas={},
+        )
+
+    with patch("apps.api.services.mcp_config_cache.time.monotonic", return_value=100.0):
+        cache.put("a", entry(95.0))
+        cache.put("b", entry(80.0))
+        assert cache.get("a", "1") is not None
+        assert cache.get("b", "1") is None  # expired
+        cache.put("c", entry(100.0))
+        assert cache.get("b", "1") is None  # evicted
+
+    metrics = cache.metrics()
+    assert metrics["entries"] == 2
+    assert metrics["evicted"] == 1
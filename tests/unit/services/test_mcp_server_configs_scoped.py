@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from apps.api.services.mcp_server_configs import McpServerConfigService
+from tests.helpers.cache_pipeline import pipeline_factory
 
 
 @pytest.fixture
@@ -18,6 +19,7 @@ def mock_cache() -> AsyncMock:
     cache.add_to_set = AsyncMock()
     cache.remove_from_set = AsyncMock()
     cache.delete = AsyncMock(return_value=True)
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -142,3 +144,32 @@ async def test_create_server_for_api_key(
     # AND index updated with scoped key
     expected_index = "mcp_servers:index:tenant-xyz"
     mock_cache.add_to_set.assert_called_once_with(expected_index, server_name)
+
+
+@pytest.mark.anyio
+async def test_config_writes_bump_version(
+    service: McpServerConfigService, mock_cache: AsyncMock
+) -> None:
+    """Test create/update/delete bump the per-API-key config version."""
+    mock_cache.incr = AsyncMock(return_value=1)
+
+    await service.create_server_for_api_key(
+        api_key="tenant-xyz",
+        name="new-server",
+        transport_type="stdio",
+        config={"command": "python"},
+    )
+    await service.delete_server_for_api_key("tenant-xyz", "new-server")
+
+    assert mock_cache.incr.await_count == 2
+    mock_cache.incr.assert_awaited_with("mcp_servers:version:tenant-xyz")
+
+
+@pytest.mark.anyio
+async def test_get_config_version_defaults_to_zero(
+    service: McpServerConfigService, mock_cache: AsyncMock
+) -> None:
+    """Test an API key with no writes reports version "0"."""
+    mock_cache.get = AsyncMock(return_value=None)
+
+    assert await service.get_config_version("tenant-xyz") == "0"
@@ -0,0 +1,334 @@
+"""Unit tests for the background memory extraction queue."""
+
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from apps.api.services.agent.handlers import MessageHandler
+from apps.api.services.agent.query_executor import QueryExecutor
+from apps.api.services.memory_extraction import (
+    DEAD_LETTER_KEY,
+    QUEUE_KEY,
+    MemoryExtractionQueue,
+)
+from apps.api.types import JsonValue
+from apps.api.utils.crypto import hash_api_key
+from tests.helpers.cache_pipeline import SequentialPipeline
+
+
+class FakeRedis:
+    """In-memory cache implementing the JSON, sorted-set and lock calls used."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    def pipeline(self, *, transaction: bool = True) -> SequentialPipeline:
+        return SequentialPipeline(self)
+
+    async def set_json(
+        self, key: str, value: dict[str, JsonValue], ttl: int | None = None
+    ) -> bool:
+        self.store[key] = json.dumps(value)
+        return True
+
+    async def get_many_json(self, keys: list[str]) -> list[dict[str, JsonValue] | None]:
+        return [json.loads(self.store[k]) if k in self.store else None for k in keys]
+
+    async def delete(self, key: str) -> bool:
+        return self.store.pop(key, None) is not None
+
+    async def add_to_sorted_set(self, key: str, member: str, score: float) -> bool:
+        self.zsets.setdefault(key, {})[member] = score
+        return True
+
+    async def remove_from_sorted_set(self, key: str, *members: str) -> int:
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(m, None) is not None for m in members)
+
+    async def remove_from_sorted_set_by_score(
+        self, key: str, min_score: float | str, max_score: float | str
+    ) -> int:
+        zset = self.zsets.get(key, {})
+        doomed = [
+            m for m, s in zset.items() if float(min_score) <= s <= float(max_score)
+        ]
+        return sum(zset.pop(m) is not None for m in doomed)
+
+    async def sorted_set_score(self, key: str, member: str) -> float | None:
+        return self.zsets.get(key, {}).get(member)
+
+    async def sorted_set_range_by_score(
+        self,
+        key: str,
+        min_score: float | str,
+        max_score: float | str,
+        *,
+        descending: bool = False,
+        count: int | None = None,
+    ) -> list[tuple[str, float]]:
+        rows = sorted(
+            (
+                item
+                for item in self.zsets.get(key, {}).items()
+                if item[1] <= float(max_score)
+            ),
+            key=lambda item: item[1],
+        )
+        return rows[:count]
+
+    async def acquire_lock(
+        self, key: str, ttl: int = 300, value: str | None = None
+    ) -> str | None:
+        if key in self.store:
+            return None
+        self.store[key] = value or uuid4().hex
+        return self.store[key]
+
+    async def release_lock(self, key: str, value: str) -> bool:
+        if self.store.get(key) != value:
+            return False
+        del self.store[key]
+        return True
+
+
+class RecordingMemory:
+    """Memory service recording add_memory calls, failing the first N."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.calls: list[dict[str, object]] = []
+
+    async def add_memory(self, **kwargs: object) -> list[object]:
+        self.calls.append(kwargs)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("mem0 unavailable")
+        return []
+
+
+def _queue(
+    redis: FakeRedis, memory: RecordingMemory, **kwargs: object
+) -> MemoryExtractionQueue:
+    async def factory() -> RecordingMemory:
+        return memory
+
+    options: dict[str, object] = {
+        "workers": 1,
+        "poll_interval_seconds": 0.01,
+        "retry_backoff_seconds": 0,
+        **kwargs,
+    }
+    return MemoryExtractionQueue(redis, factory, **options)  # type: ignore[arg-type]
+
+
+async def _wait_until_idle(redis: FakeRedis) -> None:
+    for _ in range(200):
+        if not redis.zsets.get(QUEUE_KEY):
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("queue did not drain")
+
+
+async def _wait_for(predicate: Callable[[], bool]) -> None:
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.anyio
+async def test_jobs_are_batched_per_user() -> None:
+    redis = FakeRedis()
+    memory = RecordingMemory()
+    queue = _queue(redis, memory)
+
+    await queue.enqueue("u1", "User: a", {"session_id": "s1", "source": "query"})
+    await queue.enqueue("u1", "User: b", {"session_id": "s2", "source": "query"})
+    await queue.enqueue("u2", "User: c", {"session_id": "s3", "source": "query"})
+    queue.start()
+    await _wait_until_idle(redis)
+    await queue.close()
+
+    by_user = {call["user_id"]: call for call in memory.calls}
+    assert by_user["u1"]["messages"] == "User: a\n\nUser: b"
+    assert by_user["u1"]["metadata"] == {
+        "session_id": "s2",
+        "source": "query",
+        "session_ids": ["s1", "s2"],
+    }
+    assert by_user["u2"]["metadata"] == {"session_id": "s3", "source": "query"}
+    assert redis.store == {}
+    metrics = queue.metrics()
+    assert (metrics["processed"], metrics["batches"]) == (3, 2)
+
+
+@pytest.mark.anyio
+async def test_failed_extraction_is_retried() -> None:
+    redis = FakeRedis()
+    memory = RecordingMemory(failures=1)
+    queue = _queue(redis, memory)
+    queue.start()
+
+    await queue.enqueue("u1", "User: a", {"session_id": "s1"})
+    await _wait_until_idle(redis)
+    await queue.close()
+
+    assert len(memory.calls) == 2
+    metrics = queue.metrics()
+    assert (metrics["retried"], metrics["processed"], metrics["failed"]) == (1, 1, 0)
+
+
+@pytest.mark.anyio
+async def test_exhausted_job_is_dead_lettered() -> None:
+    redis = FakeRedis()
+    memory = RecordingMemory(failures=5)
+    queue = _queue(redis, memory, max_attempts=2)
+    queue.start()
+
+    job_id = await queue.enqueue("u1", "User: a", {"session_id": "s1"})
+    await _wait_until_idle(redis)
+    await queue.close()
+
+    assert list(redis.zsets[DEAD_LETTER_KEY]) == [job_id]
+    job = json.loads(redis.store[f"memory_extraction:job:{job_id}"])
+    assert (job["attempts"], job["last_error"]) == (2, "mem0 unavailable")
+    assert queue.metrics()["failed"] == 1
+
+
+@pytest.mark.anyio
+async def test_dead_letters_older_than_job_ttl_are_trimmed() -> None:
+    redis = FakeRedis()
+    week_ago = time.time() - 7 * 24 * 3600
+    redis.zsets[DEAD_LETTER_KEY] = {"expired": week_ago - 60, "recent": week_ago + 60}
+    memory = RecordingMemory(failures=1)
+    queue = _queue(redis, memory, max_attempts=1)
+    queue.start()
+
+    job_id = await queue.enqueue("u1", "User: a", {"session_id": "s1"})
+    await _wait_until_idle(redis)
+    await queue.close()
+
+    assert sorted(redis.zsets[DEAD_LETTER_KEY]) == sorted([job_id, "recent"])
+
+
+@pytest.mark.anyio
+async def test_jobs_survive_restart_and_expired_claims_are_retried() -> None:
+    redis = FakeRedis()
+    first = _queue(redis, RecordingMemory())
+    job_id = await first.enqueue("u1", "User: a", {"session_id": "s1"})
+    # Simulate an instance that claimed the job and then crashed; the claim
+    # lock has since expired
+    await redis.acquire_lock(f"memory_extraction:claim:{job_id}")
+    await redis.delete(f"memory_extraction:claim:{job_id}")
+
+    memory = RecordingMemory()
+    restarted = _queue(redis, memory)
+    restarted.start()
+    await _wait_until_idle(redis)
+    await restarted.close()
+
+    assert [call["messages"] for call in memory.calls] == ["User: a"]
+
+
+@pytest.mark.anyio
+async def test_claimed_job_is_skipped() -> None:
+    redis = FakeRedis()
+    memory = RecordingMemory()
+    queue = _queue(redis, memory)
+    job_id = await queue.enqueue("u1", "User: a", {"session_id": "s1"})
+    await redis.acquire_lock(f"memory_extraction:claim:{job_id}")
+
+    queue.start()
+    await asyncio.sleep(0.05)
+    await queue.close()
+
+    assert memory.calls == []
+    assert job_id in redis.zsets[QUEUE_KEY]
+
+
+@pytest.mark.anyio
+async def test_claimed_job_is_hidden_until_visibility_timeout() -> None:
+    redis = FakeRedis()
+    memory = RecordingMemory()
+    release = asyncio.Event()
+
+    async def slow_add_memory(**kwargs: object) -> list[object]:
+        memory.calls.append(kwargs)
+        await release.wait()
+        return []
+
+    memory.add_memory = slow_add_memory  # type: ignore[method-assign]
+    queue = _queue(redis, memory, visibility_timeout_seconds=300)
+    job_id = await queue.enqueue("u1", "User: a", {"session_id": "s1"})
+    queue.start()
+    await _wait_for(lambda: bool(memory.calls))
+
+    assert redis.zsets[QUEUE_KEY][job_id] > time.time() + 250
+    release.set()
+    await _wait_until_idle(redis)
+    await queue.close()
+
+
+@pytest.mark.anyio
+async def test_worker_survives_processing_errors() -> None:
+    redis = FakeRedis()
+    memory = RecordingMemory()
+    factory_failures = [RuntimeError("factory down")]
+
+    async def factory() -> RecordingMemory:
+        if factory_failures:
+            raise factory_failures.pop()
+        return memory
+
+    queue = MemoryExtractionQueue(
+        redis,  # type: ignore[arg-type]
+        factory,  # type: ignore[arg-type]
+        workers=1,
+        poll_interval_seconds=0.01,
+    )
+    first = await queue.enqueue("u1", "User: a", {"session_id": "s1"})
+    queue.start()
+    await _wait_for(lambda: queue.metrics()["errors"] > 0)
+
+    await queue.enqueue("u2", "User: b", {"session_id": "s2"})
+    await _wait_for(lambda: bool(memory.calls))
+    await queue.close()
+
+    assert [call["messages"] for call in memory.calls] == ["User: b"]
+    assert queue.metrics()["errors"] == 1
+    # The failed claim stays hidden until its visibility timeout expires
+    assert redis.zsets[QUEUE_KEY][first] > time.time()
+
+
+@pytest.mark.anyio
+async def test_query_executor_enqueues_instead_of_extracting() -> None:
+    redis = FakeRedis()
+    memory = RecordingMemory()
+    queue = _queue(redis, memory)
+    executor = QueryExecutor(MessageHandler(), extraction_queue=queue)
+    request = MagicMock(prompt="hi")
+
+    event = await executor._extract_memory(
+        request,
+        ["hello"],
+        memory,  # type: ignore[arg-type]
+        "key",
+        "s1",
+    )
+
+    assert event is None
+    assert memory.calls == []
+    [job_json] = [
+        v for k, v in redis.store.items() if k.startswith("memory_extraction:job:")
+    ]
+    job = json.loads(job_json)
+    assert job["user_id"] == hash_api_key("key")
+    assert job["messages"] == "User: hi\n\nAssistant: hello"
+    assert job["metadata"] == {"session_id": "s1", "source": "query"}
@@ -0,0 +1,135 @@
+"""Unit tests for the per-user memory search cache."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from apps.api.protocols import MemoryProtocol
+from apps.api.services.memory import MemoryService
+from apps.api.services.memory_search_cache import MemorySearchCache
+
+
+class CounterCache:
+    """Minimal Redis stand-in for version counters."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        return str(self.values[key]) if key in self.values else None
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+def _client() -> AsyncMock:
+    client = AsyncMock(spec=MemoryProtocol)
+    client.search.return_value = [
+        {"id": "m1", "memory": "Prefers Python", "score": 0.9, "metadata": {}}
+    ]
+    return client
+
+
+@pytest.mark.anyio
+async def test_normalized_repeat_search_is_served_from_cache() -> None:
+    client = _client()
+    cache = MemorySearchCache(max_entries=8, ttl_seconds=60)
+    service = MemoryService(client, search_cache=cache)
+
+    first = await service.format_memory_context("What do I like?", "u1")
+    second = await service.format_memory_context("  what do I  LIKE? ", "u1")
+    await service.format_memory_context("What do I like?", "u2")
+    await service.search_memories("What do I like?", "u1", limit=5, enable_graph=False)
+
+    assert first == second == "RELEVANT MEMORIES:\n- Prefers Python"
+    assert client.search.await_count == 3
+    metrics = cache.metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["entries"]) == (1, 3, 3)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [
+        ("add_memory", {"messages": "User: hi"}),
+        ("delete_memory", {"memory_id": "m1"}),
+        ("delete_all_memories", {}),
+    ],
+)
+async def test_memory_writes_invalidate_only_that_user(
+    method: str, kwargs: dict[str, str]
+) -> None:
+    client = _client()
+    cache = MemorySearchCache(max_entries=8, ttl_seconds=60)
+    service = MemoryService(client, search_cache=cache)
+    await service.search_memories("q", "u1")
+    await service.search_memories("q", "u2")
+
+    await getattr(service, method)(user_id="u1", **kwargs)
+    await service.search_memories("q", "u1")
+    await service.search_memories("q", "u2")
+
+    assert client.search.await_count == 3
+    assert cache.metrics()["invalidations"] == 1
+
+
+@pytest.mark.anyio
+async def test_failed_add_still_invalidates() -> None:
+    client = _client()
+    client.add.side_effect = RuntimeError("mem0 down")
+    cache = MemorySearchCache(max_entries=8, ttl_seconds=60)
+    service = MemoryService(client, search_cache=cache)
+    await service.search_memories("q", "u1")
+
+    with pytest.raises(RuntimeError):
+        await service.add_memory("User: hi", "u1")
+    await service.search_memories("q", "u1")
+
+    assert client.search.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_shared_versions_invalidate_other_instances() -> None:
+    versions = CounterCache()
+    client = _client()
+    reader = MemoryService(
+        client, search_cache=MemorySearchCache(8, 60, versions=versions)
+    )
+    writer = MemoryService(
+        _client(), search_cache=MemorySearchCache(8, 60, versions=versions)
+    )
+    await reader.search_memories("q", "u1")
+    await reader.search_memories("q", "u1")
+
+    await writer.add_memory("User: hi", "u1")
+    await reader.search_memories("q", "u1")
+
+    assert client.search.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_expired_entry_is_searched_again() -> None:
+    client = _client()
+    service = MemoryService(
+        client, search_cache=MemorySearchCache(max_entries=8, ttl_seconds=0)
+    )
+
+    await service.search_memories("q", "u1")
+    await service.search_memories("q", "u1")
+
+    assert client.search.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_version_lookup_failure_bypasses_cache() -> None:
+    versions = AsyncMock()
+    versions.get.side_effect = ConnectionError("redis down")
+    client = _client()
+    cache = MemorySearchCache(8, 60, versions=versions)
+    service = MemoryService(client, search_cache=cache)
+
+    results = await service.search_memories("q", "u1")
+
+    assert results[0]["id"] == "m1"
+    assert cache.metrics()["entries"] == 0
@@ -0,0 +1,130 @@
+"""Unit tests for the shared GCRA rate limiter."""
+
+import pytest
+
+from apps.api.protocols import RateLimitGrant
+from apps.api.services.rate_limiter import RateLimiter
+
+
+class TokenCache:
+    """Bucket of tokens per key that never refills; counts Redis calls."""
+
+    def __init__(self, tokens: int, *, fail: bool = False) -> None:
+        self.tokens: dict[str, int] = {}
+        self.initial = tokens
+        self.fail = fail
+        self.calls: list[tuple[str, int, int, int]] = []
+
+    async def gcra_acquire(
+        self, key: str, emission_interval_ms: int, burst: int, requested: int = 1
+    ) -> RateLimitGrant:
+        self.calls.append((key, emission_interval_ms, burst, requested))
+        if self.fail:
+            raise ConnectionError("redis down")
+        available = self.tokens.setdefault(key, min(self.initial, burst))
+        granted = min(requested, available)
+        self.tokens[key] = available - granted
+        return RateLimitGrant(
+            granted=granted,
+            remaining=self.tokens[key],
+            retry_after_ms=0 if granted else 30_000,
+            reset_after_ms=60_000,
+        )
+
+
+def _limiter(cache: TokenCache, **kwargs: object) -> RateLimiter:
+    options: dict[str, object] = {"burst": 20, "lease_ttl_seconds": 60, **kwargs}
+    return RateLimiter(
+        cache,  # type: ignore[arg-type]
+        {"query": 10, "session": 30, "general": 100},
+        **options,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.anyio
+async def test_each_request_claims_one_token_without_leases() -> None:
+    cache = TokenCache(tokens=100)
+    limiter = _limiter(cache)
+
+    decision = await limiter.acquire("query", "key:abc")
+
+    assert decision is not None
+    assert decision.allowed
+    assert decision.limit == 10
+    assert decision.remaining == 9
+    # Burst is capped at the per-minute limit, one token every 6s
+    assert cache.calls == [("ratelimit:query:key:abc", 6000, 10, 1)]
+
+
+@pytest.mark.anyio
+async def test_denied_key_is_not_rechecked_until_retry_time() -> None:
+    cache = TokenCache(tokens=1)
+    limiter = _limiter(cache)
+
+    first = await limiter.acquire("query", "key:abc")
+    second = await limiter.acquire("query", "key:abc")
+    third = await limiter.acquire("query", "key:abc")
+
+    assert first is not None
+    assert first.allowed
+    assert second is not None
+    assert not second.allowed
+    assert second.retry_after_seconds == 30
+    assert third is not None
+    assert not third.allowed
+    assert len(cache.calls) == 2
+    metrics = limiter.metrics()
+    assert metrics["limited"] == 2
+    assert metrics["local_denials"] == 1
+    assert metrics["keys"]["query:key:abc"] == {"allowed": 1, "limited": 2}
+
+
+@pytest.mark.anyio
+async def test_lease_mode_spends_claimed_tokens_locally() -> None:
+    cache = TokenCache(tokens=100)
+    limiter = _limiter(cache, lease_size=5)
+
+    decisions = [await limiter.acquire("general", "key:abc") for _ in range(6)]
+
+    assert all(d is not None and d.allowed for d in decisions)
+    assert [call[3] for call in cache.calls] == [5, 5]
+    assert [d.remaining for d in decisions if d is not None][:5] == [
+        19,
+        18,
+        17,
+        16,
+        15,
+    ]
+    metrics = limiter.metrics()
+    assert metrics["redis_calls"] == 2
+    assert metrics["lease_hits"] == 4
+
+
+@pytest.mark.anyio
+async def test_expired_lease_is_forfeited() -> None:
+    cache = TokenCache(tokens=100)
+    limiter = _limiter(cache, lease_size=5, lease_ttl_seconds=0)
+
+    await limiter.acquire("general", "key:abc")
+    await limiter.acquire("general", "key:abc")
+
+    assert len(cache.calls) == 2
+    assert limiter.metrics()["lease_hits"] == 0
+
+
+@pytest.mark.anyio
+async def test_backend_error_fails_open() -> None:
+    limiter = _limiter(TokenCache(tokens=100, fail=True))
+
+    assert await limiter.acquire("session", "ip:10.0.0.1") is None
+    assert limiter.metrics()["errors"] == 1
+
+
+@pytest.mark.anyio
+async def test_tracked_keys_are_bounded() -> None:
+    limiter = _limiter(TokenCache(tokens=100), max_tracked_keys=2)
+
+    for client in ("a", "b", "c"):
+        await limiter.acquire("general", f"key:{client}")
+
+    assert list(limiter.metrics()["keys"]) == ["general:key:b", "general:key:c"]
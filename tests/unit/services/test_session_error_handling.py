@@ -14,6 +14,7 @@ from sqlalchemy.exc import OperationalError
 
 from apps.api.exceptions.base import APIError
 from apps.api.services.session import SessionService
+from tests.helpers.cache_pipeline import pipeline_factory
 
 # ===== Task #3: Redis Failure Masking Tests =====
 
@@ -23,6 +24,7 @@ def mock_cache_connection_error():
     """Mock cache that raises ConnectionError."""
     cache = AsyncMock()
     cache.set_json = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -31,6 +33,7 @@ def mock_cache_timeout_error():
     """Mock cache that raises TimeoutError."""
     cache = AsyncMock()
     cache.set_json = AsyncMock(side_effect=TimeoutError("Redis timeout"))
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -39,6 +42,7 @@ def mock_cache_value_error():
     """Mock cache that raises ValueError (serialization error)."""
     cache = AsyncMock()
     cache.set_json = AsyncMock(side_effect=ValueError("Serialization error"))
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -101,6 +105,7 @@ def mock_cache_miss():
     """Mock cache that returns None (cache miss)."""
     cache = AsyncMock()
     cache.get_json = AsyncMock(return_value=None)
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -172,6 +177,7 @@ def mock_cache_corrupted():
         }
     )
     cache.delete = AsyncMock()
+    cache.pipeline = pipeline_factory(cache)
     return cache
 
 
@@ -250,6 +256,7 @@ async def test_delete_session_with_invalid_uuid_format() -> None:
     """
     mock_cache = AsyncMock()
     mock_cache.get_json = AsyncMock(return_value=None)  # No cached session
+    mock_cache.pipeline = pipeline_factory(mock_cache)
     mock_db_repo = AsyncMock()
     mock_db_repo.get = AsyncMock(side_effect=ValueError("Invalid UUID string"))
 
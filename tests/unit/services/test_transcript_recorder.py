@@ -0,0 +1,162 @@
+"""Unit tests for the write-behind transcript recorder."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Sequence
+from uuid import UUID, uuid4
+
+import pytest
+
+from apps.api.exceptions.base import APIError
+from apps.api.services import transcript_recorder as recorder_module
+from apps.api.services.transcript_recorder import TranscriptRecorder
+
+
+class FakeRepository:
+    """Records add_messages batches; can fail or block on demand."""
+
+    batches: list[list[dict[str, object]]] = []
+    errors: list[APIError] = []
+    missing_sessions: set[UUID] = set()
+    gate: asyncio.Event | None = None
+
+    def __init__(self, _db: object) -> None:
+        pass
+
+    async def add_messages(self, messages: Sequence[dict[str, object]]) -> int:
+        if FakeRepository.gate is not None:
+            await FakeRepository.gate.wait()
+        if FakeRepository.errors:
+            raise FakeRepository.errors.pop(0)
+        missing = FakeRepository.missing_sessions
+        if any(row["session_id"] in missing for row in messages):
+            raise APIError("violates constraints", "ALREADY_EXISTS", 409)
+        FakeRepository.batches.append(list(messages))
+        return len(messages)
+
+
+@contextlib.asynccontextmanager
+async def _session_maker() -> AsyncIterator[object]:
+    yield object()
+
+
+@pytest.fixture(autouse=True)
+def fake_repository(monkeypatch: pytest.MonkeyPatch) -> type[FakeRepository]:
+    FakeRepository.batches = []
+    FakeRepository.errors = []
+    FakeRepository.missing_sessions = set()
+    FakeRepository.gate = None
+    monkeypatch.setattr(recorder_module, "SessionRepository", FakeRepository)
+    return FakeRepository
+
+
+def _recorder(**kwargs: object) -> TranscriptRecorder:
+    options: dict[str, object] = {
+        "max_size": 100,
+        "batch_size": 100,
+        "flush_interval_seconds": 0.01,
+        "backpressure_timeout_seconds": 1.0,
+        "max_attempts": 3,
+        "retry_backoff_seconds": 0,
+        **kwargs,
+    }
+    return TranscriptRecorder(_session_maker, **options)  # type: ignore[arg-type]
+
+
+@pytest.mark.anyio
+async def test_rows_are_written_in_batches_in_order() -> None:
+    recorder = _recorder(batch_size=2)
+    recorder.start()
+    session_id = str(uuid4())
+
+    for i in range(5):
+        assert await recorder.record(session_id, "assistant", {"n": i})
+    await recorder.close()
+
+    assert [len(batch) for batch in FakeRepository.batches] == [2, 2, 1]
+    rows = [row for batch in FakeRepository.batches for row in batch]
+    assert [row["content"] for row in rows] == [{"n": i} for i in range(5)]
+    assert all(row["session_id"] == UUID(session_id) for row in rows)
+    created = [row["created_at"] for row in rows]
+    assert created == sorted(created)
+    metrics = recorder.metrics()
+    assert metrics["written"] == 5
+    assert metrics["batches"] == 3
+
+
+@pytest.mark.anyio
+async def test_partial_batch_is_flushed_after_interval() -> None:
+    recorder = _recorder(batch_size=100, flush_interval_seconds=0.01)
+    recorder.start()
+
+    await recorder.record(str(uuid4()), "user", {"text": "hi"})
+    await asyncio.sleep(0.1)
+
+    assert len(FakeRepository.batches) == 1
+    await recorder.close()
+
+
+@pytest.mark.anyio
+async def test_full_buffer_applies_backpressure_then_drops() -> None:
+    FakeRepository.gate = asyncio.Event()
+    recorder = _recorder(max_size=1, batch_size=1, backpressure_timeout_seconds=0.05)
+    recorder.start()
+    session_id = str(uuid4())
+
+    # First row is taken by the blocked flusher, second fills the buffer
+    assert await recorder.record(session_id, "assistant", {"n": 0})
+    await asyncio.sleep(0)
+    assert await recorder.record(session_id, "assistant", {"n": 1})
+    assert not await recorder.record(session_id, "assistant", {"n": 2})
+    assert recorder.metrics()["dropped"] == 1
+
+    FakeRepository.gate.set()
+    await recorder.close()
+    assert recorder.metrics()["written"] == 2
+
+
+@pytest.mark.anyio
+async def test_unavailable_database_is_retried() -> None:
+    FakeRepository.errors = [
+        APIError("Database temporarily unavailable", "DATABASE_UNAVAILABLE", 503)
+    ]
+    recorder = _recorder()
+    recorder.start()
+
+    await recorder.record(str(uuid4()), "assistant", {})
+    await recorder.close()
+
+    metrics = recorder.metrics()
+    assert metrics["retries"] == 1
+    assert metrics["written"] == 1
+    assert metrics["failed"] == 0
+
+
+@pytest.mark.anyio
+async def test_missing_session_only_fails_its_own_rows() -> None:
+    missing, present = uuid4(), uuid4()
+    FakeRepository.missing_sessions = {missing}
+    recorder = _recorder(batch_size=10, flush_interval_seconds=0.05)
+    recorder.start()
+
+    await recorder.record(str(present), "user", {"n": 0})
+    await recorder.record(str(missing), "user", {"n": 1})
+    await recorder.record(str(present), "assistant", {"n": 2})
+    await recorder.close()
+
+    rows = [row for batch in FakeRepository.batches for row in batch]
+    assert [row["content"] for row in rows] == [{"n": 0}, {"n": 2}]
+    metrics = recorder.metrics()
+    assert metrics["failed"] == 1
+    assert metrics["retries"] == 0
+
+
+@pytest.mark.anyio
+async def test_record_rejects_non_uuid_session_and_closed_recorder() -> None:
+    recorder = _recorder()
+    recorder.start()
+
+    assert not await recorder.record("not-a-uuid", "user", {})
+    await recorder.close()
+    assert not await recorder.record(str(uuid4()), "user", {})
+    assert recorder.metrics()["dropped"] == 2
@@ -0,0 +1,168 @@
+"""Unit tests for the background webhook delivery queue."""
+
+import json
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from apps.api.schemas.requests.config import HookWebhookSchema
+from apps.api.services.webhook import WebhookService
+from apps.api.services.webhook_delivery import (
+    OverflowPolicy,
+    WebhookDelivery,
+    WebhookDeliveryQueue,
+)
+from apps.api.services.webhook_http import WebhookHttpPool
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _pool(handler: Handler) -> WebhookHttpPool:
+    return WebhookHttpPool(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_connections=10,
+        max_connections_per_host=10,
+    )
+
+
+def _recorder(
+    statuses: list[int] | None = None,
+) -> tuple[Handler, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+    pending = list(statuses or [])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        status = pending.pop(0) if pending else 200
+        return httpx.Response(status, json={"acknowledged": True})
+
+    return handler, requests
+
+
+def _queue(
+    handler: Handler,
+    *,
+    max_size: int = 100,
+    max_batch_size: int = 1,
+    overflow: OverflowPolicy = "drop_newest",
+) -> WebhookDeliveryQueue:
+    return WebhookDeliveryQueue(
+        _pool(handler),
+        max_size=max_size,
+        workers=1,
+        max_batch_size=max_batch_size,
+        max_attempts=3,
+        retry_backoff_seconds=0,
+        overflow=overflow,
+    )
+
+
+def _delivery(
+    url: str = "https://hooks.example.com/post", n: int = 0
+) -> WebhookDelivery:
+    return WebhookDelivery(hook_event="PostToolUse", url=url, payload={"n": n})
+
+
+@pytest.mark.anyio
+async def test_observational_hooks_are_queued_and_pre_tool_use_is_not() -> None:
+    handler, requests = _recorder()
+    queue = _queue(handler)
+    queue.start()
+    service = WebhookService(http_pool=_pool(handler), delivery_queue=queue)
+    hook = HookWebhookSchema(url="https://hooks.example.com/hook")
+
+    post = await service.execute_hook("PostToolUse", hook, "s1", tool_name="Read")
+    assert post == {"acknowledged": True, "queued": True}
+    assert requests == []
+
+    pre = await service.execute_hook("PreToolUse", hook, "s1", tool_name="Read")
+    assert pre == {"acknowledged": True}
+    assert len(requests) == 1
+
+    await queue.close()
+    assert [json.loads(r.content)["hook_event"] for r in requests] == [
+        "PreToolUse",
+        "PostToolUse",
+    ]
+    assert queue.metrics()["delivered"] == 1
+
+
+@pytest.mark.anyio
+async def test_events_to_the_same_url_are_batched() -> None:
+    handler, requests = _recorder()
+    queue = _queue(handler, max_batch_size=10)
+    queue.start()
+
+    for n in range(3):
+        queue.submit(_delivery(n=n))
+    queue.submit(_delivery(url="https://other.example.com/post", n=9))
+    await queue.close()
+
+    bodies = {str(r.url): json.loads(r.content) for r in requests}
+    assert bodies == {
+        "https://hooks.example.com/post": {"events": [{"n": 0}, {"n": 1}, {"n": 2}]},
+        "https://other.example.com/post": {"n": 9},
+    }
+    metrics = queue.metrics()
+    assert (metrics["delivered"], metrics["batches"]) == (4, 2)
+
+
+@pytest.mark.anyio
+async def test_transient_failures_are_retried() -> None:
+    handler, requests = _recorder([503, 429])
+    queue = _queue(handler)
+    queue.start()
+
+    queue.submit(_delivery())
+    await queue.close()
+
+    assert len(requests) == 3
+    metrics = queue.metrics()
+    assert (metrics["delivered"], metrics["retries"], metrics["failed"]) == (1, 2, 0)
+
+
+@pytest.mark.anyio
+async def test_client_errors_are_not_retried() -> None:
+    handler, requests = _recorder([400])
+    queue = _queue(handler)
+    queue.start()
+
+    queue.submit(_delivery())
+    await queue.close()
+
+    assert len(requests) == 1
+    assert queue.metrics()["failed"] == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("overflow", "third_queued", "delivered"),
+    [("drop_newest", False, [0, 1]), ("drop_oldest", True, [1, 2])],
+)
+async def test_overflow_policy(
+    overflow: OverflowPolicy, third_queued: bool, delivered: list[int]
+) -> None:
+    handler, requests = _recorder()
+    queue = _queue(handler, max_size=2, overflow=overflow)
+
+    assert queue.submit(_delivery(n=0))
+    assert queue.submit(_delivery(n=1))
+    assert queue.submit(_delivery(n=2)) is third_queued
+    queue.start()
+    await queue.close()
+
+    assert [json.loads(r.content)["n"] for r in requests] == delivered
+    assert queue.metrics()["dropped"] == 1
+
+
+@pytest.mark.anyio
+async def test_submit_after_close_is_dropped() -> None:
+    handler, requests = _recorder()
+    queue = _queue(handler)
+    queue.start()
+    await queue.close()
+
+    assert queue.submit(_delivery()) is False
+    assert requests == []
+    assert queue.metrics()["dropped"] == 1
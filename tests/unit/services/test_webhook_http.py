@@ -0,0 +1,112 @@
+"""Unit tests for the shared webhook HTTP pool."""
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from apps.api.config import Settings
+from apps.api.dependencies import (
+    AppState,
+    close_webhook_http_pool,
+    init_webhook_http_pool,
+)
+from apps.api.schemas.requests.config import HookWebhookSchema
+from apps.api.services.webhook import WebhookService
+from apps.api.services.webhook_http import WebhookHttpPool
+
+
+def _pool(
+    handler: httpx.MockTransport, *, per_host: int = 10
+) -> tuple[WebhookHttpPool, httpx.AsyncClient]:
+    client = httpx.AsyncClient(transport=handler)
+    pool = WebhookHttpPool(
+        client, max_connections=100, max_connections_per_host=per_host
+    )
+    return pool, client
+
+
+@pytest.mark.anyio
+async def test_hook_calls_share_pooled_client_and_record_latency() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/broken":
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json={"decision": "allow"})
+
+    pool, client = _pool(httpx.MockTransport(handler))
+    service = WebhookService(http_pool=pool)
+    ok_hook = HookWebhookSchema(url="https://hooks.example.com/ok")
+    broken_hook = HookWebhookSchema(url="https://hooks.example.com/broken")
+
+    await service.execute_hook("PreToolUse", ok_hook, "s1", tool_name="Bash")
+    await service.execute_hook("PreToolUse", broken_hook, "s1", tool_name="Bash")
+    denied = await service.execute_hook("PreToolUse", broken_hook, "s1")
+    await service.execute_hook("Stop", ok_hook, "s1")
+
+    assert len(requests) == 4
+    assert denied["decision"] == "deny"
+    metrics = pool.metrics()
+    assert metrics["hosts"] == 1
+    assert metrics["in_flight"] == 0
+    assert list(metrics["hooks"]) == ["PreToolUse", "Stop"]
+    pre = metrics["hooks"]["PreToolUse"]
+    assert pre["count"] == 3
+    assert pre["errors"] == 2
+    assert pre["buckets"]["+Inf"] == 3
+    assert metrics["hooks"]["Stop"]["errors"] == 0
+
+    await pool.close()
+    assert client.is_closed
+
+
+@pytest.mark.anyio
+async def test_concurrent_requests_are_capped_per_host() -> None:
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        return httpx.Response(200, json={})
+
+    pool, _ = _pool(httpx.MockTransport(handler), per_host=2)
+
+    await asyncio.gather(
+        *(
+            pool.post(f"https://{host}/hook", content=b"{}", headers={}, timeout=5)
+            for host in ["a.example.com"] * 6 + ["b.example.com"] * 6
+        )
+    )
+
+    assert peak == {"a.example.com": 2, "b.example.com": 2}
+    await pool.close()
+
+
+def test_http2_falls_back_when_h2_is_missing() -> None:
+    settings = Settings(webhook_http2=True, webhook_max_connections_per_host=3)
+
+    with patch.dict(sys.modules, {"h2": None}):
+        pool = WebhookHttpPool.from_settings(settings)
+
+    metrics = pool.metrics()
+    assert metrics["http2"] is False
+    assert metrics["max_connections_per_host"] == 3
+
+
+@pytest.mark.anyio
+async def test_lifespan_helpers_own_the_pool() -> None:
+    state = AppState()
+
+    pool = init_webhook_http_pool(state, Settings(webhook_http2=False))
+
+    assert state.webhook_http_pool is pool
+    await close_webhook_http_pool(state)
+    assert state.webhook_http_pool is None
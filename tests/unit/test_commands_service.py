@@ -1,8 +1,11 @@
 """Unit tests for slash commands service."""
 
+import os
+import time
 from pathlib import Path
+from unittest.mock import patch
 
-from apps.api.services.commands import CommandsService
+from apps.api.services.commands import CommandDiscoveryCache, CommandsService
 
 
 class TestCommandsDiscovery:
@@ -69,3 +72,86 @@ class TestCommandExecution:
         result = service.parse_command("regular prompt")
 
         assert result is None
+
+
+class TestCommandDiscoveryCache:
+    """Test the shared command discovery cache."""
+
+    @staticmethod
+    def _make_commands_dir(root: Path, *names: str) -> Path:
+        commands_dir = root / ".claude" / "commands"
+        commands_dir.mkdir(parents=True)
+        for name in names:
+            (commands_dir / f"{name}.md").write_text(f"# {name}")
+        return commands_dir
+
+    def test_repeated_discovery_is_served_from_cache(self, tmp_path: Path) -> None:
+        """Second service for the same path reuses the scanned set."""
+        self._make_commands_dir(tmp_path, "review")
+        cache = CommandDiscoveryCache(max_entries=8, ttl_seconds=60)
+
+        first = CommandsService(tmp_path, cache=cache).discover_command_schemas()
+        second = CommandsService(tmp_path, cache=cache).discover_command_schemas()
+
+        assert [cmd.name for cmd in second] == ["review"]
+        assert first[0] is second[0]
+        assert cache.metrics()["hits"] == 1
+        assert cache.metrics()["misses"] == 1
+
+    def test_directory_mtime_change_invalidates(self, tmp_path: Path) -> None:
+        """Adding a command file is picked up on the next request."""
+        commands_dir = self._make_commands_dir(tmp_path, "review")
+        cache = CommandDiscoveryCache(max_entries=8, ttl_seconds=0)
+        assert CommandsService(tmp_path, cache=cache).has_command("review")
+
+        (commands_dir / "deploy.md").write_text("# deploy")
+        os.utime(commands_dir, ns=(0, time.time_ns() + 1_000_000_000))
+
+        service = CommandsService(tmp_path, cache=cache)
+        assert service.has_command("deploy")
+        assert cache.metrics()["misses"] == 2
+
+    def test_missing_directory_is_cached_until_created(self, tmp_path: Path) -> None:
+        """A project without commands caches the empty result."""
+        cache = CommandDiscoveryCache(max_entries=8, ttl_seconds=60)
+        assert CommandsService(tmp_path, cache=cache).discover_commands() == []
+        assert CommandsService(tmp_path, cache=cache).discover_commands() == []
+        assert cache.metrics()["hits"] == 1
+
+        self._make_commands_dir(tmp_path, "lint")
+
+        assert CommandsService(tmp_path, cache=cache).has_command("lint")
+
+    def test_ttl_expiry_forces_rescan(self, tmp_path: Path) -> None:
+        """Entries older than the TTL are rescanned."""
+        self._make_commands_dir(tmp_path, "review")
+        cache = CommandDiscoveryCache(max_entries=8, ttl_seconds=30)
+        service = CommandsService(tmp_path, cache=cache)
+        service.discover_commands()
+
+        with patch(
+            "apps.api.services.commands.time.monotonic",
+            return_value=time.monotonic() + 31,
+        ):
+            CommandsService(tmp_path, cache=cache).discover_commands()
+
+        assert cache.metrics()["misses"] == 2
+
+    def test_lru_eviction_bounds_entries(self, tmp_path: Path) -> None:
+        """Least recently used project paths are evicted past max_entries."""
+        cache = CommandDiscoveryCache(max_entries=2, ttl_seconds=60)
+        projects = [tmp_path / name for name in ("a", "b", "c")]
+        for project in projects:
+            project.mkdir()
+
+        CommandsService(projects[0], cache=cache).discover_commands()
+        CommandsService(projects[1], cache=cache).discover_commands()
+        CommandsService(projects[0], cache=cache).discover_commands()
+        CommandsService(projects[2], cache=cache).discover_commands()
+
+        metrics = cache.metrics()
+        assert metrics["entries"] == 2
+        assert metrics["evicted"] == 1
+        # "a" was used most recently before "c", so "b" was evicted
+        CommandsService(projects[0], cache=cache).discover_commands()
+        assert cache.metrics()["hits"] == 2
@@ -12,6 +12,7 @@ import pytest
 from apps.api.exceptions import SessionNotFoundError
 from apps.api.services.session import SessionService
 from apps.api.types import JsonValue
+from tests.helpers.cache_pipeline import SequentialPipeline
 
 if TYPE_CHECKING:
     from apps.api.protocols import Cache
@@ -28,6 +29,10 @@ class MockCache:
         """Get JSON value from cache."""
         return self._store.get(key)
 
+    def pipeline(self, *, transaction: bool = True) -> SequentialPipeline:
+        """Batch writes, replayed one at a time."""
+        return SequentialPipeline(self)
+
     async def set_json(
         self, key: str, value: dict[str, JsonValue], ttl: int | None = None
     ) -> bool:
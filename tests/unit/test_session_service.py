@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
 import pytest
@@ -9,6 +10,7 @@ import pytest
 from apps.api.exceptions import SessionNotFoundError
 from apps.api.services.session import SessionService
 from apps.api.types import JsonValue
+from tests.helpers.cache_pipeline import SequentialPipeline
 
 
 class MockCache:
@@ -42,6 +44,10 @@ class MockCache:
         """Get JSON value from cache."""
         return self._store.get(key)
 
+    def pipeline(self, *, transaction: bool = True) -> SequentialPipeline:
+        """Batch writes, replayed one at a time."""
+        return SequentialPipeline(self)
+
     async def set_json(
         self, key: str, value: dict[str, JsonValue], ttl: int | None = None
     ) -> bool:
@@ -217,7 +223,9 @@ class TestSessionServiceList:
         session_service: SessionService,
     ) -> None:
         """Test that list_sessions returns empty list when no sessions."""
-        result = await session_service.list_sessions(page=1, page_size=10)
+        result = await session_service.list_sessions(
+            page=1, page_size=10, include_total=True
+        )
 
         assert result.total == 0
         assert result.page == 1
@@ -243,7 +251,9 @@ class TestSessionServiceList:
             owner_api_key="owner-key",
         )
 
-        result = await service.list_sessions(current_api_key="owner-key")
+        result = await service.list_sessions(
+            current_api_key="owner-key", include_total=True
+        )
 
         assert result.total == 1
         assert result.sessions[0].id == "owned-session-1"
@@ -300,14 +310,19 @@ class TestSessionServiceListDbRepo:
         )
 
         repo = MagicMock()
-        repo.list_sessions = AsyncMock(return_value=([fake_session], 1))
+        repo.list_sessions = AsyncMock()
+        repo.list_sessions_keyset = AsyncMock(return_value=([fake_session], False, 1))
 
         service = SessionService(cache=NoScanCache(), db_repo=repo)
-        result = await service.list_sessions(current_api_key="owner-key")
+        result = await service.list_sessions(
+            current_api_key="owner-key", include_total=True
+        )
 
         assert result.total == 1
         assert result.sessions[0].id == str(fake_session.id)
-        repo.list_sessions.assert_called_once()
+        repo.list_sessions_keyset.assert_called_once()
+        assert repo.list_sessions_keyset.call_args.kwargs["include_total"] is True
+        repo.list_sessions.assert_not_called()
 
     @pytest.mark.anyio
     async def test_list_sessions_maps_invalid_status_and_zero_cost(self) -> None:
@@ -329,7 +344,9 @@ class TestSessionServiceListDbRepo:
         )
 
         repo = MagicMock()
-        repo.list_sessions = AsyncMock(return_value=([fake_session], 1))
+        repo.list_sessions_keyset = AsyncMock(
+            return_value=([fake_session], False, None)
+        )
 
         service = SessionService(cache=MockCache(), db_repo=repo)
         result = await service.list_sessions(current_api_key="owner-key")
@@ -366,6 +383,193 @@ class TestSessionServiceListDbRepo:
             search="auth",
         )
 
+    @pytest.mark.anyio
+    async def test_list_sessions_cursor_uses_keyset_query(self) -> None:
+        """Test cursor mode seeks past the cursor and skips the count."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from apps.api.utils.pagination import decode_cursor, encode_cursor
+
+        now = datetime.now(UTC)
+        fake_session = FakeSessionModel(
+            id=uuid4(),
+            model="sonnet",
+            status="active",
+            total_turns=0,
+            total_cost_usd=None,
+            parent_session_id=None,
+            owner_api_key=None,
+            owner_api_key_hash=None,
+            created_at=now,
+            updated_at=now,
+        )
+        repo = MagicMock()
+        repo.list_sessions = AsyncMock()
+        repo.list_sessions_keyset = AsyncMock(return_value=([fake_session], True, None))
+        cursor = encode_cursor(now, uuid4())
+
+        service = SessionService(cache=MockCache(), db_repo=repo)
+        result = await service.list_sessions(
+            current_api_key="owner-key", page_size=1, cursor=cursor, include_total=False
+        )
+
+        repo.list_sessions.assert_not_called()
+        assert repo.list_sessions_keyset.call_args.kwargs["after"] == decode_cursor(
+            cursor
+        )
+        assert result.total is None
+        assert result.next_cursor == encode_cursor(now, fake_session.id)
+
+    @pytest.mark.anyio
+    async def test_list_sessions_first_page_skips_count_by_default(self) -> None:
+        """Test the first page seeks without a cursor and runs no count."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        repo = MagicMock()
+        repo.list_sessions = AsyncMock()
+        repo.list_sessions_keyset = AsyncMock(return_value=([], False, None))
+
+        service = SessionService(cache=MockCache(), db_repo=repo)
+        result = await service.list_sessions(current_api_key="owner-key")
+
+        repo.list_sessions.assert_not_called()
+        kwargs = repo.list_sessions_keyset.call_args.kwargs
+        assert kwargs["after"] is None
+        assert kwargs["include_total"] is False
+        assert result.total is None
+
+    @pytest.mark.anyio
+    async def test_list_sessions_rejects_malformed_cursor(self) -> None:
+        """Test a cursor that does not decode raises a validation error."""
+        from apps.api.exceptions import ValidationError
+
+        service = SessionService(cache=MockCache())
+
+        with pytest.raises(ValidationError):
+            await service.list_sessions(current_api_key="owner-key", cursor="%%%")
+
+    @pytest.mark.anyio
+    async def test_list_sessions_cursor_walks_cached_sessions(self) -> None:
+        """Test next_cursor pages through cache-backed listings without gaps."""
+        service = SessionService(cache=MockCache())
+        for i in range(5):
+            await service.create_session(
+                model="sonnet", session_id=f"s{i}", owner_api_key="owner-key"
+            )
+
+        first = await service.list_sessions(
+            current_api_key="owner-key", page_size=2, include_total=True
+        )
+        seen = [s.id for s in first.sessions]
+        cursor = first.next_cursor
+        while cursor is not None:
+            page = await service.list_sessions(
+                current_api_key="owner-key",
+                page_size=2,
+                cursor=cursor,
+                include_total=False,
+            )
+            assert page.total is None
+            seen.extend(s.id for s in page.sessions)
+            cursor = page.next_cursor
+
+        assert first.total == 5
+        assert sorted(seen) == [f"s{i}" for i in range(5)]
+
+
+@dataclass
+class FakeMessageModel:
+    """Minimal SessionMessage stand-in for transcript reads."""
+
+    id: UUID
+    session_id: UUID
+    message_type: str
+    content: dict[str, object]
+    created_at: datetime
+
+
+class TestSessionServiceTranscript:
+    """Tests for reading persisted session transcripts."""
+
+    async def _service_with_session(
+        self, mock_cache: MockCache, repo: MagicMock
+    ) -> tuple[SessionService, str]:
+        session_id = str(uuid4())
+        await SessionService(cache=mock_cache).create_session(
+            model="sonnet", session_id=session_id, owner_api_key="owner-key"
+        )
+        return SessionService(cache=mock_cache, db_repo=repo), session_id
+
+    @pytest.mark.anyio
+    async def test_list_messages_pages_with_cursor(self, mock_cache: MockCache) -> None:
+        """Test a full page returns a cursor built from its last message."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from apps.api.utils.pagination import decode_cursor, encode_cursor
+
+        repo = MagicMock()
+        service, session_id = await self._service_with_session(mock_cache, repo)
+        now = datetime.now(UTC)
+        rows = [
+            FakeMessageModel(uuid4(), UUID(session_id), "user", {"n": i}, now)
+            for i in range(2)
+        ]
+        repo.list_messages_keyset = AsyncMock(return_value=(rows, True))
+        cursor = encode_cursor(now, uuid4())
+
+        page = await service.list_messages(
+            session_id, current_api_key="owner-key", limit=2, cursor=cursor
+        )
+
+        assert [m.content for m in page.messages] == [{"n": 0}, {"n": 1}]
+        assert page.next_cursor == encode_cursor(now, rows[-1].id)
+        call = repo.list_messages_keyset.call_args
+        assert call.kwargs["after"] == decode_cursor(cursor)
+        assert call.kwargs["limit"] == 2
+
+    @pytest.mark.anyio
+    async def test_list_messages_enforces_ownership(
+        self, mock_cache: MockCache
+    ) -> None:
+        """Test another API key cannot read the transcript."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        repo = MagicMock()
+        repo.list_messages_keyset = AsyncMock()
+        service, session_id = await self._service_with_session(mock_cache, repo)
+
+        with pytest.raises(SessionNotFoundError):
+            await service.list_messages(session_id, current_api_key="other-key")
+        repo.list_messages_keyset.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_stream_messages_yields_all_rows(self, mock_cache: MockCache) -> None:
+        """Test the export iterates the repository stream in order."""
+        from collections.abc import AsyncIterator
+
+        now = datetime.now(UTC)
+        rows: list[FakeMessageModel] = []
+
+        async def _stream(
+            session_id: UUID, *, after: object = None
+        ) -> AsyncIterator[FakeMessageModel]:
+            for row in rows:
+                yield row
+
+        repo = MagicMock()
+        repo.stream_messages = _stream
+        service, session_id = await self._service_with_session(mock_cache, repo)
+        rows.extend(
+            FakeMessageModel(uuid4(), UUID(session_id), "assistant", {"n": i}, now)
+            for i in range(3)
+        )
+
+        messages = await service.stream_messages(
+            session_id, current_api_key="owner-key"
+        )
+
+        assert [m.content async for m in messages] == [{"n": i} for i in range(3)]
+
 
 class TestSessionServiceUpdate:
     """Tests for session updates."""
@@ -616,7 +820,7 @@ class TestSessionServiceEdgeCases:
 
         # Get first page (2 items)
         page1 = await session_service.list_sessions(
-            page=1, page_size=2, current_api_key="test-key"
+            page=1, page_size=2, current_api_key="test-key", include_total=True
         )
         assert page1.total == 5
         assert len(page1.sessions) == 2
@@ -625,7 +829,7 @@ class TestSessionServiceEdgeCases:
 
         # Get second page (2 items)
         page2 = await session_service.list_sessions(
-            page=2, page_size=2, current_api_key="test-key"
+            page=2, page_size=2, current_api_key="test-key", include_total=True
         )
         assert page2.total == 5
         assert len(page2.sessions) == 2
@@ -633,7 +837,7 @@ class TestSessionServiceEdgeCases:
 
         # Get third page (1 item)
         page3 = await session_service.list_sessions(
-            page=3, page_size=2, current_api_key="test-key"
+            page=3, page_size=2, current_api_key="test-key", include_total=True
         )
         assert page3.total == 5
         assert len(page3.sessions) == 1
@@ -764,7 +968,7 @@ class TestSessionServiceEdgeCases:
 
         # List sessions
         result = await session_service.list_sessions(
-            page=1, page_size=10, current_api_key="test-key"
+            page=1, page_size=10, current_api_key="test-key", include_total=True
         )
 
         # Should make exactly 1 bulk cache call (not 3 individual calls)
@@ -70,3 +70,10 @@ class TestSessionsRouterStructure:
         routes = _get_route_paths(router)
         # Router includes prefix in path
         assert "/sessions/{session_id}/answer" not in routes
+
+    def test_sessions_router_has_messages_endpoint(self) -> None:
+        """Test that router has the transcript read endpoint."""
+        from apps.api.routes.sessions import router
+
+        routes = _get_route_paths(router)
+        assert "/sessions/{session_id}/messages" in routes
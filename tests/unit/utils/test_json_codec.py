@@ -0,0 +1,110 @@
+"""Unit tests for the pluggable JSON codec."""
+
+import json
+import sys
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from apps.api.adapters.cache import RedisCache
+from apps.api.config import Settings
+from apps.api.utils.json_codec import (
+    JsonCodec,
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+    create_json_codec,
+    get_json_codec,
+    reset_json_codec,
+)
+
+PAYLOAD = {
+    "id": "sess-1",
+    "content": [{"type": "text", "text": "héllo ✓"}],
+    "usage": {"input_tokens": 12, "output_tokens": 3},
+    "cost": 0.25,
+    "done": True,
+    "parent": None,
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_codec() -> Iterator[None]:
+    reset_json_codec()
+    yield
+    reset_json_codec()
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def codec(request: pytest.FixtureRequest) -> JsonCodec:
+    if request.param == "orjson":
+        # orjson ships with the optional fast-json extra
+        pytest.importorskip("orjson")
+    return create_json_codec(request.param)
+
+
+def test_round_trip_from_bytes_and_text(codec: JsonCodec) -> None:
+    encoded = codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(codec.dumps_str(PAYLOAD)) == PAYLOAD
+    assert json.loads(encoded) == PAYLOAD
+
+
+def test_stdlib_output_matches_json_dumps() -> None:
+    assert StdlibJsonCodec().dumps_str(PAYLOAD) == json.dumps(PAYLOAD)
+
+
+def test_orjson_accepts_what_stdlib_accepts() -> None:
+    pytest.importorskip("orjson")
+    codec = OrjsonJsonCodec()
+    value = {1: "int key", "big": 2**70}
+
+    assert json.loads(codec.dumps(value)) == json.loads(json.dumps(value))
+
+
+def test_invalid_input_raises_value_error(codec: JsonCodec) -> None:
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_auto_prefers_orjson() -> None:
+    pytest.importorskip("orjson")
+
+    assert create_json_codec("auto").name == "orjson"
+
+
+def test_auto_falls_back_to_stdlib_without_orjson() -> None:
+    with patch.dict(sys.modules, {"orjson": None}):
+        assert create_json_codec("auto").name == "stdlib"
+        with pytest.raises(RuntimeError, match="orjson is not installed"):
+            create_json_codec("orjson")
+
+
+def test_unknown_codec_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        create_json_codec("simdjson")
+
+
+def test_get_json_codec_uses_settings_once() -> None:
+    settings = Settings(json_codec="stdlib")
+
+    codec = get_json_codec(settings)
+
+    assert codec.name == "stdlib"
+    assert get_json_codec() is codec
+
+
+@pytest.mark.anyio
+async def test_cache_parses_reply_bytes_without_text_decode(codec: JsonCodec) -> None:
+    client = AsyncMock()
+    client.get.return_value = codec.dumps(PAYLOAD)
+    client.mget.return_value = [codec.dumps(PAYLOAD), None, b"garbage"]
+    cache = RedisCache(client, codec=codec)
+
+    assert await cache.get_json("k") == PAYLOAD
+    assert await cache.get_many_json(["a", "b", "c"]) == [PAYLOAD, None, None]
+
+    await cache.set_json("k", PAYLOAD, ttl=30)
+    client.setex.assert_awaited_once_with("k", 30, codec.dumps(PAYLOAD))
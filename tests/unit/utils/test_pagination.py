@@ -0,0 +1,27 @@
+"""Unit tests for keyset pagination cursors."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from apps.api.exceptions import ValidationError
+from apps.api.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_sort_key() -> None:
+    created_at = datetime(2026, 10, 16, 12, 30, 45, 123456, tzinfo=UTC)
+    row_id = uuid4()
+
+    cursor = encode_cursor(created_at, row_id)
+
+    assert "=" not in cursor
+    decoded = decode_cursor(cursor)
+    assert decoded.created_at == created_at
+    assert decoded.id == str(row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", "bm9waXBl", "fHg"])
+def test_malformed_cursor_raises_validation_error(cursor: str) -> None:
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
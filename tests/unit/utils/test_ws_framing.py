@@ -0,0 +1,107 @@
+"""Unit tests for compact WebSocket frame codecs."""
+
+import json
+import sys
+
+import pytest
+
+from apps.api.services.agent.types import StreamEvent
+from apps.api.utils.ws_framing import (
+    FRAME_ACK,
+    FRAME_PARTIAL_DELTA,
+    SUBPROTOCOL_COMPACT,
+    SUBPROTOCOL_MSGPACK,
+    CompactFrameCodec,
+    MsgpackFrameCodec,
+    negotiate_frame_codec,
+)
+
+MESSAGE = {
+    "type": "assistant",
+    "content": [{"type": "text", "text": "héllo"}],
+    "usage": {"input_tokens": 12, "output_tokens": 3},
+}
+DELTA = {
+    "type": "content_block_delta",
+    "index": 1,
+    "content_block": None,
+    "delta": {"type": "text_delta", "text": "hi", "thinking": None},
+}
+
+
+def test_negotiation_takes_first_supported_subprotocol(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(sys.modules, "msgpack", None)  # not installed
+
+    codec = negotiate_frame_codec(f"chat, {SUBPROTOCOL_MSGPACK}, {SUBPROTOCOL_COMPACT}")
+
+    assert codec is not None
+    assert codec.subprotocol == SUBPROTOCOL_COMPACT
+    assert negotiate_frame_codec(None) is None
+    assert negotiate_frame_codec("chat") is None
+
+
+def test_compact_event_frame_splices_cached_payload() -> None:
+    event = StreamEvent("message", MESSAGE)
+    frame = CompactFrameCodec().encode_event(event)
+
+    assert frame.endswith(event.json_bytes + b"]")
+    assert json.loads(frame) == [2, MESSAGE]
+    assert json.loads(CompactFrameCodec().encode_event(StreamEvent("memo", {}))) == [
+        "memo",
+        {},
+    ]
+
+
+def test_partial_deltas_are_sent_delta_only() -> None:
+    codec = CompactFrameCodec()
+    start = {"type": "content_block_start", "index": 1, "content_block": None}
+
+    delta_frame = codec.encode_event(StreamEvent("partial", DELTA))
+    start_frame = codec.encode_event(StreamEvent("partial", start))
+
+    assert json.loads(delta_frame) == [FRAME_PARTIAL_DELTA, 1, 0, "hi"]
+    assert json.loads(start_frame) == [4, start]
+
+
+def test_multiplexed_frames_carry_request_id() -> None:
+    codec = CompactFrameCodec()
+
+    event_frame = codec.encode_event(StreamEvent("message", MESSAGE), "r1")
+    delta_frame = codec.encode_event(StreamEvent("partial", DELTA), "r1")
+    ack_frame = codec.encode_control(FRAME_ACK, "Query started", "r1")
+
+    assert json.loads(event_frame) == [2, MESSAGE, "r1"]
+    assert json.loads(delta_frame) == [FRAME_PARTIAL_DELTA, 1, 0, "hi", "r1"]
+    assert json.loads(ack_frame) == [FRAME_ACK, "Query started", "r1"]
+
+
+def test_control_frames_and_client_messages() -> None:
+    codec = CompactFrameCodec()
+
+    assert json.loads(codec.encode_control(FRAME_ACK, "Query started")) == [
+        FRAME_ACK,
+        "Query started",
+    ]
+    assert codec.decode('{"type": "interrupt"}') == {"type": "interrupt"}
+    with pytest.raises(ValueError):
+        codec.decode("not json")
+
+
+def test_msgpack_frames_round_trip() -> None:
+    msgpack = pytest.importorskip("msgpack")
+    codec = MsgpackFrameCodec()
+
+    assert msgpack.unpackb(codec.encode_event(StreamEvent("message", MESSAGE))) == [
+        2,
+        MESSAGE,
+    ]
+    assert msgpack.unpackb(codec.encode_event(StreamEvent("partial", DELTA))) == [
+        FRAME_PARTIAL_DELTA,
+        1,
+        0,
+        "hi",
+    ]
+    assert codec.decode(msgpack.packb({"type": "answer"})) == {"type": "answer"}
+    assert codec.decode('{"type": "answer"}') == {"type": "answer"}